@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -29,6 +30,46 @@ class Settings(BaseSettings):
         "SECRET_KEY", "your-secret-key-change-this-in-production"
     )
 
+    # Analyzer settings
+    ANALYZER_STRATEGY: str = os.getenv("ANALYZER_STRATEGY", "fifo_lot_queue")
+    # Serve closed positions from the lots stored by the incremental FIFO matching
+    PERSISTED_LOTS_ENABLED: bool = (
+        os.getenv("PERSISTED_LOTS_ENABLED", "False").lower() == "true"
+    )
+
+    # Executor settings, CPU bound work (parsing, matching, formatting) runs in this pool
+    EXECUTOR_TYPE: str = os.getenv("EXECUTOR_TYPE", "thread")
+    EXECUTOR_MAX_WORKERS: int = int(os.getenv("EXECUTOR_MAX_WORKERS", "4"))
+
+    # Cache settings, memory budget of the analysis results (0 disables the cache)
+    ANALYSIS_CACHE_MAX_BYTES: int = int(
+        os.getenv("ANALYSIS_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+    )
+
+    # Conditional GET settings, seconds the dataset version is reused before reading it again
+    DATASET_VERSION_TTL_SECONDS: float = float(
+        os.getenv("DATASET_VERSION_TTL_SECONDS", "1")
+    )
+
+    # Holdings settings, maximum number of dates of a batched holdings request
+    HOLDINGS_MAX_DATES: int = int(os.getenv("HOLDINGS_MAX_DATES", "500"))
+
+    # Upload settings, streamed uploads are stored in chunks of CSV_CHUNK_SIZE rows
+    MAX_UPLOAD_SIZE: int = int(os.getenv("MAX_UPLOAD_SIZE", str(10 * 1024 * 1024)))
+    MAX_STREAMING_UPLOAD_SIZE: int = int(
+        os.getenv("MAX_STREAMING_UPLOAD_SIZE", str(1024 * 1024 * 1024))
+    )
+    CSV_CHUNK_SIZE: int = int(os.getenv("CSV_CHUNK_SIZE", "20000"))
+
+    # Background upload settings, files are copied to the spool directory until they are stored
+    INGEST_MAX_CONCURRENT_JOBS: int = int(os.getenv("INGEST_MAX_CONCURRENT_JOBS", "2"))
+    INGEST_MAX_QUEUED_JOBS: int = int(os.getenv("INGEST_MAX_QUEUED_JOBS", "50"))
+    INGEST_SPOOL_DIR: str = os.getenv(
+        "INGEST_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "analyzer-uploads")
+    )
+
+    # Export settings, exports are read and written in batches of EXPORT_BATCH_SIZE rows
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "5000"))
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-
@@ -0,0 +1,39 @@
+import datetime
+
+import pytest
+
+from app.domain.entities.entities import Operation, OperationType, Reference, Ticket
+from app.domain.entities.enums import HBTypeOperations
+
+
+@pytest.fixture
+def make_operation():
+    """Fixture that provides a factory of operations, only the fields a test cares about are given."""
+
+    def build_operation(
+        id: int = 1,
+        type_operation: str = HBTypeOperations.BUY,
+        date: datetime.date = datetime.date(2024, 1, 1),
+        amount: float | None = 10,
+        price: float = 10.0,
+        ticker: str | None = "AAPL",
+        detail: str | None = None,
+    ) -> Operation:
+        return Operation(
+            id=id,
+            type_operation=OperationType(type_operation=type_operation),
+            ticket=Ticket(species="SPECIES", species_code="001", ticker=ticker),
+            code=f"OP{id:03d}",
+            accumulated=0.0,
+            number_receipt=id,
+            date_liquidation=date,
+            date_operation=date,
+            reference=Reference(detail=detail),
+            # Buys take money from the account and sells bring it in
+            import_of_operation=-(amount or 0) * price,
+            comprobant_of_operation=1,
+            amount=amount,
+            price_of_operation=price,
+        )
+
+    return build_operation
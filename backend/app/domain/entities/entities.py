@@ -1,5 +1,13 @@
+import base64
+import binascii
 import datetime
-from dataclasses import dataclass
+import json
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import chain
+
+from app.domain.entities.enums import CursorDirections, JobStatuses
 
 
 @dataclass
@@ -98,3 +106,384 @@ class OperationsAnalyzed:
             "nominal_gain": round(self.nominal_gain, 2),
             "tna": round(self.tna, 2),
         }
+
+
+@dataclass
+class OpenLot:
+    """
+    Remaining quantity of a buy operation that has not been matched by a sell yet.
+    """
+
+    operation_id: int  # NUME of the buy
+    ticker: str | None
+    date_operation: datetime.date
+    price: float
+    amount: float
+
+
+@dataclass
+class FifoWatermark:
+    """
+    Last operation already matched into the stored lots.
+    """
+
+    last_operation_id: int  # NUME
+    last_date_operation: datetime.date  # FEC2
+
+
+@dataclass
+class TickerSummary:
+    """
+    Totals of the closed and open lots of a ticker.
+    """
+
+    ticker: str | None
+    closed_amount: int
+    open_amount: int
+    inverted_amount: float  # Cost of the closed lots
+    current_amount: float  # Proceeds of the closed lots
+    nominal_gain: float  # Realized gain
+    open_inverted_amount: float  # Cost of the open lots
+
+    @property
+    def percentage_gain(self) -> float:
+        if not self.inverted_amount:
+            return 0.0
+        return self.nominal_gain / self.inverted_amount * 100
+
+    def to_formatted_dict(self) -> dict:
+        """
+        Convert to dictionary with float values rounded to 2 decimal places.
+        """
+        return {
+            "ticker": self.ticker,
+            "closed_amount": self.closed_amount,
+            "open_amount": self.open_amount,
+            "inverted_amount": round(self.inverted_amount, 2),
+            "current_amount": round(self.current_amount, 2),
+            "nominal_gain": round(self.nominal_gain, 2),
+            "percentage_gain": round(self.percentage_gain, 2),
+            "open_inverted_amount": round(self.open_inverted_amount, 2),
+        }
+
+
+@dataclass
+class Holding:
+    """
+    Quantity of a ticker held at a date and the FIFO cost of the lots holding it.
+    """
+
+    ticker: str | None
+    amount: float
+    cost_basis: float
+
+    @property
+    def average_price(self) -> float:
+        if not self.amount:
+            return 0.0
+        return self.cost_basis / self.amount
+
+    def to_formatted_dict(self) -> dict:
+        """
+        Convert to dictionary with float values rounded to 2 decimal places.
+        """
+        return {
+            "ticker": self.ticker,
+            "amount": self.amount,
+            "cost_basis": round(self.cost_basis, 2),
+            "average_price": round(self.average_price, 2),
+        }
+
+
+@dataclass
+class PortfolioTimeSeries:
+    """
+    Daily values of the account, one entry per calendar day in each list: the cash balance,
+    the FIFO cost of the lots held and the gain realized by the sells up to the day.
+    """
+
+    dates: list[datetime.date] = field(default_factory=list)
+    cash: list[float] = field(default_factory=list)
+    invested: list[float] = field(default_factory=list)
+    realized_pnl: list[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def between(
+        self, from_date: datetime.date | None, to_date: datetime.date | None
+    ) -> "PortfolioTimeSeries":
+        """
+        Get the days between the dates, both included.
+        """
+        start = bisect_left(self.dates, from_date) if from_date else 0
+        end = bisect_right(self.dates, to_date) if to_date else len(self.dates)
+        return PortfolioTimeSeries(
+            dates=self.dates[start:end],
+            cash=self.cash[start:end],
+            invested=self.invested[start:end],
+            realized_pnl=self.realized_pnl[start:end],
+        )
+
+    def take(self, indices: Sequence[int]) -> "PortfolioTimeSeries":
+        """
+        Get the days at the given positions, as selected by a downsampler.
+        """
+        return PortfolioTimeSeries(
+            dates=[self.dates[index] for index in indices],
+            cash=[self.cash[index] for index in indices],
+            invested=[self.invested[index] for index in indices],
+            realized_pnl=[self.realized_pnl[index] for index in indices],
+        )
+
+    def to_formatted_records(self) -> list[dict]:
+        """
+        Convert to one dictionary per day with float values rounded to 2 decimal places.
+        """
+        return [
+            {
+                "date": date.strftime("%d/%m/%Y"),
+                "cash": round(cash, 2),
+                "invested": round(invested, 2),
+                "realized_pnl": round(realized_pnl, 2),
+            }
+            for date, cash, invested, realized_pnl in zip(
+                self.dates, self.cash, self.invested, self.realized_pnl
+            )
+        ]
+
+
+@dataclass
+class RealizedPnlSeries:
+    """
+    Gain realized by each closed lot, sorted by the date it was sold, and the gain accumulated
+    up to it.
+    """
+
+    dates: list[datetime.date] = field(default_factory=list)
+    tickers: list[str | None] = field(default_factory=list)
+    nominal_gain: list[float] = field(default_factory=list)
+    cumulative_gain: list[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def take(self, indices: Sequence[int]) -> "RealizedPnlSeries":
+        """
+        Get the lots at the given positions, as selected by a downsampler.
+        """
+        return RealizedPnlSeries(
+            dates=[self.dates[index] for index in indices],
+            tickers=[self.tickers[index] for index in indices],
+            nominal_gain=[self.nominal_gain[index] for index in indices],
+            cumulative_gain=[self.cumulative_gain[index] for index in indices],
+        )
+
+    def to_formatted_records(self) -> list[dict]:
+        """
+        Convert to one dictionary per lot with float values rounded to 2 decimal places.
+        """
+        return [
+            {
+                "date": date.strftime("%d/%m/%Y"),
+                "ticker": ticker,
+                "nominal_gain": round(nominal_gain, 2),
+                "cumulative_gain": round(cumulative_gain, 2),
+            }
+            for date, ticker, nominal_gain, cumulative_gain in zip(
+                self.dates, self.tickers, self.nominal_gain, self.cumulative_gain
+            )
+        ]
+
+
+@dataclass
+class PositionsAnalysis:
+    """
+    Closed and open lots computed by a single FIFO pass.
+    """
+
+    closed_operations: Sequence[OperationsAnalyzed]
+    open_operations: Sequence[OperationsAnalyzed]
+
+    def summarize_by_ticker(self) -> list[TickerSummary]:
+        """
+        Add up the closed and open lots of each ticker, sorted by ticker with missing tickers last.
+        """
+        summaries: dict[str | None, TickerSummary] = {}
+        for operation in chain(self.closed_operations, self.open_operations):
+            if operation.ticker not in summaries:
+                summaries[operation.ticker] = TickerSummary(
+                    ticker=operation.ticker,
+                    closed_amount=0,
+                    open_amount=0,
+                    inverted_amount=0.0,
+                    current_amount=0.0,
+                    nominal_gain=0.0,
+                    open_inverted_amount=0.0,
+                )
+
+        for operation in self.closed_operations:
+            summary = summaries[operation.ticker]
+            summary.closed_amount += operation.amount
+            summary.inverted_amount += operation.inverted_amount
+            summary.current_amount += operation.current_amount
+            summary.nominal_gain += operation.nominal_gain
+
+        for operation in self.open_operations:
+            summary = summaries[operation.ticker]
+            summary.open_amount += operation.amount
+            summary.open_inverted_amount += operation.inverted_amount
+
+        return sorted(
+            summaries.values(),
+            key=lambda summary: (summary.ticker is None, summary.ticker or ""),
+        )
+
+
+@dataclass
+class IngestResult:
+    """
+    Outcome of storing the operations of an uploaded file.
+    """
+
+    inserted: int = 0
+    updated: int = 0  # Operations already stored that were overwritten
+    skipped: int = 0  # Operations already stored that were left as they were
+    already_ingested: bool = False  # The same file was stored before, nothing was done
+
+    @property
+    def operations_stored(self) -> int:
+        return self.inserted + self.updated
+
+    def add(self, other: "IngestResult") -> None:
+        """
+        Add the counts of another batch of the same file.
+        """
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.skipped += other.skipped
+
+
+@dataclass
+class IngestJob:
+    """
+    Upload stored in the background, updated as its chunks are parsed and written.
+    """
+
+    id: str
+    file_name: str | None
+    status: JobStatuses = JobStatuses.QUEUED
+    rows_parsed: int = 0
+    rows_written: int = 0  # Rows sent to the database, stored or skipped
+    created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+    started_at: datetime.datetime | None = None
+    finished_at: datetime.datetime | None = None
+    result: IngestResult | None = None
+    error: str | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        elapsed = (
+            (self.finished_at or datetime.datetime.now()) - self.started_at
+        ).total_seconds()
+        return self.rows_written / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class OperationsCursor:
+    """
+    Position of an operation in the (date_operation, date_liquidation, id) order, the
+    page read from it starts right after or right before that operation.
+    The query is a fingerprint of the sort and filters of the pages, a position is only
+    meaningful among the operations of the same query.
+    """
+
+    date_operation: datetime.date
+    date_liquidation: datetime.date
+    id: int
+    direction: CursorDirections = CursorDirections.NEXT
+    query: str = ""
+
+    @classmethod
+    def from_operation(
+        cls, operation: "Operation", direction: CursorDirections, query: str = ""
+    ) -> "OperationsCursor":
+        return cls(
+            date_operation=operation.date_operation,
+            date_liquidation=operation.date_liquidation,
+            id=operation.id,
+            direction=direction,
+            query=query,
+        )
+
+    def to_token(self) -> str:
+        """
+        Encode the cursor as an opaque URL safe token.
+        """
+        payload = json.dumps(
+            [
+                self.date_operation.isoformat(),
+                self.date_liquidation.isoformat(),
+                self.id,
+                self.direction,
+                self.query,
+            ]
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def from_token(cls, token: str) -> "OperationsCursor":
+        """
+        Decode a token created by to_token.
+
+        Raises:
+            ValueError: If the token is not a valid cursor
+        """
+        try:
+            payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            date_operation, date_liquidation, id, direction, query = json.loads(payload)
+            return cls(
+                date_operation=datetime.date.fromisoformat(date_operation),
+                date_liquidation=datetime.date.fromisoformat(date_liquidation),
+                id=int(id),
+                direction=CursorDirections(direction),
+                query=str(query),
+            )
+        except (binascii.Error, TypeError, ValueError):
+            raise ValueError(f"Invalid cursor: '{token}'")
+
+
+@dataclass
+class OperationsPage:
+    """
+    Page of operations read with keyset pagination.
+    """
+
+    operations: list[Operation]
+    next_cursor: OperationsCursor | None = None
+    prev_cursor: OperationsCursor | None = None
+    total: int | None = None  # Only counted for the pages requested without cursor
+
+
+@dataclass(frozen=True)
+class DatasetVersion:
+    """
+    Version of the stored operations and when they changed for the last time.
+    """
+
+    version: int = 0
+    modified_at: datetime.datetime | None = None  # None until the first change
+
+
+@dataclass
+class LotSnapshot:
+    """
+    Open lots of every ticker once the operations up to a date are matched.
+    """
+
+    as_of: datetime.date
+    open_lots: list[OpenLot]
+    # Fingerprint of the operations of the month, tells whether the snapshot is still current
+    fingerprint: str = ""
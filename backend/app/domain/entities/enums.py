@@ -38,6 +38,7 @@ class DatabaseColumnsOperations(StrEnum):
     AMOUNT = "amount"
     PRICE = "price"
     ACCUMULATED = "accumulated"
+    IMPORT_OF_OPERATION = "import_of_operation"
     NUMBER_RECEIPT = "number_receipt"
     TYPE_OPERATION = "type_operation"
     DATE_OPERATION = "date_operation"
@@ -89,6 +90,16 @@ class HBTypeOperations(StrEnum):
 
 
 
+class AnalyzerStrategies(StrEnum):
+    """
+    Reference of the strategies available to match buy and sell operations
+    """
+    FIFO = "fifo"
+    FIFO_LOT_QUEUE = "fifo_lot_queue"
+    FIFO_VECTORIZED = "fifo_vectorized"
+    FIFO_PARALLEL = "fifo_parallel"
+
+
 class TypeOfSort(StrEnum):
     """
     Reference of the type of sort
@@ -97,3 +108,70 @@ class TypeOfSort(StrEnum):
     DESCENDING = "descending"
 
 
+
+class ExportFormats(StrEnum):
+    """
+    Reference of the formats positions can be exported to
+    """
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class CursorDirections(StrEnum):
+    """
+    Reference of the side of a page that a pagination cursor reads
+    """
+    NEXT = "next"
+    PREV = "prev"
+
+
+class TickerMatches(StrEnum):
+    """
+    Reference of how the ticker filter is compared with the stored tickers
+    """
+    CONTAINS = "contains"
+    EXACT = "exact"
+
+
+class WindowModes(StrEnum):
+    """
+    Reference of how the operations before a date window are treated by the FIFO analysis
+    """
+    ISOLATED = "isolated"  # Only the operations inside the window are matched
+    HISTORY = "history"  # Lots opened before the window are closed by the sells inside it
+
+
+
+class ExecutorTypes(StrEnum):
+    """
+    Reference of the pools available to run CPU bound tasks off the event loop
+    """
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ConflictModes(StrEnum):
+    """
+    Reference of what to do with uploaded operations whose NUME is already stored
+    """
+    SKIP = "skip"
+    OVERWRITE = "overwrite"
+    REJECT = "reject"
+
+
+class JobStatuses(StrEnum):
+    """
+    Reference of the states of an upload stored in the background
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class DownsamplingMethods(StrEnum):
+    """
+    Reference of how a series is reduced to fewer points for charting
+    """
+    LTTB = "lttb"  # Largest-Triangle-Three-Buckets, keeps the visual shape of the curve
+    MIN_MAX = "min_max"  # Lowest and highest point of each bucket, keeps the peaks
@@ -0,0 +1,47 @@
+import datetime
+
+from app.domain.entities.entities import OperationsAnalyzed, PositionsAnalysis
+
+
+def _lot(ticker, amount, buy_price, sell_price) -> OperationsAnalyzed:
+    return OperationsAnalyzed(
+        id=0,
+        ticker=ticker,
+        amount=amount,
+        date_operation=datetime.date(2024, 1, 1),
+        date_liquidation=datetime.date(2024, 2, 1),
+        buy_price=buy_price,
+        sell_price=sell_price,
+        inverted_amount=amount * buy_price,
+        current_amount=amount * sell_price,
+        percentage_gain=(sell_price / buy_price - 1) * 100,
+        nominal_gain=(sell_price - buy_price) * amount,
+        tna=0.0,
+    )
+
+
+class TestPositionsAnalysis:
+    """Test class for PositionsAnalysis functionality."""
+
+    def test_summarize_by_ticker(self):
+        """Test that closed and open lots are added up per ticker."""
+        analysis = PositionsAnalysis(
+            closed_operations=[
+                _lot("MSFT", 10, 2.0, 3.0),
+                _lot("AAPL", 10, 1.0, 2.0),
+                _lot("AAPL", 30, 1.0, 0.5),
+            ],
+            open_operations=[_lot("AAPL", 5, 4.0, 4.0), _lot(None, 1, 1.0, 1.0)],
+        )
+
+        summaries = analysis.summarize_by_ticker()
+
+        assert [summary.ticker for summary in summaries] == ["AAPL", "MSFT", None]
+        aapl = summaries[0]
+        assert (aapl.closed_amount, aapl.open_amount) == (40, 5)
+        assert aapl.inverted_amount == 40.0
+        assert aapl.nominal_gain == -5.0
+        assert aapl.percentage_gain == -12.5
+        assert aapl.open_inverted_amount == 20.0
+        assert summaries[2].closed_amount == 0
+        assert summaries[2].to_formatted_dict()["percentage_gain"] == 0.0
@@ -0,0 +1,26 @@
+from abc import abstractmethod
+from typing import Protocol, Sequence
+
+
+class DownsamplerInterface(Protocol):
+    """
+    Interface for reducing series to fewer points before they are sent to a chart.
+    """
+
+    @abstractmethod
+    def select_indices(
+        self, x: Sequence[float], curves: Sequence[Sequence[float]], points: int
+    ) -> list[int]:
+        """
+        Select the positions kept of curves sharing the x values, so every curve is sliced
+        the same way.
+
+        Args:
+            x: Increasing x values of the series
+            curves: y values of each curve, as long as x
+            points: Maximum number of positions kept
+
+        Returns:
+            Sorted positions kept, all of them when there are no more than points
+        """
+        raise NotImplementedError
@@ -0,0 +1,19 @@
+import datetime
+from abc import abstractmethod
+from typing import Protocol
+
+from app.domain.entities.entities import Holding
+
+
+class PositionLedgerInterface(Protocol):
+    """
+    Interface for an index of the quantity and cost held of every ticker over time, built once
+    from the operations so holdings at any date are answered without matching them again.
+    """
+
+    @abstractmethod
+    def holdings_as_of(self, date: datetime.date) -> list[Holding]:
+        """
+        Get the tickers held at the end of the date, sorted by ticker.
+        """
+        raise NotImplementedError
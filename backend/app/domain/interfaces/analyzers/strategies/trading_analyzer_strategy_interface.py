@@ -1,18 +1,25 @@
 from abc import abstractmethod
-from typing import Protocol, Tuple
+from collections import deque
+from collections.abc import Sequence
+from typing import Protocol, Tuple, runtime_checkable
 
-from app.domain.entities.entities import Operation, OperationsAnalyzed
+import pandas as pd
+
+from app.domain.entities.entities import OpenLot, Operation, OperationsAnalyzed
 
 
 class TradingAnalyzerStrategyInterface(Protocol):
     """
     Interface for trading analyzer strategy.
+
+    A single instance is shared by every request and, with a thread executor, run by several
+    workers at once, so implementations must keep no state between runs.
     """
 
     @abstractmethod
     async def run_strategy(
         self, operations: list[Operation]
-    ) -> Tuple[list[OperationsAnalyzed], list[OperationsAnalyzed]]:
+    ) -> Tuple[Sequence[OperationsAnalyzed], Sequence[OperationsAnalyzed]]:
         """
         Run the strategy.
 
@@ -20,3 +27,54 @@ class TradingAnalyzerStrategyInterface(Protocol):
             Tuple of (closed_operations, open_operations)
         """
         raise NotImplementedError
+
+
+@runtime_checkable
+class FrameTradingAnalyzerStrategyInterface(Protocol):
+    """
+    Interface for strategies able to run over the columns of the operations, so they can be
+    read from the database without building an Operation per row.
+    """
+
+    @abstractmethod
+    async def run_strategy_on_frame(
+        self, frame: pd.DataFrame
+    ) -> Tuple[Sequence[OperationsAnalyzed], Sequence[OperationsAnalyzed]]:
+        """
+        Run the strategy over a flat DataFrame with the DatabaseColumnsOperations columns,
+        rows in the order the repository returns them (newest first).
+
+        Returns:
+            Tuple of (closed_operations, open_operations)
+        """
+        raise NotImplementedError
+
+
+class LotMatchingStrategyInterface(Protocol):
+    """
+    Interface for strategies able to continue matching from previously stored open lots.
+    """
+
+    @abstractmethod
+    def match_operations(
+        self,
+        operations: list[Operation],
+        open_lots: dict[str | None, deque[OpenLot]],
+        first_id: int = 1,
+    ) -> list[OperationsAnalyzed]:
+        """
+        Match the operations against the open lots of each ticker, updating them in place.
+
+        Returns:
+            Closed operations
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def build_open_operations(
+        self, open_lots: dict[str | None, deque[OpenLot]], first_id: int = 1
+    ) -> list[OperationsAnalyzed]:
+        """
+        Create open positions from the lots left by the matching.
+        """
+        raise NotImplementedError
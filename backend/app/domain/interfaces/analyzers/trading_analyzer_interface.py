@@ -1,8 +1,15 @@
 # app/interfaces/analyzers/trading_analyzer_interface.py
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
-from app.domain.entities.entities import Operation, OperationsAnalyzed
+import pandas as pd
+
+from app.domain.entities.entities import (
+    Operation,
+    OperationsAnalyzed,
+    PositionsAnalysis,
+)
 
 
 class TradingAnalyzerInterface(Protocol):
@@ -12,7 +19,9 @@ class TradingAnalyzerInterface(Protocol):
     """
 
     @abstractmethod
-    async def analyze(self, operations: list[Operation]) -> list[OperationsAnalyzed]:
+    async def analyze(
+        self, operations: list[Operation]
+    ) -> Sequence[OperationsAnalyzed]:
         """
         Analyzes trading operations from historical data.
 
@@ -23,3 +32,36 @@ class TradingAnalyzerInterface(Protocol):
             List of analyzed trading operations including profits and gains
         """
         raise NotImplementedError("Method analyze must be implemented")
+
+    @abstractmethod
+    async def analyze_positions(self, operations: list[Operation]) -> PositionsAnalysis:
+        """
+        Analyzes trading operations returning both the closed and the open lots.
+
+        Args:
+            operations: List of trading operations to analyze
+
+        Returns:
+            Closed and open lots computed by the same analysis
+        """
+        raise NotImplementedError("Method analyze_positions must be implemented")
+
+    @abstractmethod
+    def supports_frames(self) -> bool:
+        """
+        Whether the analysis can run over the columns returned by get_operations_frame.
+        """
+        raise NotImplementedError("Method supports_frames must be implemented")
+
+    @abstractmethod
+    async def analyze_positions_frame(self, frame: pd.DataFrame) -> PositionsAnalysis:
+        """
+        Analyzes the operations of a flat DataFrame returning both the closed and the open lots.
+
+        Args:
+            frame: DataFrame with the DatabaseColumnsOperations columns, newest first
+
+        Returns:
+            Closed and open lots computed by the same analysis
+        """
+        raise NotImplementedError("Method analyze_positions_frame must be implemented")
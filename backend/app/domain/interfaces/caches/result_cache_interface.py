@@ -0,0 +1,29 @@
+from abc import abstractmethod
+from typing import Any, Hashable, Protocol
+
+
+class ResultCacheInterface(Protocol):
+    """
+    Interface for caching computed results, such as analyzed operations, by query.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get the result stored for the key, None if it is not cached.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store the result for the key, the cache may discard it or older entries to stay in budget.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove every cached result, called when the data they were computed from changes.
+        """
+        raise NotImplementedError
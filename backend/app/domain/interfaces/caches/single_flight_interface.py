@@ -0,0 +1,18 @@
+from abc import abstractmethod
+from typing import Awaitable, Callable, Hashable, Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlightInterface(Protocol):
+    """
+    Interface for sharing one computation between concurrent callers asking for the same key.
+    """
+
+    @abstractmethod
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `compute` unless a computation of the key is in flight, in which case its result,
+        or its error, is awaited instead.
+        """
+        raise NotImplementedError
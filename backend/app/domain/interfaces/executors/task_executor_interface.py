@@ -0,0 +1,32 @@
+from abc import abstractmethod
+from typing import Any, Callable, Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class TaskExecutorInterface(Protocol):
+    """
+    Interface for running CPU bound tasks without blocking the event loop.
+    """
+
+    @abstractmethod
+    async def run(self, task_name: str, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a synchronous function in the executor and wait for its result.
+
+        Args:
+            task_name: Name used to report the timing of the task
+            func: Function to run, it must be picklable when running in processes
+            args: Arguments of the function
+
+        Returns:
+            The value returned by the function
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """
+        Release the workers of the executor.
+        """
+        raise NotImplementedError
@@ -0,0 +1,39 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from fastapi import UploadFile
+
+from app.domain.entities.entities import IngestJob
+from app.domain.entities.enums import ConflictModes
+
+
+class IngestJobQueueInterface(Protocol):
+    """
+    Interface for storing uploaded files in the background.
+    """
+
+    @abstractmethod
+    async def submit(
+        self, csv_file: UploadFile, on_conflict: ConflictModes = ConflictModes.REJECT
+    ) -> IngestJob:
+        """
+        Keep a copy of the uploaded file and queue it to be stored.
+
+        Returns:
+            The queued job, updated while the file is stored
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, job_id: str) -> IngestJob | None:
+        """
+        Get a job by its id, None when it does not exist or was already forgotten.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        """
+        Stop the workers, the running jobs fail and the jobs still queued are discarded.
+        """
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol
+from typing import BinaryIO, Iterator, Protocol
 
 from fastapi import UploadFile
 
@@ -11,9 +11,17 @@ class CsvParserInterface(Protocol):
     Interface for csv parser.
     """
     @abstractmethod
-    def parse(self, csv_file: UploadFile) -> list[Operation]:
+    def parse(self, csv_file: UploadFile | BinaryIO) -> list[Operation]:
         """
-        Parse a csv file.
+        Parse a csv file, either the uploaded file or its content already read.
         """
-        raise NotImplementedError       
+        raise NotImplementedError
 
+    @abstractmethod
+    def split_chunks(
+        self, csv_file: UploadFile | BinaryIO, chunk_size: int
+    ) -> Iterator[BinaryIO]:
+        """
+        Split a csv file into csv files of at most `chunk_size` rows that can be parsed on their own.
+        """
+        raise NotImplementedError
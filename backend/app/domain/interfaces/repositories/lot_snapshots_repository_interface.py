@@ -0,0 +1,62 @@
+import datetime
+from abc import abstractmethod
+from contextlib import AbstractAsyncContextManager
+from typing import Protocol
+
+from app.domain.entities.entities import LotSnapshot
+
+
+class LotSnapshotsRepositoryInterface(Protocol):
+    """
+    Interface for lot snapshots repository, it stores the open lots at regular dates so an
+    analysis can start from them instead of replaying the whole history.
+    """
+
+    @abstractmethod
+    async def get_dataset_version(self) -> int | None:
+        """
+        Get the version of the operations the stored snapshots were built from, None if there
+        are no snapshots.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_snapshot_before(self, date: datetime.date) -> LotSnapshot | None:
+        """
+        Get the latest snapshot taken before the date, None if there is none.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_fingerprints(self) -> dict[datetime.date, str]:
+        """
+        Get the fingerprint of the operations each stored snapshot was built from, by date.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace_snapshots(
+        self,
+        snapshots: list[LotSnapshot],
+        dataset_version: int,
+        from_date: datetime.date = datetime.date.min,
+    ) -> None:
+        """
+        Replace the stored snapshots taken from `from_date` on in a single transaction, the
+        earlier ones are kept and marked as built from `dataset_version`.
+
+        Args:
+            snapshots: Snapshots built from the operations, none taken before `from_date`
+            dataset_version: Version of the operations they were built from
+            from_date: Date of the first snapshot replaced
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def rebuild_lock(self) -> AbstractAsyncContextManager[bool]:
+        """
+        Transaction holding the lock of the snapshots rebuild when it can be taken at once, it
+        gives whether it was taken. Concurrent rebuilds of any process never wait for each
+        other: the ones not holding the lock leave the snapshots to the one holding it.
+        """
+        raise NotImplementedError
@@ -0,0 +1,95 @@
+import datetime
+from abc import abstractmethod
+from contextlib import AbstractAsyncContextManager
+from typing import AsyncIterator, Protocol
+
+from app.domain.entities.entities import FifoWatermark, OpenLot, OperationsAnalyzed
+from app.domain.entities.enums import TickerMatches
+
+
+class LotsRepositoryInterface(Protocol):
+    """
+    Interface for lots repository, it stores the state of the FIFO matching so new
+    operations can be matched without replaying the whole history.
+    """
+
+    @abstractmethod
+    async def get_watermark(self) -> FifoWatermark | None:
+        """
+        Get the last operation already matched, None if the lots were never built.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_open_lots(
+        self, tickers: list[str | None] | None = None
+    ) -> list[OpenLot]:
+        """
+        Get the open lots in FIFO order.
+
+        Args:
+            tickers: Tickers to get the lots for, all of them if None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_matching(
+        self,
+        closed_operations: list[OperationsAnalyzed],
+        open_lots: list[OpenLot],
+        watermark: FifoWatermark,
+        tickers: list[str | None] | None = None,
+    ) -> None:
+        """
+        Store the result of matching new operations in a single transaction.
+
+        Args:
+            closed_operations: New closed lots to append
+            open_lots: Open lots replacing the stored ones of `tickers`
+            watermark: Last operation matched
+            tickers: Tickers whose open lots are replaced, all of them if None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def sync_lock(self) -> AbstractAsyncContextManager[None]:
+        """
+        Transaction holding a lock while the lots are matched, so concurrent syncs of any
+        process run one after the other instead of both replacing the stored lots. The
+        operations and lots read inside it use the transaction, no other connection is needed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reset(self) -> None:
+        """
+        Remove every stored lot and the watermark, so the lots are rebuilt from the history.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_closed_lots(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> list[OperationsAnalyzed]:
+        """
+        Get the closed lots bought and sold between the dates provided.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_closed_lots(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        batch_size: int,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> AsyncIterator[list[OperationsAnalyzed]]:
+        """
+        Yield the closed lots of get_closed_lots in batches of up to `batch_size`.
+        """
+        raise NotImplementedError
@@ -1,9 +1,21 @@
 import datetime
 from abc import abstractmethod
-from typing import NotRequired, Protocol, TypedDict
+from typing import AsyncIterable, AsyncIterator, NotRequired, Protocol, TypedDict
 
-from app.domain.entities.entities import Operation
-from app.domain.entities.enums import HBTypeOperations
+import pandas as pd
+
+from app.domain.entities.entities import (
+    DatasetVersion,
+    IngestResult,
+    Operation,
+    OperationsCursor,
+)
+from app.domain.entities.enums import (
+    ConflictModes,
+    HBTypeOperations,
+    TickerMatches,
+    TypeOfSort,
+)
 
 
 class OperationProperties(TypedDict, total=False):
@@ -27,9 +39,43 @@ class OperationsRepositoryInterface(Protocol):
     """
 
     @abstractmethod
-    async def create_operations(self, operations: list[Operation]):
+    async def create_operations(
+        self,
+        operations: list[Operation],
+        on_conflict: ConflictModes = ConflictModes.REJECT,
+        content_hash: str | None = None,
+    ) -> IngestResult:
         """
         Create operations.
+
+        Args:
+            operations: Operations to create
+            on_conflict: What to do with the operations whose NUME is already stored
+            content_hash: Hash of the file of the operations, stored so the file is not ingested again
+
+        Returns:
+            Counts of the operations stored, nothing is stored and already_ingested is set when
+            the hash was stored before
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_operations_in_chunks(
+        self,
+        chunks: AsyncIterable[list[Operation]],
+        on_conflict: ConflictModes = ConflictModes.REJECT,
+        content_hash: str | None = None,
+    ) -> IngestResult:
+        """
+        Create the operations of each chunk before the next one is requested, in a single
+        transaction.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def is_file_ingested(self, content_hash: str) -> bool:
+        """
+        Check if a file with the same content was already ingested.
         """
         raise NotImplementedError
 
@@ -40,9 +86,97 @@ class OperationsRepositoryInterface(Protocol):
         to_date: datetime.date,
         type_operation: tuple[HBTypeOperations, ...] | None = None,
         ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
     ) -> list[Operation]:
         """
-        Get operations.
+        Get operations, the ticker is compared as the ticker_match provided.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_operations_page(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        limit: int,
+        sort: TypeOfSort = TypeOfSort.ASCENDING,
+        cursor: OperationsCursor | None = None,
+        offset: int = 0,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> list[Operation]:
+        """
+        Get up to `limit` operations sorted by (date_operation, date_liquidation, id), starting
+        after the cursor or skipping `offset` operations. The operations are returned in the
+        order they are read from the cursor, so a previous page comes reversed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_operations(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        batch_size: int,
+        sort: TypeOfSort = TypeOfSort.ASCENDING,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> AsyncIterator[list[Operation]]:
+        """
+        Yield every operation in batches of up to `batch_size`, sorted like get_operations_page.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_operations(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> int:
+        """
+        Count the operations get_operations would return.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_operations_frame(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> pd.DataFrame:
+        """
+        Get the operations as a flat DataFrame with the type operation, ticker, amount, price
+        and date operation DatabaseColumnsOperations columns, in the order of get_operations.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_cash_frame(
+        self, from_date: datetime.date, to_date: datetime.date
+    ) -> pd.DataFrame:
+        """
+        Get the cash movements of the operations liquidated between the dates as a flat
+        DataFrame with the date liquidation, accumulated and import of operation
+        DatabaseColumnsOperations columns, newest first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_daily_fingerprints(
+        self, type_operation: tuple[HBTypeOperations, ...] | None = None
+    ) -> dict[datetime.date, str]:
+        """
+        Get a fingerprint of the operations of every operation date, it changes when an
+        operation of the day is created, updated or deleted. The days whose operations changed
+        are found without reading the operations.
         """
         raise NotImplementedError
 
@@ -74,3 +208,19 @@ class OperationsRepositoryInterface(Protocol):
         they will be used as filters to delete operations that match all criteria.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_dataset_version(self) -> int:
+        """
+        Get the version of the stored operations, it increases every time operations are
+        created, updated or deleted so results computed from them can be reused until then.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_dataset_version_info(self) -> DatasetVersion:
+        """
+        Get the version of the stored operations with the time they changed for the last time,
+        used to tell clients whether the responses they hold are still current.
+        """
+        raise NotImplementedError
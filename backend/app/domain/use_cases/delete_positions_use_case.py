@@ -1,7 +1,9 @@
 from app.domain.entities.enums import HBTypeOperations
+from app.domain.interfaces.caches.result_cache_interface import ResultCacheInterface
 from app.domain.interfaces.repositories.operations_repository_interface import (
     OperationsRepositoryInterface,
 )
+from app.domain.use_cases.sync_lots_use_case import SyncLotsUseCase
 
 
 class DeletePositionsUseCase:
@@ -12,8 +14,12 @@ class DeletePositionsUseCase:
     def __init__(
         self,
         repository: OperationsRepositoryInterface,
+        sync_lots_use_case: SyncLotsUseCase | None = None,
+        result_cache: ResultCacheInterface | None = None,
     ):
         self.repository = repository
+        self.sync_lots_use_case = sync_lots_use_case
+        self.result_cache = result_cache
 
     async def execute(
         self,
@@ -27,4 +33,11 @@ class DeletePositionsUseCase:
             type_operation=type_operation,
         )
 
+        # Stored lots no longer match the history, they are rebuilt in the background
+        if self.sync_lots_use_case and deleted_count:
+            await self.sync_lots_use_case.invalidate()
+
+        if self.result_cache is not None and deleted_count:
+            self.result_cache.clear()
+
         return deleted_count
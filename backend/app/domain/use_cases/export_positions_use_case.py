@@ -0,0 +1,104 @@
+from collections.abc import AsyncIterator, Sequence
+
+from app.domain.entities.entities import Operation, OperationsAnalyzed
+from app.domain.entities.enums import TickerMatches, TypeOfSort
+from app.domain.interfaces.repositories.lots_repository_interface import (
+    LotsRepositoryInterface,
+)
+from app.domain.interfaces.repositories.operations_repository_interface import (
+    OperationsRepositoryInterface,
+)
+from app.domain.use_cases.get_positions_use_case import (
+    GetPositionsUseCase,
+    parse_query_date,
+)
+from app.domain.use_cases.sync_lots_use_case import TRADING_TYPES, SyncLotsUseCase
+
+
+class ExportPositionsUseCase:
+    """
+    This use case is responsible of reading whole position histories in batches, so they can be
+    streamed without holding them in memory.
+
+    The filters are validated before the batches are returned, errors are raised before anything
+    is streamed.
+    """
+
+    def __init__(
+        self,
+        repository: OperationsRepositoryInterface,
+        batch_size: int,
+        lots_repository: LotsRepositoryInterface | None = None,
+        sync_lots_use_case: SyncLotsUseCase | None = None,
+        get_positions_use_case: GetPositionsUseCase | None = None,
+    ):
+        self.repository = repository
+        self.batch_size = batch_size
+        self.lots_repository = lots_repository
+        self.sync_lots_use_case = sync_lots_use_case
+        self.get_positions_use_case = get_positions_use_case
+
+    async def export_all_positions(
+        self,
+        from_date: str,
+        to_date: str,
+        sort: TypeOfSort = TypeOfSort.ASCENDING,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> AsyncIterator[list[Operation]]:
+        return self.repository.iter_operations(
+            parse_query_date(from_date, "from_date"),
+            parse_query_date(to_date, "to_date"),
+            self.batch_size,
+            sort=sort,
+            type_operation=TRADING_TYPES,
+            ticker=ticker.strip().upper() if ticker else None,
+            ticker_match=ticker_match,
+        )
+
+    async def export_closed_positions(
+        self,
+        from_date: str,
+        to_date: str,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> AsyncIterator[Sequence[OperationsAnalyzed]]:
+        """
+        Read the stored closed lots when they are kept by the incremental matching and built,
+        otherwise the closed operations of the analysis are returned in batches.
+
+        Only the stored lots are read in batches from the database. The analysis builds every
+        closed operation of the period before the first batch, so without stored lots the
+        memory used grows with the export, as it does for the closed positions route.
+        """
+        from_date_parsed = parse_query_date(from_date, "from_date")
+        to_date_parsed = parse_query_date(to_date, "to_date")
+        if (
+            self.lots_repository
+            and self.sync_lots_use_case
+            and await self.sync_lots_use_case.ensure_built()
+        ):
+            return self.lots_repository.iter_closed_lots(
+                from_date_parsed,
+                to_date_parsed,
+                self.batch_size,
+                ticker=ticker.strip().upper() if ticker else None,
+                ticker_match=ticker_match,
+            )
+
+        if not self.get_positions_use_case:
+            raise ValueError("An analysis is required to export closed positions")
+        closed_operations = await self.get_positions_use_case.execute(
+            from_date,
+            to_date,
+            type_operation=TRADING_TYPES,
+            ticker=ticker,
+            ticker_match=ticker_match,
+        )
+        return self._in_batches(closed_operations)
+
+    async def _in_batches(
+        self, operations: Sequence[OperationsAnalyzed]
+    ) -> AsyncIterator[Sequence[OperationsAnalyzed]]:
+        for start in range(0, len(operations), self.batch_size):
+            yield operations[start : start + self.batch_size]
@@ -0,0 +1,54 @@
+from app.domain.entities.entities import OperationsAnalyzed
+from app.domain.entities.enums import TickerMatches
+from app.domain.interfaces.repositories.lots_repository_interface import (
+    LotsRepositoryInterface,
+)
+from app.domain.use_cases.get_positions_use_case import (
+    GetPositionsUseCase,
+    parse_query_date,
+)
+from app.domain.use_cases.sync_lots_use_case import TRADING_TYPES, SyncLotsUseCase
+
+
+class GetClosedLotsUseCase:
+    """
+    This use case is responsible of getting the closed lots stored by the incremental FIFO matching.
+    While the lots are being rebuilt the closed positions come from the analysis.
+    """
+
+    def __init__(
+        self,
+        lots_repository: LotsRepositoryInterface,
+        sync_lots_use_case: SyncLotsUseCase,
+        get_positions_use_case: GetPositionsUseCase,
+    ):
+        self.lots_repository = lots_repository
+        self.sync_lots_use_case = sync_lots_use_case
+        self.get_positions_use_case = get_positions_use_case
+
+    async def execute(
+        self,
+        from_date: str,
+        to_date: str,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> list[OperationsAnalyzed]:
+        from_date_parsed = parse_query_date(from_date, "from_date")
+        to_date_parsed = parse_query_date(to_date, "to_date")
+        ticker_parsed = ticker.strip().upper() if ticker else None
+
+        if not await self.sync_lots_use_case.ensure_built():
+            return await self.get_positions_use_case.execute(
+                from_date,
+                to_date,
+                type_operation=TRADING_TYPES,
+                ticker=ticker,
+                ticker_match=ticker_match,
+            )
+
+        return await self.lots_repository.get_closed_lots(
+            from_date_parsed,
+            to_date_parsed,
+            ticker=ticker_parsed,
+            ticker_match=ticker_match,
+        )
@@ -0,0 +1,93 @@
+import datetime
+from typing import Any, Callable
+
+from app.domain.entities.entities import Holding
+from app.domain.entities.enums import TickerMatches
+from app.domain.interfaces.analyzers.position_ledger_interface import (
+    PositionLedgerInterface,
+)
+from app.domain.interfaces.caches.result_cache_interface import ResultCacheInterface
+from app.domain.interfaces.executors.task_executor_interface import (
+    TaskExecutorInterface,
+)
+from app.domain.interfaces.repositories.operations_repository_interface import (
+    OperationsRepositoryInterface,
+)
+from app.domain.use_cases.get_positions_use_case import (
+    matches_ticker,
+    parse_query_date,
+)
+from app.domain.use_cases.sync_lots_use_case import TRADING_TYPES
+
+
+class GetHoldingsUseCase:
+    """
+    This use case is responsible of getting what the portfolio held at given dates.
+    The ledger of every ticker is built once per dataset version from the stored operations,
+    each date is then answered with a binary search per ticker.
+    """
+
+    def __init__(
+        self,
+        repository: OperationsRepositoryInterface,
+        build_ledger: Callable[[Any], PositionLedgerInterface],
+        result_cache: ResultCacheInterface | None = None,
+        task_executor: TaskExecutorInterface | None = None,
+    ):
+        """
+        Args:
+            build_ledger: Builds the ledger from the frame of operations of the repository
+        """
+        self.repository = repository
+        self.build_ledger = build_ledger
+        self.result_cache = result_cache
+        self.task_executor = task_executor
+
+    async def execute(
+        self,
+        as_of_dates: list[str],
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> list[tuple[datetime.date, list[Holding]]]:
+        """
+        Get the holdings at the end of each date, in the order the dates are received.
+        """
+        dates = [parse_query_date(as_of, "as_of") for as_of in as_of_dates]
+        ticker_parsed = ticker.strip().upper() if ticker else None
+
+        ledger = await self.get_ledger()
+        return [
+            (
+                date,
+                [
+                    holding
+                    for holding in ledger.holdings_as_of(date)
+                    if matches_ticker(holding.ticker, ticker_parsed, ticker_match)
+                ],
+            )
+            for date in dates
+        ]
+
+    async def get_ledger(self) -> PositionLedgerInterface:
+        """
+        Get the ledger of the current operations, built again once they change.
+        """
+        cache_key = ("ledger", await self.repository.get_dataset_version())
+        if self.result_cache is not None:
+            cached_ledger = self.result_cache.get(cache_key)
+            if cached_ledger is not None:
+                return cached_ledger
+
+        frame = await self.repository.get_operations_frame(
+            datetime.date.min, datetime.date.max, type_operation=TRADING_TYPES
+        )
+        if self.task_executor is not None:
+            ledger = await self.task_executor.run(
+                "build_position_ledger", self.build_ledger, frame
+            )
+        else:
+            ledger = self.build_ledger(frame)
+
+        if self.result_cache is not None:
+            self.result_cache.set(cache_key, ledger)
+        return ledger
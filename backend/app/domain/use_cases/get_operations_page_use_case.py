@@ -0,0 +1,136 @@
+import hashlib
+import json
+from datetime import date
+from typing import Any
+
+from app.domain.entities.entities import OperationsCursor, OperationsPage
+from app.domain.entities.enums import (
+    CursorDirections,
+    HBTypeOperations,
+    TickerMatches,
+    TypeOfSort,
+)
+from app.domain.interfaces.repositories.operations_repository_interface import (
+    OperationsRepositoryInterface,
+)
+from app.domain.use_cases.get_positions_use_case import parse_query_date
+
+
+class GetOperationsPageUseCase:
+    """
+    This use case is responsible of getting a page of operations sorted and paginated by the database.
+    """
+
+    def __init__(self, repository: OperationsRepositoryInterface):
+        self.repository = repository
+
+    async def execute(
+        self,
+        from_date: str,
+        to_date: str,
+        limit: int,
+        sort: TypeOfSort = TypeOfSort.ASCENDING,
+        cursor: str | None = None,
+        offset: int = 0,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> OperationsPage:
+        """
+        Get the page after or before the cursor, or the page at `offset` when no cursor is given.
+        Only the pages requested without cursor count the total of operations.
+        """
+        from_date_parsed, to_date_parsed, filters, query, cursor_parsed = (
+            self.parse_query(
+                from_date,
+                to_date,
+                sort,
+                cursor,
+                offset,
+                type_operation,
+                ticker,
+                ticker_match,
+            )
+        )
+
+        # One operation more than the page tells whether there is another page after it
+        operations = await self.repository.get_operations_page(
+            from_date_parsed,
+            to_date_parsed,
+            limit + 1,
+            sort=sort,
+            cursor=cursor_parsed,
+            offset=offset,
+            **filters,
+        )
+        has_more = len(operations) > limit
+        operations = operations[:limit]
+
+        backwards = (
+            cursor_parsed is not None
+            and cursor_parsed.direction == CursorDirections.PREV
+        )
+        if backwards:
+            operations.reverse()
+
+        page = OperationsPage(operations=operations)
+        if operations:
+            if has_more or backwards:
+                page.next_cursor = OperationsCursor.from_operation(
+                    operations[-1], CursorDirections.NEXT, query
+                )
+            if (has_more and backwards) or (not backwards and (cursor or offset)):
+                page.prev_cursor = OperationsCursor.from_operation(
+                    operations[0], CursorDirections.PREV, query
+                )
+
+        if cursor_parsed is None:
+            page.total = await self.repository.count_operations(
+                from_date_parsed, to_date_parsed, **filters
+            )
+        return page
+
+    def parse_query(
+        self,
+        from_date: str,
+        to_date: str,
+        sort: TypeOfSort = TypeOfSort.ASCENDING,
+        cursor: str | None = None,
+        offset: int = 0,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> tuple[date, date, dict[str, Any], str, OperationsCursor | None]:
+        """
+        Validate the query without reading the database.
+
+        Returns:
+            Tuple of (from_date, to_date, filters, query fingerprint, cursor)
+        """
+        if cursor and offset:
+            raise ValueError("Use either a cursor or an offset, not both")
+
+        from_date_parsed = parse_query_date(from_date, "from_date")
+        to_date_parsed = parse_query_date(to_date, "to_date")
+        ticker_parsed = ticker.strip().upper() if ticker else None
+        filters = {
+            "type_operation": type_operation,
+            "ticker": ticker_parsed,
+            "ticker_match": ticker_match,
+        }
+        query = query_fingerprint(from_date_parsed, to_date_parsed, sort, **filters)
+        cursor_parsed = OperationsCursor.from_token(cursor) if cursor else None
+        if cursor_parsed is not None and cursor_parsed.query != query:
+            raise ValueError(
+                "The cursor belongs to a query with another sort or other filters, "
+                "request the first page again"
+            )
+        return from_date_parsed, to_date_parsed, filters, query, cursor_parsed
+
+
+def query_fingerprint(*values, **filters) -> str:
+    """
+    Short hash of the sort and filters of a paginated query, stored in its cursors.
+    """
+    payload = json.dumps([values, filters], default=str, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
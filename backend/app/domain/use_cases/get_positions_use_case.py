@@ -1,15 +1,44 @@
-from datetime import datetime
+from datetime import date, datetime
+from functools import partial
 from typing import Any
 
-from app.domain.entities.enums import HBTypeOperations
+from app.domain.entities.entities import PositionsAnalysis
+from app.domain.entities.enums import HBTypeOperations, TickerMatches
 from app.domain.interfaces.analyzers.trading_analyzer_interface import (
     TradingAnalyzerInterface,
 )
+from app.domain.interfaces.caches.result_cache_interface import ResultCacheInterface
+from app.domain.interfaces.caches.single_flight_interface import SingleFlightInterface
 from app.domain.interfaces.repositories.operations_repository_interface import (
     OperationsRepositoryInterface,
 )
 
 
+def parse_query_date(value: str, field_name: str) -> date:
+    """
+    Parse a DD/MM/YYYY date received as filter.
+    """
+    try:
+        return datetime.strptime(value, "%d/%m/%Y").date()
+    except ValueError:
+        raise ValueError(
+            f"Invalid date format for '{field_name}': '{value}'. Expected format: DD/MM/YYYY (e.g., 01/01/2024)"
+        )
+
+
+def matches_ticker(
+    ticker: str | None, ticker_filter: str | None, ticker_match: TickerMatches
+) -> bool:
+    """
+    Compare a ticker with the filter received as the repositories compare the stored tickers.
+    """
+    if not ticker_filter:
+        return True
+    if ticker_match == TickerMatches.EXACT:
+        return ticker == ticker_filter
+    return ticker_filter in (ticker or "").upper()
+
+
 class GetPositionsUseCase:
     """
     This use case is responsible of getting operations from the database and analyzing them doing business transformation in the middle.
@@ -19,9 +48,17 @@ class GetPositionsUseCase:
         self,
         repository: OperationsRepositoryInterface,
         analyzer: TradingAnalyzerInterface | None = None,
+        result_cache: ResultCacheInterface | None = None,
+        strategy_name: str | None = None,
+        single_flight: SingleFlightInterface | None = None,
     ):
         self.repository = repository
         self.analyzer = analyzer
+        self.result_cache = result_cache
+        # Part of the cache key, results of different strategies must not be mixed
+        self.strategy_name = strategy_name
+        # Shared between the instances so concurrent identical queries are computed once
+        self.single_flight = single_flight
 
     async def execute(
         self,
@@ -29,30 +66,115 @@ class GetPositionsUseCase:
         to_date: str,
         type_operation: tuple[HBTypeOperations, ...] | None = None,
         ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
     ) -> list[Any]:
-        try:
-            from_date_parsed = datetime.strptime(from_date, "%d/%m/%Y").date()
-        except ValueError:
-            raise ValueError(
-                f"Invalid date format for 'from_date': '{from_date}'. Expected format: DD/MM/YYYY (e.g., 01/01/2024)"
-            )
+        result = await self._get_result(
+            from_date, to_date, type_operation, ticker, ticker_match
+        )
+        if self.analyzer:
+            return result.closed_operations
+        return result
 
-        try:
-            to_date_parsed = datetime.strptime(to_date, "%d/%m/%Y").date()
-        except ValueError:
-            raise ValueError(
-                f"Invalid date format for 'to_date': '{to_date}'. Expected format: DD/MM/YYYY (e.g., 01/01/2024)"
-            )
+    async def analyze_positions(
+        self,
+        from_date: str,
+        to_date: str,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> PositionsAnalysis:
+        """
+        Get both the closed and the open lots, which come from the same cached analysis
+        as the closed operations returned by `execute`.
+        """
+        if not self.analyzer:
+            raise ValueError("An analyzer is required to analyze positions")
+        return await self._get_result(
+            from_date, to_date, type_operation, ticker, ticker_match
+        )
+
+    async def _get_result(
+        self,
+        from_date: str,
+        to_date: str,
+        type_operation: tuple[HBTypeOperations, ...] | None,
+        ticker: str | None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> Any:
+        """
+        Get the operations, analyzed when there is an analyzer, reusing cached results.
+        """
+        from_date_parsed = parse_query_date(from_date, "from_date")
+        to_date_parsed = parse_query_date(to_date, "to_date")
 
         ticker_parsed = ticker.strip().upper() if ticker else None
-        operations = await self.repository.get_operations(
+
+        cache_key = None
+        if self.result_cache is not None or self.single_flight is not None:
+            # The dataset version changes with every write, so stale results are never hit
+            cache_key = (
+                from_date_parsed,
+                to_date_parsed,
+                ticker_parsed,
+                ticker_match if ticker_parsed else None,
+                type_operation,
+                self.strategy_name if self.analyzer else None,
+                await self.repository.get_dataset_version(),
+            )
+        if self.result_cache is not None:
+            cached_result = self.result_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+
+        compute = partial(
+            self._compute_result,
             from_date_parsed,
             to_date_parsed,
-            type_operation=type_operation,
-            ticker=ticker_parsed,
+            type_operation,
+            ticker_parsed,
+            ticker_match,
+            cache_key,
         )
+        if self.single_flight is not None:
+            # Identical queries arriving while this one runs wait for its result
+            return await self.single_flight.run(cache_key, compute)
+        return await compute()
 
-        if self.analyzer:
-            return await self.analyzer.analyze(operations)
+    async def _compute_result(
+        self,
+        from_date_parsed: date,
+        to_date_parsed: date,
+        type_operation: tuple[HBTypeOperations, ...] | None,
+        ticker_parsed: str | None,
+        ticker_match: TickerMatches,
+        cache_key: Any,
+    ) -> Any:
+        """
+        Read and analyze the operations, storing the result in the cache.
+        """
+        if self.analyzer and self.analyzer.supports_frames():
+            # Only the analyzed columns are read, no Operation is built per row
+            frame = await self.repository.get_operations_frame(
+                from_date_parsed,
+                to_date_parsed,
+                type_operation=type_operation,
+                ticker=ticker_parsed,
+                ticker_match=ticker_match,
+            )
+            result = await self.analyzer.analyze_positions_frame(frame)
         else:
-            return operations
+            operations = await self.repository.get_operations(
+                from_date_parsed,
+                to_date_parsed,
+                type_operation=type_operation,
+                ticker=ticker_parsed,
+                ticker_match=ticker_match,
+            )
+            if self.analyzer:
+                result = await self.analyzer.analyze_positions(operations)
+            else:
+                result = operations
+
+        if self.result_cache is not None:
+            self.result_cache.set(cache_key, result)
+        return result
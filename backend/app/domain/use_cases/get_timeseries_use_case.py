@@ -0,0 +1,99 @@
+import datetime
+from typing import Any, Callable
+
+from app.domain.entities.entities import PortfolioTimeSeries
+from app.domain.interfaces.analyzers.downsampler_interface import (
+    DownsamplerInterface,
+)
+from app.domain.interfaces.caches.result_cache_interface import ResultCacheInterface
+from app.domain.interfaces.executors.task_executor_interface import (
+    TaskExecutorInterface,
+)
+from app.domain.interfaces.repositories.operations_repository_interface import (
+    OperationsRepositoryInterface,
+)
+from app.domain.use_cases.get_positions_use_case import parse_query_date
+from app.domain.use_cases.sync_lots_use_case import TRADING_TYPES
+
+
+class GetTimeSeriesUseCase:
+    """
+    This use case is responsible of getting the daily cash, invested and realized P&L curves
+    of the account. The curves of the whole history are built once per dataset version, every
+    request slices them by date and reduces them to the points asked for.
+    """
+
+    def __init__(
+        self,
+        repository: OperationsRepositoryInterface,
+        build_timeseries: Callable[[Any, Any], PortfolioTimeSeries],
+        downsampler: DownsamplerInterface,
+        result_cache: ResultCacheInterface | None = None,
+        task_executor: TaskExecutorInterface | None = None,
+    ):
+        """
+        Args:
+            build_timeseries: Builds the curves from the cash and trades frames of the
+                repository
+            downsampler: Selects the days kept when fewer points are asked for
+        """
+        self.repository = repository
+        self.build_timeseries = build_timeseries
+        self.downsampler = downsampler
+        self.result_cache = result_cache
+        self.task_executor = task_executor
+
+    async def execute(
+        self,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        points: int | None = None,
+    ) -> PortfolioTimeSeries:
+        """
+        Get the curves between the dates, the whole history when they are not given.
+        """
+        from_date_parsed = (
+            parse_query_date(from_date, "from_date") if from_date else None
+        )
+        to_date_parsed = parse_query_date(to_date, "to_date") if to_date else None
+
+        series = (await self.get_timeseries()).between(from_date_parsed, to_date_parsed)
+        if points is not None:
+            series = series.take(
+                self.downsampler.select_indices(
+                    range(len(series)),
+                    [series.cash, series.invested, series.realized_pnl],
+                    points,
+                )
+            )
+        return series
+
+    async def get_timeseries(self) -> PortfolioTimeSeries:
+        """
+        Get the curves of the current operations, built again once they change.
+        """
+        cache_key = ("timeseries", await self.repository.get_dataset_version())
+        if self.result_cache is not None:
+            cached_series = self.result_cache.get(cache_key)
+            if cached_series is not None:
+                return cached_series
+
+        cash_frame = await self.repository.get_cash_frame(
+            datetime.date.min, datetime.date.max
+        )
+        trades_frame = await self.repository.get_operations_frame(
+            datetime.date.min, datetime.date.max, type_operation=TRADING_TYPES
+        )
+        if self.task_executor is not None:
+            series = await self.task_executor.run(
+                "build_portfolio_timeseries",
+                self.build_timeseries,
+                cash_frame,
+                trades_frame,
+            )
+        else:
+            series = self.build_timeseries(cash_frame, trades_frame)
+
+        if self.result_cache is not None:
+            self.result_cache.set(cache_key, series)
+        return series
@@ -0,0 +1,243 @@
+import calendar
+import datetime
+import hashlib
+from collections import deque
+from dataclasses import replace
+from itertools import count
+from typing import Hashable
+
+from app.domain.entities.entities import (
+    LotSnapshot,
+    OpenLot,
+    Operation,
+    PositionsAnalysis,
+)
+from app.domain.entities.enums import TickerMatches
+from app.domain.interfaces.analyzers.strategies.trading_analyzer_strategy_interface import (
+    LotMatchingStrategyInterface,
+)
+from app.domain.interfaces.caches.result_cache_interface import ResultCacheInterface
+from app.domain.interfaces.repositories.lot_snapshots_repository_interface import (
+    LotSnapshotsRepositoryInterface,
+)
+from app.domain.interfaces.repositories.operations_repository_interface import (
+    OperationsRepositoryInterface,
+)
+from app.domain.use_cases.get_positions_use_case import (
+    matches_ticker,
+    parse_query_date,
+)
+from app.domain.use_cases.sync_lots_use_case import TRADING_TYPES
+
+
+def month_end(date: datetime.date) -> datetime.date:
+    return date.replace(day=calendar.monthrange(date.year, date.month)[1])
+
+
+class GetWindowPositionsUseCase:
+    """
+    This use case is responsible of analyzing a date window against the whole history, so lots
+    bought before the window are closed in FIFO order by the sells inside it.
+    The open lots of every month end are stored as snapshots built once per dataset version,
+    a window only replays the operations after the last snapshot before it. A new version only
+    rebuilds the snapshots from the first month whose operations changed.
+    """
+
+    def __init__(
+        self,
+        operations_repository: OperationsRepositoryInterface,
+        snapshots_repository: LotSnapshotsRepositoryInterface,
+        strategy: LotMatchingStrategyInterface,
+        result_cache: ResultCacheInterface | None = None,
+    ):
+        self.operations_repository = operations_repository
+        self.snapshots_repository = snapshots_repository
+        self.strategy = strategy
+        self.result_cache = result_cache
+
+    async def execute(
+        self,
+        from_date: str,
+        to_date: str,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> PositionsAnalysis:
+        """
+        Get the lots sold between the dates, whenever they were bought, and the lots still open
+        at `to_date`.
+        """
+        from_date_parsed = parse_query_date(from_date, "from_date")
+        to_date_parsed = parse_query_date(to_date, "to_date")
+        ticker_parsed = ticker.strip().upper() if ticker else None
+
+        dataset_version = await self.operations_repository.get_dataset_version()
+        cache_key: Hashable = (
+            "history",
+            from_date_parsed,
+            to_date_parsed,
+            ticker_parsed,
+            ticker_match if ticker_parsed else None,
+            dataset_version,
+        )
+        if self.result_cache is not None:
+            cached_result = self.result_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+
+        # While another request builds the snapshots the window replays the whole history
+        snapshot = (
+            await self.snapshots_repository.get_snapshot_before(from_date_parsed)
+            if await self.ensure_snapshots(dataset_version)
+            else None
+        )
+        # The lots are consumed by the replay, the snapshot is left as it was read
+        open_lots = self._group_by_ticker(
+            [
+                replace(lot)
+                for lot in (snapshot.open_lots if snapshot else [])
+                if matches_ticker(lot.ticker, ticker_parsed, ticker_match)
+            ]
+        )
+        operations = await self.operations_repository.get_operations(
+            (
+                snapshot.as_of + datetime.timedelta(days=1)
+                if snapshot
+                else datetime.date.min
+            ),
+            to_date_parsed,
+            type_operation=TRADING_TYPES,
+            ticker=ticker_parsed,
+            ticker_match=ticker_match,
+        )
+
+        # Sells before the window only consume lots, what they closed is left out
+        closed_operations = [
+            operation
+            for operation in self.strategy.match_operations(operations, open_lots)
+            if operation.date_liquidation.date() >= from_date_parsed
+        ]
+        for operation_id, operation in zip(count(1), closed_operations):
+            operation.id = operation_id
+        result = PositionsAnalysis(
+            closed_operations=closed_operations,
+            open_operations=self.strategy.build_open_operations(
+                open_lots, first_id=len(closed_operations) + 1
+            ),
+        )
+
+        if self.result_cache is not None:
+            self.result_cache.set(cache_key, result)
+        return result
+
+    async def ensure_snapshots(self, dataset_version: int | None = None) -> bool:
+        """
+        Build the snapshots when they were built from another version of the operations.
+        Requests finding them being built by another one do not wait for it.
+
+        Returns:
+            Whether the stored snapshots are built from the version
+        """
+        if dataset_version is None:
+            dataset_version = await self.operations_repository.get_dataset_version()
+        if await self.snapshots_repository.get_dataset_version() == dataset_version:
+            return True
+        async with self.snapshots_repository.rebuild_lock() as locked:
+            if not locked:
+                return False
+            if await self.snapshots_repository.get_dataset_version() != dataset_version:
+                await self.build_snapshots(dataset_version)
+            return True
+
+    async def build_snapshots(self, dataset_version: int) -> int:
+        """
+        Match the history month by month, taking the open lots at every month end. The months
+        before the first one whose operations changed keep their snapshots, the matching
+        starts from the last of them.
+
+        Returns:
+            Number of snapshots built
+        """
+        fingerprints = month_fingerprints(
+            await self.operations_repository.get_daily_fingerprints(TRADING_TYPES)
+        )
+        stored_fingerprints = await self.snapshots_repository.get_fingerprints()
+        changed_months = [
+            as_of
+            for as_of in fingerprints.keys() | stored_fingerprints.keys()
+            if fingerprints.get(as_of) != stored_fingerprints.get(as_of)
+        ]
+        if not changed_months:
+            await self.snapshots_repository.replace_snapshots(
+                [], dataset_version, datetime.date.max
+            )
+            return 0
+
+        first_changed = min(changed_months)
+        snapshot = await self.snapshots_repository.get_snapshot_before(first_changed)
+        operations = await self.operations_repository.get_operations(
+            (
+                snapshot.as_of + datetime.timedelta(days=1)
+                if snapshot
+                else datetime.date.min
+            ),
+            datetime.date.max,
+            type_operation=TRADING_TYPES,
+        )
+
+        # Months are matched in chronological order, each keeps the order of the repository
+        months: dict[datetime.date, list[Operation]] = {}
+        for operation in operations:
+            months.setdefault(month_end(_as_date(operation.date_operation)), []).append(
+                operation
+            )
+
+        open_lots = self._group_by_ticker(snapshot.open_lots if snapshot else [])
+        snapshots = []
+        for as_of in sorted(months):
+            self.strategy.match_operations(months[as_of], open_lots)
+            snapshots.append(
+                LotSnapshot(
+                    as_of=as_of,
+                    open_lots=[
+                        replace(lot)
+                        for lots in open_lots.values()
+                        for lot in lots
+                        if lot.amount > 0
+                    ],
+                    fingerprint=fingerprints.get(as_of, ""),
+                )
+            )
+
+        await self.snapshots_repository.replace_snapshots(
+            snapshots, dataset_version, first_changed
+        )
+        return len(snapshots)
+
+    def _group_by_ticker(
+        self, open_lots: list[OpenLot]
+    ) -> dict[str | None, deque[OpenLot]]:
+        grouped: dict[str | None, deque[OpenLot]] = {}
+        for lot in open_lots:
+            grouped.setdefault(lot.ticker, deque()).append(lot)
+        return grouped
+
+
+def month_fingerprints(
+    daily_fingerprints: dict[datetime.date, str],
+) -> dict[datetime.date, str]:
+    """
+    Combine the fingerprints of the days of every month, by month end.
+    """
+    months: dict[datetime.date, list[str]] = {}
+    for day in sorted(daily_fingerprints):
+        months.setdefault(month_end(day), []).append(
+            f"{day.isoformat()}={daily_fingerprints[day]}"
+        )
+    return {
+        as_of: hashlib.sha256("|".join(days).encode()).hexdigest()
+        for as_of, days in months.items()
+    }
+
+
+def _as_date(value: datetime.date) -> datetime.date:
+    return value.date() if isinstance(value, datetime.datetime) else value
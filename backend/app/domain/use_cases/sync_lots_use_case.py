@@ -0,0 +1,201 @@
+import asyncio
+import datetime
+import logging
+from collections import deque
+
+from app.domain.entities.entities import FifoWatermark, OpenLot, Operation
+from app.domain.entities.enums import HBTypeOperations
+from app.domain.interfaces.analyzers.strategies.trading_analyzer_strategy_interface import (
+    LotMatchingStrategyInterface,
+)
+from app.domain.interfaces.repositories.lots_repository_interface import (
+    LotsRepositoryInterface,
+)
+from app.domain.interfaces.repositories.operations_repository_interface import (
+    OperationsRepositoryInterface,
+)
+
+TRADING_TYPES = (
+    HBTypeOperations.BUY,
+    HBTypeOperations.SELL,
+    HBTypeOperations.SELL_PARITY,
+)
+
+
+def _as_date(value: datetime.date) -> datetime.date:
+    """Parsed operations carry datetimes while stored ones carry dates."""
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+
+class SyncLotsUseCase:
+    """
+    This use case is responsible of keeping the stored FIFO lots up to date.
+    New operations are matched against the stored open lots, and the lots are rebuilt from
+    the whole history only when they are missing or the new operations are not after the
+    last matched one. Reads never rebuild them: missing lots are rebuilt in the background.
+    """
+
+    def __init__(
+        self,
+        operations_repository: OperationsRepositoryInterface,
+        lots_repository: LotsRepositoryInterface,
+        strategy: LotMatchingStrategyInterface,
+    ):
+        self.operations_repository = operations_repository
+        self.lots_repository = lots_repository
+        self.strategy = strategy
+        self.logger = logging.getLogger(__name__)
+        self._rebuild_task: asyncio.Task | None = None
+        self._rebuild_requested = False
+
+    async def execute(self, new_operations: list[Operation] | None = None) -> int:
+        """
+        Args:
+            new_operations: Operations just created, if None the lots are only built when missing
+
+        Returns:
+            Number of closed lots added
+        """
+        async with self.lots_repository.sync_lock():
+            return await self._match_new_operations(new_operations)
+
+    async def rebuild(self) -> int:
+        """
+        Match the whole history again, replacing the stored lots.
+
+        Returns:
+            Number of closed lots stored
+        """
+        async with self.lots_repository.sync_lock():
+            return await self._rebuild()
+
+    async def invalidate(self) -> None:
+        """
+        Discard the stored lots and rebuild them from the whole history in the background.
+        A sync running meanwhile finishes before they are discarded, so it never leaves lots
+        matched from the history before the change.
+        """
+        async with self.lots_repository.sync_lock():
+            await self.lots_repository.reset()
+        self.start_rebuild()
+
+    async def ensure_built(self) -> bool:
+        """
+        Whether the stored lots can be read, checked without taking the lock. Missing lots are
+        rebuilt in the background and the caller reads the positions from elsewhere meanwhile.
+        """
+        if await self.lots_repository.get_watermark() is not None:
+            return True
+        self.start_rebuild()
+        return False
+
+    def start_rebuild(self) -> None:
+        """
+        Build the missing lots in the background, a rebuild asked for while another one runs
+        starts once it finishes.
+        """
+        self._rebuild_requested = True
+        if self._rebuild_task is None or self._rebuild_task.done():
+            self._rebuild_task = asyncio.create_task(self._run_rebuilds())
+
+    async def shutdown(self) -> None:
+        """
+        Cancel the background rebuild, the lots it did not store are rebuilt after a restart.
+        """
+        if self._rebuild_task is not None:
+            self._rebuild_task.cancel()
+            await asyncio.gather(self._rebuild_task, return_exceptions=True)
+
+    async def _run_rebuilds(self) -> None:
+        while self._rebuild_requested:
+            self._rebuild_requested = False
+            try:
+                # Another process may have built them while the rebuild waited for the lock
+                await self.execute()
+            except Exception as e:
+                self.logger.error(f"Lots rebuild failed: {str(e)}")
+
+    async def _match_new_operations(
+        self, new_operations: list[Operation] | None
+    ) -> int:
+        watermark = await self.lots_repository.get_watermark()
+        if watermark is None:
+            return await self._rebuild()
+
+        trading_operations = [
+            operation
+            for operation in new_operations or []
+            if operation.type_operation.type_operation in TRADING_TYPES
+        ]
+        if not trading_operations:
+            return 0
+
+        if any(
+            _as_date(operation.date_operation) <= watermark.last_date_operation
+            for operation in trading_operations
+        ):
+            # Older operations change the FIFO order of what was already matched
+            return await self._rebuild()
+
+        tickers = list({operation.ticket.ticker for operation in trading_operations})
+        open_lots = self._group_by_ticker(
+            await self.lots_repository.get_open_lots(tickers)
+        )
+        closed_operations = self.strategy.match_operations(
+            trading_operations, open_lots
+        )
+
+        await self.lots_repository.save_matching(
+            closed_operations=closed_operations,
+            open_lots=[lot for lots in open_lots.values() for lot in lots],
+            watermark=self._get_watermark(trading_operations),
+            tickers=tickers,
+        )
+        return len(closed_operations)
+
+    async def _rebuild(self) -> int:
+        operations = await self.operations_repository.get_operations(
+            datetime.date.min,
+            datetime.date.max,
+            type_operation=TRADING_TYPES,
+        )
+        if not operations:
+            # The watermark of an empty history marks the lots as built
+            await self.lots_repository.save_matching(
+                closed_operations=[],
+                open_lots=[],
+                watermark=FifoWatermark(
+                    last_operation_id=0, last_date_operation=datetime.date.min
+                ),
+            )
+            return 0
+
+        open_lots: dict[str | None, deque[OpenLot]] = {}
+        closed_operations = self.strategy.match_operations(operations, open_lots)
+
+        await self.lots_repository.save_matching(
+            closed_operations=closed_operations,
+            open_lots=[lot for lots in open_lots.values() for lot in lots],
+            watermark=self._get_watermark(operations),
+        )
+        return len(closed_operations)
+
+    def _group_by_ticker(
+        self, open_lots: list[OpenLot]
+    ) -> dict[str | None, deque[OpenLot]]:
+        grouped: dict[str | None, deque[OpenLot]] = {}
+        for lot in open_lots:
+            grouped.setdefault(lot.ticker, deque()).append(lot)
+        return grouped
+
+    def _get_watermark(self, operations: list[Operation]) -> FifoWatermark:
+        """
+        Operations are newest first, so the first one of the latest date is the last matched.
+        """
+        last_operation = max(
+            operations, key=lambda operation: _as_date(operation.date_operation)
+        )
+        return FifoWatermark(
+            last_operation_id=last_operation.id,
+            last_date_operation=_as_date(last_operation.date_operation),
+        )
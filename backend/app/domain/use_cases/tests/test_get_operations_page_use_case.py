@@ -0,0 +1,68 @@
+import pytest
+
+from app.domain.entities.enums import TickerMatches, TypeOfSort
+from app.domain.use_cases.get_operations_page_use_case import (
+    GetOperationsPageUseCase,
+)
+
+
+class InMemoryOperationsRepository:
+    """Operations repository paginating a list sorted by NUME, cursors hold the last NUME."""
+
+    def __init__(self, operations):
+        self.operations = operations
+
+    async def get_operations_page(
+        self, from_date, to_date, limit, sort, cursor, offset, **filters
+    ):
+        operations = sorted(
+            self.operations,
+            key=lambda operation: operation.id,
+            reverse=sort == TypeOfSort.DESCENDING,
+        )
+        if cursor is not None:
+            position = [operation.id for operation in operations].index(cursor.id)
+            operations = operations[position + 1 :]
+        return operations[offset : offset + limit]
+
+    async def count_operations(self, from_date, to_date, **filters):
+        return len(self.operations)
+
+
+@pytest.fixture
+def use_case(make_operation):
+    return GetOperationsPageUseCase(
+        InMemoryOperationsRepository([make_operation(id) for id in range(1, 6)])
+    )
+
+
+class TestGetOperationsPageUseCase:
+    """Test class for GetOperationsPageUseCase functionality."""
+
+    async def test_cursor_reads_next_page(self, use_case):
+        """Test that the cursor of a page reads the page after it with the same query."""
+        first = await use_case.execute("01/01/2024", "31/12/2024", limit=2)
+        second = await use_case.execute(
+            "01/01/2024", "31/12/2024", limit=2, cursor=first.next_cursor.to_token()
+        )
+
+        assert [operation.id for operation in second.operations] == [3, 4]
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"sort": TypeOfSort.DESCENDING},
+            {"ticker": "AAPL"},
+            {"ticker_match": TickerMatches.EXACT},
+            {"to_date": "30/06/2024"},
+        ],
+    )
+    async def test_cursor_of_another_query_is_rejected(self, use_case, changes):
+        """Test that a cursor can not be reused with another sort or other filters."""
+        first = await use_case.execute("01/01/2024", "31/12/2024", limit=2)
+        query = {"from_date": "01/01/2024", "to_date": "31/12/2024", **changes}
+
+        with pytest.raises(ValueError, match="another sort or other filters"):
+            await use_case.execute(
+                limit=2, cursor=first.next_cursor.to_token(), **query
+            )
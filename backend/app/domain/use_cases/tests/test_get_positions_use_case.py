@@ -0,0 +1,123 @@
+import asyncio
+import datetime
+
+import pytest
+
+from app.domain.entities.entities import PositionsAnalysis
+from app.domain.entities.enums import HBTypeOperations
+from app.domain.use_cases.get_positions_use_case import GetPositionsUseCase
+from app.infrastructure.caches.lru_result_cache import LruResultCache
+from app.infrastructure.caches.single_flight import SingleFlight
+
+
+class CountingOperationsRepository:
+    def __init__(self):
+        self.dataset_version = 0
+        self.get_operations_calls = 0
+
+    async def get_operations(
+        self, from_date, to_date, type_operation=None, ticker=None, ticker_match=None
+    ):
+        self.get_operations_calls += 1
+        return [(from_date, to_date, ticker)]
+
+    async def get_dataset_version(self) -> int:
+        return self.dataset_version
+
+
+class CountingAnalyzer:
+    def __init__(self):
+        self.calls = 0
+
+    def supports_frames(self) -> bool:
+        return False
+
+    async def analyze_positions(self, operations):
+        self.calls += 1
+        # Gives the concurrent callers the chance to arrive while the analysis runs
+        await asyncio.sleep(0.01)
+        return PositionsAnalysis(closed_operations=operations, open_operations=[])
+
+
+@pytest.fixture
+def repository():
+    return CountingOperationsRepository()
+
+
+@pytest.fixture
+def analyzer():
+    return CountingAnalyzer()
+
+
+@pytest.fixture
+def use_case(repository, analyzer):
+    return GetPositionsUseCase(
+        repository, analyzer, LruResultCache(max_bytes=1_000_000), "fifo"
+    )
+
+
+class TestGetPositionsUseCase:
+    """Test class for GetPositionsUseCase functionality."""
+
+    async def test_same_query_is_analyzed_once(self, use_case, repository, analyzer):
+        """Test that repeated queries, e.g. paging, reuse the cached analysis."""
+        first = await use_case.execute("01/01/2024", "31/12/2024", ticker=" aapl ")
+        second = await use_case.execute("01/01/2024", "31/12/2024", ticker="AAPL")
+
+        assert first is second
+        assert repository.get_operations_calls == 1
+        assert analyzer.calls == 1
+        assert first[0] == (
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 12, 31),
+            "AAPL",
+        )
+
+    async def test_other_filters_are_analyzed(self, use_case, analyzer):
+        """Test that each combination of filters has its own result."""
+        await use_case.execute("01/01/2024", "31/12/2024")
+        await use_case.execute("01/01/2024", "30/06/2024")
+        await use_case.execute(
+            "01/01/2024", "31/12/2024", type_operation=(HBTypeOperations.BUY,)
+        )
+
+        assert analyzer.calls == 3
+
+    async def test_new_dataset_version_is_analyzed(
+        self, use_case, repository, analyzer
+    ):
+        """Test that results are computed again once the operations change."""
+        await use_case.execute("01/01/2024", "31/12/2024")
+        repository.dataset_version += 1
+        await use_case.execute("01/01/2024", "31/12/2024")
+
+        assert analyzer.calls == 2
+
+    async def test_open_and_closed_positions_share_the_analysis(
+        self, use_case, analyzer
+    ):
+        """Test that closed and open positions of a query come from one analysis."""
+        closed = await use_case.execute("01/01/2024", "31/12/2024")
+        analysis = await use_case.analyze_positions("01/01/2024", "31/12/2024")
+
+        assert analysis.closed_operations is closed
+        assert analyzer.calls == 1
+
+    async def test_concurrent_queries_are_analyzed_once(self, repository, analyzer):
+        """Test that identical concurrent queries join the analysis in flight."""
+        single_flight = SingleFlight()
+        use_cases = [
+            GetPositionsUseCase(repository, analyzer, None, "fifo", single_flight)
+            for _ in range(3)
+        ]
+
+        results = await asyncio.gather(
+            use_cases[0].execute("01/01/2024", "31/12/2024", ticker="AAPL"),
+            use_cases[1].execute("01/01/2024", "31/12/2024", ticker=" aapl"),
+            use_cases[2].execute("01/01/2024", "30/06/2024", ticker="AAPL"),
+        )
+
+        assert results[0] is results[1]
+        assert analyzer.calls == 2
+        assert (single_flight.executions, single_flight.joins) == (2, 1)
+        assert single_flight.stats()["in_flight"] == 0
@@ -0,0 +1,213 @@
+import asyncio
+import contextlib
+import datetime
+
+import pytest
+
+from app.domain.entities.entities import (
+    LotSnapshot,
+    Operation,
+)
+from app.domain.entities.enums import HBTypeOperations
+from app.domain.use_cases.get_window_positions_use_case import (
+    GetWindowPositionsUseCase,
+)
+from app.infrastructure.analyzers.strategies.lot_queue_fifo_strategy import (
+    LotQueueFifoStrategy,
+)
+
+
+class InMemoryOperationsRepository:
+    """Operations repository keeping the history newest first, as the database export."""
+
+    def __init__(self, operations: list[Operation]):
+        self.operations = operations
+        self.reads: list[tuple[datetime.date, datetime.date]] = []
+        self.dataset_version = 1
+
+    async def get_operations(
+        self, from_date, to_date, type_operation=None, ticker=None, ticker_match=None
+    ):
+        self.reads.append((from_date, to_date))
+        return [
+            operation
+            for operation in self.operations
+            if from_date <= operation.date_operation <= to_date
+            and (ticker is None or ticker in operation.ticket.ticker)
+        ]
+
+    async def get_daily_fingerprints(self, type_operation=None):
+        days: dict[datetime.date, list[tuple]] = {}
+        for operation in self.operations:
+            days.setdefault(operation.date_operation, []).append(
+                (operation.id, operation.amount, operation.price_of_operation)
+            )
+        return {day: str(sorted(values)) for day, values in days.items()}
+
+    async def get_dataset_version(self) -> int:
+        return self.dataset_version
+
+
+class InMemoryLotSnapshotsRepository:
+    def __init__(self):
+        self.snapshots: list[LotSnapshot] = []
+        self.dataset_version: int | None = None
+        self.lock = asyncio.Lock()
+
+    async def get_dataset_version(self):
+        return self.dataset_version
+
+    async def get_snapshot_before(self, date):
+        earlier = [snapshot for snapshot in self.snapshots if snapshot.as_of < date]
+        return max(earlier, key=lambda snapshot: snapshot.as_of, default=None)
+
+    async def get_fingerprints(self):
+        return {snapshot.as_of: snapshot.fingerprint for snapshot in self.snapshots}
+
+    async def replace_snapshots(
+        self, snapshots, dataset_version, from_date=datetime.date.min
+    ):
+        kept = [snapshot for snapshot in self.snapshots if snapshot.as_of < from_date]
+        # A pause lets concurrent rebuilds overlap when they are not serialized
+        await asyncio.sleep(0)
+        self.snapshots = kept + snapshots
+        self.dataset_version = dataset_version
+
+    @contextlib.asynccontextmanager
+    async def rebuild_lock(self):
+        if self.lock.locked():
+            yield False
+            return
+        async with self.lock:
+            yield True
+
+
+@pytest.fixture
+def operations_repository(make_operation):
+    return InMemoryOperationsRepository(
+        [
+            make_operation(
+                5, HBTypeOperations.BUY, datetime.date(2024, 3, 20), 5, 30.0
+            ),
+            make_operation(
+                4, HBTypeOperations.SELL, datetime.date(2024, 3, 10), 3, 25.0
+            ),
+            make_operation(
+                3, HBTypeOperations.SELL, datetime.date(2024, 2, 10), 4, 20.0
+            ),
+            make_operation(
+                2, HBTypeOperations.BUY, datetime.date(2024, 1, 20), 2, 12.0
+            ),
+            make_operation(
+                1, HBTypeOperations.BUY, datetime.date(2024, 1, 10), 4, 10.0
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def use_case(operations_repository):
+    return GetWindowPositionsUseCase(
+        operations_repository, InMemoryLotSnapshotsRepository(), LotQueueFifoStrategy()
+    )
+
+
+class TestGetWindowPositionsUseCase:
+    async def test_window_closes_lots_bought_before(
+        self, use_case, operations_repository
+    ):
+        """Test that the sells of the window close the lots left by the earlier months."""
+        analysis = await use_case.execute("01/03/2024", "31/03/2024")
+
+        closed = [
+            (operation.date_operation.date(), operation.amount, operation.buy_price)
+            for operation in analysis.closed_operations
+        ]
+        opened = [
+            (operation.date_operation.date(), operation.amount)
+            for operation in analysis.open_operations
+        ]
+        assert closed == [(datetime.date(2024, 1, 20), 2, 12.0)]
+        assert opened == [(datetime.date(2024, 3, 20), 5)]
+        # Only the operations after the February snapshot were replayed
+        assert operations_repository.reads[-1] == (
+            datetime.date(2024, 3, 1),
+            datetime.date(2024, 3, 31),
+        )
+
+    async def test_snapshots_are_built_once(self, use_case, operations_repository):
+        """Test that the month end snapshots hold the open lots and are reused."""
+        await use_case.execute("01/02/2024", "29/02/2024")
+        await use_case.execute("01/03/2024", "31/03/2024")
+
+        snapshots = use_case.snapshots_repository.snapshots
+        assert [snapshot.as_of for snapshot in snapshots] == [
+            datetime.date(2024, 1, 31),
+            datetime.date(2024, 2, 29),
+            datetime.date(2024, 3, 31),
+        ]
+        assert [(lot.operation_id, lot.amount) for lot in snapshots[1].open_lots] == [
+            (2, 2)
+        ]
+        full_history_reads = [
+            read
+            for read in operations_repository.reads
+            if read[0] == datetime.date.min and read[1] == datetime.date.max
+        ]
+        assert len(full_history_reads) == 1
+
+    async def test_snapshots_rebuilt_from_changed_month(
+        self, use_case, operations_repository, make_operation
+    ):
+        """Test that a new version only replays the months from the first one that changed."""
+        await use_case.ensure_snapshots()
+        january, february, _ = use_case.snapshots_repository.snapshots
+
+        operations_repository.operations.insert(
+            0,
+            make_operation(
+                6, HBTypeOperations.SELL, datetime.date(2024, 3, 25), 5, 40.0
+            ),
+        )
+        operations_repository.dataset_version = 2
+        assert await use_case.ensure_snapshots()
+
+        snapshots = use_case.snapshots_repository.snapshots
+        assert snapshots[:2] == [january, february]
+        assert operations_repository.reads[-1] == (
+            datetime.date(2024, 3, 1),
+            datetime.date.max,
+        )
+        assert snapshots[2].open_lots == []
+        assert use_case.snapshots_repository.dataset_version == 2
+
+    async def test_unchanged_trades_keep_snapshots(
+        self, use_case, operations_repository
+    ):
+        """Test that a version without changed months only marks the snapshots as current."""
+        await use_case.ensure_snapshots()
+        reads = len(operations_repository.reads)
+
+        operations_repository.dataset_version = 2
+
+        assert await use_case.ensure_snapshots()
+        assert len(operations_repository.reads) == reads
+        assert len(use_case.snapshots_repository.snapshots) == 3
+        assert use_case.snapshots_repository.dataset_version == 2
+
+    async def test_concurrent_requests_build_once(
+        self, use_case, operations_repository
+    ):
+        """Test that requests finding the snapshots being built replay the history instead."""
+        results = await asyncio.gather(
+            *(use_case.execute("01/03/2024", "31/03/2024") for _ in range(3))
+        )
+
+        full_history_reads = [
+            read for read in operations_repository.reads if read[0] == datetime.date.min
+        ]
+        # The rebuild and the two requests that did not wait for it
+        assert len(full_history_reads) == 3
+        closed = [result.closed_operations for result in results]
+        assert closed[1:] == closed[:-1]
+        assert use_case.snapshots_repository.dataset_version == 1
@@ -0,0 +1,275 @@
+import asyncio
+import contextlib
+import copy
+import datetime
+
+import pytest
+
+from app.domain.entities.entities import (
+    FifoWatermark,
+    OpenLot,
+    Operation,
+    OperationsAnalyzed,
+)
+from app.domain.entities.enums import HBTypeOperations
+from app.domain.use_cases.delete_positions_use_case import DeletePositionsUseCase
+from app.domain.use_cases.sync_lots_use_case import SyncLotsUseCase
+from app.infrastructure.analyzers.strategies.lot_queue_fifo_strategy import (
+    LotQueueFifoStrategy,
+)
+
+
+class InMemoryOperationsRepository:
+    """Operations repository keeping the history newest first, as the database export."""
+
+    def __init__(self):
+        self.operations: list[Operation] = []
+
+    async def create_operations(self, operations: list[Operation]) -> int:
+        self.operations = operations + self.operations
+        return len(operations)
+
+    async def get_operations(
+        self, from_date, to_date, type_operation=None, ticker=None
+    ):
+        return [
+            operation
+            for operation in self.operations
+            if type_operation is None
+            or operation.type_operation.type_operation in type_operation
+        ]
+
+    async def delete_operations(self, id=None, ticker=None, type_operation=None):
+        kept = [operation for operation in self.operations if operation.id not in id]
+        deleted_count = len(self.operations) - len(kept)
+        self.operations = kept
+        return deleted_count
+
+
+class InMemoryLotsRepository:
+    def __init__(self):
+        self.watermark: FifoWatermark | None = None
+        self.open_lots: list[OpenLot] = []
+        self.closed_lots: list[OperationsAnalyzed] = []
+        self.rebuilds = 0
+        self.lock = asyncio.Lock()
+
+    async def get_watermark(self):
+        return self.watermark
+
+    async def get_open_lots(self, tickers=None):
+        return [
+            copy.copy(lot)
+            for lot in self.open_lots
+            if tickers is None or lot.ticker in tickers
+        ]
+
+    async def save_matching(
+        self, closed_operations, open_lots, watermark, tickers=None
+    ):
+        if tickers is None:
+            self.rebuilds += 1
+            self.closed_lots = []
+            self.open_lots = []
+        self.open_lots = [
+            lot for lot in self.open_lots if lot.ticker not in (tickers or [])
+        ] + [lot for lot in open_lots if lot.amount > 0]
+        self.closed_lots += closed_operations
+        self.watermark = watermark
+
+    @contextlib.asynccontextmanager
+    async def sync_lock(self):
+        async with self.lock:
+            yield
+
+    async def reset(self):
+        self.watermark = None
+        self.open_lots = []
+        self.closed_lots = []
+
+
+@pytest.fixture
+def operations_repository():
+    return InMemoryOperationsRepository()
+
+
+@pytest.fixture
+def lots_repository():
+    return InMemoryLotsRepository()
+
+
+@pytest.fixture
+def use_case(operations_repository, lots_repository):
+    return SyncLotsUseCase(
+        operations_repository, lots_repository, LotQueueFifoStrategy()
+    )
+
+
+def _lots_summary(lots_repository: InMemoryLotsRepository):
+    closed = sorted(
+        (op.ticker, op.date_operation, op.date_liquidation, op.amount, op.buy_price)
+        for op in lots_repository.closed_lots
+    )
+    open_lots = sorted(
+        (lot.ticker, lot.operation_id, lot.amount) for lot in lots_repository.open_lots
+    )
+    return closed, open_lots
+
+
+class TestSyncLotsUseCase:
+    """Test class for SyncLotsUseCase functionality."""
+
+    async def test_incremental_matching_equals_rebuild(
+        self, make_operation, use_case, operations_repository, lots_repository
+    ):
+        """Test that matching uploads one by one gives the same lots as a full replay."""
+        uploads = [
+            [
+                make_operation(
+                    2, HBTypeOperations.BUY, datetime.date(2024, 1, 20), 100, 2.0
+                ),
+                make_operation(
+                    1, HBTypeOperations.BUY, datetime.date(2024, 1, 15), 100, 1.0
+                ),
+            ],
+            [
+                make_operation(
+                    4,
+                    HBTypeOperations.BUY,
+                    datetime.date(2024, 2, 20),
+                    50,
+                    1.0,
+                    ticker="MSFT",
+                ),
+                make_operation(
+                    3, HBTypeOperations.SELL, datetime.date(2024, 2, 15), -150, 3.0
+                ),
+            ],
+            [
+                make_operation(
+                    6, HBTypeOperations.SELL, datetime.date(2024, 3, 10), -30, 4.0
+                ),
+                make_operation(
+                    5, HBTypeOperations.DIVIDEND, datetime.date(2024, 3, 1), 0, 0.0
+                ),
+            ],
+        ]
+
+        for operations in uploads:
+            await operations_repository.create_operations(operations)
+            await use_case.execute(operations)
+
+        assert lots_repository.rebuilds == 1
+        assert lots_repository.watermark == FifoWatermark(
+            last_operation_id=6, last_date_operation=datetime.date(2024, 3, 10)
+        )
+        incremental = _lots_summary(lots_repository)
+
+        await use_case.rebuild()
+        assert _lots_summary(lots_repository) == incremental
+        assert incremental[1] == [("AAPL", 2, 20), ("MSFT", 4, 50)]
+
+    async def test_older_operations_trigger_rebuild(
+        self, make_operation, use_case, operations_repository, lots_repository
+    ):
+        """Test that operations dated before the watermark rebuild the lots."""
+        first_upload = [
+            make_operation(
+                2, HBTypeOperations.SELL, datetime.date(2024, 2, 15), -100, 3.0
+            ),
+            make_operation(
+                1, HBTypeOperations.BUY, datetime.date(2024, 1, 20), 100, 2.0
+            ),
+        ]
+        await operations_repository.create_operations(first_upload)
+        await use_case.execute(first_upload)
+
+        backfill = [
+            make_operation(
+                0, HBTypeOperations.BUY, datetime.date(2024, 1, 10), 100, 1.0
+            )
+        ]
+        await operations_repository.create_operations(backfill)
+        await use_case.execute(backfill)
+
+        assert lots_repository.rebuilds == 2
+        closed, open_lots = _lots_summary(lots_repository)
+        assert [op[4] for op in closed] == [1.0]
+        assert open_lots == [("AAPL", 1, 100)]
+
+    async def test_lots_are_built_when_missing(
+        self, make_operation, use_case, operations_repository, lots_repository
+    ):
+        """Test that executing without new operations only builds missing lots."""
+        await operations_repository.create_operations(
+            [
+                make_operation(
+                    1, HBTypeOperations.BUY, datetime.date(2024, 1, 20), 100, 2.0
+                )
+            ]
+        )
+
+        await use_case.execute()
+        await use_case.execute()
+
+        assert lots_repository.rebuilds == 1
+        assert [lot.amount for lot in lots_repository.open_lots] == [100]
+
+    async def test_delete_waits_for_the_running_sync(
+        self, make_operation, use_case, operations_repository, lots_repository
+    ):
+        """Test that a sync reading the history before a delete cannot leave its lots after it."""
+        await operations_repository.create_operations(
+            [
+                make_operation(
+                    2, HBTypeOperations.SELL, datetime.date(2024, 1, 20), -10, 2.0
+                ),
+                make_operation(
+                    1, HBTypeOperations.BUY, datetime.date(2024, 1, 10), 10, 1.0
+                ),
+            ]
+        )
+        history_read, release_sync = asyncio.Event(), asyncio.Event()
+        get_operations = operations_repository.get_operations
+
+        async def get_operations_slowly(*args, **kwargs):
+            operations = await get_operations(*args, **kwargs)
+            history_read.set()
+            await release_sync.wait()
+            return operations
+
+        operations_repository.get_operations = get_operations_slowly
+        sync = asyncio.create_task(use_case.rebuild())
+        await history_read.wait()
+        delete = asyncio.create_task(
+            DeletePositionsUseCase(operations_repository, use_case).execute(id=[2])
+        )
+        await asyncio.sleep(0)
+        release_sync.set()
+        await asyncio.gather(sync, delete)
+        await use_case._rebuild_task
+
+        closed, open_lots = _lots_summary(lots_repository)
+        assert closed == []
+        assert open_lots == [("AAPL", 1, 10)]
+        assert lots_repository.watermark.last_operation_id == 1
+
+    async def test_missing_lots_are_built_in_the_background(
+        self, make_operation, use_case, operations_repository, lots_repository
+    ):
+        """Test that reads never build the lots, a background rebuild does it once."""
+        await operations_repository.create_operations(
+            [
+                make_operation(
+                    1, HBTypeOperations.BUY, datetime.date(2024, 1, 20), 100, 2.0
+                )
+            ]
+        )
+
+        assert not await use_case.ensure_built()
+        assert not await use_case.ensure_built()
+        assert lots_repository.rebuilds == 0
+        await use_case._rebuild_task
+
+        assert await use_case.ensure_built()
+        assert lots_repository.rebuilds == 1
@@ -0,0 +1,49 @@
+from io import BytesIO
+
+from fastapi import UploadFile
+
+from app.domain.entities.entities import IngestResult
+from app.domain.use_cases.treat_csv_use_case import TreatCsvUseCase
+
+
+class StoringRepository:
+    async def is_file_ingested(self, content_hash):
+        return False
+
+    async def create_operations(self, operations, on_conflict, content_hash):
+        return IngestResult(inserted=len(operations))
+
+
+class ParsedOperationsParser:
+    def __init__(self, operations):
+        self.operations = operations
+
+    def parse(self, csv_file):
+        return self.operations
+
+
+class FailingSyncLotsUseCase:
+    def __init__(self):
+        self.invalidations = 0
+
+    async def execute(self, new_operations=None):
+        raise RuntimeError("connection lost")
+
+    async def invalidate(self):
+        self.invalidations += 1
+
+
+class TestTreatCsvUseCase:
+    async def test_failed_lots_sync_keeps_stored_upload(self, make_operation):
+        """Test that a failed lots sync discards the lots instead of failing a stored upload."""
+        sync_lots_use_case = FailingSyncLotsUseCase()
+        use_case = TreatCsvUseCase(
+            StoringRepository(),
+            ParsedOperationsParser([make_operation(1)]),
+            sync_lots_use_case,
+        )
+
+        result = await use_case.execute(UploadFile(BytesIO(b"content")))
+
+        assert result.inserted == 1
+        assert sync_lots_use_case.invalidations == 1
@@ -1,7 +1,21 @@
+import hashlib
+import logging
+from io import BytesIO
+from typing import AsyncIterator
+
+from app.domain.entities.entities import IngestJob, IngestResult, Operation
+from app.domain.entities.enums import ConflictModes
+from app.domain.interfaces.caches.result_cache_interface import ResultCacheInterface
+from app.domain.interfaces.executors.task_executor_interface import (
+    TaskExecutorInterface,
+)
 from app.domain.interfaces.parsers.csv_parser_interface import CsvParserInterface
 from app.domain.interfaces.repositories.operations_repository_interface import (
     OperationsRepositoryInterface,
 )
+from app.domain.use_cases.sync_lots_use_case import SyncLotsUseCase
+
+HASH_BLOCK_SIZE = 1024 * 1024
 
 
 class TreatCsvUseCase:
@@ -10,19 +24,134 @@ class TreatCsvUseCase:
     """
 
     def __init__(
-        self, repository: OperationsRepositoryInterface, csv_parser: CsvParserInterface
+        self,
+        repository: OperationsRepositoryInterface,
+        csv_parser: CsvParserInterface,
+        sync_lots_use_case: SyncLotsUseCase | None = None,
+        task_executor: TaskExecutorInterface | None = None,
+        result_cache: ResultCacheInterface | None = None,
     ):
         self.repository = repository
         self.csv_parser = csv_parser
+        self.sync_lots_use_case = sync_lots_use_case
+        self.task_executor = task_executor
+        self.result_cache = result_cache
+        self.logger = logging.getLogger(__name__)
 
-    async def execute(self, csv_file):
+    async def execute(
+        self, csv_file, on_conflict: ConflictModes = ConflictModes.REJECT
+    ) -> IngestResult:
         try:
-            operations = self.csv_parser.parse(csv_file)
-            operations_created = await self.repository.create_operations(operations)
-            return operations_created
+            content_hash = await self._hash_file(csv_file)
+            if await self.repository.is_file_ingested(content_hash):
+                return IngestResult(already_ingested=True)
+
+            if self.task_executor:
+                # The content is read here so the parser gets a picklable file in the pool
+                csv_content = BytesIO(await csv_file.read())
+                operations = await self.task_executor.run(
+                    "parse_csv", self.csv_parser.parse, csv_content
+                )
+            else:
+                operations = self.csv_parser.parse(csv_file)
+            result = await self.repository.create_operations(
+                operations, on_conflict, content_hash
+            )
+            await self._refresh_results(result, operations)
+            return result
         except ValueError as e:
             # Re-raise ValueError with more context
             raise ValueError(f"CSV processing failed: {str(e)}")
         except Exception as e:
             # Handle any other unexpected errors
             raise ValueError(f"Unexpected error processing CSV file: {str(e)}")
+
+    async def execute_streaming(
+        self,
+        csv_file,
+        chunk_size: int,
+        on_conflict: ConflictModes = ConflictModes.REJECT,
+        job: IngestJob | None = None,
+    ) -> IngestResult:
+        """
+        Save the csv file chunk by chunk, each chunk is parsed and stored before the next one is
+        read so the memory used does not depend on the size of the file.
+        The stored lots are discarded instead of matched, they are rebuilt in the background.
+
+        Args:
+            job: Background job of the upload, its progress is updated after each chunk
+        """
+        try:
+            content_hash = await self._hash_file(csv_file)
+            if await self.repository.is_file_ingested(content_hash):
+                return IngestResult(already_ingested=True)
+
+            result = await self.repository.create_operations_in_chunks(
+                self._parse_chunks(csv_file, chunk_size, job), on_conflict, content_hash
+            )
+            await self._refresh_results(result)
+            return result
+        except ValueError as e:
+            raise ValueError(f"CSV processing failed: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Unexpected error processing CSV file: {str(e)}")
+
+    async def _refresh_results(
+        self, result: IngestResult, operations: list[Operation] | None = None
+    ) -> None:
+        """
+        Discard the cached results and bring the stored lots up to date. The lots are matched
+        incrementally only when every operation is new, otherwise they are discarded and
+        rebuilt in the background.
+
+        The operations are already committed, so a failed sync does not fail the upload: the
+        lots are discarded to be rebuilt in the background, otherwise a retried upload would
+        store nothing and the lots would stay behind the operations.
+        """
+        if not result.operations_stored:
+            return
+        if self.result_cache is not None:
+            self.result_cache.clear()
+        if not self.sync_lots_use_case:
+            return
+        try:
+            if operations is not None and not result.updated and not result.skipped:
+                await self.sync_lots_use_case.execute(operations)
+            else:
+                await self.sync_lots_use_case.invalidate()
+        except Exception as e:
+            self.logger.error(
+                f"Lots sync failed after storing the operations: {str(e)}"
+            )
+            try:
+                await self.sync_lots_use_case.invalidate()
+            except Exception as e:
+                self.logger.error(f"Stored lots could not be discarded: {str(e)}")
+
+    async def _hash_file(self, csv_file) -> str:
+        """
+        Hash the content of the file in blocks, leaving it ready to be read again.
+        """
+        content_hash = hashlib.sha256()
+        while block := await csv_file.read(HASH_BLOCK_SIZE):
+            content_hash.update(block)
+        await csv_file.seek(0)
+        return content_hash.hexdigest()
+
+    async def _parse_chunks(
+        self, csv_file, chunk_size: int, job: IngestJob | None = None
+    ) -> AsyncIterator[list[Operation]]:
+        for chunk in self.csv_parser.split_chunks(csv_file, chunk_size):
+            if self.task_executor:
+                operations = await self.task_executor.run(
+                    "parse_csv_chunk", self.csv_parser.parse, chunk
+                )
+            else:
+                operations = self.csv_parser.parse(chunk)
+
+            if job is not None:
+                job.rows_parsed += len(operations)
+            yield operations
+            # The repository asks for the next chunk once this one is written
+            if job is not None:
+                job.rows_written += len(operations)
@@ -1,10 +1,23 @@
-from app.domain.entities.entities import Operation, OperationsAnalyzed
+import asyncio
+from collections.abc import Sequence
+
+import pandas as pd
+
+from app.domain.entities.entities import (
+    Operation,
+    OperationsAnalyzed,
+    PositionsAnalysis,
+)
 from app.domain.interfaces.analyzers.strategies.trading_analyzer_strategy_interface import (
+    FrameTradingAnalyzerStrategyInterface,
     TradingAnalyzerStrategyInterface,
 )
 from app.domain.interfaces.analyzers.trading_analyzer_interface import (
     TradingAnalyzerInterface,
 )
+from app.domain.interfaces.executors.task_executor_interface import (
+    TaskExecutorInterface,
+)
 
 
 class AnalyzerHomeBrokerData(TradingAnalyzerInterface):
@@ -12,13 +25,84 @@ class AnalyzerHomeBrokerData(TradingAnalyzerInterface):
     Analyze data of dataset which was stored in the data-lake.
     """
 
-    def __init__(self, strategy: TradingAnalyzerStrategyInterface | None):
+    def __init__(
+        self,
+        strategy: TradingAnalyzerStrategyInterface | None,
+        task_executor: TaskExecutorInterface | None = None,
+    ):
         self.strategy = strategy
+        self.task_executor = task_executor
+
+    async def analyze(
+        self, operations: list[Operation]
+    ) -> Sequence[OperationsAnalyzed]:
+        analysis = await self.analyze_positions(operations)
+        return analysis.closed_operations
+
+    async def analyze_positions(self, operations: list[Operation]) -> PositionsAnalysis:
+        """
+        Run the strategy once and keep both the closed and the open lots.
+        """
+        if self.task_executor:
+            closed_operations, open_operations = await self.task_executor.run(
+                f"run_strategy:{type(self.strategy).__name__}",
+                run_strategy,
+                self.strategy,
+                operations,
+            )
+        else:
+            closed_operations, open_operations = await self.strategy.run_strategy(
+                operations
+            )
+
+        return PositionsAnalysis(
+            closed_operations=closed_operations, open_operations=open_operations
+        )
+
+    def supports_frames(self) -> bool:
+        return isinstance(self.strategy, FrameTradingAnalyzerStrategyInterface)
 
-    async def analyze(self, operations: list[Operation]) -> list[OperationsAnalyzed]:
-        
-        closed_operations, open_operations = await self.strategy.run_strategy(
-            operations
+    async def analyze_positions_frame(self, frame: pd.DataFrame) -> PositionsAnalysis:
+        """
+        Run the strategy once over the columns of the operations and keep both the closed
+        and the open lots.
+        """
+        if not self.supports_frames():
+            raise ValueError(
+                f"Strategy {type(self.strategy).__name__} can not analyze DataFrames"
+            )
+
+        if self.task_executor:
+            closed_operations, open_operations = await self.task_executor.run(
+                f"run_strategy_on_frame:{type(self.strategy).__name__}",
+                run_strategy_on_frame,
+                self.strategy,
+                frame,
+            )
+        else:
+            closed_operations, open_operations = (
+                await self.strategy.run_strategy_on_frame(frame)
+            )
+
+        return PositionsAnalysis(
+            closed_operations=closed_operations, open_operations=open_operations
         )
 
-        return closed_operations
+
+def run_strategy(
+    strategy: TradingAnalyzerStrategyInterface, operations: list[Operation]
+) -> tuple[Sequence[OperationsAnalyzed], Sequence[OperationsAnalyzed]]:
+    """
+    Run the strategy synchronously, the strategies do not await anything so a worker
+    can run them in its own event loop.
+    """
+    return asyncio.run(strategy.run_strategy(operations))
+
+
+def run_strategy_on_frame(
+    strategy: FrameTradingAnalyzerStrategyInterface, frame: pd.DataFrame
+) -> tuple[Sequence[OperationsAnalyzed], Sequence[OperationsAnalyzed]]:
+    """
+    Run the strategy over a DataFrame synchronously, like run_strategy.
+    """
+    return asyncio.run(strategy.run_strategy_on_frame(frame))
@@ -0,0 +1,105 @@
+from typing import Sequence
+
+import numpy as np
+
+from app.domain.entities.enums import DownsamplingMethods
+from app.domain.interfaces.analyzers.downsampler_interface import (
+    DownsamplerInterface,
+)
+
+
+class Downsampler(DownsamplerInterface):
+    """
+    Downsampler sharing the points among the curves of a series: each curve selects its own
+    positions with the method and the series keeps all of them, so a peak of any curve is
+    kept for every curve.
+    """
+
+    def __init__(self, method: DownsamplingMethods = DownsamplingMethods.LTTB):
+        self.method = method
+
+    def select_indices(
+        self, x: Sequence[float], curves: Sequence[Sequence[float]], points: int
+    ) -> list[int]:
+        size = len(x)
+        if points >= size:
+            return list(range(size))
+
+        x_values = np.asarray(x, dtype=np.float64)
+        points_per_curve = points // max(len(curves), 1)
+        if points_per_curve < 3:
+            return even_indices(size, points).tolist()
+
+        selected = [
+            (
+                lttb_indices(
+                    x_values, np.asarray(y, dtype=np.float64), points_per_curve
+                )
+                if self.method == DownsamplingMethods.LTTB
+                else min_max_indices(np.asarray(y, dtype=np.float64), points_per_curve)
+            )
+            for y in curves
+        ]
+        return np.unique(np.concatenate(selected)).tolist()
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: keep the first and last points and, from each bucket in
+    between, the point forming the largest triangle with the point kept before it and the
+    average of the next bucket.
+    """
+    size = len(y)
+    if points >= size:
+        return np.arange(size)
+    if points < 3:
+        return even_indices(size, points)
+
+    # points - 2 buckets over the positions between the first and the last one
+    edges = np.linspace(1, size - 1, points - 1).astype(np.int64)
+    next_edges = np.append(edges[1:], size)
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, size - 1
+
+    previous = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start, next_end = next_edges[bucket], next_edges[bucket + 1]
+        average_x = x[next_start:next_end].mean()
+        average_y = y[next_start:next_end].mean()
+        # Twice the area of the triangles, the factor does not change the largest
+        areas = np.abs(
+            (x[previous] - average_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (average_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def min_max_indices(y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Keep the first and last points and the lowest and highest point of each bucket of
+    consecutive positions, in their original order.
+    """
+    size = len(y)
+    if points >= size:
+        return np.arange(size)
+    if points < 4:
+        return even_indices(size, points)
+
+    buckets = (points - 2) // 2
+    bucket_of = np.arange(size) * buckets // size
+    # Sorted by bucket and value, the first and last position of each bucket are its extremes
+    order = np.lexsort((y, bucket_of))
+    starts = np.searchsorted(bucket_of[order], np.arange(buckets))
+    ends = np.append(starts[1:], size) - 1
+    return np.unique(np.concatenate(([0, size - 1], order[starts], order[ends])))
+
+
+def even_indices(size: int, points: int) -> np.ndarray:
+    """
+    Positions spread evenly from the first to the last one, used when too few points are asked
+    for the methods to choose among.
+    """
+    return np.unique(np.linspace(0, size - 1, max(points, 1)).round().astype(np.int64))
@@ -0,0 +1,192 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+import numpy as np
+import pandas as pd
+
+from app.domain.entities.entities import OperationsAnalyzed, RealizedPnlSeries
+
+OPERATIONS_ANALYZED_COLUMNS = [
+    "id",
+    "ticker",
+    "amount",
+    "date_operation",
+    "date_liquidation",
+    "buy_price",
+    "sell_price",
+    "inverted_amount",
+    "current_amount",
+    "percentage_gain",
+    "nominal_gain",
+    "tna",
+]
+
+DATE_COLUMNS = ["date_operation", "date_liquidation"]
+
+FLOAT_COLUMNS = [
+    "buy_price",
+    "sell_price",
+    "inverted_amount",
+    "current_amount",
+    "percentage_gain",
+    "nominal_gain",
+    "tna",
+]
+
+
+class OperationsAnalyzedResultSet(Sequence[OperationsAnalyzed]):
+    """
+    Analyzed operations stored by column in a DataFrame with the OperationsAnalyzed columns.
+    Slicing, sorting and formatting work on whole columns, OperationsAnalyzed instances are
+    only created when single rows are accessed or iterated.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+
+    @classmethod
+    def from_operations(
+        cls, operations: Iterable[OperationsAnalyzed]
+    ) -> "OperationsAnalyzedResultSet":
+        """
+        Build a result set from OperationsAnalyzed instances, result sets are returned as is.
+        """
+        if isinstance(operations, cls):
+            return operations
+
+        operations = list(operations)
+        frame = pd.DataFrame(
+            {
+                column: [getattr(operation, column) for operation in operations]
+                for column in OPERATIONS_ANALYZED_COLUMNS
+            },
+            columns=OPERATIONS_ANALYZED_COLUMNS,
+        )
+        for column in DATE_COLUMNS:
+            frame[column] = pd.to_datetime(frame[column])
+        return cls(frame)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @overload
+    def __getitem__(self, index: int) -> OperationsAnalyzed: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "OperationsAnalyzedResultSet": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OperationsAnalyzedResultSet(self.frame.iloc[index])
+        return _to_operation(next(self.frame.iloc[[index]].itertuples(index=False)))
+
+    def __iter__(self) -> Iterator[OperationsAnalyzed]:
+        return (_to_operation(row) for row in self.frame.itertuples(index=False))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            operation == other_operation
+            for operation, other_operation in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __sizeof__(self) -> int:
+        # Used by sys.getsizeof, so caches account for the memory of the columns
+        return object.__sizeof__(self) + int(self.frame.memory_usage(deep=True).sum())
+
+    def sort_by(
+        self, columns: str | list[str], ascending: bool = True
+    ) -> "OperationsAnalyzedResultSet":
+        """
+        Sort by the given columns, rows with equal values keep their order.
+        """
+        return OperationsAnalyzedResultSet(
+            self.frame.sort_values(
+                columns, ascending=ascending, kind="stable", na_position="last"
+            )
+        )
+
+    def page(self, offset: int, limit: int) -> "OperationsAnalyzedResultSet":
+        return self[offset : offset + limit]
+
+    def to_formatted_records(self) -> list[dict[str, Any]]:
+        """
+        Convert to dictionaries with the same values as OperationsAnalyzed.to_formatted_dict,
+        rounding and formatting whole columns at once.
+        """
+        columns: dict[str, list] = {
+            "id": self.frame["id"].to_numpy(dtype=np.int64).tolist(),
+            "ticker": self.frame["ticker"].tolist(),
+            "amount": self.frame["amount"].to_numpy(dtype=np.int64).tolist(),
+        }
+        for column in DATE_COLUMNS:
+            columns[column] = _format_dates(self.frame[column])
+        for column in FLOAT_COLUMNS:
+            columns[column] = (
+                self.frame[column].to_numpy(dtype=np.float64).round(2).tolist()
+            )
+
+        keys = OPERATIONS_ANALYZED_COLUMNS
+        return [
+            dict(zip(keys, row)) for row in zip(*(columns[column] for column in keys))
+        ]
+
+    def to_operations(self) -> list[OperationsAnalyzed]:
+        return list(self)
+
+
+def format_operations_analyzed(
+    operations: Sequence[OperationsAnalyzed],
+) -> list[dict[str, Any]]:
+    """
+    Format analyzed operations for a response, by column when they are stored that way.
+    """
+    if isinstance(operations, OperationsAnalyzedResultSet):
+        return operations.to_formatted_records()
+    return [operation.to_formatted_dict() for operation in operations]
+
+
+def realized_pnl_series(
+    operations: Sequence[OperationsAnalyzed],
+) -> RealizedPnlSeries:
+    """
+    Build the realized P&L series of closed operations, sorted by the date they were sold.
+    """
+    frame = OperationsAnalyzedResultSet.from_operations(operations).frame
+    frame = frame.sort_values(["date_liquidation", "id"], kind="stable")
+    nominal_gain = frame["nominal_gain"].to_numpy(dtype=np.float64)
+    return RealizedPnlSeries(
+        dates=frame["date_liquidation"].dt.date.tolist(),
+        tickers=frame["ticker"].tolist(),
+        nominal_gain=nominal_gain.tolist(),
+        cumulative_gain=np.cumsum(nominal_gain).tolist(),
+    )
+
+
+def _format_dates(dates: pd.Series) -> list[str]:
+    """
+    Format dates as DD/MM/YYYY. Results hold few distinct days, so only those are formatted.
+    """
+    codes, unique_dates = pd.factorize(dates)
+    formatted = np.asarray(pd.DatetimeIndex(unique_dates).strftime("%d/%m/%Y"))
+    return formatted[codes].tolist()
+
+
+def _to_operation(row: Any) -> OperationsAnalyzed:
+    return OperationsAnalyzed(
+        id=int(row.id),
+        ticker=row.ticker,
+        amount=int(row.amount),
+        date_operation=row.date_operation.to_pydatetime(),
+        date_liquidation=row.date_liquidation.to_pydatetime(),
+        buy_price=float(row.buy_price),
+        sell_price=float(row.sell_price),
+        inverted_amount=float(row.inverted_amount),
+        current_amount=float(row.current_amount),
+        percentage_gain=float(row.percentage_gain),
+        nominal_gain=float(row.nominal_gain),
+        tna=float(row.tna),
+    )
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+from app.domain.entities.entities import PortfolioTimeSeries
+from app.domain.entities.enums import DatabaseColumnsOperations
+from app.infrastructure.analyzers.position_ledger import replay_trades
+
+
+def build_portfolio_timeseries(
+    cash_frame: pd.DataFrame, trades_frame: pd.DataFrame
+) -> PortfolioTimeSeries:
+    """
+    Build the daily curves of the account in a single pass over its history, module level so
+    it can be sent to a process pool.
+
+    Args:
+        cash_frame: Frame of OperationsRepository.get_cash_frame with the whole history
+        trades_frame: Frame of OperationsRepository.get_operations_frame with the trades
+
+    The cash is the balance left by the last operation liquidated each day, carried over the
+    days without operations. Invested and realized P&L come from the FIFO replay of the trades
+    by operation date, summed per day over the tickers and accumulated.
+    """
+    cash_days, balances = _end_of_day_balances(cash_frame)
+    replay = replay_trades(trades_frame)
+
+    bounds = [day for day in cash_days[:1]] + [day for day in cash_days[-1:]]
+    if replay is not None:
+        bounds += [replay.first_day, replay.first_day + (replay.days_count - 1)]
+    if not bounds:
+        return PortfolioTimeSeries()
+    first_day, last_day = min(bounds), max(bounds)
+    days_count = int((last_day - first_day).astype(np.int64)) + 1
+
+    # Days without operations keep the balance of the last day with them
+    cash = np.zeros(days_count)
+    if len(cash_days):
+        last_known = np.full(days_count, -1)
+        last_known[(cash_days - first_day).astype(np.int64)] = np.arange(len(cash_days))
+        last_known = np.maximum.accumulate(last_known)
+        cash = np.where(last_known >= 0, balances[np.maximum(last_known, 0)], 0.0)
+
+    invested = np.zeros(days_count)
+    realized_pnl = np.zeros(days_count)
+    if replay is not None:
+        days = replay.days + int((replay.first_day - first_day).astype(np.int64))
+        # Change of the cost held made by each operation, the first of a ticker starts at 0
+        cost_changes = np.diff(replay.cost_basis, prepend=0.0)
+        ticker_starts = np.append(True, replay.codes[1:] != replay.codes[:-1])
+        cost_changes[ticker_starts] = replay.cost_basis[ticker_starts]
+        invested = np.cumsum(
+            np.bincount(days, weights=cost_changes, minlength=days_count)
+        )
+        realized_pnl = np.cumsum(
+            np.bincount(days, weights=replay.realized_pnl, minlength=days_count)
+        )
+
+    dates = first_day + np.arange(days_count)
+    return PortfolioTimeSeries(
+        dates=dates.astype(object).tolist(),
+        cash=_clean(cash),
+        invested=_clean(invested),
+        realized_pnl=_clean(realized_pnl),
+    )
+
+
+def _end_of_day_balances(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Days with liquidated operations, sorted, and the balance at the end of each of them.
+
+    Operations of the same day have no order stored, so the last one is the operation whose
+    balance no other operation of the day started from. When the chain of balances is broken
+    the balance the next day started from is preferred, then the first operation of the day in
+    the repository order.
+    """
+    if df.empty:
+        return np.array([], dtype="datetime64[D]"), np.array([])
+
+    days = df[DatabaseColumnsOperations.DATE_LIQUIDATION].to_numpy(
+        dtype="datetime64[D]"
+    )
+    accumulated = df[DatabaseColumnsOperations.ACCUMULATED].to_numpy(dtype=np.float64)
+    imports = np.nan_to_num(
+        df[DatabaseColumnsOperations.IMPORT_OF_OPERATION].to_numpy(dtype=np.float64)
+    )
+
+    # Balances are compared in cents, an operation without import leaves the same balance.
+    # A balance is left for the next day when fewer operations of the day started from it
+    # than left it, which holds when an import is reverted within the day.
+    moves = imports != 0
+    balance_cents = np.round(accumulated * 100).astype(np.int64)
+    started_cents = np.round((accumulated - imports) * 100).astype(np.int64)
+    balances = pd.MultiIndex.from_arrays([days, balance_cents])
+    started = pd.MultiIndex.from_arrays([days[moves], started_cents[moves]])
+    continued = started.value_counts().reindex(balances, fill_value=0).to_numpy() >= (
+        balances.value_counts().reindex(balances).to_numpy()
+    )
+
+    unique_days = np.unique(days)
+    next_days = unique_days[
+        np.minimum(
+            np.searchsorted(unique_days, days, side="right"), len(unique_days) - 1
+        )
+    ]
+    carried = pd.MultiIndex.from_arrays([next_days, balance_cents]).isin(started)
+
+    order = np.lexsort((~carried, continued, days))
+    end_days, first_positions = np.unique(days[order], return_index=True)
+    return end_days, accumulated[order][first_positions]
+
+
+def _clean(values: np.ndarray) -> list[float]:
+    # Accumulated sums leave float noise around the cents, which would show as -0.0
+    return (np.round(values, 6) + 0.0).tolist()
@@ -0,0 +1,250 @@
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from app.domain.entities.entities import Holding
+from app.domain.entities.enums import DatabaseColumnsOperations, HBTypeOperations
+from app.domain.interfaces.analyzers.position_ledger_interface import (
+    PositionLedgerInterface,
+)
+
+SELL_TYPES = [HBTypeOperations.SELL, HBTypeOperations.SELL_PARITY]
+
+
+@dataclass
+class TradeReplay:
+    """
+    Trading operations sorted by ticker and day, with what was held of the ticker after each
+    of them and the gain realized by each sell.
+    """
+
+    tickers: np.ndarray
+    keys: np.ndarray  # ticker code * days_count + days since first_day
+    held: np.ndarray
+    cost_basis: np.ndarray
+    realized_pnl: np.ndarray
+    first_day: np.datetime64
+    days_count: int
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self.keys // self.days_count
+
+    @property
+    def days(self) -> np.ndarray:
+        return self.keys % self.days_count
+
+
+class PositionLedger(PositionLedgerInterface):
+    """
+    Quantity held and FIFO cost basis of every ticker at the end of each day it traded.
+    Entries are sorted by a single key combining ticker and day, so the holdings at a date are
+    found with one binary search per ticker over the whole index.
+    """
+
+    def __init__(
+        self,
+        tickers: np.ndarray,
+        keys: np.ndarray,
+        amount: np.ndarray,
+        cost_basis: np.ndarray,
+        first_day: np.datetime64,
+        days_count: int,
+    ):
+        self.tickers = tickers
+        self.keys = keys  # ticker code * days_count + days since first_day
+        self.amount = amount
+        self.cost_basis = cost_basis
+        self.first_day = first_day
+        self.days_count = days_count
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PositionLedger":
+        """
+        Build the ledger from a flat DataFrame with the DatabaseColumnsOperations columns.
+        Rows are expected in the order the repository returns them (newest first).
+        """
+        replay = replay_trades(df)
+        if replay is None:
+            return cls.empty()
+
+        # Only the last entry of each day is the holding at the end of that day
+        last_of_day = np.append(replay.keys[1:] != replay.keys[:-1], True)
+        return cls(
+            tickers=replay.tickers,
+            keys=replay.keys[last_of_day],
+            amount=replay.held[last_of_day],
+            cost_basis=replay.cost_basis[last_of_day],
+            first_day=replay.first_day,
+            days_count=replay.days_count,
+        )
+
+    @classmethod
+    def empty(cls) -> "PositionLedger":
+        return cls(
+            tickers=np.array([], dtype=object),
+            keys=np.array([], dtype=np.int64),
+            amount=np.array([]),
+            cost_basis=np.array([]),
+            first_day=np.datetime64("1970-01-01", "D"),
+            days_count=1,
+        )
+
+    def __sizeof__(self) -> int:
+        # Used by sys.getsizeof, so caches account for the memory of the arrays
+        return object.__sizeof__(self) + sum(
+            array.nbytes
+            for array in (self.tickers, self.keys, self.amount, self.cost_basis)
+        )
+
+    def holdings_as_of(self, date: datetime.date) -> list[Holding]:
+        """
+        Get the tickers held at the end of the date, sorted by ticker with missing tickers last.
+        """
+        day = int((np.datetime64(date, "D") - self.first_day).astype(np.int64))
+        if day < 0 or len(self.keys) == 0:
+            return []
+
+        codes = np.arange(len(self.tickers))
+        positions = (
+            np.searchsorted(
+                self.keys,
+                codes * self.days_count + min(day, self.days_count - 1),
+                side="right",
+            )
+            - 1
+        )
+        # A ticker without entries up to the date finds the last entry of the previous one
+        traded = (positions >= 0) & (
+            self.keys[np.maximum(positions, 0)] // self.days_count == codes
+        )
+        codes, positions = codes[traded], positions[traded]
+        held = self.amount[positions] > 0
+        return [
+            Holding(ticker=ticker, amount=float(amount), cost_basis=float(cost_basis))
+            for ticker, amount, cost_basis in zip(
+                self.tickers[codes[held]].tolist(),
+                self.amount[positions[held]].tolist(),
+                self.cost_basis[positions[held]].tolist(),
+            )
+        ]
+
+
+def build_position_ledger(df: pd.DataFrame) -> PositionLedger:
+    """
+    Build the ledger in a worker, module level so it can be sent to a process pool.
+    """
+    return PositionLedger.from_frame(df)
+
+
+def replay_trades(df: pd.DataFrame) -> TradeReplay | None:
+    """
+    Replay the buys and sells of a flat DataFrame with the DatabaseColumnsOperations columns,
+    in the order the repository returns them (newest first). None when there are no trades.
+    """
+    type_operation = df[DatabaseColumnsOperations.TYPE_OPERATION].to_numpy()
+    is_buy = type_operation == HBTypeOperations.BUY
+    is_sell = np.isin(type_operation, SELL_TYPES)
+    amount = np.abs(
+        pd.to_numeric(df[DatabaseColumnsOperations.AMOUNT])
+        .fillna(0)
+        .to_numpy(dtype=np.float64)
+    )
+    trading = (is_buy | is_sell) & (amount > 0)
+    if not trading.any():
+        return None
+
+    codes, uniques = pd.factorize(
+        df[DatabaseColumnsOperations.TICKER].to_numpy()[trading],
+        sort=True,
+        use_na_sentinel=False,
+    )
+    tickers = np.asarray(uniques, dtype=object)
+    tickers[pd.isna(tickers)] = None
+    is_buy = is_buy[trading]
+    amount = amount[trading]
+    price = np.nan_to_num(
+        pd.to_numeric(df[DatabaseColumnsOperations.PRICE]).to_numpy(dtype=np.float64)[
+            trading
+        ]
+    )
+    dates = pd.to_datetime(df[DatabaseColumnsOperations.DATE_OPERATION]).to_numpy(
+        dtype="datetime64[D]"
+    )[trading]
+    first_day = dates.min()
+    days = (dates - first_day).astype(np.int64)
+    days_count = int(days.max()) + 1
+
+    # Chronological order per ticker as the FIFO strategies: buys before sells of the
+    # same day and ties in the newest-first history reversed
+    keys = codes * days_count + days
+    reversed_positions = np.arange(len(keys))[::-1]
+    order = reversed_positions[np.argsort((keys * 2 + ~is_buy)[::-1], kind="stable")]
+    keys, codes, is_buy, amount, price = (
+        keys[order],
+        codes[order],
+        is_buy[order],
+        amount[order],
+        price[order],
+    )
+
+    held = np.empty(len(keys))
+    cost_basis = np.empty(len(keys))
+    realized_pnl = np.empty(len(keys))
+    group_starts = np.flatnonzero(np.diff(codes)) + 1
+    for start, end in zip(
+        np.concatenate(([0], group_starts)),
+        np.concatenate((group_starts, [len(keys)])),
+    ):
+        held[start:end], cost_basis[start:end], realized_pnl[start:end] = _hold_ticker(
+            is_buy[start:end], amount[start:end], price[start:end]
+        )
+
+    return TradeReplay(
+        tickers=tickers,
+        keys=keys,
+        held=held,
+        cost_basis=cost_basis,
+        realized_pnl=realized_pnl,
+        first_day=first_day,
+        days_count=days_count,
+    )
+
+
+def _hold_ticker(
+    is_buy: np.ndarray, amount: np.ndarray, price: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Quantity and FIFO cost held after each chronologically sorted operation of a ticker, and
+    the gain realized by it.
+
+    Sells consume the bought quantity from its start, capped by what was bought before
+    them as the lot queue strategy does. The cost held is the cost of the bought quantity
+    not consumed yet, which is linear within each buy.
+    """
+    bought = np.cumsum(np.where(is_buy, amount, 0.0))
+    bought_cost = np.cumsum(np.where(is_buy, amount * price, 0.0))
+    sold = np.cumsum(np.where(is_buy, 0.0, amount))
+    # Running shortfall of sells over the bought quantity, removed from the sold axis
+    shortfall = np.minimum.accumulate(np.minimum(bought - sold, 0.0))
+    sold_matched = sold + shortfall
+
+    buy_positions = np.flatnonzero(is_buy)
+    if len(buy_positions) == 0:
+        return np.zeros(len(amount)), np.zeros(len(amount)), np.zeros(len(amount))
+    sold_cost = np.interp(
+        sold_matched,
+        np.concatenate(([0.0], bought[buy_positions])),
+        np.concatenate(([0.0], bought_cost[buy_positions])),
+    )
+    # A sell realizes its matched quantity at its price against the cost it released
+    realized_pnl = np.diff(sold_matched, prepend=0.0) * price - np.diff(
+        sold_cost, prepend=0.0
+    )
+    return (
+        bought - sold_matched,
+        bought_cost - sold_cost,
+        np.where(is_buy, 0.0, realized_pnl),
+    )
@@ -1,4 +1,5 @@
 import datetime
+import itertools
 
 import pandas as pd
 
@@ -23,9 +24,6 @@ class FifoStrategy(TradingAnalyzerStrategyInterface):
     Strategy for analyzing trading operations using First In First Out (FIFO) strategy.
     """
 
-    def __init__(self):
-        self._id_counter = 0
-
     async def run_strategy(
         self, operations: list[Operation]
     ) -> tuple[list[OperationsAnalyzed], list[OperationsAnalyzed]]:
@@ -50,6 +48,8 @@ class FifoStrategy(TradingAnalyzerStrategyInterface):
 
         closed_operations = []
         open_operations = []
+        # Numbered per run, the instance is shared by the workers of the executor
+        ids = itertools.count(1)
 
         # Track remaining amounts for each operation
         remaining_amounts = df[OperationsAnalyzedColumns.AMOUNT].copy()
@@ -93,6 +93,7 @@ class FifoStrategy(TradingAnalyzerStrategyInterface):
                         sell_price=buy_price,  # Use buy price as placeholder for open positions
                         amount=buy_amount,
                         ticket=buy_ticket,
+                        id=next(ids),
                     )
                     open_operations.append(open_operation)
                     remaining_amounts[buy_index] = 0
@@ -119,6 +120,7 @@ class FifoStrategy(TradingAnalyzerStrategyInterface):
                             sell_price=sell_price,
                             amount=sell_amount,
                             ticket=buy_ticket,
+                            id=next(ids),
                         )
                         closed_operations.append(closed_operation)
 
@@ -138,6 +140,7 @@ class FifoStrategy(TradingAnalyzerStrategyInterface):
                             sell_price=sell_price,
                             amount=buy_amount,
                             ticket=buy_ticket,
+                            id=next(ids),
                         )
                         closed_operations.append(closed_operation)
 
@@ -175,6 +178,7 @@ class FifoStrategy(TradingAnalyzerStrategyInterface):
                             sell_price=buy_price,  # Use buy price as placeholder for open positions
                             amount=buy_amount,
                             ticket=buy_ticket,
+                            id=next(ids),
                         )
                         open_operations.append(open_operation)
 
@@ -211,6 +215,7 @@ class FifoStrategy(TradingAnalyzerStrategyInterface):
         sell_price: float,
         amount: float,
         ticket: str,
+        id: int,
     ) -> OperationsAnalyzed:
         """
         Create OperationsAnalyzed dataclass instance from matched operations.
@@ -228,9 +233,8 @@ class FifoStrategy(TradingAnalyzerStrategyInterface):
         percentage_gain = calculate_percentage_gain(buy_price, sell_price)
         tna = calculate_tna(buy_price, sell_price, int(t))
 
-        self._id_counter += 1
         return OperationsAnalyzed(
-            id=self._id_counter,
+            id=id,
             ticker=ticket,
             amount=int(amount),
             date_operation=buy_date,
@@ -0,0 +1,307 @@
+import datetime
+from collections import deque
+from collections.abc import Iterable
+from itertools import count
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from app.domain.entities.entities import OpenLot, Operation, OperationsAnalyzed
+from app.domain.entities.enums import DatabaseColumnsOperations, HBTypeOperations
+from app.domain.interfaces.analyzers.strategies.trading_analyzer_strategy_interface import (
+    FrameTradingAnalyzerStrategyInterface,
+    LotMatchingStrategyInterface,
+    TradingAnalyzerStrategyInterface,
+)
+from app.infrastructure.utils.formulas.formulas import (
+    calculate_nominal_profit,
+    calculate_percentage_gain,
+    calculate_tna,
+)
+
+SELL_TYPES = (HBTypeOperations.SELL, HBTypeOperations.SELL_PARITY)
+
+
+class TradingRow(NamedTuple):
+    """
+    Fields of a buy or sell read by the matching.
+    """
+
+    operation_id: int
+    is_buy: bool
+    date_operation: datetime.date
+    price: float
+    amount: float
+
+
+class LotQueueFifoStrategy(
+    TradingAnalyzerStrategyInterface,
+    FrameTradingAnalyzerStrategyInterface,
+    LotMatchingStrategyInterface,
+):
+    """
+    Strategy for analyzing trading operations using First In First Out (FIFO) strategy.
+    Operations are partitioned by ticker once and matched in a single chronological pass,
+    keeping a queue of open buy lots per ticker.
+    """
+
+    async def run_strategy(
+        self, operations: list[Operation]
+    ) -> tuple[list[OperationsAnalyzed], list[OperationsAnalyzed]]:
+        """
+        Match buy operations with sell operations using First In First Out (FIFO) strategy.
+        Returns both closed operations (those with both buy and sell) and open operations (unmatched buys).
+
+        Returns:
+            Tuple of (closed_operations, open_operations)
+        """
+        open_lots: dict[str | None, deque[OpenLot]] = {}
+        closed_operations = self.match_operations(operations, open_lots)
+        open_operations = self.build_open_operations(
+            open_lots, first_id=len(closed_operations) + 1
+        )
+        return closed_operations, open_operations
+
+    async def run_strategy_on_frame(
+        self, frame: pd.DataFrame
+    ) -> tuple[list[OperationsAnalyzed], list[OperationsAnalyzed]]:
+        """
+        Match the operations of a flat DataFrame with the DatabaseColumnsOperations columns,
+        as read by OperationsRepository.get_operations_frame, so no Operation is built per row.
+
+        Returns:
+            Tuple of (closed_operations, open_operations)
+        """
+        open_lots: dict[str | None, deque[OpenLot]] = {}
+        closed_operations = self._match_partitions(
+            self._partition_frame_by_ticker(frame), open_lots
+        )
+        open_operations = self.build_open_operations(
+            open_lots, first_id=len(closed_operations) + 1
+        )
+        return closed_operations, open_operations
+
+    def match_operations(
+        self,
+        operations: list[Operation],
+        open_lots: dict[str | None, deque[OpenLot]],
+        first_id: int = 1,
+    ) -> list[OperationsAnalyzed]:
+        """
+        Match the operations against the open lots of each ticker.
+        Buys are appended to the queue of their ticker and sells consume it from the oldest lot,
+        so `open_lots` holds the remaining lots once the operations are processed.
+
+        Args:
+            operations: Operations to match, in the order the repository returns them (newest first)
+            open_lots: Queue of open lots per ticker, updated in place
+            first_id: Id assigned to the first closed operation
+
+        Returns:
+            Closed operations sorted by buy date, sell date and ticker
+        """
+        return self._match_partitions(
+            self._partition_by_ticker(operations), open_lots, first_id
+        )
+
+    def _match_partitions(
+        self,
+        partitions: dict[str | None, list[TradingRow]],
+        open_lots: dict[str | None, deque[OpenLot]],
+        first_id: int = 1,
+    ) -> list[OperationsAnalyzed]:
+        """
+        Match the chronologically sorted buys and sells of each ticker against its open lots.
+        """
+        closed_operations = []
+        for ticker, rows in partitions.items():
+            lots = open_lots.setdefault(ticker, deque())
+            for row in rows:
+                amount = row.amount
+                if amount <= 0:
+                    continue
+
+                if row.is_buy:
+                    lots.append(
+                        OpenLot(
+                            operation_id=row.operation_id,
+                            ticker=ticker,
+                            date_operation=row.date_operation,
+                            price=row.price,
+                            amount=amount,
+                        )
+                    )
+                    continue
+
+                # Sells without open lots left (e.g. bought before the period) are ignored
+                while amount > 0 and lots:
+                    lot = lots[0]
+                    matched_amount = min(lot.amount, amount)
+                    closed_operations.append(
+                        self._create_operations_analyzed(
+                            buy_date=self._to_datetime(lot.date_operation),
+                            sell_date=self._to_datetime(row.date_operation),
+                            buy_price=lot.price,
+                            sell_price=row.price,
+                            amount=matched_amount,
+                            ticket=ticker,
+                        )
+                    )
+                    lot.amount -= matched_amount
+                    amount -= matched_amount
+                    if lot.amount <= 0:
+                        lots.popleft()
+
+        closed_operations.sort(
+            key=lambda operation: (
+                operation.date_operation,
+                operation.date_liquidation,
+                operation.ticker is None,
+                operation.ticker or "",
+            )
+        )
+        for operation_id, closed_operation in zip(count(first_id), closed_operations):
+            closed_operation.id = operation_id
+
+        return closed_operations
+
+    def build_open_operations(
+        self, open_lots: dict[str | None, deque[OpenLot]], first_id: int = 1
+    ) -> list[OperationsAnalyzed]:
+        """
+        Create open positions from the remaining lots, valued at their buy price as of today.
+        """
+        today = datetime.datetime.today()
+        remaining_lots = sorted(
+            (lot for lots in open_lots.values() for lot in lots if lot.amount > 0),
+            key=lambda lot: (lot.date_operation, lot.ticker is None, lot.ticker or ""),
+        )
+
+        open_operations = []
+        for operation_id, lot in zip(count(first_id), remaining_lots):
+            open_operation = self._create_operations_analyzed(
+                buy_date=self._to_datetime(lot.date_operation),
+                sell_date=today,
+                buy_price=lot.price,
+                sell_price=lot.price,  # Use buy price as placeholder for open positions
+                amount=lot.amount,
+                ticket=lot.ticker,
+            )
+            open_operation.id = operation_id
+            open_operations.append(open_operation)
+
+        return open_operations
+
+    def _partition_by_ticker(
+        self, operations: list[Operation]
+    ) -> dict[str | None, list[TradingRow]]:
+        """
+        Group buy and sell operations by ticker in chronological order.
+        """
+        return self._group_by_ticker(
+            (
+                operation.ticket.ticker,
+                TradingRow(
+                    operation_id=operation.id,
+                    is_buy=operation.type_operation.type_operation
+                    == HBTypeOperations.BUY,
+                    date_operation=operation.date_operation,
+                    price=operation.price_of_operation,
+                    amount=abs(operation.amount or 0),
+                ),
+            )
+            for operation in reversed(operations)
+            if operation.type_operation.type_operation == HBTypeOperations.BUY
+            or operation.type_operation.type_operation in SELL_TYPES
+        )
+
+    def _partition_frame_by_ticker(
+        self, frame: pd.DataFrame
+    ) -> dict[str | None, list[TradingRow]]:
+        """
+        Group the buy and sell rows of the frame by ticker in chronological order.
+        The lots they open are never stored, so their operation id is left at 0.
+        """
+        if frame.empty:
+            return {}
+
+        columns = zip(
+            frame[DatabaseColumnsOperations.TYPE_OPERATION].tolist(),
+            frame[DatabaseColumnsOperations.TICKER].tolist(),
+            # Missing amounts are decoded as NaN
+            np.abs(
+                pd.to_numeric(frame[DatabaseColumnsOperations.AMOUNT]).fillna(0)
+            ).tolist(),
+            pd.to_numeric(frame[DatabaseColumnsOperations.PRICE]).tolist(),
+            pd.to_datetime(frame[DatabaseColumnsOperations.DATE_OPERATION])
+            .to_numpy(dtype="datetime64[D]")
+            .tolist(),
+        )
+        return self._group_by_ticker(
+            (
+                ticker,
+                TradingRow(
+                    operation_id=0,
+                    is_buy=type_operation == HBTypeOperations.BUY,
+                    date_operation=date_operation,
+                    price=price,
+                    amount=amount,
+                ),
+            )
+            for type_operation, ticker, amount, price, date_operation in reversed(
+                list(columns)
+            )
+            if type_operation == HBTypeOperations.BUY or type_operation in SELL_TYPES
+        )
+
+    def _group_by_ticker(
+        self, rows: Iterable[tuple[str | None, TradingRow]]
+    ) -> dict[str | None, list[TradingRow]]:
+        """
+        Group the rows, received oldest first, by ticker in chronological order.
+        Rows of the same day keep the order of the history and buys go before sells,
+        so a sell can close a position opened that same day.
+        """
+        trading_rows = sorted(
+            rows, key=lambda row: (row[1].date_operation, not row[1].is_buy)
+        )
+
+        partitions: dict[str | None, list[TradingRow]] = {}
+        for ticker, row in trading_rows:
+            partitions.setdefault(ticker, []).append(row)
+        return partitions
+
+    def _to_datetime(self, date: datetime.date) -> datetime.datetime:
+        return datetime.datetime.combine(date, datetime.time())
+
+    def _create_operations_analyzed(
+        self,
+        buy_date: datetime.datetime,
+        sell_date: datetime.datetime,
+        buy_price: float,
+        sell_price: float,
+        amount: float,
+        ticket: str | None,
+    ) -> OperationsAnalyzed:
+        """
+        Create OperationsAnalyzed dataclass instance from matched operations.
+        The id is assigned by the caller once the order of the results is known.
+        """
+        time_diff = (sell_date - buy_date).days
+        t = time_diff if time_diff > 0 else 1
+
+        return OperationsAnalyzed(
+            id=0,
+            ticker=ticket,
+            amount=int(amount),
+            date_operation=buy_date,
+            date_liquidation=sell_date,
+            buy_price=buy_price,
+            sell_price=sell_price,
+            inverted_amount=amount * buy_price,
+            current_amount=amount * sell_price,
+            percentage_gain=calculate_percentage_gain(buy_price, sell_price),
+            nominal_gain=calculate_nominal_profit(buy_price, sell_price, int(amount)),
+            tna=calculate_tna(buy_price, sell_price, int(t)),
+        )
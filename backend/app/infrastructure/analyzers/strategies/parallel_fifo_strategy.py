@@ -0,0 +1,246 @@
+import asyncio
+import heapq
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from app.domain.entities.entities import Operation, OperationsAnalyzed
+from app.domain.entities.enums import DatabaseColumnsOperations
+from app.domain.interfaces.analyzers.strategies.trading_analyzer_strategy_interface import (
+    FrameTradingAnalyzerStrategyInterface,
+    TradingAnalyzerStrategyInterface,
+)
+from app.infrastructure.analyzers.operations_analyzed_result_set import (
+    OPERATIONS_ANALYZED_COLUMNS,
+    OperationsAnalyzedResultSet,
+)
+from app.infrastructure.analyzers.strategies.vectorized_fifo_strategy import (
+    VectorizedFifoStrategy,
+)
+
+# Below this number of operations the pool costs more than it saves
+MIN_PARALLEL_ROWS = 50_000
+
+
+class ParallelFifoStrategy(
+    TradingAnalyzerStrategyInterface, FrameTradingAnalyzerStrategyInterface
+):
+    """
+    Strategy for analyzing trading operations using First In First Out (FIFO) strategy.
+    Tickers are matched independently, so they are split into shards of similar row count
+    and each shard is matched by the vectorized strategy in a separate process.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        min_parallel_rows: int = MIN_PARALLEL_ROWS,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_rows = min_parallel_rows
+        self.vectorized_strategy = VectorizedFifoStrategy()
+        self._pool: ProcessPoolExecutor | None = None
+        # Workers of a thread executor can start the pool at the same time
+        self._pool_lock = threading.Lock()
+
+    async def run_strategy(
+        self, operations: list[Operation]
+    ) -> tuple[OperationsAnalyzedResultSet, OperationsAnalyzedResultSet]:
+        """
+        Match buy operations with sell operations using First In First Out (FIFO) strategy.
+        Returns both closed operations (those with both buy and sell) and open operations (unmatched buys).
+
+        Returns:
+            Tuple of (closed_operations, open_operations)
+        """
+        return await self.run_strategy_on_frame(
+            self.vectorized_strategy.convert_operations_to_dataframe(operations)
+        )
+
+    async def run_strategy_on_frame(
+        self, frame: pd.DataFrame
+    ) -> tuple[OperationsAnalyzedResultSet, OperationsAnalyzedResultSet]:
+        """
+        Match the operations of a flat DataFrame with the DatabaseColumnsOperations columns,
+        as read by OperationsRepository.get_operations_frame.
+
+        Returns:
+            Tuple of (closed_operations, open_operations)
+        """
+        closed_frame, open_frame = await self.match_frame(frame)
+        return (
+            OperationsAnalyzedResultSet(closed_frame),
+            OperationsAnalyzedResultSet(open_frame),
+        )
+
+    async def match_frame(self, df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Match the operations of a flat DataFrame with the DatabaseColumnsOperations columns,
+        giving the same result as VectorizedFifoStrategy.match_frame.
+        """
+        if len(df) < self.min_parallel_rows:
+            return self.vectorized_strategy.match_frame(df)
+
+        tickers, shards = self._build_shards(df)
+        if len(shards) <= 1:
+            return self.vectorized_strategy.match_frame(df)
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, match_shard, shard) for shard in shards)
+        )
+        closed_frame = self._merge_frames(
+            [closed for closed, _ in results], tickers, first_id=1
+        )
+        open_frame = self._merge_frames(
+            [open_frame for _, open_frame in results],
+            tickers,
+            first_id=len(closed_frame) + 1,
+        )
+        return closed_frame, open_frame
+
+    def shutdown(self) -> None:
+        """
+        Release the worker processes, a new pool is created if the strategy runs again.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __getstate__(self) -> dict:
+        # The strategy can itself be sent to a worker, the pool stays in this process
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        del state["_pool_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def _build_shards(
+        self, df: pd.DataFrame
+    ) -> tuple[np.ndarray, list[dict[str, np.ndarray]]]:
+        """
+        Split the rows into at most `max_workers` shards keeping every ticker in a single shard.
+        Tickers are assigned from the largest to the emptiest shard so the row counts stay
+        balanced. Each shard holds plain arrays, which pickle much faster than dataclasses,
+        and the rows keep their original order.
+
+        Tickers are sent as their alphabetical rank (missing tickers last), so the workers
+        match and return integers that keep the order of the tickers they stand for.
+
+        Returns:
+            Tuple of (tickers by rank, shards)
+        """
+        if df.empty:
+            return np.array([], dtype=object), []
+
+        ticker_codes, tickers = pd.factorize(
+            df[DatabaseColumnsOperations.TICKER], sort=True, use_na_sentinel=False
+        )
+        ticker_rows = np.bincount(ticker_codes)
+        shard_count = min(self.max_workers, len(tickers))
+
+        shard_loads = [(0, shard) for shard in range(shard_count)]
+        ticker_shards = np.empty(len(tickers), dtype=np.int64)
+        for ticker_code in np.argsort(-ticker_rows, kind="stable"):
+            load, shard = heapq.heappop(shard_loads)
+            ticker_shards[ticker_code] = shard
+            heapq.heappush(shard_loads, (load + ticker_rows[ticker_code], shard))
+
+        type_codes, type_operations = pd.factorize(
+            df[DatabaseColumnsOperations.TYPE_OPERATION], use_na_sentinel=False
+        )
+        columns = {
+            "type_codes": type_codes,
+            "ticker_codes": ticker_codes,
+            DatabaseColumnsOperations.AMOUNT: pd.to_numeric(
+                df[DatabaseColumnsOperations.AMOUNT]
+            ).to_numpy(dtype=np.float64),
+            DatabaseColumnsOperations.PRICE: pd.to_numeric(
+                df[DatabaseColumnsOperations.PRICE]
+            ).to_numpy(dtype=np.float64),
+            DatabaseColumnsOperations.DATE_OPERATION: pd.to_datetime(
+                df[DatabaseColumnsOperations.DATE_OPERATION]
+            ).to_numpy(dtype="datetime64[D]"),
+        }
+        type_operations = np.asarray(type_operations, dtype=object)
+        tickers = np.asarray(tickers, dtype=object)
+        tickers[pd.isna(tickers)] = None
+
+        row_shards = ticker_shards[ticker_codes]
+        shards = []
+        for shard in range(shard_count):
+            rows = np.flatnonzero(row_shards == shard)
+            shard_columns = {name: values[rows] for name, values in columns.items()}
+            shard_columns["type_operations"] = type_operations
+            shards.append(shard_columns)
+        return tickers, shards
+
+    def _merge_frames(
+        self, frames: list[pd.DataFrame], tickers: np.ndarray, first_id: int
+    ) -> pd.DataFrame:
+        """
+        Merge the frames of every shard sorted by buy date, sell date and ticker, replace the
+        ticker ranks by the tickers and number the rows from `first_id`. Rows of a ticker come
+        from a single shard, so the stable sort keeps the order the vectorized strategy gives them.
+        """
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=OPERATIONS_ANALYZED_COLUMNS)
+
+        merged = pd.concat(frames, ignore_index=True)
+        ticker_codes = merged["ticker"].to_numpy(dtype=np.int64)
+        buy_days = (
+            merged["date_operation"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+        )
+        sell_days = (
+            merged["date_liquidation"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+        )
+        buy_days -= buy_days.min()
+        sell_days -= sell_days.min()
+        # A single composite key sorts faster than np.lexsort, as in the vectorized strategy
+        sort_key = (buy_days * (sell_days.max() + 1) + sell_days) * len(
+            tickers
+        ) + ticker_codes
+        order = np.argsort(sort_key, kind="stable")
+        merged = merged.take(order).reset_index(drop=True)
+        merged["ticker"] = tickers[ticker_codes[order]]
+        merged["id"] = np.arange(first_id, first_id + len(merged))
+        return merged
+
+
+def match_shard(shard: dict[str, np.ndarray]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Match the operations of a shard in a worker process, defined at module level to be picklable.
+    """
+    df = pd.DataFrame(
+        {
+            DatabaseColumnsOperations.TYPE_OPERATION: shard["type_operations"][
+                shard["type_codes"]
+            ],
+            DatabaseColumnsOperations.TICKER: shard["ticker_codes"],
+            DatabaseColumnsOperations.AMOUNT: shard[DatabaseColumnsOperations.AMOUNT],
+            DatabaseColumnsOperations.PRICE: shard[DatabaseColumnsOperations.PRICE],
+            DatabaseColumnsOperations.DATE_OPERATION: shard[
+                DatabaseColumnsOperations.DATE_OPERATION
+            ],
+        }
+    )
+    closed_frame, open_frame = VectorizedFifoStrategy().match_frame(df)
+    # Send the ticker ranks back as integers rather than Python objects
+    for frame in (closed_frame, open_frame):
+        frame["ticker"] = frame["ticker"].astype(np.int64)
+    return closed_frame, open_frame
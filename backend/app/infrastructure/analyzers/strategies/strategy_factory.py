@@ -0,0 +1,48 @@
+from app.domain.entities.enums import AnalyzerStrategies, ExecutorTypes
+from app.domain.interfaces.analyzers.strategies.trading_analyzer_strategy_interface import (
+    TradingAnalyzerStrategyInterface,
+)
+from app.infrastructure.analyzers.strategies.fifo_strategy import FifoStrategy
+from app.infrastructure.analyzers.strategies.lot_queue_fifo_strategy import (
+    LotQueueFifoStrategy,
+)
+from app.infrastructure.analyzers.strategies.parallel_fifo_strategy import (
+    ParallelFifoStrategy,
+)
+from app.infrastructure.analyzers.strategies.vectorized_fifo_strategy import (
+    VectorizedFifoStrategy,
+)
+
+STRATEGIES: dict[AnalyzerStrategies, type[TradingAnalyzerStrategyInterface]] = {
+    AnalyzerStrategies.FIFO: FifoStrategy,
+    AnalyzerStrategies.FIFO_LOT_QUEUE: LotQueueFifoStrategy,
+    AnalyzerStrategies.FIFO_VECTORIZED: VectorizedFifoStrategy,
+    AnalyzerStrategies.FIFO_PARALLEL: ParallelFifoStrategy,
+}
+
+
+def build_strategy(
+    strategy: str, executor_type: str = ExecutorTypes.THREAD
+) -> TradingAnalyzerStrategyInterface:
+    """
+    Build the analyzer strategy registered with the given name, to be run by an executor of
+    the given type.
+
+    Raises:
+        ValueError: If the strategy is not supported or can not run in the executor
+    """
+    try:
+        strategy_type = STRATEGIES[AnalyzerStrategies(strategy)]
+    except ValueError:
+        raise ValueError(
+            f"Invalid analyzer strategy: '{strategy}'. "
+            f"Expected one of: {', '.join(AnalyzerStrategies)}"
+        )
+
+    # Each worker process would start its own pool of processes
+    if strategy_type is ParallelFifoStrategy and executor_type == ExecutorTypes.PROCESS:
+        raise ValueError(
+            f"Analyzer strategy '{strategy}' already runs in a process pool and can not "
+            f"be used with the '{ExecutorTypes.PROCESS}' executor"
+        )
+    return strategy_type()
@@ -401,3 +401,15 @@ class TestFifoStrategy:
         # Open operation should be MSFT
         open_op = open_operations[0]
         assert open_op.ticker == "MSFT"
+
+    async def test_ids_restart_on_every_run(
+        self, strategy: FifoStrategy, operations: list[Operation]
+    ):
+        """Test that a shared instance numbers the results of every run from 1."""
+        first_closed, first_open = await strategy.run_strategy(operations)
+        second_closed, second_open = await strategy.run_strategy(operations)
+
+        assert [op.id for op in second_closed + second_open] == [
+            op.id for op in first_closed + first_open
+        ]
+        assert min(op.id for op in second_closed + second_open) == 1
@@ -0,0 +1,200 @@
+import datetime
+from collections import deque
+
+import pytest
+
+from app.domain.entities.entities import (
+    OpenLot,
+)
+from app.domain.entities.enums import HBTypeOperations
+from app.infrastructure.analyzers.strategies.fifo_strategy import FifoStrategy
+from app.infrastructure.analyzers.strategies.lot_queue_fifo_strategy import (
+    LotQueueFifoStrategy,
+)
+from app.infrastructure.analyzers.strategies.tests.files.mock_operations import (
+    mock_operations,
+)
+from app.infrastructure.analyzers.strategies.vectorized_fifo_strategy import (
+    VectorizedFifoStrategy,
+)
+
+
+@pytest.fixture
+def strategy():
+    """Fixture that provides a LotQueueFifoStrategy instance for tests."""
+    return LotQueueFifoStrategy()
+
+
+class TestLotQueueFifoStrategy:
+    """Test class for LotQueueFifoStrategy functionality."""
+
+    async def test_matches_fifo_strategy_on_newest_first_history(
+        self, strategy: LotQueueFifoStrategy
+    ):
+        """Test that the results are the same as FifoStrategy for histories sorted newest first."""
+        operations = list(reversed(mock_operations))
+
+        expected_closed, expected_open = await FifoStrategy().run_strategy(operations)
+        closed_operations, open_operations = await strategy.run_strategy(operations)
+
+        def key(operation):
+            return (
+                operation.ticker,
+                operation.date_operation.date(),
+                operation.date_liquidation.date(),
+                operation.amount,
+                operation.buy_price,
+                operation.sell_price,
+            )
+
+        assert sorted(map(key, closed_operations)) == sorted(
+            key(op) for op in expected_closed if op.amount > 0
+        )
+        assert sorted(op.amount for op in open_operations) == sorted(
+            op.amount for op in expected_open if op.amount > 0
+        )
+
+    async def test_frame_gives_the_same_results(self, strategy: LotQueueFifoStrategy):
+        """Test that matching the columns of the operations gives the same positions."""
+        operations = list(reversed(mock_operations))
+        frame = VectorizedFifoStrategy().convert_operations_to_dataframe(operations)
+
+        expected_closed, expected_open = await strategy.run_strategy(operations)
+        closed_operations, open_operations = await strategy.run_strategy_on_frame(frame)
+
+        assert closed_operations == expected_closed
+        assert [op.amount for op in open_operations] == [
+            op.amount for op in expected_open
+        ]
+        assert await strategy.run_strategy_on_frame(frame.iloc[0:0]) == ([], [])
+
+    async def test_empty_operations_list(self, strategy: LotQueueFifoStrategy):
+        """Test that the strategy handles empty operations list correctly."""
+        closed_operations, open_operations = await strategy.run_strategy([])
+        assert closed_operations == []
+        assert open_operations == []
+
+    async def test_oldest_buy_is_sold_first(
+        self, make_operation, strategy: LotQueueFifoStrategy
+    ):
+        """Test that sells consume the oldest buy lots first regardless of input order."""
+        operations = [
+            make_operation(
+                3, HBTypeOperations.SELL, datetime.date(2024, 2, 15), 150, 3.0
+            ),
+            make_operation(
+                2, HBTypeOperations.BUY, datetime.date(2024, 1, 20), 100, 2.0
+            ),
+            make_operation(
+                1, HBTypeOperations.BUY, datetime.date(2024, 1, 15), 100, 1.0
+            ),
+        ]
+
+        closed_operations, open_operations = await strategy.run_strategy(operations)
+
+        assert [(op.amount, op.buy_price) for op in closed_operations] == [
+            (100, 1.0),
+            (50, 2.0),
+        ]
+        assert closed_operations[0].nominal_gain == 200.0
+        assert [(op.amount, op.buy_price) for op in open_operations] == [(50, 2.0)]
+        assert [op.id for op in closed_operations + open_operations] == [1, 2, 3]
+
+    async def test_sell_without_previous_buy_is_ignored(
+        self, make_operation, strategy: LotQueueFifoStrategy
+    ):
+        """Test that a sell dated before any buy does not consume later lots."""
+        operations = [
+            make_operation(
+                2, HBTypeOperations.BUY, datetime.date(2024, 3, 1), 100, 1.0
+            ),
+            make_operation(
+                1, HBTypeOperations.SELL, datetime.date(2024, 2, 1), 100, 2.0
+            ),
+        ]
+
+        closed_operations, open_operations = await strategy.run_strategy(operations)
+        assert closed_operations == []
+        assert [op.amount for op in open_operations] == [100]
+
+    async def test_same_day_buy_and_sell(
+        self, make_operation, strategy: LotQueueFifoStrategy
+    ):
+        """Test that a sell closes a position opened the same day."""
+        operations = [
+            make_operation(
+                2, HBTypeOperations.SELL, datetime.date(2024, 3, 1), 100, 2.0
+            ),
+            make_operation(
+                1, HBTypeOperations.BUY, datetime.date(2024, 3, 1), 100, 1.0
+            ),
+        ]
+
+        closed_operations, open_operations = await strategy.run_strategy(operations)
+        assert len(closed_operations) == 1
+        assert closed_operations[0].tna == pytest.approx(36500.0)
+        assert open_operations == []
+
+    async def test_sell_parity_and_different_tickers(
+        self, make_operation, strategy: LotQueueFifoStrategy
+    ):
+        """Test that parity sells close positions and tickers are matched separately."""
+        operations = [
+            make_operation(
+                4, HBTypeOperations.SELL_PARITY, datetime.date(2024, 2, 15), 100, 3.0
+            ),
+            make_operation(
+                3, HBTypeOperations.DIVIDEND, datetime.date(2024, 2, 1), 0, 0.0
+            ),
+            make_operation(
+                2,
+                HBTypeOperations.BUY,
+                datetime.date(2024, 1, 20),
+                50,
+                2.0,
+                ticker="MSFT",
+            ),
+            make_operation(
+                1, HBTypeOperations.BUY, datetime.date(2024, 1, 15), 100, 1.0
+            ),
+        ]
+
+        closed_operations, open_operations = await strategy.run_strategy(operations)
+        assert [op.ticker for op in closed_operations] == ["AAPL"]
+        assert [op.ticker for op in open_operations] == ["MSFT"]
+
+    def test_match_operations_continues_from_open_lots(
+        self, make_operation, strategy: LotQueueFifoStrategy
+    ):
+        """Test that previously stored open lots are consumed before new buys."""
+        open_lots = {
+            "AAPL": deque(
+                [
+                    OpenLot(
+                        operation_id=1,
+                        ticker="AAPL",
+                        date_operation=datetime.date(2024, 1, 15),
+                        price=1.0,
+                        amount=100,
+                    )
+                ]
+            )
+        }
+        operations = [
+            make_operation(
+                3, HBTypeOperations.SELL, datetime.date(2024, 3, 1), 150, 2.0
+            ),
+            make_operation(
+                2, HBTypeOperations.BUY, datetime.date(2024, 2, 1), 100, 1.5
+            ),
+        ]
+
+        closed_operations = strategy.match_operations(operations, open_lots)
+
+        assert [(op.amount, op.buy_price) for op in closed_operations] == [
+            (100, 1.0),
+            (50, 1.5),
+        ]
+        assert [(lot.operation_id, lot.amount) for lot in open_lots["AAPL"]] == [
+            (2, 50)
+        ]
@@ -0,0 +1,72 @@
+import pickle
+
+import pytest
+
+from app.infrastructure.analyzers.strategies.parallel_fifo_strategy import (
+    ParallelFifoStrategy,
+)
+from app.infrastructure.analyzers.strategies.strategy_factory import build_strategy
+from app.infrastructure.analyzers.strategies.tests.test_vectorized_fifo_strategy import (
+    _random_operations,
+)
+from app.infrastructure.analyzers.strategies.vectorized_fifo_strategy import (
+    VectorizedFifoStrategy,
+)
+
+
+@pytest.fixture
+def strategy():
+    """Fixture that provides a ParallelFifoStrategy running every input in the pool."""
+    strategy = ParallelFifoStrategy(max_workers=2, min_parallel_rows=0)
+    yield strategy
+    strategy.shutdown()
+
+
+class TestParallelFifoStrategy:
+    """Test class for ParallelFifoStrategy functionality."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    async def test_matches_vectorized_strategy(self, strategy, seed):
+        """Test that merging the shards gives the same operations and ids as a single pass."""
+        operations = _random_operations(seed, 300)
+        for operation in operations[::9]:
+            operation.ticket.ticker = None
+
+        assert await strategy.run_strategy(
+            operations
+        ) == await VectorizedFifoStrategy().run_strategy(operations)
+
+    def test_shards_are_balanced_by_rows(self, strategy):
+        """Test that every ticker goes to a single shard and the largest ones are spread."""
+        operations = _random_operations(0, 300)
+        frame = strategy.vectorized_strategy.convert_operations_to_dataframe(operations)
+
+        tickers, shards = strategy._build_shards(frame)
+
+        assert sorted(tickers) == ["AAPL", "GGAL", "MSFT"]
+        assert sum(len(shard["ticker_codes"]) for shard in shards) == len(operations)
+        shard_tickers = [set(shard["ticker_codes"]) for shard in shards]
+        assert not shard_tickers[0] & shard_tickers[1]
+        # The largest ticker is alone, the other two share the second shard
+        assert sorted(len(codes) for codes in shard_tickers) == [1, 2]
+
+    async def test_pickled_copy_runs_without_the_pool(self, strategy):
+        """Test that the strategy can be sent to a worker, leaving its pool behind."""
+        operations = _random_operations(1, 100)
+        await strategy.run_strategy(operations)
+
+        copy = pickle.loads(pickle.dumps(strategy))
+
+        assert copy._pool is None
+        assert await copy.run_strategy(operations) == await strategy.run_strategy(
+            operations
+        )
+        copy.shutdown()
+
+    def test_process_executor_is_rejected(self):
+        """Test that the strategy can not be built for a process executor."""
+        assert isinstance(
+            build_strategy("fifo_parallel", "thread"), ParallelFifoStrategy
+        )
+        with pytest.raises(ValueError):
+            build_strategy("fifo_parallel", "process")
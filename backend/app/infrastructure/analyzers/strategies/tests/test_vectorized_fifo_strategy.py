@@ -0,0 +1,145 @@
+import datetime
+import random
+
+import pandas as pd
+import pytest
+
+from app.domain.entities.entities import Operation, OperationType, Reference, Ticket
+from app.domain.entities.enums import DatabaseColumnsOperations, HBTypeOperations
+from app.infrastructure.analyzers.strategies.lot_queue_fifo_strategy import (
+    LotQueueFifoStrategy,
+)
+from app.infrastructure.analyzers.strategies.tests.files.mock_operations import (
+    mock_operations,
+)
+from app.infrastructure.analyzers.strategies.vectorized_fifo_strategy import (
+    OPERATIONS_ANALYZED_COLUMNS,
+    VectorizedFifoStrategy,
+)
+
+
+@pytest.fixture
+def strategy():
+    """Fixture that provides a VectorizedFifoStrategy instance for tests."""
+    return VectorizedFifoStrategy()
+
+
+def _random_operations(seed: int, size: int) -> list[Operation]:
+    """Build a random history mixing buys, sells, partial fills and other operation types."""
+    rng = random.Random(seed)
+    start = datetime.date(2024, 1, 1)
+    operations = []
+    for id in range(size):
+        date = start + datetime.timedelta(days=rng.randint(0, 30))
+        operations.append(
+            Operation(
+                id=id,
+                type_operation=OperationType(
+                    type_operation=rng.choice(
+                        [
+                            HBTypeOperations.BUY,
+                            HBTypeOperations.BUY,
+                            HBTypeOperations.SELL,
+                            HBTypeOperations.SELL_PARITY,
+                            HBTypeOperations.DIVIDEND,
+                        ]
+                    )
+                ),
+                ticket=Ticket(
+                    species="SPECIES",
+                    species_code="0001",
+                    ticker=rng.choice(["AAPL", "MSFT", "GGAL"]),
+                ),
+                code=f"OP{id:03d}",
+                accumulated=0.0,
+                number_receipt=id,
+                date_liquidation=date,
+                date_operation=date,
+                reference=Reference(detail=None),
+                amount=rng.choice([0, rng.randint(1, 100), -rng.randint(1, 100)]),
+                price_of_operation=float(rng.randint(1, 50)),
+            )
+        )
+    return operations
+
+
+def _as_tuples(operations):
+    return [
+        (
+            op.id,
+            op.ticker,
+            op.amount,
+            op.date_operation.date(),
+            op.buy_price,
+            op.sell_price,
+            round(op.nominal_gain, 6),
+            round(op.tna, 6),
+        )
+        for op in operations
+    ]
+
+
+class TestVectorizedFifoStrategy:
+    """Test class for VectorizedFifoStrategy functionality."""
+
+    async def test_empty_operations_list(self, strategy: VectorizedFifoStrategy):
+        """Test that the strategy handles empty operations list correctly."""
+        closed_operations, open_operations = await strategy.run_strategy([])
+        assert closed_operations == []
+        assert open_operations == []
+
+    @pytest.mark.parametrize("seed", range(10))
+    async def test_same_results_as_lot_queue_strategy(
+        self, strategy: VectorizedFifoStrategy, seed: int
+    ):
+        """Test that interval intersection matches the lot queue results, ids included."""
+        operations = _random_operations(seed, size=60)
+
+        expected_closed, expected_open = await LotQueueFifoStrategy().run_strategy(
+            operations
+        )
+        closed_operations, open_operations = await strategy.run_strategy(operations)
+
+        assert _as_tuples(closed_operations) == _as_tuples(expected_closed)
+        assert _as_tuples(open_operations) == _as_tuples(expected_open)
+
+    async def test_mock_operations(self, strategy: VectorizedFifoStrategy):
+        """Test the mock operations data against the lot queue strategy."""
+        expected_closed, expected_open = await LotQueueFifoStrategy().run_strategy(
+            mock_operations
+        )
+        closed_operations, open_operations = await strategy.run_strategy(
+            mock_operations
+        )
+
+        assert _as_tuples(closed_operations) == _as_tuples(expected_closed)
+        assert _as_tuples(open_operations) == _as_tuples(expected_open)
+
+    def test_match_frame_returns_columns(self, strategy: VectorizedFifoStrategy):
+        """Test that the columnar output has the OperationsAnalyzed columns and gains."""
+        df = pd.DataFrame(
+            {
+                DatabaseColumnsOperations.TYPE_OPERATION: [
+                    HBTypeOperations.SELL,
+                    HBTypeOperations.BUY,
+                    HBTypeOperations.BUY,
+                ],
+                DatabaseColumnsOperations.TICKER: ["AAPL", "AAPL", "AAPL"],
+                DatabaseColumnsOperations.AMOUNT: [-150, 100, 100],
+                DatabaseColumnsOperations.PRICE: [3.0, 2.0, 1.0],
+                DatabaseColumnsOperations.DATE_OPERATION: [
+                    datetime.date(2024, 2, 15),
+                    datetime.date(2024, 1, 20),
+                    datetime.date(2024, 1, 15),
+                ],
+            }
+        )
+
+        closed_frame, open_frame = strategy.match_frame(df)
+
+        assert list(closed_frame.columns) == OPERATIONS_ANALYZED_COLUMNS
+        assert closed_frame["amount"].tolist() == [100, 50]
+        assert closed_frame["buy_price"].tolist() == [1.0, 2.0]
+        assert closed_frame["nominal_gain"].tolist() == [200.0, 50.0]
+        assert open_frame["amount"].tolist() == [50]
+        assert open_frame["id"].tolist() == [3]
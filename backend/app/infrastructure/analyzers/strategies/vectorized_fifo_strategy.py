@@ -0,0 +1,321 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from app.domain.entities.entities import Operation, OperationsAnalyzed
+from app.domain.entities.enums import DatabaseColumnsOperations, HBTypeOperations
+from app.domain.interfaces.analyzers.strategies.trading_analyzer_strategy_interface import (
+    FrameTradingAnalyzerStrategyInterface,
+    TradingAnalyzerStrategyInterface,
+)
+from app.infrastructure.analyzers.operations_analyzed_result_set import (
+    OPERATIONS_ANALYZED_COLUMNS,
+    OperationsAnalyzedResultSet,
+)
+from app.infrastructure.utils.formulas.formulas import (
+    calculate_nominal_profit,
+    calculate_percentage_gain,
+    calculate_tna,
+)
+
+SELL_TYPES = [HBTypeOperations.SELL, HBTypeOperations.SELL_PARITY]
+
+
+class VectorizedFifoStrategy(
+    TradingAnalyzerStrategyInterface, FrameTradingAnalyzerStrategyInterface
+):
+    """
+    Strategy for analyzing trading operations using First In First Out (FIFO) strategy.
+    Intended for very large inputs: for each ticker the bought and sold quantities are laid
+    on a cumulative quantity axis and the matched (buy, sell, quantity) triples are the
+    intersections of their intervals, so no Python loop runs per operation.
+    """
+
+    async def run_strategy(
+        self, operations: list[Operation]
+    ) -> tuple[OperationsAnalyzedResultSet, OperationsAnalyzedResultSet]:
+        """
+        Match buy operations with sell operations using First In First Out (FIFO) strategy.
+        Returns both closed operations (those with both buy and sell) and open operations (unmatched buys),
+        kept by column so no OperationsAnalyzed instance is created until a row is read.
+
+        Returns:
+            Tuple of (closed_operations, open_operations)
+        """
+        return await self.run_strategy_on_frame(
+            self.convert_operations_to_dataframe(operations)
+        )
+
+    async def run_strategy_on_frame(
+        self, frame: pd.DataFrame
+    ) -> tuple[OperationsAnalyzedResultSet, OperationsAnalyzedResultSet]:
+        """
+        Match the operations of a flat DataFrame with the DatabaseColumnsOperations columns,
+        as read by OperationsRepository.get_operations_frame.
+
+        Returns:
+            Tuple of (closed_operations, open_operations)
+        """
+        closed_frame, open_frame = self.match_frame(frame)
+        return (
+            OperationsAnalyzedResultSet(closed_frame),
+            OperationsAnalyzedResultSet(open_frame),
+        )
+
+    def match_frame(self, df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Match the operations of a flat DataFrame with the DatabaseColumnsOperations columns.
+        Rows are expected in the order the repository returns them (newest first).
+
+        Returns:
+            Tuple of (closed_operations, open_operations) DataFrames with the OperationsAnalyzed columns
+        """
+        if df.empty:
+            return self._empty_frame(), self._empty_frame()
+
+        # Compare the distinct operation types only, not every row
+        type_codes, type_operations = pd.factorize(
+            df[DatabaseColumnsOperations.TYPE_OPERATION]
+        )
+        is_buy = (type_operations == HBTypeOperations.BUY)[type_codes] & (
+            type_codes >= 0
+        )
+        is_sell = np.isin(type_operations, SELL_TYPES)[type_codes] & (type_codes >= 0)
+        amount = np.abs(
+            pd.to_numeric(df[DatabaseColumnsOperations.AMOUNT])
+            .fillna(0)
+            .to_numpy(dtype=np.float64)
+        )
+        trading = (is_buy | is_sell) & (amount > 0)
+        if not trading.any():
+            return self._empty_frame(), self._empty_frame()
+
+        tickers, ticker_codes = self._factorize(
+            df[DatabaseColumnsOperations.TICKER].to_numpy()[trading]
+        )
+        is_buy = is_buy[trading]
+        amount = amount[trading]
+        price = pd.to_numeric(df[DatabaseColumnsOperations.PRICE]).to_numpy(
+            dtype=np.float64
+        )[trading]
+        dates = pd.to_datetime(df[DatabaseColumnsOperations.DATE_OPERATION]).to_numpy(
+            dtype="datetime64[D]"
+        )[trading]
+
+        # Chronological order per ticker: buys before sells of the same day and ties in the
+        # newest-first history reversed. A single composite key sorts faster than np.lexsort.
+        days = (dates - dates.min()).astype(np.int64)
+        sort_key = (ticker_codes * (days.max() + 1) + days) * 2 + ~is_buy
+        reversed_positions = np.arange(len(sort_key))[::-1]
+        order = reversed_positions[np.argsort(sort_key[::-1], kind="stable")]
+        ticker_codes, is_buy, amount, price, dates = (
+            ticker_codes[order],
+            is_buy[order],
+            amount[order],
+            price[order],
+            dates[order],
+        )
+
+        group_starts = np.flatnonzero(np.diff(ticker_codes)) + 1
+        group_bounds = zip(
+            np.concatenate(([0], group_starts)),
+            np.concatenate((group_starts, [len(ticker_codes)])),
+        )
+
+        buy_rows, sell_rows, matched_amounts = [], [], []
+        open_rows, open_amounts = [], []
+        for start, end in group_bounds:
+            group_buys, group_sells, group_matched, group_open = self._match_ticker(
+                is_buy[start:end], amount[start:end]
+            )
+            buy_rows.append(group_buys + start)
+            sell_rows.append(group_sells + start)
+            matched_amounts.append(group_matched)
+            open_rows.append(np.flatnonzero(group_open > 0) + start)
+            open_amounts.append(group_open[group_open > 0])
+
+        buy_rows = np.concatenate(buy_rows)
+        sell_rows = np.concatenate(sell_rows)
+        open_rows = np.concatenate(open_rows)
+
+        closed_frame = self._build_frame(
+            tickers=tickers,
+            ticker_codes=ticker_codes[buy_rows],
+            amount=np.concatenate(matched_amounts),
+            buy_date=dates[buy_rows],
+            sell_date=dates[sell_rows],
+            buy_price=price[buy_rows],
+            sell_price=price[sell_rows],
+            first_id=1,
+        )
+        open_frame = self._build_frame(
+            tickers=tickers,
+            ticker_codes=ticker_codes[open_rows],
+            amount=np.concatenate(open_amounts),
+            buy_date=dates[open_rows],
+            sell_date=np.full(
+                len(open_rows), np.datetime64(datetime.date.today(), "D")
+            ),
+            buy_price=price[open_rows],
+            sell_price=price[
+                open_rows
+            ],  # Use buy price as placeholder for open positions
+            first_id=len(closed_frame) + 1,
+        )
+        return closed_frame, open_frame
+
+    def _match_ticker(
+        self, is_buy: np.ndarray, amount: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Match the chronologically sorted operations of a single ticker.
+
+        Each buy covers an interval of the cumulative bought quantity and each sell an interval
+        of the cumulative sold quantity. A sell can only consume what was bought before it, so
+        the sold quantity is capped by the bought quantity at that point (the excess of a sell
+        without open lots is dropped, as the lot queue strategy does).
+
+        Returns:
+            Tuple of (buy positions, sell positions, matched amounts, open amount per position)
+            where positions are relative to the arrays received
+        """
+        buy_positions = np.flatnonzero(is_buy)
+        sell_positions = np.flatnonzero(~is_buy)
+        bought = np.cumsum(np.where(is_buy, amount, 0.0))
+        open_amount = np.zeros(len(amount))
+
+        if len(sell_positions) == 0 or len(buy_positions) == 0:
+            open_amount[buy_positions] = amount[buy_positions]
+            empty = np.array([], dtype=np.int64)
+            return empty, empty, np.array([]), open_amount
+
+        sold = np.cumsum(np.where(is_buy, 0.0, amount))
+        # Running shortfall of sells over the bought quantity, removed from the sold axis
+        shortfall = np.minimum.accumulate(np.minimum(bought - sold, 0.0))
+        sold_matched = sold + shortfall
+
+        buy_ends = bought[buy_positions]
+        sell_ends = sold_matched[sell_positions]
+        total_matched = sell_ends[-1]
+
+        breakpoints = np.unique(np.concatenate((buy_ends, sell_ends)))
+        breakpoints = breakpoints[(breakpoints > 0) & (breakpoints <= total_matched)]
+        segment_starts = np.concatenate(([0.0], breakpoints[:-1]))
+        segment_amounts = breakpoints - segment_starts
+        midpoints = segment_starts + segment_amounts / 2
+
+        segment_buys = np.searchsorted(buy_ends, midpoints, side="right")
+        segment_sells = np.searchsorted(sell_ends, midpoints, side="right")
+
+        buy_starts = np.concatenate(([0.0], buy_ends[:-1]))
+        open_amount[buy_positions] = buy_ends - np.maximum(buy_starts, total_matched)
+        np.clip(open_amount, 0.0, None, out=open_amount)
+
+        return (
+            buy_positions[segment_buys],
+            sell_positions[segment_sells],
+            segment_amounts,
+            open_amount,
+        )
+
+    def _build_frame(
+        self,
+        tickers: np.ndarray,
+        ticker_codes: np.ndarray,
+        amount: np.ndarray,
+        buy_date: np.ndarray,
+        sell_date: np.ndarray,
+        buy_price: np.ndarray,
+        sell_price: np.ndarray,
+        first_id: int,
+    ) -> pd.DataFrame:
+        """
+        Build the OperationsAnalyzed columns computing the gains over whole arrays.
+        Rows are sorted by buy date, sell date and ticker.
+        """
+        buy_days = buy_date.astype(np.int64)
+        sell_days = sell_date.astype(np.int64)
+        if len(buy_days):
+            buy_days = buy_days - buy_days.min()
+            sell_days = sell_days - sell_days.min()
+        sell_days_count = sell_days.max(initial=0) + 1
+        sort_key = (buy_days * sell_days_count + sell_days) * len(
+            tickers
+        ) + ticker_codes
+        order = np.argsort(sort_key, kind="stable")
+        tickers, amount, buy_date, sell_date, buy_price, sell_price = (
+            tickers[ticker_codes[order]],
+            amount[order],
+            buy_date[order],
+            sell_date[order],
+            buy_price[order],
+            sell_price[order],
+        )
+
+        time_diff = (sell_date - buy_date).astype(np.int64)
+        t = np.where(time_diff > 0, time_diff, 1)
+        whole_amount = amount.astype(np.int64)
+
+        return pd.DataFrame(
+            {
+                "id": np.arange(first_id, first_id + len(amount)),
+                "ticker": tickers,
+                "amount": whole_amount,
+                "date_operation": buy_date.astype("datetime64[ns]"),
+                "date_liquidation": sell_date.astype("datetime64[ns]"),
+                "buy_price": buy_price,
+                "sell_price": sell_price,
+                "inverted_amount": amount * buy_price,
+                "current_amount": amount * sell_price,
+                "percentage_gain": calculate_percentage_gain(buy_price, sell_price),
+                "nominal_gain": calculate_nominal_profit(
+                    buy_price, sell_price, whole_amount
+                ),
+                "tna": calculate_tna(buy_price, sell_price, t),
+            },
+            columns=OPERATIONS_ANALYZED_COLUMNS,
+        )
+
+    def _empty_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(columns=OPERATIONS_ANALYZED_COLUMNS)
+
+    def _factorize(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Encode tickers as integer codes in alphabetical order, keeping missing tickers as their own
+        group after the rest.
+
+        Returns:
+            Tuple of (unique tickers, code per value)
+        """
+        codes, uniques = pd.factorize(values, sort=True, use_na_sentinel=False)
+        tickers = np.asarray(uniques, dtype=object)
+        tickers[pd.isna(tickers)] = None
+        return tickers, codes
+
+    def convert_operations_to_dataframe(
+        self, operations: list[Operation]
+    ) -> pd.DataFrame:
+        """
+        Convert Operation dataclasses to DataFrame with flat structure, the columns
+        match_frame reads.
+        """
+        return pd.DataFrame(
+            {
+                DatabaseColumnsOperations.TYPE_OPERATION: [
+                    operation.type_operation.type_operation for operation in operations
+                ],
+                DatabaseColumnsOperations.TICKER: [
+                    operation.ticket.ticker for operation in operations
+                ],
+                DatabaseColumnsOperations.AMOUNT: [
+                    operation.amount or 0 for operation in operations
+                ],
+                DatabaseColumnsOperations.PRICE: [
+                    operation.price_of_operation for operation in operations
+                ],
+                DatabaseColumnsOperations.DATE_OPERATION: [
+                    operation.date_operation for operation in operations
+                ],
+            }
+        )
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from app.infrastructure.analyzers.downsampling import lttb_indices, min_max_indices
+
+
+@pytest.fixture
+def curve() -> tuple[np.ndarray, np.ndarray]:
+    y = np.sin(np.linspace(0, 20, 1000))
+    y[437] = 5.0
+    y[811] = -5.0
+    return np.arange(len(y), dtype=np.float64), y
+
+
+class TestDownsampling:
+    def test_lttb_keeps_ends_and_peaks(self, curve):
+        """Test that LTTB returns at most the points asked, with the ends and the spikes."""
+        x, y = curve
+        indices = lttb_indices(x, y, 50)
+
+        assert len(indices) == 50
+        assert (np.diff(indices) > 0).all()
+        assert {0, 437, 811, 999} <= set(indices.tolist())
+
+    def test_min_max_keeps_extremes_of_each_bucket(self, curve):
+        """Test that min/max bucketing keeps the lowest and highest point of every bucket."""
+        _, y = curve
+        indices = min_max_indices(y, 50)
+
+        assert len(indices) <= 50
+        assert (np.diff(indices) > 0).all()
+        assert {0, 437, 811, 999} <= set(indices.tolist())
+        bucket_of = np.arange(len(y)) * 24 // len(y)
+        for bucket in range(24):
+            kept = y[indices][bucket_of[indices] == bucket]
+            assert kept.max() == y[bucket_of == bucket].max()
+            assert kept.min() == y[bucket_of == bucket].min()
@@ -0,0 +1,103 @@
+import datetime
+import random
+
+import pytest
+
+from app.domain.entities.entities import OperationsAnalyzed
+from app.infrastructure.analyzers.operations_analyzed_result_set import (
+    OperationsAnalyzedResultSet,
+    format_operations_analyzed,
+)
+
+
+def _random_operations_analyzed(size: int) -> list[OperationsAnalyzed]:
+    rng = random.Random(size)
+    operations = []
+    for id in range(1, size + 1):
+        buy_date = datetime.datetime(2024, 1, 1) + datetime.timedelta(
+            days=rng.randint(0, 60)
+        )
+        buy_price = rng.uniform(1, 500)
+        sell_price = rng.uniform(1, 500)
+        amount = rng.randint(1, 100)
+        operations.append(
+            OperationsAnalyzed(
+                id=id,
+                ticker=rng.choice(["AAPL", "MSFT", None]),
+                amount=amount,
+                date_operation=buy_date,
+                date_liquidation=buy_date + datetime.timedelta(days=rng.randint(0, 90)),
+                buy_price=buy_price,
+                sell_price=sell_price,
+                inverted_amount=amount * buy_price,
+                current_amount=amount * sell_price,
+                percentage_gain=(sell_price / buy_price - 1) * 100,
+                nominal_gain=(sell_price - buy_price) * amount,
+                tna=rng.uniform(-100, 100),
+            )
+        )
+    return operations
+
+
+@pytest.fixture
+def operations():
+    return _random_operations_analyzed(50)
+
+
+@pytest.fixture
+def result_set(operations):
+    return OperationsAnalyzedResultSet.from_operations(operations)
+
+
+class TestOperationsAnalyzedResultSet:
+    """Test class for OperationsAnalyzedResultSet functionality."""
+
+    def test_behaves_as_the_list_of_operations(self, operations, result_set):
+        """Test that rows read from the columns are the original operations."""
+        assert len(result_set) == len(operations)
+        assert result_set == operations
+        assert result_set[3] == operations[3]
+        assert result_set[-1] == operations[-1]
+
+    def test_slices_are_result_sets(self, operations, result_set):
+        """Test that pages are taken from the columns without building rows."""
+        page = result_set.page(offset=10, limit=5)
+
+        assert isinstance(page, OperationsAnalyzedResultSet)
+        assert page == operations[10:15]
+        assert len(result_set.page(offset=48, limit=5)) == 2
+
+    def test_formatted_records_match_formatted_dicts(self, operations, result_set):
+        """Test that the columnar formatting gives the values of to_formatted_dict."""
+        records = result_set.to_formatted_records()
+        expected = [operation.to_formatted_dict() for operation in operations]
+
+        assert records == [
+            {
+                key: (
+                    pytest.approx(value, abs=0.011)
+                    if isinstance(value, float)
+                    else value
+                )
+                for key, value in record.items()
+            }
+            for record in expected
+        ]
+        assert type(records[0]["id"]) is int
+        assert format_operations_analyzed(operations[:2]) == expected[:2]
+
+    def test_sort_by_keeps_order_of_ties(self, operations, result_set):
+        """Test that sorting is stable, as sorting the list of operations."""
+        sorted_result_set = result_set.sort_by(["date_operation"], ascending=False)
+
+        assert sorted_result_set == sorted(
+            operations, key=lambda operation: operation.date_operation, reverse=True
+        )
+
+    def test_empty_result_set(self):
+        """Test that an empty result set formats to an empty list."""
+        result_set = OperationsAnalyzedResultSet.from_operations([])
+
+        assert len(result_set) == 0
+        assert result_set.to_formatted_records() == []
+        assert result_set == []
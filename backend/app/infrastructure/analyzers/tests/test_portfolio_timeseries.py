@@ -0,0 +1,83 @@
+import datetime
+
+import pandas as pd
+
+from app.domain.entities.enums import DatabaseColumnsOperations, HBTypeOperations
+from app.infrastructure.analyzers.portfolio_timeseries import (
+    build_portfolio_timeseries,
+)
+
+
+def _cash_frame(rows: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(
+        rows,
+        columns=[
+            DatabaseColumnsOperations.DATE_LIQUIDATION,
+            DatabaseColumnsOperations.ACCUMULATED,
+            DatabaseColumnsOperations.IMPORT_OF_OPERATION,
+        ],
+    )
+
+
+def _trades_frame(rows: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(
+        rows,
+        columns=[
+            DatabaseColumnsOperations.TICKER,
+            DatabaseColumnsOperations.TYPE_OPERATION,
+            DatabaseColumnsOperations.DATE_OPERATION,
+            DatabaseColumnsOperations.AMOUNT,
+            DatabaseColumnsOperations.PRICE,
+        ],
+    )
+
+
+class TestBuildPortfolioTimeSeries:
+    def test_daily_curves_are_carried_over_days_without_operations(self):
+        """Test that the curves hold one value per calendar day from the balances and trades."""
+        series = build_portfolio_timeseries(
+            # Operations of the same day come in no particular order
+            _cash_frame(
+                [
+                    (datetime.date(2024, 1, 4), 100.0, 40.0),
+                    (datetime.date(2024, 1, 1), 60.0, -40.0),
+                    (datetime.date(2024, 1, 1), 100.0, 100.0),
+                ]
+            ),
+            _trades_frame(
+                [
+                    (
+                        "AAPL",
+                        HBTypeOperations.SELL,
+                        datetime.date(2024, 1, 4),
+                        -2,
+                        25.0,
+                    ),
+                    ("AAPL", HBTypeOperations.BUY, datetime.date(2024, 1, 1), 4, 10.0),
+                ]
+            ),
+        )
+
+        assert series.dates == [
+            datetime.date(2024, 1, 1) + datetime.timedelta(days=day) for day in range(4)
+        ]
+        assert series.cash == [60.0, 60.0, 60.0, 100.0]
+        assert series.invested == [40.0, 40.0, 40.0, 20.0]
+        assert series.realized_pnl == [0.0, 0.0, 0.0, 30.0]
+
+    def test_trades_without_liquidated_operations(self):
+        """Test that the cash stays at zero when no operation is liquidated yet."""
+        series = build_portfolio_timeseries(
+            _cash_frame([]),
+            _trades_frame(
+                [
+                    ("AAPL", HBTypeOperations.BUY, datetime.date(2024, 1, 2), 4, 10.0),
+                    ("AAPL", HBTypeOperations.BUY, datetime.date(2024, 1, 1), 1, 10.0),
+                ]
+            ),
+        )
+
+        assert series.dates == [datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)]
+        assert series.cash == [0.0, 0.0]
+        assert series.invested == [10.0, 50.0]
+        assert series.realized_pnl == [0.0, 0.0]
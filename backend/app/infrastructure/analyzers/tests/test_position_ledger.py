@@ -0,0 +1,61 @@
+import datetime
+
+import pandas as pd
+
+from app.domain.entities.enums import DatabaseColumnsOperations, HBTypeOperations
+from app.infrastructure.analyzers.position_ledger import PositionLedger
+
+
+def _frame(rows: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(
+        rows,
+        columns=[
+            DatabaseColumnsOperations.TICKER,
+            DatabaseColumnsOperations.TYPE_OPERATION,
+            DatabaseColumnsOperations.DATE_OPERATION,
+            DatabaseColumnsOperations.AMOUNT,
+            DatabaseColumnsOperations.PRICE,
+        ],
+    )
+
+
+class TestPositionLedger:
+    def test_holdings_follow_fifo_cost(self):
+        """Test that sells consume the oldest lots and the holdings keep the cost left."""
+        ledger = PositionLedger.from_frame(
+            _frame(
+                [
+                    ("MSFT", HBTypeOperations.BUY, datetime.date(2024, 1, 15), 1, 50.0),
+                    (
+                        "AAPL",
+                        HBTypeOperations.SELL,
+                        datetime.date(2024, 2, 10),
+                        -5,
+                        20.0,
+                    ),
+                    ("AAPL", HBTypeOperations.BUY, datetime.date(2024, 1, 20), 2, 12.0),
+                    ("AAPL", HBTypeOperations.BUY, datetime.date(2024, 1, 10), 4, 10.0),
+                ]
+            )
+        )
+
+        def held(date):
+            return [
+                (holding.ticker, holding.amount, holding.cost_basis)
+                for holding in ledger.holdings_as_of(date)
+            ]
+
+        assert held(datetime.date(2024, 1, 9)) == []
+        assert held(datetime.date(2024, 1, 15)) == [
+            ("AAPL", 4, 40.0),
+            ("MSFT", 1, 50.0),
+        ]
+        assert held(datetime.date(2024, 1, 31)) == [
+            ("AAPL", 6, 64.0),
+            ("MSFT", 1, 50.0),
+        ]
+        # The sell takes the 4 bought at 10 and 1 of the 2 bought at 12
+        assert held(datetime.date(2030, 1, 1)) == [
+            ("AAPL", 1, 12.0),
+            ("MSFT", 1, 50.0),
+        ]
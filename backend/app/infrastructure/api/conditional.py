@@ -0,0 +1,69 @@
+import datetime
+from collections.abc import Mapping
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Response
+
+from app.domain.entities.entities import DatasetVersion
+
+
+def dataset_validators(
+    dataset_version: DatasetVersion, app_version: str, strategy: str
+) -> dict[str, str]:
+    """
+    ETag and Last-Modified headers of the responses computed from the dataset version.
+    Clients must revalidate them on every request, which is answered with 304 until the
+    operations change.
+
+    Args:
+        app_version: Version of the application, a release may change the responses
+        strategy: Name of the analyzer strategy, which the analyzed responses depend on
+    """
+    modified_at = dataset_version.modified_at
+    # The time tells apart the versions of a database that was emptied and filled again
+    stamp = int(modified_at.timestamp()) if modified_at else 0
+    headers = {
+        "ETag": f'W/"{app_version}-{strategy}-{dataset_version.version}-{stamp}"',
+        "Cache-Control": "no-cache",
+    }
+    if modified_at is not None:
+        headers["Last-Modified"] = format_datetime(
+            modified_at.astimezone(datetime.timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def is_not_modified(
+    request_headers: Mapping[str, str], validators: Mapping[str, str]
+) -> bool:
+    """
+    Whether the client holds the current response, If-None-Match takes precedence over
+    If-Modified-Since as in RFC 9110.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = _opaque_tag(validators["ETag"])
+        return any(
+            tag.strip() == "*" or _opaque_tag(tag.strip()) == etag
+            for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request_headers.get("if-modified-since")
+    last_modified = validators.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(validators: Mapping[str, str]) -> Response:
+    return Response(status_code=304, headers=dict(validators))
+
+
+def _opaque_tag(tag: str) -> str:
+    # If-None-Match uses the weak comparison, W/ prefixes are ignored
+    return tag[2:] if tag.startswith("W/") else tag
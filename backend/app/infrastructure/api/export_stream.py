@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+from app.domain.entities.enums import ExportFormats
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormats.NDJSON: "application/x-ndjson",
+    ExportFormats.CSV: "text/csv",
+}
+
+# zlib writes a gzip header and trailer with this window size
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """
+    Whether the client accepts gzip encoded responses. An explicit gzip entry takes precedence
+    over the wildcard, so "*;q=0, gzip" accepts it and "gzip;q=0, *" does not.
+    """
+    qualities: dict[str, float] = {}
+    for encoding in (accept_encoding or "").split(","):
+        name, *params = encoding.split(";")
+        name = name.strip().lower()
+        if name not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities.setdefault(name, quality)
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+async def encode_records(
+    batches: AsyncIterator[list[dict[str, Any]]],
+    export_format: ExportFormats,
+    columns: list[str],
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Encode batches of records as NDJSON lines or CSV rows, one chunk per batch.
+    Only the batch being encoded is held in memory, compressed on the fly when gzip is set.
+    """
+    compressor = zlib.compressobj(wbits=GZIP_WBITS) if gzip else None
+
+    def output(text: str) -> bytes:
+        data = text.encode()
+        return compressor.compress(data) if compressor else data
+
+    if export_format == ExportFormats.CSV:
+        yield output(_encode_csv([], columns, header=True))
+
+    async for records in batches:
+        if export_format == ExportFormats.CSV:
+            chunk = output(_encode_csv(records, columns))
+        else:
+            chunk = output(
+                "".join(
+                    json.dumps(record, separators=(",", ":")) + "\n"
+                    for record in records
+                )
+            )
+        # The compressor buffers small inputs, nothing is sent until it produces output
+        if chunk:
+            yield chunk
+
+    if compressor:
+        yield compressor.flush()
+
+
+def _encode_csv(
+    records: list[dict[str, Any]], columns: list[str], header: bool = False
+) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue()
@@ -1,35 +1,107 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Callable, Sequence
 from datetime import datetime
+from typing import Any
 
 from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.config.settings import Settings
-from app.domain.entities.enums import HBTypeOperations, TypeOfSort
+from app.domain.entities.entities import IngestJob, PositionsAnalysis
+from app.domain.entities.enums import (
+    ConflictModes,
+    DownsamplingMethods,
+    ExportFormats,
+    HBTypeOperations,
+    TickerMatches,
+    TypeOfSort,
+    WindowModes,
+)
 from app.domain.use_cases.delete_positions_use_case import DeletePositionsUseCase
-from app.domain.use_cases.get_positions_use_case import GetPositionsUseCase
+from app.domain.use_cases.export_positions_use_case import ExportPositionsUseCase
+from app.domain.use_cases.get_closed_lots_use_case import GetClosedLotsUseCase
+from app.domain.use_cases.get_holdings_use_case import GetHoldingsUseCase
+from app.domain.use_cases.get_operations_page_use_case import (
+    GetOperationsPageUseCase,
+)
+from app.domain.use_cases.get_positions_use_case import (
+    GetPositionsUseCase,
+    parse_query_date,
+)
+from app.domain.use_cases.get_timeseries_use_case import GetTimeSeriesUseCase
+from app.domain.use_cases.get_window_positions_use_case import (
+    GetWindowPositionsUseCase,
+)
+from app.domain.use_cases.sync_lots_use_case import TRADING_TYPES, SyncLotsUseCase
 from app.domain.use_cases.treat_csv_use_case import TreatCsvUseCase
 from app.domain.use_cases.update_positions_use_case import UpdatePositionsUseCase
 from app.infrastructure.analyzers.analyzer_home_broker_data import (
     AnalyzerHomeBrokerData,
 )
-from app.infrastructure.analyzers.strategies.fifo_strategy import FifoStrategy
+from app.infrastructure.analyzers.downsampling import Downsampler
+from app.infrastructure.analyzers.operations_analyzed_result_set import (
+    OPERATIONS_ANALYZED_COLUMNS,
+    format_operations_analyzed,
+    realized_pnl_series,
+)
+from app.infrastructure.analyzers.portfolio_timeseries import (
+    build_portfolio_timeseries,
+)
+from app.infrastructure.analyzers.position_ledger import build_position_ledger
+from app.infrastructure.analyzers.strategies.lot_queue_fifo_strategy import (
+    LotQueueFifoStrategy,
+)
+from app.infrastructure.analyzers.strategies.strategy_factory import build_strategy
+from app.infrastructure.api.conditional import (
+    dataset_validators,
+    is_not_modified,
+    not_modified_response,
+)
+from app.infrastructure.api.export_stream import (
+    EXPORT_MEDIA_TYPES,
+    accepts_gzip,
+    encode_records,
+)
+from app.infrastructure.api.responses import trusted_response
 from app.infrastructure.api.schemas import (
     AllPositionsResponse,
     ClosedPositionsResponse,
+    CursorPaginationInfo,
     DeletePositionsRequest,
     DeletePositionsResponse,
+    HoldingsBatchResponse,
+    HoldingsResponse,
+    IngestJobResponse,
+    OpenPositionsResponse,
     PaginationInfo,
+    PositionsSummaryResponse,
+    RealizedPnlResponse,
+    TimeSeriesResponse,
     UpdatePositionsRequest,
     UpdatePositionsResponse,
     UploadOperationsResponse,
 )
+from app.infrastructure.caches.lru_result_cache import LruResultCache
+from app.infrastructure.caches.single_flight import SingleFlight
+from app.infrastructure.db.postgresql.repositories.lot_snapshots_repository import (
+    LotSnapshotsRepository,
+)
+from app.infrastructure.db.postgresql.repositories.lots_repository import (
+    LotsRepository,
+)
 from app.infrastructure.db.postgresql.repositories.operations_repository import (
     OperationsRepository,
 )
+from app.infrastructure.executors.pool_task_executor import PoolTaskExecutor
+from app.infrastructure.jobs.ingest_job_queue import IngestJobQueue
 from app.infrastructure.parsers.csv_parser_portfolio import CsvParserPortfolio
-from app.infrastructure.parsers.positions_response_parser import PositionsResponseParser
+from app.infrastructure.parsers.positions_response_parser import (
+    PositionResponse,
+    PositionsResponseParser,
+)
 
 
 class MainRoutes:
@@ -41,12 +113,53 @@ class MainRoutes:
         # Store limiter for use in decorators
         self.limiter = limiter or Limiter(key_func=get_remote_address)
 
-        self.repository = OperationsRepository()
+        self.repository = OperationsRepository(
+            dataset_version_ttl=self.settings.DATASET_VERSION_TTL_SECONDS
+        )
         self.csv_parser = CsvParserPortfolio()
-        self.treat_csv_use_case = TreatCsvUseCase(self.repository, self.csv_parser)
+        self.task_executor = PoolTaskExecutor(
+            self.settings.EXECUTOR_TYPE, self.settings.EXECUTOR_MAX_WORKERS
+        )
+        self.result_cache = (
+            LruResultCache(self.settings.ANALYSIS_CACHE_MAX_BYTES)
+            if self.settings.ANALYSIS_CACHE_MAX_BYTES > 0
+            else None
+        )
+        self.single_flight = SingleFlight()
+        self.lot_snapshots_repository = LotSnapshotsRepository()
 
-        self.fifo_strategy = FifoStrategy()
-        self.home_broker_analyzer = AnalyzerHomeBrokerData(self.fifo_strategy)
+        # Stored lots are only kept up to date when they are used to serve closed positions
+        self.lots_repository = (
+            LotsRepository() if self.settings.PERSISTED_LOTS_ENABLED else None
+        )
+        self.sync_lots_use_case = (
+            SyncLotsUseCase(
+                self.repository, self.lots_repository, LotQueueFifoStrategy()
+            )
+            if self.lots_repository
+            else None
+        )
+        self.treat_csv_use_case = TreatCsvUseCase(
+            self.repository,
+            self.csv_parser,
+            self.sync_lots_use_case,
+            self.task_executor,
+            self.result_cache,
+        )
+        self.ingest_job_queue = IngestJobQueue(
+            self.treat_csv_use_case,
+            self.settings.INGEST_SPOOL_DIR,
+            self.settings.CSV_CHUNK_SIZE,
+            self.settings.INGEST_MAX_CONCURRENT_JOBS,
+            self.settings.INGEST_MAX_QUEUED_JOBS,
+        )
+
+        self.strategy = build_strategy(
+            self.settings.ANALYZER_STRATEGY, self.settings.EXECUTOR_TYPE
+        )
+        self.home_broker_analyzer = AnalyzerHomeBrokerData(
+            self.strategy, self.task_executor
+        )
 
         self._setup_routes()
 
@@ -61,20 +174,14 @@ class MainRoutes:
                 status_code=400, detail="Limit must be between 1 and 100"
             )
 
-        if offset > 10000:
-            raise HTTPException(
-                status_code=400,
-                detail="Offset cannot exceed 10,000 for performance reasons",
-            )
-
-        # Prevent potential memory issues with very large result sets
-        if offset + limit > 10000:
-            raise HTTPException(
-                status_code=400,
-                detail="Combined offset and limit cannot exceed 10,000 records",
-            )
+    def _validate_dates(self, **dates: str | list[str] | None) -> None:
+        """Parse the DD/MM/YYYY dates by name, so an invalid request gets 400 and never 304"""
+        for field_name, values in dates.items():
+            for value in values if isinstance(values, list) else [values]:
+                if value is not None:
+                    parse_query_date(value, field_name)
 
-    def _validate_file_upload(self, file: UploadFile) -> None:
+    def _validate_file_upload(self, file: UploadFile, max_file_size: int) -> None:
         """Validate uploaded file for type, size, and content"""
         # Check file extension
         if not file.filename or not file.filename.lower().endswith(".csv"):
@@ -89,14 +196,32 @@ class MainRoutes:
                 detail=f"Invalid content type: {file.content_type}. Expected CSV content type",
             )
 
-        # Check file size (10MB limit)
-        MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-        if file.size and file.size > MAX_FILE_SIZE:
+        # Check file size
+        if file.size and file.size > max_file_size:
             raise HTTPException(
                 status_code=413,
-                detail=f"File too large. Maximum size allowed is {MAX_FILE_SIZE // (1024 * 1024)}MB",
+                detail=f"File too large. Maximum size allowed is {max_file_size // (1024 * 1024)}MB",
             )
 
+    def _to_job_response(self, job: IngestJob) -> IngestJobResponse:
+        result = job.result
+        return IngestJobResponse(
+            id=job.id,
+            status=job.status,
+            file_name=job.file_name,
+            rows_parsed=job.rows_parsed,
+            rows_written=job.rows_written,
+            rows_per_second=round(job.rows_per_second, 2),
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            inserted=result.inserted if result else 0,
+            updated=result.updated if result else 0,
+            skipped=result.skipped if result else 0,
+            already_ingested=result.already_ingested if result else False,
+            error=job.error,
+        )
+
     def _setup_routes(self):
         @self.router.get("/health")
         async def health_check():
@@ -105,19 +230,75 @@ class MainRoutes:
                 "status": "healthy",
                 "service": self.settings.APP_NAME,
                 "version": self.settings.VERSION,
+                "result_cache": (
+                    self.result_cache.stats() if self.result_cache else None
+                ),
+                "single_flight": self.single_flight.stats(),
             }
 
-        @self.router.post("/upload-operations", response_model=UploadOperationsResponse)
+        @self.router.post(
+            "/upload-operations",
+            response_model=UploadOperationsResponse,
+            responses={202: {"model": IngestJobResponse}},
+        )
         @self.limiter.limit("10/hour")
-        async def upload_operations(request: Request, file: UploadFile = File(...)):
+        async def upload_operations(
+            request: Request,
+            file: UploadFile = File(...),
+            streaming: bool = Query(
+                False,
+                description="Store the file in chunks, for exports too large to load at once",
+            ),
+            on_conflict: ConflictModes = Query(
+                ConflictModes.REJECT,
+                description="What to do with the operations whose NUME is already stored",
+            ),
+            background: bool = Query(
+                False,
+                description="Store the file in the background and answer with the job to follow it",
+            ),
+        ):
             """Upload operations endpoint"""
             try:
-                self._validate_file_upload(file)
+                if background:
+                    self._validate_file_upload(
+                        file, self.settings.MAX_STREAMING_UPLOAD_SIZE
+                    )
+                    job = await self.ingest_job_queue.submit(file, on_conflict)
+                    return JSONResponse(
+                        status_code=202,
+                        content=self._to_job_response(job).model_dump(mode="json"),
+                    )
+
+                if streaming:
+                    self._validate_file_upload(
+                        file, self.settings.MAX_STREAMING_UPLOAD_SIZE
+                    )
+                    result = await self.treat_csv_use_case.execute_streaming(
+                        file, self.settings.CSV_CHUNK_SIZE, on_conflict
+                    )
+                else:
+                    self._validate_file_upload(file, self.settings.MAX_UPLOAD_SIZE)
+                    result = await self.treat_csv_use_case.execute(file, on_conflict)
 
-                operations_created: int = await self.treat_csv_use_case.execute(file)
+                if result.already_ingested:
+                    message = "The file was already uploaded, no operations were stored"
+                else:
+                    message = (
+                        f"Successfully uploaded {result.operations_stored} operations"
+                    )
                 return UploadOperationsResponse(
-                    message=f"Successfully uploaded {operations_created} operations",
+                    message=message,
                     status="success",
+                    inserted=result.inserted,
+                    updated=result.updated,
+                    skipped=result.skipped,
+                    already_ingested=result.already_ingested,
+                )
+            except asyncio.QueueFull:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Too many uploads waiting to be stored, try again later",
                 )
             except ValueError as e:
                 raise HTTPException(status_code=400, detail=str(e))
@@ -130,12 +311,24 @@ class MainRoutes:
                     detail="An unexpected error occurred while processing the file",
                 )
 
+        @self.router.get(
+            "/jobs/{job_id}",
+            description="Get the progress of an upload stored in the background",
+            response_model=IngestJobResponse,
+        )
+        async def get_job(job_id: str):
+            job = self.ingest_job_queue.get(job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail="Job not found")
+            return self._to_job_response(job)
+
         @self.router.get(
             "/closed-positions",
             description="Get only closed position of actions of historical portfolio",
             response_model=ClosedPositionsResponse,
         )
         async def closed_positions(
+            request: Request,
             from_date: str,
             to_date: str,
             ticker: str | None = Query(
@@ -143,6 +336,14 @@ class MainRoutes:
                 regex=r"^[A-Za-z0-9]+$",
                 description="Ticker symbol (alphanumeric)",
             ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
+            window: WindowModes = Query(
+                WindowModes.ISOLATED,
+                description="Match only the operations in the dates, or the whole history before them",
+            ),
             offset: int = Query(
                 0, ge=0, le=10000, description="Number of records to skip (max 10,000)"
             ),
@@ -157,6 +358,11 @@ class MainRoutes:
 
             try:
                 self._validate_pagination(offset, limit)
+                self._validate_dates(from_date=from_date, to_date=to_date)
+
+                validators = await self._dataset_validators()
+                if is_not_modified(request.headers, validators):
+                    return not_modified_response(validators)
 
                 type_operation = (
                     HBTypeOperations.BUY,
@@ -164,27 +370,55 @@ class MainRoutes:
                     HBTypeOperations.SELL_PARITY,
                 )
 
-                get_positions_use_case = GetPositionsUseCase(
-                    self.repository, self.home_broker_analyzer
-                )
-
-                closed_positions = await get_positions_use_case.execute(
-                    from_date=from_date,
-                    to_date=to_date,
-                    type_operation=type_operation,
-                    ticker=ticker,
-                )
+                if window == WindowModes.HISTORY:
+                    analysis = await self._analyze_positions(
+                        from_date, to_date, ticker, ticker_match, window
+                    )
+                    closed_positions = analysis.closed_operations
+                elif self.lots_repository and self.sync_lots_use_case:
+                    get_closed_lots_use_case = GetClosedLotsUseCase(
+                        self.lots_repository,
+                        self.sync_lots_use_case,
+                        GetPositionsUseCase(
+                            self.repository,
+                            self.home_broker_analyzer,
+                            self.result_cache,
+                            self.settings.ANALYZER_STRATEGY,
+                            self.single_flight,
+                        ),
+                    )
+                    closed_positions = await get_closed_lots_use_case.execute(
+                        from_date=from_date,
+                        to_date=to_date,
+                        ticker=ticker,
+                        ticker_match=ticker_match,
+                    )
+                else:
+                    get_positions_use_case = GetPositionsUseCase(
+                        self.repository,
+                        self.home_broker_analyzer,
+                        self.result_cache,
+                        self.settings.ANALYZER_STRATEGY,
+                        self.single_flight,
+                    )
+                    closed_positions = await get_positions_use_case.execute(
+                        from_date=from_date,
+                        to_date=to_date,
+                        type_operation=type_operation,
+                        ticker=ticker,
+                        ticker_match=ticker_match,
+                    )
 
                 total_count = len(closed_positions)
                 paginated_positions = closed_positions[offset : offset + limit]
 
-                formatted_positions = [
-                    position.to_formatted_dict() for position in paginated_positions
-                ]
+                formatted_positions = format_operations_analyzed(paginated_positions)
 
                 message = self.get_message(len(paginated_positions))
 
-                return ClosedPositionsResponse(
+                return trusted_response(
+                    ClosedPositionsResponse,
+                    headers=validators,
                     message=message,
                     data=formatted_positions,
                     pagination=PaginationInfo(
@@ -203,12 +437,380 @@ class MainRoutes:
                     detail="An unexpected error occurred while retrieving closed positions",
                 )
 
+        @self.router.get(
+            "/open-positions",
+            description="Get only open position of actions of historical portfolio",
+            response_model=OpenPositionsResponse,
+        )
+        async def open_positions(
+            request: Request,
+            from_date: str,
+            to_date: str,
+            ticker: str | None = Query(
+                None,
+                regex=r"^[A-Za-z0-9]+$",
+                description="Ticker symbol (alphanumeric)",
+            ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
+            window: WindowModes = Query(
+                WindowModes.ISOLATED,
+                description="Match only the operations in the dates, or the whole history before them",
+            ),
+            offset: int = Query(
+                0, ge=0, le=10000, description="Number of records to skip (max 10,000)"
+            ),
+            limit: int = Query(
+                10,
+                ge=1,
+                le=100,
+                description="Maximum number of records to return (max 100)",
+            ),
+        ):
+            """Get only open position of actions"""
+
+            try:
+                self._validate_pagination(offset, limit)
+                self._validate_dates(from_date=from_date, to_date=to_date)
+
+                validators = await self._dataset_validators()
+                if is_not_modified(request.headers, validators):
+                    return not_modified_response(validators)
+
+                analysis = await self._analyze_positions(
+                    from_date, to_date, ticker, ticker_match, window
+                )
+
+                total_count = len(analysis.open_operations)
+                paginated_positions = analysis.open_operations[offset : offset + limit]
+
+                formatted_positions = format_operations_analyzed(paginated_positions)
+
+                message = self.get_message(len(paginated_positions))
+
+                return trusted_response(
+                    OpenPositionsResponse,
+                    headers=validators,
+                    message=message,
+                    data=formatted_positions,
+                    pagination=PaginationInfo(
+                        total=total_count,
+                        offset=offset,
+                        limit=limit,
+                        has_more=offset + limit < total_count,
+                    ),
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Unexpected error in open_positions: {str(e)}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="An unexpected error occurred while retrieving open positions",
+                )
+
+        @self.router.get(
+            "/positions-summary",
+            description="Get closed and open positions of actions with totals per ticker",
+            response_model=PositionsSummaryResponse,
+        )
+        async def positions_summary(
+            request: Request,
+            from_date: str,
+            to_date: str,
+            ticker: str | None = Query(
+                None,
+                regex=r"^[A-Za-z0-9]+$",
+                description="Ticker symbol (alphanumeric)",
+            ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
+            window: WindowModes = Query(
+                WindowModes.ISOLATED,
+                description="Match only the operations in the dates, or the whole history before them",
+            ),
+        ):
+            """Get closed and open positions of actions from a single analysis"""
+
+            try:
+                self._validate_dates(from_date=from_date, to_date=to_date)
+
+                validators = await self._dataset_validators()
+                if is_not_modified(request.headers, validators):
+                    return not_modified_response(validators)
+
+                analysis = await self._analyze_positions(
+                    from_date, to_date, ticker, ticker_match, window
+                )
+
+                return trusted_response(
+                    PositionsSummaryResponse,
+                    headers=validators,
+                    message=self.get_message(
+                        len(analysis.closed_operations) + len(analysis.open_operations)
+                    ),
+                    closed=format_operations_analyzed(analysis.closed_operations),
+                    open=format_operations_analyzed(analysis.open_operations),
+                    totals=[
+                        summary.to_formatted_dict()
+                        for summary in analysis.summarize_by_ticker()
+                    ],
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Unexpected error in positions_summary: {str(e)}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="An unexpected error occurred while retrieving the positions summary",
+                )
+
+        @self.router.get(
+            "/holdings",
+            description="Get what the portfolio held at the end of a date",
+            response_model=HoldingsResponse,
+        )
+        async def holdings(
+            request: Request,
+            as_of: str = Query(..., description="Date of the holdings (DD/MM/YYYY)"),
+            ticker: str | None = Query(
+                None,
+                regex=r"^[A-Za-z0-9]+$",
+                description="Ticker symbol (alphanumeric)",
+            ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
+        ):
+            """Get the quantity and FIFO cost basis held of every ticker at a date"""
+
+            try:
+                self._validate_dates(as_of=as_of)
+
+                validators = await self._dataset_validators()
+                if is_not_modified(request.headers, validators):
+                    return not_modified_response(validators)
+
+                [(date, holdings)] = await self._build_holdings_use_case().execute(
+                    [as_of], ticker=ticker, ticker_match=ticker_match
+                )
+
+                return trusted_response(
+                    HoldingsResponse,
+                    headers=validators,
+                    message=self.get_message(len(holdings)),
+                    as_of=date.strftime("%d/%m/%Y"),
+                    data=[holding.to_formatted_dict() for holding in holdings],
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Unexpected error in holdings: {str(e)}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="An unexpected error occurred while retrieving the holdings",
+                )
+
+        @self.router.get(
+            "/holdings/batch",
+            description="Get what the portfolio held at the end of several dates",
+            response_model=HoldingsBatchResponse,
+        )
+        async def holdings_batch(
+            request: Request,
+            dates: list[str] = Query(
+                ...,
+                description="Dates of the holdings (DD/MM/YYYY), the parameter is repeated for each one",
+            ),
+            ticker: str | None = Query(
+                None,
+                regex=r"^[A-Za-z0-9]+$",
+                description="Ticker symbol (alphanumeric)",
+            ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
+        ):
+            """Get the holdings at several dates from a single ledger"""
+
+            try:
+                if len(dates) > self.settings.HOLDINGS_MAX_DATES:
+                    raise ValueError(
+                        f"At most {self.settings.HOLDINGS_MAX_DATES} dates can be requested"
+                    )
+
+                self._validate_dates(as_of=dates)
+
+                validators = await self._dataset_validators()
+                if is_not_modified(request.headers, validators):
+                    return not_modified_response(validators)
+
+                holdings_by_date = await self._build_holdings_use_case().execute(
+                    dates, ticker=ticker, ticker_match=ticker_match
+                )
+
+                return trusted_response(
+                    HoldingsBatchResponse,
+                    headers=validators,
+                    message=self.get_message(
+                        sum(len(holdings) for _, holdings in holdings_by_date)
+                    ),
+                    data=[
+                        {
+                            "as_of": date.strftime("%d/%m/%Y"),
+                            "holdings": [
+                                holding.to_formatted_dict() for holding in holdings
+                            ],
+                        }
+                        for date, holdings in holdings_by_date
+                    ],
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Unexpected error in holdings_batch: {str(e)}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="An unexpected error occurred while retrieving the holdings",
+                )
+
+        @self.router.get(
+            "/timeseries",
+            description="Get the daily cash, invested and realized P&L of the account",
+            response_model=TimeSeriesResponse,
+        )
+        async def timeseries(
+            request: Request,
+            from_date: str | None = Query(
+                None, description="First day of the curves (DD/MM/YYYY)"
+            ),
+            to_date: str | None = Query(
+                None, description="Last day of the curves (DD/MM/YYYY)"
+            ),
+            points: int | None = Query(
+                None,
+                ge=2,
+                description="Maximum number of days returned, the curves are downsampled to them",
+            ),
+            downsampling: DownsamplingMethods = Query(
+                DownsamplingMethods.LTTB,
+                description="How the days are chosen when the curves are downsampled",
+            ),
+        ):
+            """Get the daily curves of the account over its whole history or between dates"""
+
+            try:
+                self._validate_dates(from_date=from_date, to_date=to_date)
+
+                validators = await self._dataset_validators()
+                if is_not_modified(request.headers, validators):
+                    return not_modified_response(validators)
+
+                series = await GetTimeSeriesUseCase(
+                    self.repository,
+                    build_portfolio_timeseries,
+                    Downsampler(downsampling),
+                    self.result_cache,
+                    self.task_executor,
+                ).execute(from_date, to_date, points)
+
+                return trusted_response(
+                    TimeSeriesResponse,
+                    headers=validators,
+                    message=self.get_message(len(series)),
+                    data=series.to_formatted_records(),
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Unexpected error in timeseries: {str(e)}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="An unexpected error occurred while retrieving the time series",
+                )
+
+        @self.router.get(
+            "/realized-pnl",
+            description="Get the gain realized by each closed lot and the gain accumulated",
+            response_model=RealizedPnlResponse,
+        )
+        async def realized_pnl(
+            request: Request,
+            from_date: str,
+            to_date: str,
+            ticker: str | None = Query(
+                None,
+                regex=r"^[A-Za-z0-9]+$",
+                description="Ticker symbol (alphanumeric)",
+            ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
+            window: WindowModes = Query(
+                WindowModes.ISOLATED,
+                description="Match only the operations in the dates, or the whole history before them",
+            ),
+            points: int | None = Query(
+                None,
+                ge=2,
+                description="Maximum number of lots returned, the series is downsampled to them",
+            ),
+            downsampling: DownsamplingMethods = Query(
+                DownsamplingMethods.LTTB,
+                description="How the lots are chosen when the series is downsampled",
+            ),
+        ):
+            """Get the realized P&L of the closed lots sorted by the date they were sold"""
+
+            try:
+                self._validate_dates(from_date=from_date, to_date=to_date)
+
+                validators = await self._dataset_validators()
+                if is_not_modified(request.headers, validators):
+                    return not_modified_response(validators)
+
+                analysis = await self._analyze_positions(
+                    from_date, to_date, ticker, ticker_match, window
+                )
+                series = realized_pnl_series(analysis.closed_operations)
+                if points is not None:
+                    series = series.take(
+                        Downsampler(downsampling).select_indices(
+                            [date.toordinal() for date in series.dates],
+                            [series.cumulative_gain, series.nominal_gain],
+                            points,
+                        )
+                    )
+
+                return trusted_response(
+                    RealizedPnlResponse,
+                    headers=validators,
+                    message=self.get_message(len(series)),
+                    data=series.to_formatted_records(),
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Unexpected error in realized_pnl: {str(e)}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="An unexpected error occurred while retrieving the realized P&L",
+                )
+
         @self.router.get(
             "/all-positions",
             description="Get all positions of actions of historical portfolio",
             response_model=AllPositionsResponse,
         )
         async def all_positions(
+            request: Request,
             from_date: str,
             to_date: str,
             ticker: str | None = Query(
@@ -216,9 +818,18 @@ class MainRoutes:
                 regex=r"^[A-Za-z0-9]+$",
                 description="Ticker symbol (alphanumeric)",
             ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
             sort: TypeOfSort = TypeOfSort.ASCENDING,
+            cursor: str | None = Query(
+                None, description="Cursor of the page to read, from a previous response"
+            ),
             offset: int = Query(
-                0, ge=0, le=10000, description="Number of records to skip (max 10,000)"
+                0,
+                ge=0,
+                description="Number of records to skip, when no cursor is given",
             ),
             limit: int = Query(
                 10,
@@ -227,10 +838,9 @@ class MainRoutes:
                 description="Maximum number of records to return (max 100)",
             ),
         ):
-            """Get all positions of actions"""
+            """Get all positions of actions, sorted and paginated by the database"""
 
             try:
-                # Validate pagination parameters
                 self._validate_pagination(offset, limit)
 
                 type_operation = (
@@ -239,32 +849,55 @@ class MainRoutes:
                     HBTypeOperations.SELL_PARITY,
                 )
 
-                get_positions_use_case = GetPositionsUseCase(self.repository)
-
-                all_positions = await get_positions_use_case.execute(
+                get_operations_page_use_case = GetOperationsPageUseCase(self.repository)
+                get_operations_page_use_case.parse_query(
                     from_date=from_date,
                     to_date=to_date,
+                    sort=sort,
+                    cursor=cursor,
+                    offset=offset,
                     type_operation=type_operation,
                     ticker=ticker,
+                    ticker_match=ticker_match,
                 )
 
-                parser = PositionsResponseParser()
-                formatted_positions = parser.parse(all_positions, sort)
+                validators = await self._dataset_validators()
+                if is_not_modified(request.headers, validators):
+                    return not_modified_response(validators)
 
-                # Apply pagination
-                total_count = len(formatted_positions)
-                paginated_positions = formatted_positions[offset : offset + limit]
+                page = await get_operations_page_use_case.execute(
+                    from_date=from_date,
+                    to_date=to_date,
+                    limit=limit,
+                    sort=sort,
+                    cursor=cursor,
+                    offset=offset,
+                    type_operation=type_operation,
+                    ticker=ticker,
+                    ticker_match=ticker_match,
+                )
 
-                message = self.get_message(len(paginated_positions))
+                # The page is already sorted by the database
+                formatted_positions = PositionsResponseParser().parse(
+                    page.operations, sort=None
+                )
 
-                return AllPositionsResponse(
-                    message=message,
-                    data=paginated_positions,
-                    pagination=PaginationInfo(
-                        total=total_count,
+                return trusted_response(
+                    AllPositionsResponse,
+                    headers=validators,
+                    message=self.get_message(len(formatted_positions)),
+                    data=formatted_positions,
+                    pagination=CursorPaginationInfo(
+                        total=page.total,
                         offset=offset,
                         limit=limit,
-                        has_more=offset + limit < total_count,
+                        has_more=page.next_cursor is not None,
+                        next_cursor=(
+                            page.next_cursor.to_token() if page.next_cursor else None
+                        ),
+                        prev_cursor=(
+                            page.prev_cursor.to_token() if page.prev_cursor else None
+                        ),
                     ),
                 )
             except ValueError as e:
@@ -276,6 +909,109 @@ class MainRoutes:
                     detail="An unexpected error occurred while retrieving all positions",
                 )
 
+        @self.router.get(
+            "/closed-positions/export",
+            description=(
+                "Stream every closed position of the historical portfolio as NDJSON or CSV. "
+                "The memory used only stays constant with PERSISTED_LOTS_ENABLED, otherwise "
+                "the closed positions of the analysis are held while they are streamed"
+            ),
+        )
+        async def export_closed_positions(
+            request: Request,
+            from_date: str,
+            to_date: str,
+            ticker: str | None = Query(
+                None,
+                regex=r"^[A-Za-z0-9]+$",
+                description="Ticker symbol (alphanumeric)",
+            ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
+            export_format: ExportFormats = Query(
+                ExportFormats.NDJSON, alias="format", description="Format of the rows"
+            ),
+        ):
+            """Stream closed positions, gzip encoded when the client accepts it"""
+
+            try:
+                batches = await self._build_export_use_case().export_closed_positions(
+                    from_date=from_date,
+                    to_date=to_date,
+                    ticker=ticker,
+                    ticker_match=ticker_match,
+                )
+                return self._stream_export(
+                    request,
+                    batches,
+                    format_operations_analyzed,
+                    OPERATIONS_ANALYZED_COLUMNS,
+                    export_format,
+                    "closed-positions",
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(
+                    f"Unexpected error in export_closed_positions: {str(e)}"
+                )
+                raise HTTPException(
+                    status_code=500,
+                    detail="An unexpected error occurred while exporting closed positions",
+                )
+
+        @self.router.get(
+            "/all-positions/export",
+            description="Stream every position of the historical portfolio as NDJSON or CSV",
+        )
+        async def export_all_positions(
+            request: Request,
+            from_date: str,
+            to_date: str,
+            ticker: str | None = Query(
+                None,
+                regex=r"^[A-Za-z0-9]+$",
+                description="Ticker symbol (alphanumeric)",
+            ),
+            ticker_match: TickerMatches = Query(
+                TickerMatches.CONTAINS,
+                description="Match tickers containing the symbol or exactly equal to it",
+            ),
+            sort: TypeOfSort = TypeOfSort.ASCENDING,
+            export_format: ExportFormats = Query(
+                ExportFormats.NDJSON, alias="format", description="Format of the rows"
+            ),
+        ):
+            """Stream all positions, gzip encoded when the client accepts it"""
+
+            try:
+                batches = await self._build_export_use_case().export_all_positions(
+                    from_date=from_date,
+                    to_date=to_date,
+                    sort=sort,
+                    ticker=ticker,
+                    ticker_match=ticker_match,
+                )
+                parser = PositionsResponseParser()
+                return self._stream_export(
+                    request,
+                    batches,
+                    lambda operations: parser.parse(operations, sort=None),
+                    list(PositionResponse.model_fields),
+                    export_format,
+                    "all-positions",
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Unexpected error in export_all_positions: {str(e)}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="An unexpected error occurred while exporting all positions",
+                )
+
         @self.router.delete(
             "/delete-positions",
             description="Delete positions of actions of historical portfolio",
@@ -288,7 +1024,9 @@ class MainRoutes:
             """Delete operations based on provided criteria"""
 
             try:
-                delete_operations_use_case = DeletePositionsUseCase(self.repository)
+                delete_operations_use_case = DeletePositionsUseCase(
+                    self.repository, self.sync_lots_use_case, self.result_cache
+                )
 
                 # Convert list to tuple for type_operations to match use case signature
                 type_operations_tuple = (
@@ -337,7 +1075,9 @@ class MainRoutes:
             """Update operations based on provided criteria and update data"""
 
             try:
-                update_operations_use_case = UpdatePositionsUseCase(self.repository)
+                update_operations_use_case = UpdatePositionsUseCase(
+                    self.repository, self.sync_lots_use_case, self.result_cache
+                )
 
                 updated_count = await update_operations_use_case.execute(
                     properties_to_filter=update_request.to_operation_properties_filter(),
@@ -366,6 +1106,110 @@ class MainRoutes:
                     detail="An unexpected error occurred while updating positions",
                 )
 
+    async def _dataset_validators(self) -> dict[str, str]:
+        """
+        Validators of the responses computed from the stored operations, a client sending them
+        back is answered with 304 without running the query or the analysis.
+        """
+        return dataset_validators(
+            await self.repository.get_dataset_version_info(),
+            self.settings.VERSION,
+            self.settings.ANALYZER_STRATEGY,
+        )
+
+    def _build_holdings_use_case(self) -> GetHoldingsUseCase:
+        return GetHoldingsUseCase(
+            self.repository,
+            build_position_ledger,
+            self.result_cache,
+            self.task_executor,
+        )
+
+    def _build_export_use_case(self) -> ExportPositionsUseCase:
+        return ExportPositionsUseCase(
+            self.repository,
+            self.settings.EXPORT_BATCH_SIZE,
+            self.lots_repository,
+            self.sync_lots_use_case,
+            GetPositionsUseCase(
+                self.repository,
+                self.home_broker_analyzer,
+                self.result_cache,
+                self.settings.ANALYZER_STRATEGY,
+                self.single_flight,
+            ),
+        )
+
+    def _stream_export(
+        self,
+        request: Request,
+        batches: AsyncIterator[Sequence[Any]],
+        format_batch: Callable[[Sequence[Any]], list[dict[str, Any]]],
+        columns: list[str],
+        export_format: ExportFormats,
+        file_name: str,
+    ) -> StreamingResponse:
+        """Stream the formatted batches, the response is already sent when a batch fails"""
+        gzip = accepts_gzip(request.headers.get("accept-encoding"))
+
+        async def records() -> AsyncIterator[list[dict[str, Any]]]:
+            try:
+                async for batch in batches:
+                    yield format_batch(batch)
+            except Exception as e:
+                self.logger.error(f"Export of {file_name} interrupted: {str(e)}")
+                raise
+
+        headers = {
+            "Content-Disposition": f'attachment; filename="{file_name}.{export_format}"',
+            "Vary": "Accept-Encoding",
+        }
+        if gzip:
+            headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(
+            encode_records(records(), export_format, columns, gzip=gzip),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers=headers,
+        )
+
+    async def _analyze_positions(
+        self,
+        from_date: str,
+        to_date: str,
+        ticker: str | None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+        window: WindowModes = WindowModes.ISOLATED,
+    ) -> PositionsAnalysis:
+        """Run the FIFO analysis once for closed and open positions, sharing its cache entry"""
+        if window == WindowModes.HISTORY:
+            get_window_positions_use_case = GetWindowPositionsUseCase(
+                self.repository,
+                self.lot_snapshots_repository,
+                LotQueueFifoStrategy(),
+                self.result_cache,
+            )
+            return await get_window_positions_use_case.execute(
+                from_date=from_date,
+                to_date=to_date,
+                ticker=ticker,
+                ticker_match=ticker_match,
+            )
+
+        get_positions_use_case = GetPositionsUseCase(
+            self.repository,
+            self.home_broker_analyzer,
+            self.result_cache,
+            self.settings.ANALYZER_STRATEGY,
+            self.single_flight,
+        )
+        return await get_positions_use_case.analyze_positions(
+            from_date=from_date,
+            to_date=to_date,
+            type_operation=TRADING_TYPES,
+            ticker=ticker,
+            ticker_match=ticker_match,
+        )
+
     def get_message(self, count: int) -> str:
         if count == 0:
             return "No records found with the filters provided"
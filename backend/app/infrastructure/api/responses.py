@@ -0,0 +1,33 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson, nested pydantic models are dumped when found.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_dump_model, option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+def trusted_response(
+    schema: type[BaseModel], headers: dict[str, str] | None = None, **fields: Any
+) -> FastJSONResponse:
+    """
+    Build the response of `schema` from data built by the application, without validating it.
+    Routes returning a Response skip the validation and serialization of their response_model,
+    which is then only used to document the endpoint.
+    """
+    return FastJSONResponse(dict(schema.model_construct(**fields)), headers=headers)
+
+
+def _dump_model(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
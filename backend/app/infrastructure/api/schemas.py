@@ -36,6 +36,33 @@ class OperationResponse(BaseModel):
 class UploadOperationsResponse(BaseModel):
     message: str
     status: str
+    inserted: int = Field(0, description="Operations created")
+    updated: int = Field(
+        0, description="Operations already stored that were overwritten"
+    )
+    skipped: int = Field(0, description="Operations already stored that were kept")
+    already_ingested: bool = Field(
+        False, description="The file was uploaded before and nothing was stored"
+    )
+
+
+class IngestJobResponse(BaseModel):
+    """Progress of an upload stored in the background"""
+
+    id: str
+    status: str
+    file_name: str | None = None
+    rows_parsed: int = Field(0, description="Rows of the file parsed so far")
+    rows_written: int = Field(0, description="Rows sent to the database so far")
+    rows_per_second: float = Field(0.0, description="Rows written per second")
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    already_ingested: bool = False
+    error: str | None = None
 
 
 class DeletePositionsRequest(BaseModel):
@@ -230,9 +257,75 @@ class ClosedPositionsResponse(BaseModel):
     pagination: PaginationInfo
 
 
+class CursorPaginationInfo(BaseModel):
+    """Pagination information of pages read with keyset pagination"""
+
+    total: int | None = Field(
+        None, description="Only counted for pages requested without cursor"
+    )
+    offset: int
+    limit: int
+    has_more: bool
+    next_cursor: str | None = Field(None, description="Cursor of the next page")
+    prev_cursor: str | None = Field(None, description="Cursor of the previous page")
+
+
 class AllPositionsResponse(BaseModel):
     """Response model for all positions"""
 
+    message: str
+    data: List[Any]
+    pagination: CursorPaginationInfo
+
+
+class OpenPositionsResponse(BaseModel):
+    """Response model for open positions"""
+
     message: str
     data: List[Any]
     pagination: PaginationInfo
+
+
+class PositionsSummaryResponse(BaseModel):
+    """Response model for closed and open positions with totals per ticker"""
+
+    message: str
+    closed: List[Any]
+    open: List[Any]
+    totals: List[Any]
+
+
+class HoldingsResponse(BaseModel):
+    """Response model for the holdings at a date"""
+
+    message: str
+    as_of: str
+    data: List[Any]
+
+
+class HoldingsAtDate(BaseModel):
+    """Holdings at one of the dates of a batch"""
+
+    as_of: str
+    holdings: List[Any]
+
+
+class HoldingsBatchResponse(BaseModel):
+    """Response model for the holdings at several dates"""
+
+    message: str
+    data: List[HoldingsAtDate]
+
+
+class TimeSeriesResponse(BaseModel):
+    """Response model for the daily curves of the account"""
+
+    message: str
+    data: List[Any]
+
+
+class RealizedPnlResponse(BaseModel):
+    """Response model for the realized P&L of the closed lots"""
+
+    message: str
+    data: List[Any]
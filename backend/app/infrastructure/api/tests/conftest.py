@@ -0,0 +1,53 @@
+import datetime
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from tortoise import Tortoise
+
+from app.domain.entities.enums import HBTypeOperations
+from app.infrastructure.api.main_routes import MainRoutes
+
+
+@pytest.fixture(params=[False, True], ids=["analysis", "persisted-lots"])
+async def client(request, monkeypatch, make_operation):
+    """Fixture that provides a client of the routes, with and without the stored lots."""
+    monkeypatch.setenv("PERSISTED_LOTS_ENABLED", str(request.param))
+    monkeypatch.setenv("EXPORT_BATCH_SIZE", "1")
+    await Tortoise.init(
+        config={
+            "connections": {"default": "sqlite://:memory:"},
+            "apps": {
+                "models": {
+                    "models": ["app.infrastructure.db.postgresql.models"],
+                    "default_connection": "default",
+                }
+            },
+        }
+    )
+    await Tortoise.generate_schemas()
+    routes = MainRoutes()
+    app = FastAPI()
+    app.state.limiter = routes.limiter
+    app.include_router(routes.router)
+    await routes.repository.create_operations(
+        [
+            make_operation(1, date=datetime.date(2024, 1, 2)),
+            make_operation(2, date=datetime.date(2024, 1, 3), ticker="GGAL"),
+            make_operation(
+                3,
+                type_operation=HBTypeOperations.SELL,
+                date=datetime.date(2024, 1, 10),
+                amount=-10,
+                price=12.0,
+            ),
+        ]
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    if routes.sync_lots_use_case:
+        await routes.sync_lots_use_case.shutdown()
+    routes.task_executor.shutdown()
+    await Tortoise.close_connections()
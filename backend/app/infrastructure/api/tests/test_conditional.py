@@ -0,0 +1,54 @@
+import datetime
+
+from app.domain.entities.entities import DatasetVersion
+from app.infrastructure.api.conditional import dataset_validators, is_not_modified
+
+MODIFIED_AT = datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc)
+
+
+def validators_of(
+    dataset_version: DatasetVersion,
+    app_version: str = "1.0.0",
+    strategy: str = "fifo_lot_queue",
+) -> dict[str, str]:
+    return dataset_validators(dataset_version, app_version, strategy)
+
+
+class TestConditional:
+    def test_is_not_modified_etag(self):
+        """Test that a matching weak or strong ETag is current and another version is not."""
+        validators = validators_of(DatasetVersion(3, MODIFIED_AT))
+        stale = validators_of(DatasetVersion(2, MODIFIED_AT))
+
+        assert validators["ETag"] == (
+            f'W/"1.0.0-fifo_lot_queue-3-{int(MODIFIED_AT.timestamp())}"'
+        )
+        assert is_not_modified({"if-none-match": validators["ETag"]}, validators)
+        assert is_not_modified(
+            {"if-none-match": f'"x", {validators["ETag"][2:]}'}, validators
+        )
+        assert not is_not_modified({"if-none-match": stale["ETag"]}, validators)
+
+    def test_is_not_modified_since(self):
+        """Test that If-Modified-Since is only checked without If-None-Match."""
+        validators = validators_of(DatasetVersion(3, MODIFIED_AT))
+        current = {"if-modified-since": validators["Last-Modified"]}
+        before = {"if-modified-since": "Sun, 31 Dec 2023 12:00:00 GMT"}
+
+        assert is_not_modified(current, validators)
+        assert not is_not_modified(before, validators)
+        assert not is_not_modified({**current, "if-none-match": '"0-0"'}, validators)
+        assert not is_not_modified(current, validators_of(DatasetVersion()))
+
+    def test_etag_of_release_and_strategy(self):
+        """Test that another release or strategy invalidates the ETag of the same dataset."""
+        validators = validators_of(DatasetVersion(3, MODIFIED_AT))
+        headers = {"if-none-match": validators["ETag"]}
+
+        assert is_not_modified(headers, validators_of(DatasetVersion(3, MODIFIED_AT)))
+        assert not is_not_modified(
+            headers, validators_of(DatasetVersion(3, MODIFIED_AT), app_version="1.1.0")
+        )
+        assert not is_not_modified(
+            headers, validators_of(DatasetVersion(3, MODIFIED_AT), strategy="fifo")
+        )
@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+
+PERIOD = {"from_date": "01/01/2024", "to_date": "31/01/2024"}
+
+
+class TestExportRoutes:
+    async def test_export_closed_positions_ndjson(self, client):
+        """Test that the closed positions are streamed as JSON lines."""
+        response = await client.get(
+            "/closed-positions/export",
+            params=PERIOD,
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [(row["ticker"], row["amount"]) for row in rows] == [("AAPL", 10)]
+
+    async def test_export_closed_positions_csv_gzip(self, client):
+        """Test that the format query parameter selects CSV and gzip follows Accept-Encoding."""
+        response = await client.get(
+            "/closed-positions/export",
+            params={**PERIOD, "format": "csv"},
+            headers={"Accept-Encoding": "*;q=0, gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert 'filename="closed-positions.csv"' in (
+            response.headers["content-disposition"]
+        )
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [(row["ticker"], row["sell_price"]) for row in rows] == [
+            ("AAPL", "12.0")
+        ]
+
+    async def test_export_all_positions(self, client):
+        """Test that every trade is streamed in the order asked for, filtered by ticker."""
+        descending = await client.get(
+            "/all-positions/export",
+            params={**PERIOD, "sort": "descending", "format": "csv"},
+        )
+        ggal = await client.get(
+            "/all-positions/export", params={**PERIOD, "ticker": "GGAL"}
+        )
+
+        assert descending.status_code == ggal.status_code == 200
+        rows = csv.DictReader(io.StringIO(descending.text))
+        assert [row["id"] for row in rows] == ["3", "2", "1"]
+        assert [json.loads(line)["ticket"] for line in ggal.text.splitlines()] == [
+            "GGAL"
+        ]
+
+    async def test_export_invalid_dates(self, client):
+        """Test that invalid filters are rejected before anything is streamed."""
+        response = await client.get(
+            "/all-positions/export",
+            params={"from_date": "2024-01-01", "to_date": "31/01/2024"},
+        )
+
+        assert response.status_code == 400
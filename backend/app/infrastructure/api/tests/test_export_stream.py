@@ -0,0 +1,79 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from app.domain.entities.enums import ExportFormats
+from app.infrastructure.api.export_stream import accepts_gzip, encode_records
+
+RECORDS = [{"ticker": "AAPL", "amount": 1}, {"ticker": "GGAL, S.A.", "amount": 2}]
+
+
+async def batches(records: list[dict], size: int = 1):
+    for start in range(0, len(records), size):
+        yield records[start : start + size]
+
+
+async def encode(export_format: ExportFormats, records: list[dict], **options):
+    return [
+        chunk
+        async for chunk in encode_records(
+            batches(records), export_format, ["ticker", "amount"], **options
+        )
+    ]
+
+
+class TestExportStream:
+    @pytest.mark.parametrize(
+        "accept_encoding, expected",
+        [
+            ("gzip", True),
+            ("deflate, gzip;q=0.5", True),
+            ("*", True),
+            ("*;q=0, gzip", True),
+            ("gzip;q=0, *", False),
+            ("br, *;q=0", False),
+            ("gzip;q=invalid", False),
+            ("identity", False),
+            (None, False),
+        ],
+    )
+    def test_accepts_gzip(self, accept_encoding, expected):
+        """Test that an explicit gzip entry takes precedence over the wildcard."""
+        assert accepts_gzip(accept_encoding) is expected
+
+    async def test_encode_ndjson(self):
+        """Test that every batch is sent as its own chunk of JSON lines."""
+        chunks = await encode(ExportFormats.NDJSON, RECORDS)
+
+        assert len(chunks) == 2
+        assert [json.loads(line) for line in b"".join(chunks).splitlines()] == RECORDS
+
+    async def test_encode_csv(self):
+        """Test that the header is sent before the rows, quoting the values when needed."""
+        chunks = await encode(ExportFormats.CSV, RECORDS)
+
+        assert chunks[0] == b"ticker,amount\r\n"
+        rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+        assert rows == [
+            {"ticker": "AAPL", "amount": "1"},
+            {"ticker": "GGAL, S.A.", "amount": "2"},
+        ]
+
+    async def test_encode_gzip(self):
+        """Test that the compressed chunks form a single gzip stream of the records."""
+        chunks = await encode(ExportFormats.NDJSON, RECORDS, gzip=True)
+
+        assert b"".join(await encode(ExportFormats.NDJSON, RECORDS)) == gzip.decompress(
+            b"".join(chunks)
+        )
+
+    async def test_encode_empty_export(self):
+        """Test that an export without records still sends the CSV header."""
+        assert await encode(ExportFormats.NDJSON, []) == []
+        assert (
+            gzip.decompress(b"".join(await encode(ExportFormats.CSV, [], gzip=True)))
+            == b"ticker,amount\r\n"
+        )
@@ -0,0 +1,43 @@
+import pytest
+
+PERIOD = {"from_date": "01/01/2024", "to_date": "31/01/2024"}
+
+
+class TestMainRoutes:
+    async def test_matching_etag_is_not_modified(self, client):
+        """Test that a request sending back the ETag of the dataset gets 304."""
+        response = await client.get("/open-positions", params=PERIOD)
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            "/open-positions", params=PERIOD, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+
+    @pytest.mark.parametrize(
+        "path, params",
+        [
+            ("/closed-positions", {**PERIOD, "from_date": "2024-01-01"}),
+            ("/open-positions", {**PERIOD, "to_date": "31/13/2024"}),
+            ("/positions-summary", {**PERIOD, "from_date": "2024-01-01"}),
+            ("/realized-pnl", {**PERIOD, "from_date": "2024-01-01"}),
+            ("/timeseries", {"from_date": "2024-01-01"}),
+            ("/holdings", {"as_of": "2024-01-01"}),
+            ("/holdings/batch", {"dates": ["31/01/2024", "2024-01-01"]}),
+            ("/all-positions", {**PERIOD, "from_date": "2024-01-01"}),
+            ("/all-positions", {**PERIOD, "cursor": "invalid"}),
+        ],
+    )
+    async def test_invalid_query_is_validated_before_the_etag(
+        self, client, path, params
+    ):
+        """Test that an invalid query with a matching ETag gets 400 instead of 304."""
+        response = await client.get("/open-positions", params=PERIOD)
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            path, params=params, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 400
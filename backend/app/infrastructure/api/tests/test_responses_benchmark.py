@@ -0,0 +1,114 @@
+"""
+Benchmark of the responses built with trusted_response against the pydantic responses validated
+and serialized again by FastAPI, on a page of positions. Timings depend on the machine, so it
+only runs when asked for:
+
+    BENCHMARK_RESPONSES=true BENCHMARK_POSITIONS=100000 python -m pytest -m slow -s app/infrastructure/api/tests
+"""
+
+import datetime
+import os
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.domain.entities.entities import Operation, OperationType, Reference, Ticket
+from app.infrastructure.api.responses import trusted_response
+from app.infrastructure.api.schemas import AllPositionsResponse, CursorPaginationInfo
+from app.infrastructure.parsers.positions_response_parser import (
+    PositionResponse,
+    PositionsResponseParser,
+)
+
+BENCHMARK_RESPONSES = os.getenv("BENCHMARK_RESPONSES", "False").lower() == "true"
+BENCHMARK_POSITIONS = int(os.getenv("BENCHMARK_POSITIONS", "10000"))
+BENCHMARK_ROUNDS = 3
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not BENCHMARK_RESPONSES, reason="BENCHMARK_RESPONSES is not set"
+    ),
+]
+
+
+def build_operations(count: int) -> list[Operation]:
+    first_day = datetime.date(2020, 1, 1)
+    return [
+        Operation(
+            id=number,
+            type_operation=OperationType(type_operation="CPRA"),
+            ticket=Ticket(
+                species=f"SPECIES {number % 50}",
+                species_code=f"{number % 50:05d}",
+                ticker=f"TICK{number % 50}",
+            ),
+            amount=10,
+            code=f"C{number}",
+            accumulated=float(number),
+            number_receipt=number,
+            date_liquidation=first_day + datetime.timedelta(days=number // 100),
+            date_operation=first_day + datetime.timedelta(days=number // 100),
+            reference=Reference(detail=None),
+            import_of_operation=-1000.0,
+            price_of_operation=100.0,
+            comprobant_of_operation=1,
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+def build_app(operations: list[Operation]) -> FastAPI:
+    app = FastAPI()
+    pagination = CursorPaginationInfo(
+        total=len(operations), offset=0, limit=len(operations), has_more=False
+    )
+
+    @app.get("/validated", response_model=AllPositionsResponse)
+    async def validated():
+        # How the responses were built before, a model per position validated twice
+        rows = PositionsResponseParser().parse(operations, sort=None)
+        return AllPositionsResponse(
+            message="",
+            data=[PositionResponse(**row).model_dump() for row in rows],
+            pagination=pagination,
+        )
+
+    @app.get("/trusted", response_model=AllPositionsResponse)
+    async def trusted():
+        return trusted_response(
+            AllPositionsResponse,
+            message="",
+            data=PositionsResponseParser().parse(operations, sort=None),
+            pagination=pagination,
+        )
+
+    return app
+
+
+class TestResponsesBenchmark:
+    async def test_trusted_response_against_validated(self):
+        """Test that trusted responses build and serialize a page in less than half the time."""
+        app = build_app(build_operations(BENCHMARK_POSITIONS))
+
+        results = {}
+        bodies = {}
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+            for name in ("validated", "trusted"):
+                elapsed = []
+                for _ in range(BENCHMARK_ROUNDS):
+                    start = time.perf_counter()
+                    response = await client.get(f"/{name}")
+                    elapsed.append(time.perf_counter() - start)
+                results[name] = min(elapsed)
+                bodies[name] = response.json()
+                print(
+                    f"{name}: {BENCHMARK_POSITIONS} positions in {results[name]:.3f} s"
+                )
+
+        assert bodies["trusted"] == bodies["validated"]
+        assert results["trusted"] < results["validated"] / 2
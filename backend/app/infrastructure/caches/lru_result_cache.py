@@ -0,0 +1,78 @@
+import sys
+from collections import OrderedDict
+from dataclasses import is_dataclass
+from typing import Any, Hashable
+
+from app.domain.interfaces.caches.result_cache_interface import ResultCacheInterface
+
+
+class LruResultCache(ResultCacheInterface):
+    """
+    In memory cache evicting the least recently used results once their estimated size
+    goes over the memory budget.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = estimate_size(value)
+        self._remove(key)
+        # Results larger than the whole budget would evict everything for nothing
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory used by a result, including the attributes of dataclass instances.
+    Lists are assumed to hold items of similar size, so only the first one is measured.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        if value:
+            size += estimate_size(value[0]) * len(value)
+    elif is_dataclass(value) and not isinstance(value, type):
+        size += sys.getsizeof(value.__dict__)
+        size += sum(estimate_size(attribute) for attribute in vars(value).values())
+    return size
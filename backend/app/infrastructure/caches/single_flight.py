@@ -0,0 +1,36 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from app.domain.interfaces.caches.single_flight_interface import SingleFlightInterface
+
+T = TypeVar("T")
+
+
+class SingleFlight(SingleFlightInterface):
+    """
+    Coalesces concurrent computations of the same key into a single task.
+    The task is shielded, a caller that is cancelled does not cancel the result others await.
+    """
+
+    def __init__(self):
+        self.executions = 0
+        self.joins = 0
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(compute())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.joins += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "executions": self.executions,
+            "joins": self.joins,
+            "in_flight": len(self._in_flight),
+        }
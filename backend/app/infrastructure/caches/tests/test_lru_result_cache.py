@@ -0,0 +1,51 @@
+from app.infrastructure.caches.lru_result_cache import LruResultCache, estimate_size
+
+
+class TestLruResultCache:
+    """Test class for LruResultCache functionality."""
+
+    def test_get_returns_stored_value(self):
+        """Test that stored results are returned until the cache is cleared."""
+        cache = LruResultCache(max_bytes=10_000)
+        cache.set("key", [1, 2, 3])
+
+        assert cache.get("key") == [1, 2, 3]
+        assert cache.get("missing") is None
+
+        cache.clear()
+        assert cache.get("key") is None
+        assert cache.current_bytes == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that going over the budget evicts the entries not read for the longest time."""
+        value = list(range(10))
+        cache = LruResultCache(max_bytes=estimate_size(value) * 2)
+        cache.set("first", value)
+        cache.set("second", value)
+        cache.get("first")
+
+        cache.set("third", value)
+
+        assert cache.get("second") is None
+        assert cache.get("first") == value
+        assert cache.get("third") == value
+        assert cache.current_bytes <= cache.max_bytes
+
+    def test_values_over_budget_are_not_cached(self):
+        """Test that a result larger than the whole budget does not evict the others."""
+        cache = LruResultCache(max_bytes=estimate_size([1]) * 2)
+        cache.set("small", [1])
+
+        cache.set("large", list(range(1000)))
+
+        assert cache.get("large") is None
+        assert cache.get("small") == [1]
+
+    def test_replacing_a_key_updates_the_size(self):
+        """Test that setting an existing key does not count its previous value."""
+        cache = LruResultCache(max_bytes=10_000)
+        cache.set("key", list(range(100)))
+        cache.set("key", [1])
+
+        assert len(cache) == 1
+        assert cache.current_bytes == estimate_size([1])
@@ -0,0 +1,58 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "lot_snapshots" ADD "fingerprint" VARCHAR(64) NOT NULL DEFAULT '';
+COMMENT ON COLUMN "lot_snapshots"."fingerprint" IS 'Fingerprint of the operations of the month';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "lot_snapshots" DROP COLUMN IF EXISTS "fingerprint";"""
+
+
+MODELS_STATE = (
+    "eJztnFtzmzgUx78Kw1N3Ju0kznX3zXGcrbdJnEmcdqeZDiODbDMBiRWiqaeT774SF3MTBAgY"
+    "3PJmSzpY/CT+5+hI+KdsYg0a9oeRgW2oXWF6zb/Lf0k/ZQRMyD5ktNiTZGBZYT0voGBuuCaq"
+    "21YxMHXLwdymBKiUVS2AYUNWpEFbJbpFdYxYKXIMgxdilTXU0TIscpD+nwMVipeQriBhFY/f"
+    "WLGONPgD2vzro6wBChWDtdPZJ35Bfilehi1IvBJm8yhTXX1ilwhqoxZufcJG1I7/tCZ/412w"
+    "npSFDg0txopVsiq3XKFryy2bIHrpNuQXnCsqNhwThY2tNV1htGmtI8pLlxDxfkB+eUocjowT"
+    "8QEHFD06YRMPS8RGgwvgGDSCuCB3FSM+Zqw3tnuDS/4r7wcHR6dHZ4cnR2esiduTTcnpi3d7"
+    "4b17hi6Bm5n88uLxBF4Ld+hCbuHQxNmNVoCI4YUWCYCs20mAAa4IQZ/PBmDQJCQYztRchPLM"
+    "7YiEFxKboBKb8nIxoib4oRgQLemKYzzOwfd5eDf6OLx7Nzj+g18bs0fJe8xu/JqBW8UJh0SB"
+    "iR1vKhWcjaHB6zNSADQ1JasTHbo9kUxA1RXUpDmkzxAiae6sJYA0yYaGUZBxLbM2ZJoWiDjb"
+    "C1Yvhpu2TEDmDahuwg/8w3ZxX45Hg2D6csZxBXwVcg7Bi+FsLEKYUNRSEBO23cTIp2izHNlA"
+    "KRbRVZgGeGlgkPGMx6wS6BbcbJvKWdj55JGZPpxfjaXbu/Focj+Z3vD+m2v7PyOs5EWsQKfu"
+    "Xd6Nh1cJlHywKrCMm/Uw/QAIfYeE3a6S5X9yiApse6weVtUhBCJahWratIfqQWX6rDIyYAmV"
+    "JfvNUlQFtj1WDyvCpo6AUZ5p0rAH6i+OECjF0W//O+PjC/TFU2SpyQvmQH16BkRTUjV4gLPa"
+    "pqvMgZksAYgJgebfIL8dP2fCYllgQ/oZEpsxyUytiJrt5eVXNM9A+e5ZNJ9k6RMee/UmPPyR"
+    "S8M715eZ/CJG21uj76cgsgFWCWQTUJMg69Ja4isud92zWfLYkroCaAlLrdP/HAwOD08H+4cn"
+    "Z8dHp6fHZ/sb6umqPPznk7/5COxFcyXp1Tx7rnRmzcJNQUB14S8kxQORMM1bhPIPW81HfVlB"
+    "JB4MTVpg4mWpgE2loGdvEujZ5Hp8Pxte37rKbAfKzBasvGYQ12u/9N1JIo+1uYj0ZTL7KPGv"
+    "0tfpjSvtFrbpkri/GLabfZV5n4BDsYLwswK0KKGgOCjqije41Bf4C5sCxATkKdMZCFrl+oIF"
+    "a688Bwa9K9g5V8AfxjA3qJTCKLRtO39788Ce3yAfzpUmyOSWzIjVnb51YVXP4WaYdzMD+Rbu"
+    "r2ciOyKoE+bUbEb2Ujdgpp6mG+XKqe43Z30wYK+mO6em7OcoT3etgL0qs5+YtKu0q1gXTfn+"
+    "4/D94PgkeJodiy3eNR7AsUlZZX/x5KjA/uLJUeb+Iq9KZCTZCoBWCp7jljXEzvVJaPFZzO5B"
+    "myJj7Q/pjkTI/uzraoB8hek9Apa9yjmGkmqTq+YGportN+/FfOfEHNgKXpSJ0TYGdUdlVYX8"
+    "isdhGlgHSp4KyeyGdtmj+cFyWSaBcdsrCj8zGkCMZDbc3Xb/AZeegS3NHd2g0oJgs8u5J3YH"
+    "aHM8Lj40/9xPb8QDEzNKDMkDYjgeNV2le5Kh2/TbdgdoyrrGzz7Zkk0x4Yd21pLf8bdOb84j"
+    "5jqDqOTd9fDfZMAyupqeJ30iv8B5gv+Ch/nEIrpoMzU7SEyY1RMjFqEuy2nml2FnBA9GoDcs"
+    "rF21FzF2JLDg0zPvbGusPjegiD2DfTCxS8FExRRbl7NrFY7r1Z1U6+DJ3YKhWfzgLkNZRSbr"
+    "P7jbHzJ9c/hb/jBfZ87xybejybQhUDUcRalw/uzN587qP1mOcOR0+do9rWtLa1jw5P6ve1xl"
+    "Gsy1vEAp2uK1UCmyxG34HSDXqVDfRQtf/mEDldopEzXs6ltATWYp3JiCr5klf/G/zVgiJ/2z"
+    "5XdY6lPx0fBm1hrQ6GaIJvCDeZsgmsgLNriwzcB3NfxcBV8sNDveLxCaHe9nhma8KuH9VNUx"
+    "HcNFUMoFxu064AdHD9cV+Db97oBpYUIVvMgLf/PeHxDbtx7STa5v3ZBu06vuoXfj3+rkxeat"
+    "gw9i6Q6DR445h0QhUIWs3yVcXdqw9cQEwSNsWgTPAaKwE94v6M0rMzsTcs4V2g4wIqTfOMMb"
+    "eUv2V33F86BmCcl4Q/bXzP80jY7ABSQQMVdUagWWNGtbSC/Gs2EHnuPYkrogyphN2xzH97ft"
+    "rWojHEWZh6I8RbZtcx3dztrimkqUZWEWhK+YQH2JPsG1i3rC+gaQMOmbzHXNWPkm39V5zC/B"
+    "HApKw7iDgOdNtko8tdgHdp/QC1dHw/vR8GIsC1ShBrzu9gttgWtFWSjMNSqBr/PcOJ8akN4F"
+    "12qBakWnVZRq0keLwbacNg+FIi91HpOTAulzXwj3+vMGu3Xe4DWHlLNDnrJs9zR6VYffQDq2"
+    "xE6Z4OSH4LjduW97+ekOGlm8M3e/djYaeGlSEBN+SCCGaU+VLYQb6e81cOc0UIMU6EYZ7Qst"
+    "ajkdVFXyqq7BE5JXTPPyRO/3Vr2ao8pGVS+6oBFIXmK9k6133gKiF7udEzvbgqoOBU9bttpF"
+    "TNrec6+aLYsp3kEhxTvIUbyD/dS2uw9JKXuaIWnXNuER1vQlHnvd6kg83amjvFWdtX+S961E"
+    "6znL+9v66przao366iEkuroSuWm/JtdDg7BN76B3yEFnvg6ZrXDZL0Fu230Up5gQtWKqlidr"
+    "6T8XZ49GCYh+890E2EhI4//bRBpi9tufEZNOvftZGOs23vFs9SD9y/+L2ho1"
+)
@@ -0,0 +1,89 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "closed_lots" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "ticker" VARCHAR(25),
+    "amount" INT NOT NULL,
+    "date_operation" DATE NOT NULL,
+    "date_liquidation" DATE NOT NULL,
+    "buy_price" DOUBLE PRECISION,
+    "sell_price" DOUBLE PRECISION,
+    "inverted_amount" DOUBLE PRECISION,
+    "current_amount" DOUBLE PRECISION,
+    "percentage_gain" DOUBLE PRECISION,
+    "nominal_gain" DOUBLE PRECISION,
+    "tna" DOUBLE PRECISION
+);
+CREATE INDEX IF NOT EXISTS "idx_closed_lots_date_li_c74f1c" ON "closed_lots" ("date_liquidation", "date_operation");
+CREATE INDEX IF NOT EXISTS "idx_closed_lots_ticker_731500" ON "closed_lots" ("ticker", "date_liquidation");
+COMMENT ON COLUMN "closed_lots"."ticker" IS 'Ticker of the lot';
+COMMENT ON COLUMN "closed_lots"."amount" IS 'Amount matched between buy and sell';
+COMMENT ON COLUMN "closed_lots"."date_operation" IS 'FEC2 of the buy operation';
+COMMENT ON COLUMN "closed_lots"."date_liquidation" IS 'FEC2 of the sell operation';
+CREATE TABLE IF NOT EXISTS "fifo_watermarks" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "last_operation_id" INT NOT NULL,
+    "last_date_operation" DATE NOT NULL
+);
+COMMENT ON COLUMN "fifo_watermarks"."last_operation_id" IS 'NUME of the last matched operation';
+COMMENT ON COLUMN "fifo_watermarks"."last_date_operation" IS 'FEC2 of the last matched operation';
+CREATE TABLE IF NOT EXISTS "open_lots" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "operation_id" INT NOT NULL,
+    "ticker" VARCHAR(25),
+    "date_operation" DATE NOT NULL,
+    "price" DOUBLE PRECISION,
+    "amount" DOUBLE PRECISION NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_open_lots_ticker_c5bd74" ON "open_lots" ("ticker");
+COMMENT ON COLUMN "open_lots"."operation_id" IS 'NUME of the buy operation';
+COMMENT ON COLUMN "open_lots"."ticker" IS 'Ticker of the buy';
+COMMENT ON COLUMN "open_lots"."date_operation" IS 'FEC2 of the buy operation';
+COMMENT ON COLUMN "open_lots"."price" IS 'PCIO of the buy operation';
+COMMENT ON COLUMN "open_lots"."amount" IS 'Amount not matched by sells yet';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "closed_lots";
+        DROP TABLE IF EXISTS "fifo_watermarks";
+        DROP TABLE IF EXISTS "open_lots";"""
+
+
+MODELS_STATE = (
+    "eJztnF1vozgUhv8KytWM1B21mXZntHeUptrstEmVprMrVRVywElQwWaMmU40yn9f20AgfAUo"
+    "FNpyl9g+jv1g3nN87Pb3wMI6NJ1PiokdqF9hes2/D/6Sfg8QsCD7kNHiSBoA2w7reQEFC1OY"
+    "aKKtamIqysHCoQRolFUtgelAVqRDRyOGTQ2MWClyTZMXYo01NNAqLHKR8cOFKsUrSNeQsIr7"
+    "B1ZsIB3+gg7/ej/QAYWqydoZ7BPvkHfFy7ANiVfCbO4H1NAeWRdBbdTigXdqP6pLA5r63uwN"
+    "nRuIcpVubFE2RvRSNORdLVQNm66Fwsb2hq4x2rU2EOWlK4j4aCDvnhKXQ+Bz9JEFXLz5hk28"
+    "iUZsdLgErkkj0AqS1DDiT4GNxhETXPFf+WN4cvrl9OvnP0+/siZiJLuSL1tveuHcPUNBYDIf"
+    "bLceSeC1EA8j5BbC3menrAFJhxdaxACyYccBBrgiBH0+O4BBk5BguPZyEQ7mYiASXkpsyUls"
+    "EQ+KEbXAL9WEaEXXHONZDr7v8kz5W559GJ595H1j9nJ4L87ErxmKKk44JAos7HpLqeBqDA0O"
+    "r8gUoIklWZ2oLEYiWYBqa6hLC0ifIETSwt1IAOmSA02zIONaVm3INCYTCbYXrD4dbtIyBpk3"
+    "oIYFP/EPL4v7cqQMg+XLGe8N8zDkHIIX8nyUhjCmvqUgxmy7iZEv0WY5sgel2sTQYBLgpYlB"
+    "xju+ZxVDt+RmL6mchZ1PHpnp3fnVSLqZjZTx7Xg64eO3Ns4PM6zkRazAoGKWs5F8FUPJH1YF"
+    "lvtmPUw/AEI/IWHTVbP8Tw7RFNseq4dVcwmBiFahmjTtoXpQmT5rjAxYQXXFfrMU1RTbHquH"
+    "FWHLQMAszzRu2AP1N0cIlOLot3/P+PgGffkY2WryggXQHp8A0dVEDR7irLbJKmtoxUsAYkKg"
+    "+xPk0/GzIJfGEv/LUBMLkMfMXElKq6O8fMmStVefAoPmcyZ9tuOo3myHCRwa7gbVUhhTbdve"
+    "sU/urke7DAgb4G7vXnIPVPeGXcCqvmvPMO/mnvM53A/vPTsiqFMbory08159rogyQuhlUs69"
+    "fNYsnxWVs8uiWSHvVrdWdjAFX2xdxjLwDGU3MvB9tvjZWc7yWbnOJOQGN8p42hCoGvaUFRJJ"
+    "z04g1X9EhHDkmGgj0u6OtIEFj+De7r5zGqy1vEAp2uJQqOS1fWuxUpE1WjFY8rz7kmBL4nGM"
+    "U3RNNh07vfSxcH16qsiTeWtAI5l49n6UCZKC9pVCpBoVU7mSv1fBtxcknR0XCJLOjjODJF4V"
+    "80Oa5lquKRCUckb7dh3wSMrddQW+TR/HWTYmVMXLvEA070gu3b714Gp8fSOCq92ouodeRKLV"
+    "yaebtw4+iGo7DB651gISlUANsnGXcHVJw9ZTBAQr2LIJXgBEYSe8XzCaAys7E3JOD20HGBHS"
+    "z1zhjVw8e6u3pk5qlpCMS2dvMxPTNDoCl5BAxFxRqR1Y3KxtIb0YzeUOvMciY0rLodyzaZvj"
+    "6PamvV1thCOrr3qAmmrbNlflZt4W10TKKgtzSviKCTRW6BvcCNRjNjaAUtOv8azTnJXvMk+d"
+    "x7wN1lBQGsYdBDztslXpS4t9YPOEXriqyLeKfMFENqkKNeAVByG0Ba4VZaEw16gEHua5cz41"
+    "IJ0FfbVAtaLTKko17qPTwbacwA6FIi+JvScnBRLZvhAevals9js4+T/kkHLOqhOWrSdkK7r8"
+    "BhKyJU6tUm5hOMnncO7bXn6bQTOLeOZJVOefQZbCbpuUxJgnSpHDpK/KlsKd+Pcq+OpUUIcU"
+    "GGYZ9QstWv5j2ar78JjoFVO9PNl737pXc2TZqO5FNzUpohfb82QrnreJ6OXu1cmdY0PNgClv"
+    "W7beRUzaDvOqZsz2FO+kkOKd5CjeyXHi6N2HpJa90RC3a5uwgnVjhUfesDoSUXf8Ym1RtP7N"
+    "2ucyredu7bv11jVn1xr11jIkhrZOc9R+Ta6PBmGb3kW/Ihf9ExKnZEImYtKyAylOMSZqxVQt"
+    "T9aS/7WHvRolIPrNXyfARoIa9osUpl1w/ed2Osm6kbIziYG8Q2yC97qh0SPJNBz60E2sORT5"
+    "rPmgLce/QxXA+3At/xfnqlxNzwUF7NAVEb2IDs7bvti+/R+cbmMG"
+)
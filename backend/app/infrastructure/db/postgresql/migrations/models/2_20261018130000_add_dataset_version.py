@@ -0,0 +1,53 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "dataset_versions" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "version" BIGINT NOT NULL DEFAULT 0
+);
+COMMENT ON COLUMN "dataset_versions"."version" IS 'Increased every time the operations change';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "dataset_versions";"""
+
+
+MODELS_STATE = (
+    "eJztnF1P4zgUhv9K1KtZiR1BgYHduxLKbneAIijsSmgUuclpG5HYHccdphrx39d2PpuvJiFt"
+    "AvSu2D6p/dh5z/Gxy6+OTQywnM+qRRwwLgm7En93/lR+dTCygX/IaLGndNB8HtaLAobGljTR"
+    "ZVvNIkyWo7HDKNIZr5ogywFeZICjU3POTIJ5KV5YligkOm9o4mlYtMDm9wVojEyBzYDyisdv"
+    "vNjEBvwER/z52DEQA83i7Uz+STxQPEqUkTlQt4TbPHaYqT/xR/i1UYtv4qHzJ21igmWsjN40"
+    "hIEs19hyLssGmF3IhuJRY00n1sLGYeP5ks0IDlqbmInSKWDRGxCPZ3QhIIgxesh8Lu54wybu"
+    "QCM2BkzQwmIRaAVJ6gSLWeC9ceQAp+Jbfu8eHJ0cnR5+OTrlTWRPgpKTF3d44dhdQ0ngetR5"
+    "eXFJIreFnIyQWwh7lZ06QzQdXmgRA8i7HQfo44oQ9PgEAP0mIcFw7eUi7IxkRxQyUfiSU/gi"
+    "7hQjaqOfmgV4ymYC43EOvoferfp37/ZT9/g38WzCXw73xbn2arqyShAOiSKbLNylVHA1hgbr"
+    "V2QK0MSSrE60J3ui2IjpMzCUMbBnAKyMF0sFYUNxwLIKMq5l1YZMYzKRYHvO69PhJi1jkEUD"
+    "ZtrwWXzYLu6Lvtr1l69gvNLN9ZBzCJ73Rv00hDH1LQUxZttOjGKJbpYjnyhtTk0dkgAvLIIy"
+    "3vEVqxi6iTDbpnIWdj55ZIb3Z5d95ea2rw7uBsNr0X976Xy3wkpRxAtMJkd52+9dxlCKyarA"
+    "ctVsB9MLgPAPoHy4Wpb/ySGaYrvD6mLVF5QCZlWoJk13UF2oXJ91TgZNQZvy7yxFNcV2h9XF"
+    "ioltYmSVZxo33AH1NkcYleLotf/I+MQGffIU2WqKgjHSn54RNbREDemSrLbJKrtrx0sQ5kJg"
+    "eAMUw/GyIDyWRQ6wB6AOZ5KZLElrtpeXMTFcA+2Ha7H5tMku4bFXb8LDm7kkvDNzmskvYrS9"
+    "Pfp+AiKfYJ0CX4CGArxLS0XsuOS+J9jyOIo+Q3gKpfbpf3S7h4cn3f3DL6fHRycnx6f7AfVk"
+    "VR7+s8FfYgb2orkSd0paogsX5oT8y+eJ2og+ZcpCSqtcVZjw9tqzb7AThTcnChZyWJgl0kph"
+    "TLVtOpN3fX/VDzKjvINBTq9kbqTuRJ6EVT2bl2HezlzUa7ivz0m1RFCHc8B5x1Er9bkiygnh"
+    "7RxF7eSzZvmsqJxtFs0K+fi6tbKFR3PF1mXsZI6jbMfJ3O4U6dWnH+Wz9a1J1Hdu1MFwQ6Bq"
+    "yDVVSDC/OrFc/9ExJpHj46U8jnOUJRQ8mn+/+aihv9byAqVoi3Whkrfbf2exUpE1WjFYcr37"
+    "hBJb8ZJ42/Tq2bHTtq+L1Kenau961BjQyAkdfz/KBEl++0ohUo2KqV72HqrgWwmSjvcLBEnH"
+    "+5lBkqiK+SFdX9gLSyIo5YxW7VrgkdT7qwp8N31Mb88JZRqZ5AWieUf16faNB1eDqxsZXAW9"
+    "ah96GYlWJ59u3jh4P6ptMXi8sMdANQo68H6XcHVJw8ZTBJSoxJ5TMkaYQSu8n9+bNSs7E3LO"
+    "E5oOMCKkX7nCN3Ih9b3epjyoWUIyLqO+z0zMptFRmAAFzF1RqR1Y3KxpIT3vj3oteI9lxpSV"
+    "Q7li0zTH/t1Nc7vaCEdeX/UANdW2aa7qzagpromUVRbmlPCVUDCn+CssJeoB7xvCqenXeNZp"
+    "xMuDzFPrMb/4a8gvDeMOip6DbFX60uIf+DjBDVfV3p3aO+cim1SFGvDKgxDWANeKslCYa1QC"
+    "1/MMnE8NSG/9ZzVAtaLTKko17qPTwTacwA6FIi+JvSInBRLZnhDuvats9gc4+V/nkHLOqhOW"
+    "jSdkK7r8DSRkS5xapdzCcJLzcObZXny9BSuLeOZJVOvnIEthXzYpiTFPlCKHSV+VLYWB+O9U"
+    "8M2poAEMmVYZ9QstGv4RfdV9eEz0iqlenux9bN2rObLcqO5FNzUpohfb82QrnruJ2Mndm5M7"
+    "Zw66CSlvW7beRUyaDvOqZsxWFO+gkOId5CjewX7i6N2DpJW90RC3a5qwSgxzSvput1oSUbf8"
+    "Ym1RtN7N2tcyredu7Yf11jVn1zbqrXtATX2W5qi9mlwfjcI2Oxf9hlx05q9cszUu+zeu23Yg"
+    "xSnGRK2YquXJWvK/efFXowREr/nbBLiRoIZ/I4O0C67/3A2vs26kBCYxkPeYD/DRMHW2p1im"
+    "w761E2sORTFq0Wnb8e5Q+fA+XfX+i3NVL4dnkgJx2JTKp8gHnDV9sf3lf8QdsXY="
+)
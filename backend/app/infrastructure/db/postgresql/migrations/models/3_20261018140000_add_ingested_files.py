@@ -0,0 +1,58 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "ingested_files" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "content_hash" VARCHAR(64) NOT NULL UNIQUE,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+COMMENT ON COLUMN "ingested_files"."content_hash" IS 'SHA-256 of the uploaded file';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "ingested_files";"""
+
+
+MODELS_STATE = (
+    "eJztnF1P4zgUhv9K1KtZiRlBocDuXQhlpzu0RVBmVoNGkZu4bURiZxNnmGrEf1/b+f5sEtIm"
+    "QO+K7ZPaj533HB+7/O4ZWIW6/UnSsQ3Va0zG7O/eX8LvHgIGpB9yWhwIPWCaYT0rIGCucxOF"
+    "t5V1THg5mNvEAgqhVQug25AWqdBWLM0kGka0FDm6zgqxQhtqaBkWOUj7z4EywUtIVtCiFQ8/"
+    "aLGGVPgL2uzPh54KCJR12k6jn9gD2aNYGTah5ZZQm4ce0ZRH+gi/Nmrxgz3UfJQXGtTV2Og1"
+    "lRnwcpmsTV42QuSKN2SPmssK1h0DhY3NNVlhFLTWEGGlS4hYbyB7PLEcBoGN0UPmc3HHGzZx"
+    "BxqxUeECODqJQCtJUsGIzQLtjc0HuGTf8rF/dHJ2cn58enJOm/CeBCVnz+7wwrG7hpzAZNZ7"
+    "fnZJArcFn4yQWwg7zk5aASsbXmiRAEi7nQTo44oQ9PgEAP0mIcFw7RUi7M14RwS8EOiSE+gi"
+    "7pUjaoBfsg7RkqwYxkEBvq/irfRZvP3QH/zBno3py+G+OBOvps+rGOGQKDCw4y6lkqsxNNi8"
+    "IjOAppZkfaIi74lgAKKsoCrMIXmCEAlzZy0ApAo21PWSjBtZtSHThEyk2F7S+my4acsEZNaA"
+    "aAb8xD7sFvfVUOr7y5cxjnVzM+QCgpfibJiFMKG+lSAmbLuJkS3R7XKkEyWblqbANMArHYOc"
+    "dzxmlUC3YGa7VM7SzqeIzPT+4noo3NwOpdHdaDph/TfW9n96WMmKaIFG+Chvh+J1AiWbrBos"
+    "42Z7mF4AhH5Ciw5XzvM/BUQzbPdYXayKY1kQkTpU06Z7qC5Uqs8KJQOWUF7S76xENcN2j9XF"
+    "irChIaBXZ5o03AP1NkcIVOLotX/P+NgGffEY2WqygjlQHp+ApcqpGtzHeW3TVUbfSJYARIVA"
+    "9QbIhuNlQWgsC2xIvkLLpkxykyVZzQ6KMiaqayD/dC22nzbZJzwOmk14eDOXhnehLXP5RYx2"
+    "t0c/TEGkE6xYkC5AVYC0S2uB7bj4vifY8tiCsgJoCSvt0//s94+Pz/qHx6fng5Ozs8H5YUA9"
+    "XVWE/2L0N5uBg2iuxJ2SjujClbbA3+g8WQawHnNlIaNVoSosaHv5yTfYi8KrEwUd2CTMEsmV"
+    "MGbatp3Jm9yPh0FmlHYwyOlVzI00ncjjsOpn83LMu5mLegn3zTmpjgjqiPoam5K90nSYq6fp"
+    "RoVyqnnNaR90uFfTV6em9OsIS3ysgL2qcrKUtKt1vtQUzd7dZ/Fjf3Dqv82OSbdxKn2T2aKs"
+    "c9J0elLipOn0JPekiVUlclM0FuRZu4y81KWngTmkY5ZF8sk+7FRCy69iOgZ1ivS1N6UFdGej"
+    "8fBuJo5v+C7W9nexVEhZTT++t/VKP5wmZiJ4iPBtNPsssD+F79MJ3wab2CZLi39j2G72vcf6"
+    "BByCZYSfZKBGVp9f6oPpip5PTYiKrhfE6gtVnHo8tJurBXsBb1jAa0bCXQ6Ca5yvNh37dvCq"
+    "RUlXGL9pQVF246bF/lbAi0+zq5++dubgtXcjjaZbAtXA2UGNA8MXHxQ2fxUI4ch1oDW/XmEL"
+    "a1jyqtXbPV+Y+mutKFCKttgUKnnZ2zcWK21zf8a9+8LChuAdyuzSq+fHTru+/tecnkriZNYa"
+    "0Gj2QM3wSEVZAzXLH9XMFrwA37X4tQ6+WJA0OCwRJA0Oc4MkVpXwQ4riGI7OEVRyRnG7Dngk"
+    "6X5cg++2r10ZJraIjBdFgWjR1ats+9aDq9H4hgdXQa+6h55HovXJZ5u3Dt6PajsMHjnGHFqy"
+    "BRVI+13B1aUNW08RWFjChmnhOUAEdsL7+b3ZsLJzIRc8oe0AI0L6hSt8Kz8weKu3448alpCc"
+    "Hxe8zUzMttFZcAEtiKgrqrQDS5q1LaSXw5nYgfeYZ0xJNZQxm7Y5Du9u2tvVRjjS+roXYjJt"
+    "2+Yq3cza4ppKWeVhzghfsQW1JfoC1xz1iPYNoMz0azLrNKPlQeap85if/TXkl4ZxhwWegmxV"
+    "9tKiH+g4oRuuSuKdJF4Oexmq0ABefhBCWuBaUxZKc41K4GaegfNpAOmt/6wWqNZ0WmWpJn10"
+    "NtiWE9ihUBQlsWNyUiKR7QnhwZvKZr+Dk/9NDqngrDpl2XpCtqbL30JCtsKpVcYtDDs9Dxee"
+    "7dWXW6jnEc89ier8HOQp7PM2JTHhiTLkMO2r8qUwEP+9Cr46FVQhAZpeRf1Ci5b/KUrdfXhC"
+    "9MqpXpHsvW/daziy3KruRTc1GaKX2PPkK567idjL3auTO9uEigYz3rZ8vYuYtB3m1c2YxRTv"
+    "qJTiHRUo3tFh6ujdgyRXvdGQtGubsIRVbYmHbrc6ElF3/GJtWbTezdqXMm3mbu279dYNZ9e2"
+    "6q1FaGnKKstRezWFPhqEbfYu+hW56Nz/WpCvcfn/s2DXDqQ8xYSolVO1IllL/3dG+mpUgOg1"
+    "f50AtxLUeD/STEP85246ybuREpgkQN4jOsAHVVPIgaBrNvnRTawFFNmoWaeDXxX68D6MxX+T"
+    "XKXr6QWnEPm5IHvARdsX25//B2PUjy4="
+)
@@ -0,0 +1,70 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        UPDATE "operations" SET "type_operation_id" = "duplicates"."kept_id" FROM (SELECT "id", MIN("id") OVER (PARTITION BY "type_operation") AS "kept_id" FROM "operation_types") AS "duplicates" WHERE "operations"."type_operation_id" = "duplicates"."id" AND "duplicates"."id" <> "duplicates"."kept_id";
+DELETE FROM "operation_types" WHERE "id" NOT IN (SELECT MIN("id") FROM "operation_types" GROUP BY "type_operation");
+UPDATE "operations" SET "ticket_id" = "duplicates"."kept_id" FROM (SELECT "id", MIN("id") OVER (PARTITION BY "ticker") AS "kept_id" FROM "tickets") AS "duplicates" WHERE "operations"."ticket_id" = "duplicates"."id" AND "duplicates"."id" <> "duplicates"."kept_id";
+DELETE FROM "tickets" WHERE "id" NOT IN (SELECT MIN("id") FROM "tickets" GROUP BY "ticker");
+UPDATE "operations" SET "reference_id" = "duplicates"."kept_id" FROM (SELECT "id", MIN("id") OVER (PARTITION BY "detail") AS "kept_id" FROM "references") AS "duplicates" WHERE "operations"."reference_id" = "duplicates"."id" AND "duplicates"."id" <> "duplicates"."kept_id";
+DELETE FROM "references" WHERE "id" NOT IN (SELECT MIN("id") FROM "references" GROUP BY "detail");
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_operation_t_type_op_b34c80" ON "operation_types" ("type_operation");
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_tickets_ticker_e2080f" ON "tickets" ("ticker") NULLS NOT DISTINCT;
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_references_detail_9cdcee" ON "references" ("detail") NULLS NOT DISTINCT;
+CREATE INDEX IF NOT EXISTS "idx_operations_ticket__faa33f" ON "operations" ("ticket_id", "date_operation") INCLUDE ("type_operation_id", "amount", "price_of_operation");
+CREATE INDEX IF NOT EXISTS "idx_operations_type_op_b254ac" ON "operations" ("type_operation_id", "date_operation") INCLUDE ("ticket_id", "amount", "price_of_operation");
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+CREATE INDEX IF NOT EXISTS "gin_tickets_ticker_trgm" ON "tickets" USING GIN (UPPER("ticker") gin_trgm_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "gin_tickets_ticker_trgm";
+DROP INDEX IF EXISTS "idx_operations_type_op_b254ac";
+DROP INDEX IF EXISTS "idx_operations_ticket__faa33f";
+DROP INDEX IF EXISTS "uid_references_detail_9cdcee";
+DROP INDEX IF EXISTS "uid_tickets_ticker_e2080f";
+DROP INDEX IF EXISTS "uid_operation_t_type_op_b34c80";"""
+
+
+MODELS_STATE = (
+    "eJztnF1T2zgUhv+KJ1fdGdqBQIDdO2PCNluSMBDanTIdj2IriQdbytpyaabDf19J/v6MbZzY"
+    "aX0XJB1HeiS/5+hI4WfPwCrUrQ+Sji2o3mIyZn/3/hJ+9hAwIP2Q0eJI6IH1OqhnBQTMdW6i"
+    "8LayjgkvB3OLmEAhtGoBdAvSIhVaiqmtiYYRLUW2rrNCrNCGGloGRTbS/rOhTPASkhU0acXT"
+    "N1qsIRX+gBb786mnAgJlnbbT6Cf2QPYoVobX0HRKqM1Tj2jKM32EVxu2+MYeun6WFxrU1cjo"
+    "NZUZ8HKZbNa8bITIDW/IHjWXFazbBgoarzdkhZHfWkOElS4hYr2B7PHEtBkENkYXmcfFGW/Q"
+    "xBloyEaFC2DrJAStIEkFIzYLtDcWH+CSfcv7/snZxdnl6fnZJW3Ce+KXXLw6wwvG7hhyApNZ"
+    "7/XVIQmcFnwyAm4B7Cg7aQXMdHiBRQwg7XYcoIcrRNDl4wP0mgQEg7WXi7A34x0R8EKgS06g"
+    "i7hXjKgBfsg6REuyYhgHOfg+i/fSR/H+XX/wB3s2pi+H8+JM3Jo+r2KEA6LAwLazlAquxsBg"
+    "+4pMAZpYktWJirwnggGIsoKqMIfkBUIkzO2NAJAqWFDXCzKuZdUGTGMykWB7TevT4SYtY5BZ"
+    "A6IZ8AP7sF/cN0Op7y1fxjjSze2Qcwhei7NhGsKY+paCGLNtJ0a2RHfLkU6UvDY1BSYB3ugY"
+    "ZLzjEasYugUz26dyFnY+eWSmj1e3Q+HufiiNHkbTCeu/sbH+04NKVkQLNMJHeT8Ub2Mo2WRV"
+    "YBk162C6ARD6Dk06XDnL/+QQTbHtsDpYFds0ISJVqCZNO6gOVKrPCiUDllBe0u8sRTXFtsPq"
+    "YEXY0BDQyzONG3ZA3c0RAqU4uu1/Z3xsg754Dm01WcEcKM8vwFTlRA3u46y2ySqjb8RLAKJC"
+    "oLoDZMNxsyA0lgUWJJ+haVEmmcmStGZHeRkT1TGQvzsWu0+bdAmPo3oTHu7MJeFdactMfiGj"
+    "/e3RjxMQ6QQrJqQLUBUg7dJGYDsuvu/xtzyWoKwAWsJS+/Q/+/3T04v+8en55eDs4mJweexT"
+    "T1bl4b8a/c1m4CicK3GmpCW6cKMt8Bc6T6YBzOdMWUhplasKC9pefvEMOlE4OFHQgUWCLJFc"
+    "CmOqbdOZvMnjeOhnRmkH/ZxeydxI3Yk8Dqt6Ni/DvJ25qLdw356TaomgjqivsSjZG02HmXqa"
+    "bJQrp5rbnPZBh52aHpya0q8jLPGxAtaqzMlS3K7S+VJdNHsPH8X3/cG59zbba7qNU+mbzBZl"
+    "lZOm87MCJ03nZ5knTawqlpuisSDP2qXkpa5dDcwgHbHMk0/2Ya8SWnwV0zGoU6Rv3CnNoTsb"
+    "jYcPM3F8x3exlreLpULKavrRva1b+u48NhP+Q4Qvo9lHgf0pfJ1O+DZ4jS2yNPk3Bu1mX3us"
+    "T8AmWEb4RQZqaPV5pR6Ytuj5dA1R3vWCSH2uilOPh/ZztaAT8JoFvGIk3OYguML5at2xbwuv"
+    "WhR0hdGbFhRlO25adLcC3nyaXf70tTUHr707aTTdEagazg4qHBi++aCw/qtACIeuA2349QpL"
+    "2MCCV61+3fOFqbfW8gKlcIttoZKbvd15rORerySui069f0knKpHQijfcb8y1y30ejxIWJjYE"
+    "93Bnn9FBdgy272uE9emyJE5mjQENZyHUFM+Wl31Q0/xaxazDG/Ddip+r4IsEW4PjAsHW4Dgz"
+    "2GJVMX+mKLZh6xxBKacWtWuBZ5MexxX47vr6lrHGJpHxIi+gzbvClW7feJA2Gt/xIM3vVfvQ"
+    "84i2Ovl088bBe9Fxi8Ej25hDUzahAmm/S7i6pGHjqQYTS9hYm3gOEIGt8H5eb7as7EzIOU9o"
+    "OsAIkX7jCt/JDxV+1Vv2JzVLSMaPFH7NjM6u0ZlwAU2IqCsqtQOLmzUtpNfDmdiC9ziySS6I"
+    "MmLTNMfhw11zu9oQx7RcQlGeabZNc5XuZk1xTaS+sjCnhK/YhNoSfYIbjnpE+wZQaho3nr2a"
+    "0XI/g9V6zK/eGvJKg7jDBC9+tip9adEPdJzQCVcl8UESr4e9FFWoAS8/UCENcK0oC4W5hiVw"
+    "O0/f+dSA9N57VgNUKzqtolTjPjodbMOJ8EAo8pLhETkpkBB3hfCou0FwWDcItjmknDPvhGWz"
+    "18CqOvwdpGNLnH2l3OWwkrNw5drefLqHehbvzPOsg40GXncpiDE/lCKGSU+VLYS+9HcaeHAa"
+    "qEICNL2M9gUWtdz3qSp5VffgMckrpnl5ovd7q17NUeVOVS+8oUmRvNh+J1vvnA1EJ3YHJ3bW"
+    "GioaTHnbstUuZNL0mXvVbFlE8U4KKd5JjuKdHCeO3V1IctnbDHG7pglLWNWWeOh0qyXxdKsu"
+    "51Z11u7d3LcSred27m/rq2vOq+3UV4vQ1JRVmpt2a3I9NAjadA76gBx05v89yFa47P96sG/3"
+    "UZxiTNSKqVqerCX/vyN9NUpAdJsfJsCdhDTuzzyTEP95mE6y7qL4JjGQj4gO8EnVFHIk6JpF"
+    "vrUTaw5FNmrWaf93iR68d2Px3zhX6XZ6xSmEfnDIHnDV9NX41/8BQjSnOg=="
+)
@@ -0,0 +1,53 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_operations_date_op_fedd22" ON "operations" ("date_operation", "date_liquidation", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_operations_date_op_fedd22";"""
+
+
+MODELS_STATE = (
+    "eJztnF1zmzgUhv8K46vuTNpJnDjJ7h0hztbb2M4kTrvTTIeRQbaZgOQF0dTTyX9fie8PgYFg"
+    "g1vuHEkHS4/Ee6Sj4/zsGViFuvVB0rEF1VtMxuzv3l/Czx4CBqQfMlocCT2wXof1rICAue6Y"
+    "KE5bWcfEKQdzi5hAIbRqAXQL0iIVWoqprYmGES1Ftq6zQqzQhhpahkU20v6zoUzwEpIVNGnF"
+    "0zdarCEV/oAW+/OppwICZZ220+gn9kD2KFaG19B0S6jNU49oyjN9hF8btfjGHrp+lhca1NXY"
+    "6DWVGTjlMtmsnbIRIjdOQ/aouaxg3TZQ2Hi9ISuMgtYaIqx0CRHrDWSPJ6bNILAxesh8Lu54"
+    "wybuQCM2KlwAWycRaAVJKhixWaC9sZwBLtm3vO+fnF2cXZ6en13SJk5PgpKLV3d44dhdQ4fA"
+    "ZNZ7fXVJAreFMxkhtxB2nJ20AiYfXmiRAEi7nQTo44oQ9PgEAP0mIcFw7eUi7M2cjgh4IdAl"
+    "J9BF3CtG1AA/ZB2iJVkxjIMcfJ/Fe+mjeP+uP/iDPRvTl8N9cSZeTd+pYoRDosDAtruUCq7G"
+    "0GD7iuQATS3J6kRFpyeCAYiygqowh+QFQiTM7Y0AkCpYUNcLMq5l1YZMEzKRYntN6/lw05YJ"
+    "yKwB0Qz4gX3YL+6bodT3ly9jHOvmdsg5BK/F2ZCHMKG+pSAmbNuJkS3R3XKkEyWvTU2BaYA3"
+    "OgYZ73jMKoFuwcz2qZyFnU8emenj1e1QuLsfSqOH0XTC+m9srP/0sJIV0QKNOKO8H4q3CZRs"
+    "siqwjJt1ML0NEPoOTTpcOcv/5BDl2HZYXayKbZoQkSpU06YdVBcq1WeFkgFLKC/pd5aiyrHt"
+    "sLpYETY0BPTyTJOGHVDvcIRAKY5e+98ZHzugL54jR01WMAfK8wswVTlVg/s4q226yugbyRKA"
+    "qBCo3gDZcLwoCN3LAguSz9C0KJPMYAmv2VFexER1DeTvrsXuwyZdwOOo3oCHN3NpeFfaMpNf"
+    "xGh/Z/TjFEQ6wYoJ6QJUBUi7tBHYics59wRHHktQVgAtYalz+p/9/unpRf/49PxycHZxMbg8"
+    "Dqinq/LwX43+ZjNwFI2VuFPSEl240Rb4C50n0wDmc6YscFrlqsKCtpdffINOFA5OFHRgkTBK"
+    "JJfCyLVtOpI3eRwPg8go7WAQ0ysZG6k7kOfAqh7NyzBvZyzqLdy3x6RaIqgj6mssSvZG02Gm"
+    "nqYb5cqp5jWnfdBhp6YHp6b06wgLfKyAtSpzs5S0q3S/VBfN3sNH8X1/cO6/zfaaHuNU+iaz"
+    "RVnlpun8rMBN0/lZ5k0Tq0rEpuhe0InaceJS154GZpCOWebJJ/uwVwktvorpGNQp0jfelObQ"
+    "nY3Gw4eZOL5zTrGWf4qlQspq+vGzrVf67jwxE8FDhC+j2UeB/Sl8nU6cY/AaW2RpOt8Ytpt9"
+    "7bE+AZtgGeEXGaiR1eeX+mDaoufTNUR56QWx+lwVpx4P7Se1oBPwmgW84k64zZvgCverde99"
+    "W5hqUdAVxjMtKMp2ZFp0WQFvvs0uf/vamovX3p00mu4IVA13BxUuDN98UVh/KhDCkXSgjZNe"
+    "YQkbWDDV6te9X5j6ay1voxRtsW2r5EVvd75X8tIrieeiufmXdKJSAS1ew7SK8hKFqP2e0zZ3"
+    "eSp09hQLExuCdxW0z71E9o5t30mH9am4JE5mjQGNxixUjh/Mi1WoPC9YMUbxBny34ucq+GJb"
+    "s8Fxga3Z4Dhza8aqEt5PUWzD1h0EpVxg3K4FflB6HFfgu+tkL2ONTSLjRd72Ny/hi2/f+JZu"
+    "NL5ztnRBr9qH3tn/VifPN28cvL+XbjF4ZBtzaMomVCDtdwlXlzZsPDBhYgkbaxPPASKwFd7P"
+    "782WlZ0JOecJTW8wIqTfuMJ38rOGXzUn/6RmCcn4ScOvGf/ZNToTLqAJEXVFpU5gSbOmhfR6"
+    "OBNb8B7HjtQFUcZsmuY4fLhr7lQb4ciLPBTlybNtmqt0N2uKaypQloWZs33FJtSW6BPcOKhH"
+    "tG8AcYO+yVjXjJYH8a7WY37115BfGu47TPASRKv4S4t+oOOE7nZVEh8k8XrY46hCDXid6xfS"
+    "ANeKslCYa1QCt/MMnE8NSO/9ZzVAtaLTKko16aP5YBsOm4dCkRc6j8lJgfC5J4RHXb7BYeUb"
+    "bHNIOTfkKctmk8aqOvwdhGNL3JRxMj+s9CxcebY3n+6hnsU78/brYHcDr7sUxIQf4ohh2lNl"
+    "C2Eg/Z0GHpwGqpAATS+jfaFFLdlBVSWv6hk8IXnFNC9P9H5v1at5V7lT1YseaDiSlzjvZOud"
+    "e4DoxO7gxM5aQ0WDnLctW+0iJk3fuVeNlsUU76SQ4p3kKN7Jcera3YMkl81mSNo1TVjCqrbE"
+    "Q7dbLdlPtyqVt6qz9jJ530q0nlze39ZX1xxX26mvFqGpKSuem/Zqcj00CNt0DvqAHHTmf0nI"
+    "Vrjs/5Gwb/dRnGJC1IqpWp6spf8bJH01SkD0mh8mwJ1sabwfhaYh/vMwnWTlogQmCZCPiA7w"
+    "SdUUciTomkW+tRNrDkU2atbp4FeMPrx3Y/HfJFfpdnrlUIj8PJE94KrpRPrX/wHMyLbd"
+)
@@ -0,0 +1,56 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "dataset_versions" ADD "modified_at" TIMESTAMPTZ;
+COMMENT ON COLUMN "dataset_versions"."modified_at" IS 'When the operations changed for the last time';
+UPDATE "dataset_versions" SET "modified_at" = CURRENT_TIMESTAMP WHERE "version" > 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "dataset_versions" DROP COLUMN IF EXISTS "modified_at";"""
+
+
+MODELS_STATE = (
+    "eJztnG1z2jgQx7+Kh1e9mbSTkJDk7h0h5Mo1gUxC2ptmOh5hC/DEljhbbsp08t1v5Qf8JBvb"
+    "GGxa3hFJa+Sf5f+uVkt+tgyqYt360NOphdVbyu74362/pJ8tggwMH1JGHEkttFgE/byBoYnu"
+    "mCjOWFmnzGlHE4uZSGHQNUW6haFJxZZiagumUQKtxNZ13kgVGKiRWdBkE+0/G8uMzjCbYxM6"
+    "nr9Bs0ZU/ANb/M/nlooYlnUYp8EnfkF+Kd5GF9h0W8DmucU05QUu4feGLb7xiy5e5KmGdTVy"
+    "95rKDZx2mS0XTtuAsBtnIL/URFaobhskGLxYsjklq9EaYbx1hgmfDeaXZ6bNIfB79JD5XNz7"
+    "DYa4NxqyUfEU2ToLQctJUqGEPwWYjeXc4Ix/y/v2ydnF2eXp+dklDHFmsmq5eHNvL7h319Ah"
+    "MBy33t5cksgd4TyMgFsAO8quN0emGF5gEQMI044D9HGFCHp8VgD9IQHBYO1lImyNnYlIdCrB"
+    "kpNgEbfyETXQD1nHZMbmHGMnA9/n7kPvY/fhXbvzB782hZfDfXGGXk/b6eKEA6LIoLa7lHKu"
+    "xsBg/YoUAE0syfJEu85MJAMxZY5VaYLZK8ZEmthLCRFVsrCu52RcyaoNmMZkIsH2GvrFcJOW"
+    "Mch8ANMM/IF/2C3um36v7S9fzjgyzfWQMwhed8d9EcKY+haCGLNtJka+RLfLER6UvDA1BScB"
+    "3ugUpbzjEasYuik326Vy5nY+WWRGT1e3fen+od8bPA5GQz5/Y2n9pwedvAkaNObc5UO/extD"
+    "yR9WCZZRswNMLwAi37EJtyun+Z8MogLbA1YXq2KbJiasDNWk6QGqCxX0WQEyaIblGXxnIaoC"
+    "2wNWFyuhhkaQXpxp3PAA1NscEVSIozf+d8bHN+jTl9BWkzdMkPLyikxVTvTQNk0bm+wy2ka8"
+    "BREQAtW7QX47XhYEYllkYfYZmxYwSU2WiIYdZWVMVNdA/u5abD9tckh4HFWb8PCeXBLelTZL"
+    "5Rcy2t0e/TgBER6wYmJYgKqEYUpLie+4nH3PastjScockRkutE//s90+Pb1oH5+eX3bOLi46"
+    "l8cr6smuLPxXg7/5EzgK50qSu3l4rzSwhnBTEFBdextJ8YOImWZtQvmHneajvswxET8MVZpS"
+    "081SIYtJ/sw2Eujx4K7/OO7e3TvKbPnKDBtW3tOO6rXX+u48lsdaXUT6Mhh/lPif0tfR0JH2"
+    "BbXYzHS+MRg3/tric0I2ozKhrzJSw4T8Zr+pKd7gRpvSL7AETAOZL6nOQDAq0xdMYbz86hsc"
+    "XMHeuQL+Mga5QbkQRqFt3fnb4RO8v34+nCuNn8ktmBGrOn3rwCqfw00xb2YGchPu6zORDRHU"
+    "ATg1C8jeaDpO1dPkoEw51bzhMAcdH9R079QUvo7xdNccWfMi54lxu1KnilXRbD1+7L5vd879"
+    "t9lewOZd5QEcLMoy54vnZznOF8/PUs8XeVcsIwk7AFYqeI5aVhA7Vyeh+Vcx3IM6IvrSe6R7"
+    "EiF7q6+pAfJogUlWUUmkP1PFweOR3RSUHAS8YgEvGQk3OQgucapedezbwAKbnK4wWl8DKMv4"
+    "v+rraw61IBvXMBQ/c2/McXvrvjcYbQlUBSdGJY6JNz4err4AjNBQEdjSKaqxpCXOWWD3654q"
+    "jfy1lhUohUesC5W8NPHWYyWvqJZ5LlpYdQsPKpHQEg1MqqioPAzsd1ysu81doRNTTE1qSN4B"
+    "4C5jifSIbdelptWpeK87HNcGNJyzUAV+MCtXoYq8YMkcxQb4brufy+CLhGad4xyhWec4NTTj"
+    "XTHvpyi2YesOgkIuMGrXAD/Ye7orwXfbJX7GgppMptOs8DerzE9sX3tIN7i7d0K61ayah96J"
+    "f8uTF5vXDt6PpRsMntjGBJuyiRUM8y7g6pKGtScmTNqjxsKkE0QYboT382ezZmWnQs64Qt0B"
+    "Roj0hit8Kz9m+VV/iXFSsYSk/JDl18z/bBudiafYxARcUaEdWNysbiG97o+7DXiPI1vqnCgj"
+    "NnVz7D/e17erDXEUZR7y8hTZ1s21dz+ui2siUZaGWRC+UhNrM/IJLx3UA5gbIsKkbzzXNYb2"
+    "Vb6r8Zjf/DXktwZxh4leV9kq8dKCD3Cf2A1Xe93HXve63xKoQgV4neMXVgPXkrKQm2tYAtfz"
+    "XDmfCpA++NeqgWpJp5WXatxHi8HWnDYPhCIrdR6Rkxzpc08Ijw71BvtVb7DOIWWckCcs6y0a"
+    "K+vwt5COLXBSJqj8sJJP4cqzvfn0gPU03qmnX3sbDbxtUxBjfkgghklPlS6EK+k/aODeaaCK"
+    "GdL0ItoXWFRSHVRW8sruwWOSl0/zskTv91a9iqPKrapeeEMjkLzYfidd79wNxEHs9k7srAVW"
+    "NCx429LVLmRS95l72WxZRPFOcineSYbinRwnjt09SHLRaoa4Xd2Ee1TVZrTvTqsh8XSjSnnL"
+    "OmuvkndTotXU8v62vrrivNpWfXUXm5oyF7lpryfTQ6NgzMFB75GDTv3fGOkKl/6fMXbtPvJT"
+    "jIlaPlXLkrXk/wCFV6MARG/4fgLcSkjj/Sg0CfGfx9EwrRZlZRID+UTgBp9VTWFHkq5Z7Fsz"
+    "sWZQ5HfNJ736FaMP791d9984197t6MqhEPp5Ir/AVd2F9G//A54oWKg="
+)
@@ -0,0 +1,57 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        INSERT INTO "dataset_versions" ("id", "version") VALUES (1, 0) ON CONFLICT ("id") DO NOTHING;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DELETE FROM "dataset_versions" WHERE "id" = 1 AND "version" = 0;"""
+
+
+MODELS_STATE = (
+    "eJztnFtzmzoQx78K46eembSTONeeN8dxTn2axJnEac8002FkkG0mILkgmno6+e5nxcXcBAGM"
+    "DU55SyQtET+J/66WJb87BlWxbn3o69TC6hVl1/z3zt/S7w5BBoYfUkbsSR20WAT9vIGhie6Y"
+    "KM5YWafMaUcTi5lIYdA1RbqFoUnFlmJqC6ZRAq3E1nXeSBUYqJFZ0GQT7YeNZUZnmM2xCR2P"
+    "36FZIyr+hS3+62NHRQzLOozT4Cd+QX4p3kYX2HRbwOaxwzTlCS7h94YtvvOLLp7kqYZ1NXL3"
+    "msoNnHaZLRdO25CwS2cgv9REVqhuGyQYvFiyOSWr0RphvHWGCZ8N5pdnps0h8Hv0kPlc3PsN"
+    "hrg3GrJR8RTZOgtBy0lSoYSvAszGcm5wxv/K++7B0enR2eHJ0RkMcWayajl9cW8vuHfX0CFw"
+    "M+68vLgkkTvCWYyAWwA7yq4/R6YYXmARAwjTjgP0cYUIenxWAP0hAcFg72Ui7IydiUh0KsGW"
+    "k2ATd/IRNdAvWcdkxuYc43EGvi+9u/6n3t277vFf/NoUHg73wbnxerpOFyccEEUGtd2tlHM3"
+    "Bgav70gB0MSWLE+058xEMhBT5liVJpg9Y0ykib2UEFElC+t6TsaV7NqAaUwmEmwvoF8MN2kZ"
+    "g8wHMM3AH/gP28V9Oeh3/e3LGUem+TrkDIIXvfFAhDCmvoUgxmybiZFv0c1yhIWSF6am4CTA"
+    "S52ilGc8YhVDN+Vm21TO3M4ni8zo4fxqIN3eDfrD++Hohs/fWFo/9KCTN0GDxpy7vBv0rmIo"
+    "+WKVYBk1a2F6ARD5iU24XTnN/2QQFdi2WF2sim2amLAyVJOmLVQXKuizAmTQDMsz+JuFqAps"
+    "W6wuVkINjSC9ONO4YQvUOxwRVIijN/5PxscP6NOn0FGTN0yQ8vSMTFVO9NAuTRub7DK6RrwF"
+    "ERAC1btBfjteFgRiWWRh9gWbFjBJTZaIhu1lZUxU10D+6VpsPm3SJjz2qk14eCuXhHeuzVL5"
+    "hYy2d0bfT0CEBVZMDBtQlTBMaSnxE5dz7lkdeSxJmSMyw4XO6R+73cPD0+7+4cnZ8dHp6fHZ"
+    "/op6sisL//nwH74Ce+FcSfI0D8+VBtYQbgoCqgvvICleiJhp1iGU/7DVfNTXOSbixVClKTXd"
+    "LBWymOTPbC2BHg+vB/fj3vWto8yWr8xwYOU93ahee63vTmJ5rNVFpK/D8SeJ/yp9G9040r6g"
+    "FpuZzl8Mxo2/dfickM2oTOizjNQwIb/Zb2qKN7jUpvQrbAHTQOZTqjMQjMr0BVMYLz/7Bq0r"
+    "2DlXwB/GIDcoF8IotK07f3vzAM+vnw/nSuNncgtmxKpO3zqwyudwU8ybmYFch/vrmciGCOoQ"
+    "nJoFZC81HafqaXJQppxq3nCYg45bNd05NYU/x3i6a46seZH3iXG7Um8Vq6LZuf/Ue989PvGf"
+    "ZnsBh3eVB3CwKcu8Xzw5yvF+8eQo9f0i74plJOEEwEoFz1HLCmLn6iQ0/y6Ge1BHRF96S7oj"
+    "EbK3+5oaIF9Rdk/QwppnFJYkxmSquU6ZbHnDWzHfOTFHlkynRWK0lUHVUVlZIb/icZiKlr6S"
+    "J0Iya0Nv2cP5wWJZJoFx3ScKLzPqQwxlNpy37d4DLj0jS5rYms6kqUmNJuee4A7IquAtujT/"
+    "3o9uxAsTMYotyQMBHI+qprA9Sdcs9n27CzSCqfHaJ0uyGDV50c5S8ia+7vbmPCKu049K3l33"
+    "/osHLP2r0XncJ/ILnDfn0MJRZVVORvoznVtkP7SObZccW8l0T5MzPSVKx6pO8DSwijRnmBAt"
+    "IgWUZQ551ReRtgWPa4dixQvLGlNT1rntD0cbAlVBWUSJWqi1a6Cqr3ImNFTpvHQqRy1piXNW"
+    "kb/d0omRv9eyAqXwiNdCpdBxa8NfmDhOhXkuWvhpCSxU4q2NaGBSRUU10GC/5S9SNnlidmIK"
+    "fn6TvIPoNmOJjFTElr+nqE7F+72bcW1Aw4l5VeAHsxLyqsgLlkzEr4HvqvelDL5IaHa8nyM0"
+    "O95PDc14V8z7KYpt2LqDoJALjNo1wA/2H65L8N10HbuxoCaT6TQr/M2qZRfb1x7SDa9vnZBu"
+    "NavmoXfi3/Lkxea1g/dj6QaDJ7YxwaZsYgXDvAu4uqRh7YkJk/apsTDpBBGGG+H9/Nm8srNT"
+    "IWdcoe4AI0R6zR2+kS823+rnhgcVS0jK15pvM/+zaXQmnmITE3BFhU5gcbO6hfRiMO414DmO"
+    "HKlzoozY1M1xcH9b36k2xFGUecjLU2RbN9f+7bgurolEWRpmQfhKTazNyGe8dFAPYW6ICJO+"
+    "8VzXGNpX+a7GY37x95DfGsQdJnpeZavEWwt+gPvEbrja7933exeDjkAVKsDrvH5hNXAtKQu5"
+    "uYYl8HWeK+dTAdI7/1o1UC3ptPJSjftoMdia0+aBUGSlziNykiN97gnhXltvsFv1Bq85pIw3"
+    "5AnLeiujyzr8DaRjC7wpE1R+CEq/zj3by893WE/jnfr2a2ejgZdNCmLMDwnEMOmp0oVwJf2t"
+    "Bu6cBqqYIU0von2BRSXVQWUlr+wZPCZ5+TQvS/T+bNWrOKrcqOqFDzQCyYudd9L1zj1AtGK3"
+    "c2JnLbCiYcHTlq52IZO637mXzZZFFO8gl+IdZCjewX7itbsHSS5azRC3q5twn6rajA7caTUk"
+    "nm5UKW9ZZ+1V8q5LtJpa3j/WV1ecV9uor+5hU1PmIjft9WR6aBSMaR30Djno1E/z0hUu/YO8"
+    "bbuP/BRjopZP1bJkLfmPruHRKADRG76bADcS0nj/+SAJMf1LxJBJo75DzI31zX9v+PI/RTyS"
+    "Gw=="
+)
@@ -0,0 +1,57 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_closed_lots_date_op_6d6d07" ON "closed_lots" ("date_operation", "date_liquidation", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_closed_lots_date_op_6d6d07";"""
+
+
+MODELS_STATE = (
+    "eJztnFtzmzgUgP8K46fuTNpJnGv3zXGcrbdJnEmcdqeZDiODbDMByQXR1NPJf98jLuYmCGBs"
+    "cMqbLelg8Umcmw7+3TGoinXrQ1+nFlavKLvm3zt/S787BBkYPqSM2JM6aLEI+nkDQxPdEVGc"
+    "sbJOmdOOJhYzkcKga4p0C0OTii3F1BZMowRaia3rvJEqMFAjs6DJJtoPG8uMzjCbYxM6Hr9D"
+    "s0ZU/Atb/OtjR0UMyzqM0+ATvyC/FG+jC2y6LSDz2GGa8gSX8HvDEk5/TEY0jv+02vnOp7B4"
+    "kqca1tUIK+iELqddZsuF0zYk7NIZyC84kRWq2wYJBi+WbE7JarRGGG+dYcLngfnlmWlzZJyI"
+    "B9in6NIJhrhYQjIqniJbZyHEObkrlPA1g9lYzg3O+K+87x4cnR6dHZ4cncEQZyarltMX9/aC"
+    "e3cFHQI3487Li8sTuSOcpQu4BUsTZdefI1MML5CIAYRpxwH6uEIEPT4rgP6QgGCwUzMRdsbO"
+    "RCQ6lWCDSrDlO/mIGuiXrGMyY3OO8TgD35feXf9T7+5d9/gvfm0Kj5L7mN14PV2nixMOiCKD"
+    "2u5WyrkbA4HXd6QAaGJLlifac2YiGYgpc6xKE8yeMSbSxF5KiKiShXU9J+NKdm3ANKkgomwv"
+    "oF8MNykZg8wHMM3AH/iH7eK+HPS7/vbljKMa8FXIGQQveuOBCGFMoxaCGJNtJka+RTfLERZK"
+    "XpiagpMAL3WKUp7xiFQM3ZSLbVNz5jY+WWRGD+dXA+n2btAf3g9HN3z+xtL6oQedvAkaNObc"
+    "5d2gdxVDyRerBMuoWAvTc4DIT2zC7cpp9ieDqEC2xepiVWzTxISVoZoUbaG6UEE/K0AGzbA8"
+    "g98sRFUg22J1sRJqaATpxZnGBVugXnBEUCGO3vg/GR8P0KdPoVCTN0yQ8vSMTFVO9NAuTRub"
+    "7DK6RrwFEVAEqneD/Ha8nAn4ssjC7As2LWCSmloRDdvLyq+oroD805XYfJKlTXjsVZvw8FYu"
+    "Ce9cm6XyCwltL0bfT0CEBVZMDBtQlTBMaSnxiMuJe1YhjyUpc0RmuFCc/rHbPTw87e4fnpwd"
+    "H52eHp/tr6gnu7Lwnw//4SuwF86VJKN5eK40kAZ3U+BQXXiBpHghYqJZQSj/sNV81Nc5JuLF"
+    "UKUpNd0sFbKY5M9sLQU9Hl4P7se961tHM1u+ZoaAlfd0o/raa313EstjrS4ifR2OP0n8q/Rt"
+    "dOOo9gW12Mx0fjEYN/7W4XNCNqMyoc8yUsOE/Ga/qSnW4FKb0q+wBUwDmU+pxkAwKtMWTGG8"
+    "/OwLtKZg50wBfxiD3KBcCKNQtu787c0DPL9+PpxrGj+TWzAjVnX61oFVPoebIt7MDOQ63F/P"
+    "RDZEoQ7BqFlA9lLTcao+TQ7KVKeaNxzmoONWm+6cNoWfYzzdNUfWvMh5Ylyu1KliVTQ79596"
+    "77vHJ/7TbC8geFe5Awebssz54slRjvPFk6PU80XeFctIQgTASjnPUckKfOfqVGj+XQz3oI6I"
+    "vvSWdEc8ZG/3NdVBvqLsnqCFNc8oQ0mMydTmOmWy5Q1vlfnOKXNkyXRaxEdbCVTtlZVV5Ffc"
+    "D1PR0tfkCZfM2tApezg/WCzLJBCuO6LwMqM+xFBmwzlt9x5w6RlZ0sTWdCZNTWo0OfcEd0BW"
+    "5XHRpfn3fnQjXpiIUGxJHgjgeFQ1he1Jumax79tdoBFMjdc+WZLFqMmLdpaSN/F1tzfnETGd"
+    "vlfy7rr3X9xh6V+NzuM2kV/gvDlBC0eVVWcZ6c80bpH90Bq2XTJsJdM9Tc70lCgdqzrB08Aq"
+    "0pxuQrSIFFCWCfKqLyJtCx7XdsWKF5Y1pqasc9sfjjYEqoKyiBK1UGvXQFVf5UxoqNJ56VSO"
+    "WtIS56wif7ulEyN/r2U5SuERr7lKoXBrw++jOEaFeSZa+CIKLFTi1EY0sKlvpGwyYnZ8Ch6/"
+    "SV4guk1fIiMVseX3KarT4v3ezbg2oOHEvCqwg1kJeVVkBUsm4tfAd9X7UgZfxDU73s/hmh3v"
+    "p7pmvCtm/RTFNmzdQVDIBEblGmAH+w/XJfhuuo7dWFCTyXSa5f5m1bKL5Wt36YbXt45Lt5pV"
+    "89A7/m958mLx2sH7vnSDwRPbmGBTNrGCYd4FTF1SsPbEhEn71FiYdIIIw42wfv5sXtnZqZAz"
+    "rlC3gxEiveYO38gbm2/1dcODilVIytuabzP/s2l0Jp5iExMwRYUisLhY3Yr0YjDuNeA5joTU"
+    "OVFGZOrmOLi/rS+qDXEUZR7y8hTJ1s21fzuui2siUZaGWeC+UhNrM/IZLx3UQ5gbIsKkbzzX"
+    "NYb2Vb6r8Zhf/D3ktwZ+h4meV9kq8daCD3Cf2HVX+737fu9i0BFohQrwOscvrAauJdVCbq5h"
+    "Ffg6z5XxqQDpnX+tGqiWNFp5qcZttBhszWnzQFFkpc4j6iRH+txThHttvcFu1Ru8ZpAyTsgT"
+    "kvVWRpc1+BtIxxY4KRNUfghKv8492cvPd1hP4516+rWz3sDLJhVizA4JlGHSUqUrwpXqb3Xg"
+    "zulAFTOk6UV0XyBRSXVQWZVXNgaPqbx8Oi9L6f3ZWq9ir3KjWi8c0AhUXizeSdd3bgDRKrud"
+    "U3bWAisaFjxt6douJFL3mXvZbFlE4x3k0ngHGRrvYD9x7O5BkotWM8Tl6ibcp6o2owN3Wg3x"
+    "pxtVylvWWHuVvOsSraaW94+11RXn1TZqq3vY1JS5yEx7PZkWGgVjWgO9QwY69dW8dA2X/kLe"
+    "ts1HfooxpZZPq2WpteQfXcOjUQCiN3w3AW7EpfH++SAJMf1NxJBIo95DzI31zb9v+PI/Yw+h"
+    "vg=="
+)
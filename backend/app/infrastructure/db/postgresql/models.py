@@ -8,7 +8,7 @@ class TicketModel(Model):
         max_length=50, description="CodigoEspecie from dataset"
     )
     ticker = fields.CharField(
-        max_length=25, null=True, description="Ticker from dataset"
+        max_length=25, null=True, unique=True, description="Ticker from dataset"
     )
 
     class Meta:
@@ -17,7 +17,9 @@ class TicketModel(Model):
 
 class OperationTypeModel(Model):
     id = fields.IntField(unique=True, pk=True)
-    type_operation = fields.CharField(max_length=50, description="CPTE from dataset")
+    type_operation = fields.CharField(
+        max_length=50, unique=True, description="CPTE from dataset"
+    )
 
     class Meta:
         table = "operation_types"
@@ -26,7 +28,7 @@ class OperationTypeModel(Model):
 class ReferenceModel(Model):
     id = fields.IntField(unique=True, pk=True)
     detail = fields.CharField(
-        max_length=500, null=True, description="DETA from dataset"
+        max_length=500, null=True, unique=True, description="DETA from dataset"
     )
 
     class Meta:
@@ -73,6 +75,104 @@ class OperationModel(Model):
 
     class Meta:
         table = "operations"
+        indexes = (
+            ("ticket_id", "date_operation"),
+            ("type_operation_id", "date_operation"),
+            ("date_operation", "date_liquidation", "id"),
+        )
+
+
+class OpenLotModel(Model):
+    id = fields.IntField(unique=True, pk=True)
+    operation_id = fields.IntField(description="NUME of the buy operation")
+    ticker = fields.CharField(
+        max_length=25, null=True, db_index=True, description="Ticker of the buy"
+    )
+    date_operation = fields.DateField(description="FEC2 of the buy operation")
+    price = fields.FloatField(description="PCIO of the buy operation", null=True)
+    amount = fields.FloatField(description="Amount not matched by sells yet")
+
+    class Meta:
+        table = "open_lots"
+
+
+class ClosedLotModel(Model):
+    id = fields.IntField(unique=True, pk=True)
+    ticker = fields.CharField(max_length=25, null=True, description="Ticker of the lot")
+    amount = fields.IntField(description="Amount matched between buy and sell")
+    date_operation = fields.DateField(description="FEC2 of the buy operation")
+    date_liquidation = fields.DateField(description="FEC2 of the sell operation")
+    buy_price = fields.FloatField(null=True)
+    sell_price = fields.FloatField(null=True)
+    inverted_amount = fields.FloatField(null=True)
+    current_amount = fields.FloatField(null=True)
+    percentage_gain = fields.FloatField(null=True)
+    nominal_gain = fields.FloatField(null=True)
+    tna = fields.FloatField(null=True)
+
+    class Meta:
+        table = "closed_lots"
+        indexes = (
+            ("date_liquidation", "date_operation"),
+            ("ticker", "date_liquidation"),
+            ("date_operation", "date_liquidation", "id"),
+        )
+
+
+class FifoWatermarkModel(Model):
+    id = fields.IntField(unique=True, pk=True)
+    last_operation_id = fields.IntField(
+        description="NUME of the last matched operation"
+    )
+    last_date_operation = fields.DateField(
+        description="FEC2 of the last matched operation"
+    )
+
+    class Meta:
+        table = "fifo_watermarks"
+
+
+class LotSnapshotModel(Model):
+    id = fields.IntField(unique=True, pk=True)
+    as_of = fields.DateField(
+        unique=True, description="Last day of the matched operations"
+    )
+    dataset_version = fields.BigIntField(
+        description="Version of the operations the snapshot was built from"
+    )
+    open_lots = fields.JSONField(description="Open lots stored by column")
+    fingerprint = fields.CharField(
+        max_length=64,
+        default="",
+        description="Fingerprint of the operations of the month",
+    )
+
+    class Meta:
+        table = "lot_snapshots"
+
+
+class DatasetVersionModel(Model):
+    id = fields.IntField(unique=True, pk=True)
+    version = fields.BigIntField(
+        default=0, description="Increased every time the operations change"
+    )
+    modified_at = fields.DatetimeField(
+        null=True, description="When the operations changed for the last time"
+    )
+
+    class Meta:
+        table = "dataset_versions"
+
+
+class IngestedFileModel(Model):
+    id = fields.IntField(unique=True, pk=True)
+    content_hash = fields.CharField(
+        max_length=64, unique=True, description="SHA-256 of the uploaded file"
+    )
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "ingested_files"
 
 
 # uv run aerich history
@@ -0,0 +1,55 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+# Keys of the PostgreSQL advisory locks taken by the repositories
+LOTS_SYNC_LOCK_KEY = 20_261_018_001
+LOT_SNAPSHOTS_LOCK_KEY = 20_261_018_002
+
+_process_locks: dict[int, asyncio.Lock] = {}
+
+
+@asynccontextmanager
+async def advisory_lock(connection: BaseDBAsyncClient, key: int) -> AsyncIterator[None]:
+    """
+    Run the block in a transaction holding the lock of `key`. The coroutines of this process
+    wait for each other before opening it, so they do not hold pooled connections meanwhile.
+    On PostgreSQL the transaction also takes an advisory lock, released when it ends, so every
+    process using the database waits for it. The block runs its queries in the transaction,
+    it never needs a second connection while the lock is held.
+    """
+    async with _process_locks.setdefault(key, asyncio.Lock()):
+        async with in_transaction(connection.connection_name) as transaction:
+            if isinstance(transaction, AsyncpgDBClient):
+                await transaction.execute_query(
+                    "SELECT pg_advisory_xact_lock($1)", [key]
+                )
+            yield
+
+
+@asynccontextmanager
+async def try_advisory_lock(
+    connection: BaseDBAsyncClient, key: int
+) -> AsyncIterator[bool]:
+    """
+    Like advisory_lock, without waiting: the block runs at once and gets whether it holds the
+    lock, it must not do the locked work when it does not.
+    """
+    process_lock = _process_locks.setdefault(key, asyncio.Lock())
+    if process_lock.locked():
+        yield False
+        return
+
+    async with process_lock:
+        async with in_transaction(connection.connection_name) as transaction:
+            if isinstance(transaction, AsyncpgDBClient):
+                _, rows = await transaction.execute_query(
+                    "SELECT pg_try_advisory_xact_lock($1)", [key]
+                )
+                yield bool(rows[0][0])
+            else:
+                yield True
@@ -0,0 +1,222 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+from tortoise.expressions import Q
+from tortoise.models import Model
+
+from app.domain.entities.entities import Operation
+from app.infrastructure.db.postgresql.models import (
+    OperationTypeModel,
+    ReferenceModel,
+    TicketModel,
+)
+
+
+@dataclass
+class DimensionIds:
+    """
+    Ids of the operation types, tickers and references by their natural key.
+    """
+
+    type_operation_ids: dict[str, int] = field(default_factory=dict)
+    ticket_ids: dict[str | None, int] = field(default_factory=dict)
+    reference_ids: dict[str | None, int] = field(default_factory=dict)
+
+    def get(self, model: type[Model]) -> dict:
+        if model is OperationTypeModel:
+            return self.type_operation_ids
+        if model is TicketModel:
+            return self.ticket_ids
+        return self.reference_ids
+
+
+class DimensionCache:
+    """
+    Ids of the operation types, tickers and references by their natural key.
+    The tables are loaded once and each batch of operations only creates the keys it adds, so
+    resolving the related models takes a few queries regardless of the number of operations.
+    Ids created by a transaction are kept apart until it is committed, so other uploads never
+    reference rows that could still be rolled back.
+    """
+
+    def __init__(self):
+        # Committed ids, shared by every upload
+        self.ids = DimensionIds()
+        self._loaded = False
+
+    async def resolve(
+        self, operations: list[Operation], created: DimensionIds
+    ) -> DimensionIds:
+        """
+        Get the ids of the related models of the operations, creating the missing ones.
+        The first operation with a key provides the values of the created model.
+        It must run inside the transaction that stores the operations: the ids it creates are
+        added to `created`, which is published once the transaction is committed.
+        """
+        # No lock is held across the queries: they run in the caller's transaction, and an
+        # upsert waiting for a key inserted by another upload would keep its lock from it.
+        # Concurrent resolves may upsert the same keys, ON CONFLICT keeps a single row per key.
+        ids = self.ids
+        if not self._loaded:
+            await self._load_ids(OperationTypeModel, "type_operation", ids, created)
+            await self._load_ids(TicketModel, "ticker", ids, created)
+            await self._load_ids(ReferenceModel, "detail", ids, created)
+            # An invalidation while loading leaves the new ids to the next resolve
+            self._loaded = self.ids is ids
+
+        # Iterating in reverse leaves the first operation of each key in the dict
+        type_operations = {
+            operation.type_operation.type_operation: operation.type_operation
+            for operation in reversed(operations)
+        }
+        tickets = {
+            operation.ticket.ticker: operation.ticket
+            for operation in reversed(operations)
+        }
+        references = {
+            operation.reference.detail: operation.reference
+            for operation in reversed(operations)
+        }
+
+        return DimensionIds(
+            type_operation_ids=await self._resolve_keys(
+                OperationTypeModel,
+                "type_operation",
+                {key: {"type_operation": key} for key in type_operations},
+                ids,
+                created,
+            ),
+            ticket_ids=await self._resolve_keys(
+                TicketModel,
+                "ticker",
+                {
+                    key: {
+                        "species": ticket.species,
+                        "species_code": ticket.species_code,
+                        "ticker": key,
+                    }
+                    for key, ticket in tickets.items()
+                },
+                ids,
+                created,
+            ),
+            reference_ids=await self._resolve_keys(
+                ReferenceModel,
+                "detail",
+                {key: {"detail": key} for key in references},
+                ids,
+                created,
+            ),
+        )
+
+    def publish(self, created: DimensionIds) -> None:
+        """
+        Share the ids created by a committed transaction.
+        """
+        for model in (OperationTypeModel, TicketModel, ReferenceModel):
+            ids = self.ids.get(model)
+            for key, id in created.get(model).items():
+                ids.setdefault(key, id)
+
+    def invalidate(self) -> None:
+        """
+        Forget the ids, they are loaded again on the next resolve.
+        """
+        self.ids = DimensionIds()
+        self._loaded = False
+
+    async def _resolve_keys(
+        self,
+        model: type[Model],
+        key_field: str,
+        values: dict[Any, dict[str, Any]],
+        cached: DimensionIds,
+        created: DimensionIds,
+    ) -> dict:
+        """
+        Get the ids of the keys, looking up the keys missing in the cache before creating them
+        since other processes may have created them meanwhile.
+        """
+        ids = cached.get(model)
+        created_ids = created.get(model)
+        missing = [key for key in values if key not in ids and key not in created_ids]
+        if missing:
+            await self._load_ids(model, key_field, cached, created, missing)
+            missing = [key for key in missing if key not in ids]
+        if missing:
+            await self._upsert(
+                model, key_field, [values[key] for key in missing], created
+            )
+        return {key: ids.get(key, created_ids.get(key)) for key in values}
+
+    async def _upsert(
+        self,
+        model: type[Model],
+        key_field: str,
+        values: list[dict[str, Any]],
+        created: DimensionIds,
+    ) -> None:
+        """
+        Insert the keys in a single statement returning their ids. A key inserted at the same
+        time by another transaction waits for it and returns its id instead of failing.
+        The unique indexes treat NULL keys as equal, so missing tickers and references conflict
+        like any other key.
+        """
+        connection = model._meta.db
+        columns = list(values[0])
+        parameters = [row[column] for row in values for column in columns]
+        if isinstance(connection, AsyncpgDBClient):
+            placeholders = [f"${number}" for number in range(1, len(parameters) + 1)]
+        else:
+            placeholders = ["?"] * len(parameters)
+        quoted_columns = ", ".join(f'"{column}"' for column in columns)
+        rows = ", ".join(
+            f"({', '.join(placeholders[start:start + len(columns)])})"
+            for start in range(0, len(parameters), len(columns))
+        )
+
+        _, records = await connection.execute_query(
+            f'INSERT INTO "{model._meta.db_table}" ({quoted_columns}) '
+            f'VALUES {rows} ON CONFLICT ("{key_field}") '
+            f'DO UPDATE SET "{key_field}" = EXCLUDED."{key_field}" '
+            f'RETURNING "{key_field}", "id"',
+            parameters,
+        )
+        created_ids = created.get(model)
+        for key, id in records:
+            created_ids.setdefault(key, id)
+
+    async def _load_ids(
+        self,
+        model: type[Model],
+        key_field: str,
+        cached: DimensionIds,
+        created: DimensionIds,
+        keys: list | None = None,
+    ) -> None:
+        """
+        Load the ids of the keys provided or of the whole table, keeping the oldest id of a key.
+        Rows created by the transaction are the only uncommitted ones it reads, they are left
+        out so the cache only holds committed ids.
+        """
+        query = model.all()
+        if keys is not None:
+            query = query.filter(self._keys_filter(key_field, keys))
+
+        ids = cached.get(model)
+        uncommitted_ids = set(created.get(model).values())
+        for key, id in await query.order_by("id").values_list(key_field, "id"):
+            if id not in uncommitted_ids:
+                ids.setdefault(key, id)
+
+    def _keys_filter(self, key_field: str, keys: list) -> Q:
+        """
+        Filter by keys, missing tickers and references are stored with NULL.
+        """
+        keys_filter = Q(
+            **{f"{key_field}__in": [key for key in keys if key is not None]}
+        )
+        if None in keys:
+            keys_filter |= Q(**{f"{key_field}__isnull": True})
+        return keys_filter
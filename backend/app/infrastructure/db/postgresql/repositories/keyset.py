@@ -0,0 +1,19 @@
+from tortoise.expressions import Q
+
+from app.domain.entities.entities import OperationsCursor
+
+
+def keyset_filter(cursor: OperationsCursor, ascending: bool) -> Q:
+    """
+    Filter the rows after the cursor in the (date_operation, date_liquidation, id) order
+    provided. The bound on date_operation alone lets the index range start at the cursor.
+    """
+    after = "gt" if ascending else "lt"
+    return Q(**{f"date_operation__{after}e": cursor.date_operation}) & (
+        Q(**{f"date_operation__{after}": cursor.date_operation})
+        | Q(**{f"date_liquidation__{after}": cursor.date_liquidation})
+        | Q(
+            date_liquidation=cursor.date_liquidation,
+            **{f"id__{after}": cursor.id},
+        )
+    )
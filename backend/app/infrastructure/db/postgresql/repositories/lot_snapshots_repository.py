@@ -0,0 +1,103 @@
+import datetime
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from tortoise.transactions import in_transaction
+
+from app.domain.entities.entities import LotSnapshot, OpenLot
+from app.domain.interfaces.repositories.lot_snapshots_repository_interface import (
+    LotSnapshotsRepositoryInterface,
+)
+from app.infrastructure.db.postgresql.models import LotSnapshotModel
+from app.infrastructure.db.postgresql.repositories.advisory_lock import (
+    LOT_SNAPSHOTS_LOCK_KEY,
+    try_advisory_lock,
+)
+
+
+class LotSnapshotsRepository(LotSnapshotsRepositoryInterface):
+    async def get_dataset_version(self) -> int | None:
+        """
+        Get the version of the operations the stored snapshots were built from.
+        """
+        record = await LotSnapshotModel.all().order_by("-as_of").first()
+        return record.dataset_version if record else None
+
+    async def get_snapshot_before(self, date: datetime.date) -> LotSnapshot | None:
+        """
+        Get the latest snapshot taken before the date.
+        """
+        record = (
+            await LotSnapshotModel.filter(as_of__lt=date).order_by("-as_of").first()
+        )
+        if record is None:
+            return None
+        return LotSnapshot(
+            as_of=record.as_of,
+            open_lots=_decode_lots(record.open_lots),
+            fingerprint=record.fingerprint,
+        )
+
+    async def get_fingerprints(self) -> dict[datetime.date, str]:
+        return dict(await LotSnapshotModel.all().values_list("as_of", "fingerprint"))
+
+    async def replace_snapshots(
+        self,
+        snapshots: list[LotSnapshot],
+        dataset_version: int,
+        from_date: datetime.date = datetime.date.min,
+    ) -> None:
+        """
+        Replace the stored snapshots from the date on, each one keeps its lots as a single
+        JSON row.
+        """
+        async with in_transaction():
+            await LotSnapshotModel.filter(as_of__gte=from_date).delete()
+            await LotSnapshotModel.all().update(dataset_version=dataset_version)
+            await LotSnapshotModel.bulk_create(
+                [
+                    LotSnapshotModel(
+                        as_of=snapshot.as_of,
+                        dataset_version=dataset_version,
+                        open_lots=_encode_lots(snapshot.open_lots),
+                        fingerprint=snapshot.fingerprint,
+                    )
+                    for snapshot in snapshots
+                ]
+            )
+
+    def rebuild_lock(self) -> AbstractAsyncContextManager[bool]:
+        return try_advisory_lock(LotSnapshotModel._meta.db, LOT_SNAPSHOTS_LOCK_KEY)
+
+
+def _encode_lots(lots: list[OpenLot]) -> dict[str, list[Any]]:
+    """
+    Store the lots by column, so the attribute names are not repeated for every lot.
+    Dates are stored as ordinals.
+    """
+    return {
+        "operation_id": [lot.operation_id for lot in lots],
+        "ticker": [lot.ticker for lot in lots],
+        "date_operation": [lot.date_operation.toordinal() for lot in lots],
+        "price": [lot.price for lot in lots],
+        "amount": [lot.amount for lot in lots],
+    }
+
+
+def _decode_lots(columns: dict[str, list[Any]]) -> list[OpenLot]:
+    return [
+        OpenLot(
+            operation_id=operation_id,
+            ticker=ticker,
+            date_operation=datetime.date.fromordinal(date_operation),
+            price=price,
+            amount=amount,
+        )
+        for operation_id, ticker, date_operation, price, amount in zip(
+            columns["operation_id"],
+            columns["ticker"],
+            columns["date_operation"],
+            columns["price"],
+            columns["amount"],
+        )
+    ]
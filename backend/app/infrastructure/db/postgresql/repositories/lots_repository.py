@@ -0,0 +1,224 @@
+import datetime
+from contextlib import AbstractAsyncContextManager
+from typing import Any, AsyncIterator
+
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+
+from app.domain.entities.entities import (
+    FifoWatermark,
+    OpenLot,
+    OperationsAnalyzed,
+    OperationsCursor,
+)
+from app.domain.entities.enums import CursorDirections, TickerMatches
+from app.domain.interfaces.repositories.lots_repository_interface import (
+    LotsRepositoryInterface,
+)
+from app.infrastructure.db.postgresql.models import (
+    ClosedLotModel,
+    FifoWatermarkModel,
+    OpenLotModel,
+)
+from app.infrastructure.db.postgresql.repositories.advisory_lock import (
+    LOTS_SYNC_LOCK_KEY,
+    advisory_lock,
+)
+from app.infrastructure.db.postgresql.repositories.keyset import keyset_filter
+
+WATERMARK_ID = 1
+
+
+class LotsRepository(LotsRepositoryInterface):
+    async def get_watermark(self) -> FifoWatermark | None:
+        """
+        Get the last operation already matched.
+        """
+        record = await FifoWatermarkModel.get_or_none(id=WATERMARK_ID)
+        if record is None:
+            return None
+        return FifoWatermark(
+            last_operation_id=record.last_operation_id,
+            last_date_operation=record.last_date_operation,
+        )
+
+    async def get_open_lots(
+        self, tickers: list[str | None] | None = None
+    ) -> list[OpenLot]:
+        """
+        Get the open lots in FIFO order.
+        """
+        query = OpenLotModel.all()
+        if tickers is not None:
+            query = query.filter(self._tickers_filter(tickers))
+
+        records = await query.order_by("date_operation", "id")
+        return [
+            OpenLot(
+                operation_id=record.operation_id,
+                ticker=record.ticker,
+                date_operation=record.date_operation,
+                price=record.price,
+                amount=record.amount,
+            )
+            for record in records
+        ]
+
+    async def save_matching(
+        self,
+        closed_operations: list[OperationsAnalyzed],
+        open_lots: list[OpenLot],
+        watermark: FifoWatermark,
+        tickers: list[str | None] | None = None,
+    ) -> None:
+        """
+        Store the result of matching new operations.
+        When no tickers are provided the stored lots are fully replaced.
+        """
+        async with in_transaction():
+            if tickers is None:
+                await ClosedLotModel.all().delete()
+                await OpenLotModel.all().delete()
+            else:
+                await OpenLotModel.filter(self._tickers_filter(tickers)).delete()
+
+            await OpenLotModel.bulk_create(
+                [
+                    OpenLotModel(
+                        operation_id=lot.operation_id,
+                        ticker=lot.ticker,
+                        date_operation=lot.date_operation,
+                        price=lot.price,
+                        amount=lot.amount,
+                    )
+                    for lot in open_lots
+                    if lot.amount > 0
+                ]
+            )
+            await ClosedLotModel.bulk_create(
+                [
+                    ClosedLotModel(
+                        ticker=operation.ticker,
+                        amount=operation.amount,
+                        date_operation=operation.date_operation,
+                        date_liquidation=operation.date_liquidation,
+                        buy_price=operation.buy_price,
+                        sell_price=operation.sell_price,
+                        inverted_amount=operation.inverted_amount,
+                        current_amount=operation.current_amount,
+                        percentage_gain=operation.percentage_gain,
+                        nominal_gain=operation.nominal_gain,
+                        tna=operation.tna,
+                    )
+                    for operation in closed_operations
+                ]
+            )
+            await FifoWatermarkModel.update_or_create(
+                id=WATERMARK_ID,
+                defaults={
+                    "last_operation_id": watermark.last_operation_id,
+                    "last_date_operation": watermark.last_date_operation,
+                },
+            )
+
+    def sync_lock(self) -> AbstractAsyncContextManager[None]:
+        return advisory_lock(OpenLotModel._meta.db, LOTS_SYNC_LOCK_KEY)
+
+    async def reset(self) -> None:
+        """
+        Remove every stored lot and the watermark.
+        """
+        async with in_transaction():
+            await ClosedLotModel.all().delete()
+            await OpenLotModel.all().delete()
+            await FifoWatermarkModel.all().delete()
+
+    async def get_closed_lots(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> list[OperationsAnalyzed]:
+        """
+        Get the closed lots bought and sold between the dates provided.
+        """
+        records = await ClosedLotModel.filter(
+            **self._get_closed_lots_filters(from_date, to_date, ticker, ticker_match)
+        ).order_by("date_operation", "date_liquidation", "id")
+        return [self._to_operation_analyzed(record) for record in records]
+
+    async def iter_closed_lots(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        batch_size: int,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> AsyncIterator[list[OperationsAnalyzed]]:
+        """
+        Yield the closed lots of get_closed_lots in batches, walking their order with a cursor.
+        """
+        query = ClosedLotModel.filter(
+            **self._get_closed_lots_filters(from_date, to_date, ticker, ticker_match)
+        )
+        cursor = None
+        while True:
+            batch_query = query
+            if cursor is not None:
+                batch_query = query.filter(keyset_filter(cursor, ascending=True))
+            records = await batch_query.order_by(
+                "date_operation", "date_liquidation", "id"
+            ).limit(batch_size)
+            if records:
+                yield [self._to_operation_analyzed(record) for record in records]
+            if len(records) < batch_size:
+                return
+            cursor = OperationsCursor(
+                date_operation=records[-1].date_operation,
+                date_liquidation=records[-1].date_liquidation,
+                id=records[-1].id,
+                direction=CursorDirections.NEXT,
+            )
+
+    def _get_closed_lots_filters(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        ticker: str | None,
+        ticker_match: TickerMatches,
+    ) -> dict[str, Any]:
+        filters: dict[str, Any] = {
+            "date_operation__gte": from_date,
+            "date_liquidation__lte": to_date,
+        }
+        if ticker and ticker_match == TickerMatches.EXACT:
+            filters["ticker"] = ticker
+        elif ticker:
+            filters["ticker__icontains"] = ticker
+        return filters
+
+    def _to_operation_analyzed(self, record: ClosedLotModel) -> OperationsAnalyzed:
+        return OperationsAnalyzed(
+            id=record.id,
+            ticker=record.ticker,
+            amount=record.amount,
+            date_operation=record.date_operation,
+            date_liquidation=record.date_liquidation,
+            buy_price=record.buy_price,
+            sell_price=record.sell_price,
+            inverted_amount=record.inverted_amount,
+            current_amount=record.current_amount,
+            percentage_gain=record.percentage_gain,
+            nominal_gain=record.nominal_gain,
+            tna=record.tna,
+        )
+
+    def _tickers_filter(self, tickers: list[str | None]) -> Q:
+        """
+        Filter by tickers, the lots of operations without ticker are stored with NULL.
+        """
+        tickers_filter = Q(ticker__in=[ticker for ticker in tickers if ticker])
+        if None in tickers:
+            tickers_filter |= Q(ticker__isnull=True)
+        return tickers_filter
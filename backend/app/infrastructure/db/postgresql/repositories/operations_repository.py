@@ -1,11 +1,29 @@
 import datetime
-from typing import TYPE_CHECKING, Any
-
-from tortoise.expressions import Q
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator
+
+import numpy as np
+import pandas as pd
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import F, Q
 from tortoise.transactions import in_transaction
 
-from app.domain.entities.entities import Operation
-from app.domain.entities.enums import HBTypeOperations
+from app.domain.entities.entities import (
+    DatasetVersion,
+    IngestResult,
+    Operation,
+    OperationsCursor,
+)
+from app.domain.entities.enums import (
+    ConflictModes,
+    CursorDirections,
+    DatabaseColumnsOperations,
+    HBTypeOperations,
+    TickerMatches,
+    TypeOfSort,
+)
 from app.domain.interfaces.repositories.operations_repository_interface import (
     OperationsRepositoryInterface,
 )
@@ -16,62 +34,356 @@ if TYPE_CHECKING:
     )
 
 from app.infrastructure.db.postgresql.models import (
+    DatasetVersionModel,
+    IngestedFileModel,
     OperationModel,
-    OperationTypeModel,
-    ReferenceModel,
-    TicketModel,
 )
+from app.infrastructure.db.postgresql.repositories.dimension_cache import (
+    DimensionCache,
+    DimensionIds,
+)
+from app.infrastructure.db.postgresql.repositories.keyset import keyset_filter
+
+DATASET_VERSION_ID = 1
+# Ids looked up per query, below the bind parameters allowed by PostgreSQL and SQLite
+EXISTING_IDS_BATCH_SIZE = 10_000
+
+OPERATIONS_STAGING_TABLE = "operations_staging"
+# Columns of the operations table in the order of the records copied to the staging table
+OPERATIONS_COLUMNS = (
+    "id",
+    "type_operation_id",
+    "ticket_id",
+    "reference_id",
+    "amount",
+    "code",
+    "accumulated",
+    "number_receipt",
+    "date_liquidation",
+    "date_operation",
+    "price_of_operation",
+    "import_of_operation",
+    "comprobant_of_operation",
+)
+# Columns read for the analysis in a joined query: type, ticker, amount, price and date
+OPERATIONS_FRAME_COLUMNS = (
+    '"operation_types"."type_operation"',
+    '"tickets"."ticker"',
+    '"operations"."amount"',
+    '"operations"."price_of_operation"',
+    '"operations"."date_operation"',
+)
+
+
+def _to_int(value: float | int | None) -> int | None:
+    """Amounts come as floats when the column has missing values."""
+    return None if value is None else int(value)
+
+
+def _to_date(value: datetime.date) -> datetime.date:
+    """Parsed operations carry datetimes, the date columns are stored as dates."""
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+
+def _conflict_error(ids: list[int]) -> ValueError:
+    return ValueError(
+        f"Operations already stored (NUME {', '.join(map(str, ids[:10]))}), "
+        "upload them again skipping or overwriting the conflicts"
+    )
+
+
+async def _as_chunks(operations: list[Operation]) -> AsyncIterator[list[Operation]]:
+    yield operations
 
 
 class OperationsRepository(OperationsRepositoryInterface):
-    async def create_operations(self, operations: list[Operation]) -> int:
+    def __init__(
+        self,
+        bulk_load: bool = True,
+        dimension_cache: DimensionCache | None = None,
+        dataset_version_ttl: float = 0.0,
+    ):
+        """
+        Args:
+            bulk_load: Store operations with the COPY protocol when the database is PostgreSQL
+            dimension_cache: Ids of the related models, kept between uploads
+            dataset_version_ttl: Seconds the dataset version is reused before reading it again,
+                changes made through this repository are seen immediately
+        """
+        self.bulk_load = bulk_load
+        self.dimension_cache = (
+            dimension_cache if dimension_cache is not None else DimensionCache()
+        )
+        self.dataset_version_ttl = dataset_version_ttl
+        self._dataset_version: DatasetVersion | None = None
+        self._dataset_version_read_at = 0.0
+        self._dataset_version_changes = 0
+
+    async def create_operations(
+        self,
+        operations: list[Operation],
+        on_conflict: ConflictModes = ConflictModes.REJECT,
+        content_hash: str | None = None,
+    ) -> IngestResult:
         """
         Create operations.
+
+        Args:
+            operations: Operations to create
+            on_conflict: What to do with the operations whose NUME is already stored
+            content_hash: Hash of the file of the operations, stored so the file is not ingested again
         """
-        async with in_transaction():
-            operations_records = []
-            for operation in operations:
-                # Create and save related models first
-                operation_type, _ = await OperationTypeModel.get_or_create(
-                    type_operation=operation.type_operation.type_operation,
-                    defaults={
-                        "type_operation": operation.type_operation.type_operation
-                    },
-                )
+        return await self.create_operations_in_chunks(
+            _as_chunks(operations), on_conflict, content_hash
+        )
 
-                ticket, _ = await TicketModel.get_or_create(
-                    ticker=operation.ticket.ticker,
-                    defaults={
-                        "species": operation.ticket.species,
-                        "species_code": operation.ticket.species_code,
-                        "ticker": operation.ticket.ticker,
-                    },
+    async def create_operations_in_chunks(
+        self,
+        chunks: AsyncIterable[list[Operation]],
+        on_conflict: ConflictModes = ConflictModes.REJECT,
+        content_hash: str | None = None,
+    ) -> IngestResult:
+        """
+        Create the operations of each chunk before the next one is requested, all in a single
+        transaction so a chunk that fails leaves none of them stored.
+        The hash of the file is stored first in the same transaction, an upload of the same file
+        running at the same time waits for it and then stores nothing.
+        """
+        result = IngestResult()
+        created_ids = DimensionIds()
+        async with self._write_transaction() as connection:
+            if content_hash is not None and not await self._store_content_hash(
+                connection, content_hash
+            ):
+                return IngestResult(already_ingested=True)
+
+            async for operations in chunks:
+                result.add(
+                    await self._create_operations_records(
+                        operations, connection, on_conflict, created_ids
+                    )
                 )
+            if result.operations_stored:
+                await self._increase_dataset_version()
+        # Related models created in the transaction are only shared once it is committed
+        self.dimension_cache.publish(created_ids)
+        return result
 
-                reference, _ = await ReferenceModel.get_or_create(
-                    detail=operation.reference.detail,
-                    defaults={"detail": operation.reference.detail},
-                )
+    async def is_file_ingested(self, content_hash: str) -> bool:
+        """
+        Check if a file with the same content was already ingested.
+        """
+        return await IngestedFileModel.filter(content_hash=content_hash).exists()
+
+    async def _store_content_hash(
+        self, connection: BaseDBAsyncClient, content_hash: str
+    ) -> bool:
+        """
+        Store the hash of an ingested file, it must run inside the transaction that stores its
+        operations.
 
-                # Now create the operation model with the saved related models
-                operation_model = OperationModel(
-                    id=operation.id,
-                    type_operation=operation_type,
-                    ticket=ticket,
-                    amount=operation.amount,
-                    code=operation.code,
-                    accumulated=operation.accumulated,
-                    number_receipt=operation.number_receipt,
-                    date_liquidation=operation.date_liquidation,
-                    date_operation=operation.date_operation,
-                    reference=reference,
-                    price_of_operation=operation.price_of_operation,
-                    import_of_operation=operation.import_of_operation,
-                    comprobant_of_operation=operation.comprobant_of_operation,
+        Returns:
+            False if the file was already ingested
+        """
+        placeholder = "$1" if isinstance(connection, AsyncpgDBClient) else "?"
+        _, rows = await connection.execute_query(
+            f'INSERT INTO "{IngestedFileModel._meta.db_table}" ("content_hash") '
+            f'VALUES ({placeholder}) ON CONFLICT ("content_hash") DO NOTHING RETURNING "id"',
+            [content_hash],
+        )
+        return bool(rows)
+
+    async def _create_operations_records(
+        self,
+        operations: list[Operation],
+        connection: BaseDBAsyncClient,
+        on_conflict: ConflictModes,
+        created_ids: DimensionIds,
+    ) -> IngestResult:
+        """
+        Create the operations with their related models, it must run inside a transaction.
+        A NUME repeated within the operations is a conflict with its first operation.
+        """
+        unique_operations = self._remove_repeated(operations, on_conflict)
+        repeated = len(operations) - len(unique_operations)
+        if repeated and on_conflict == ConflictModes.REJECT:
+            raise ValueError(f"{repeated} operations have a repeated NUME")
+
+        if self.bulk_load and isinstance(connection, AsyncpgDBClient):
+            result = await self._copy_operations(
+                unique_operations, connection, on_conflict, created_ids
+            )
+        else:
+            result = await self._insert_operations(
+                unique_operations, on_conflict, created_ids
+            )
+
+        if on_conflict == ConflictModes.OVERWRITE:
+            result.updated += repeated
+        else:
+            result.skipped += repeated
+        return result
+
+    async def _insert_operations(
+        self,
+        operations: list[Operation],
+        on_conflict: ConflictModes,
+        created_ids: DimensionIds,
+    ) -> IngestResult:
+        """
+        Create the operations through the ORM, with INSERT ... ON CONFLICT for stored NUMEs.
+        """
+        if not operations:
+            return IngestResult()
+
+        existing_ids = await self._get_existing_ids(
+            [operation.id for operation in operations]
+        )
+        if existing_ids and on_conflict == ConflictModes.REJECT:
+            raise _conflict_error(sorted(existing_ids))
+
+        ids = await self.dimension_cache.resolve(operations, created_ids)
+        operations_records = [
+            OperationModel(
+                id=operation.id,
+                type_operation_id=ids.type_operation_ids[
+                    operation.type_operation.type_operation
+                ],
+                ticket_id=ids.ticket_ids[operation.ticket.ticker],
+                amount=operation.amount,
+                code=operation.code,
+                accumulated=operation.accumulated,
+                number_receipt=operation.number_receipt,
+                date_liquidation=_to_date(operation.date_liquidation),
+                date_operation=_to_date(operation.date_operation),
+                reference_id=ids.reference_ids[operation.reference.detail],
+                price_of_operation=operation.price_of_operation,
+                import_of_operation=operation.import_of_operation,
+                comprobant_of_operation=operation.comprobant_of_operation,
+            )
+            for operation in operations
+        ]
+
+        inserted = len(operations_records) - len(existing_ids)
+        if on_conflict == ConflictModes.OVERWRITE:
+            await OperationModel.bulk_create(
+                operations_records,
+                on_conflict=["id"],
+                update_fields=OPERATIONS_COLUMNS[1:],
+            )
+            return IngestResult(inserted=inserted, updated=len(existing_ids))
+
+        await OperationModel.bulk_create(
+            operations_records, ignore_conflicts=on_conflict == ConflictModes.SKIP
+        )
+        return IngestResult(inserted=inserted, skipped=len(existing_ids))
+
+    async def _copy_operations(
+        self,
+        operations: list[Operation],
+        connection: AsyncpgDBClient,
+        on_conflict: ConflictModes,
+        created_ids: DimensionIds,
+    ) -> IngestResult:
+        """
+        Copy the operations into a temporary staging table and move them to the operations table
+        with a single INSERT ... SELECT, so the rows never go through the ORM.
+        """
+        if not operations:
+            return IngestResult()
+
+        ids = await self.dimension_cache.resolve(operations, created_ids)
+        type_operation_ids = ids.type_operation_ids
+        ticket_ids = ids.ticket_ids
+        reference_ids = ids.reference_ids
+        records = [
+            (
+                operation.id,
+                type_operation_ids[operation.type_operation.type_operation],
+                ticket_ids[operation.ticket.ticker],
+                reference_ids[operation.reference.detail],
+                _to_int(operation.amount),
+                operation.code,
+                operation.accumulated,
+                operation.number_receipt,
+                _to_date(operation.date_liquidation),
+                _to_date(operation.date_operation),
+                operation.price_of_operation,
+                operation.import_of_operation,
+                _to_int(operation.comprobant_of_operation),
+            )
+            for operation in operations
+        ]
+
+        columns = ", ".join(f'"{column}"' for column in OPERATIONS_COLUMNS)
+        if on_conflict == ConflictModes.OVERWRITE:
+            conflict_clause = 'ON CONFLICT ("id") DO UPDATE SET ' + ", ".join(
+                f'"{column}" = EXCLUDED."{column}"' for column in OPERATIONS_COLUMNS[1:]
+            )
+        else:
+            conflict_clause = 'ON CONFLICT ("id") DO NOTHING'
+
+        async with connection.acquire_connection() as asyncpg_connection:
+            # Dropped after each chunk, and by the commit or rollback if a chunk fails
+            await asyncpg_connection.execute(
+                f'CREATE TEMPORARY TABLE "{OPERATIONS_STAGING_TABLE}" (LIKE "operations") '
+                "ON COMMIT DROP"
+            )
+            await asyncpg_connection.copy_records_to_table(
+                OPERATIONS_STAGING_TABLE, records=records, columns=OPERATIONS_COLUMNS
+            )
+            if on_conflict == ConflictModes.REJECT:
+                conflicts = await asyncpg_connection.fetch(
+                    f'SELECT "staging"."id" FROM "{OPERATIONS_STAGING_TABLE}" "staging" '
+                    'JOIN "operations" ON "operations"."id" = "staging"."id" '
+                    'ORDER BY "staging"."id" LIMIT 10'
                 )
-                operations_records.append(operation_model)
-            await OperationModel.bulk_create(operations_records)
-            return len(operations_records)
+                if conflicts:
+                    raise _conflict_error([conflict["id"] for conflict in conflicts])
+
+            # xmax is 0 for the rows inserted and the id of the transaction for the rows updated
+            counts = await asyncpg_connection.fetchrow(
+                f'WITH "merged" AS (INSERT INTO "operations" ({columns}) '
+                f'SELECT {columns} FROM "{OPERATIONS_STAGING_TABLE}" {conflict_clause} '
+                'RETURNING ("xmax" = 0) AS "inserted") '
+                'SELECT COUNT(*) FILTER (WHERE "inserted") AS "inserted", '
+                'COUNT(*) AS "stored" FROM "merged"'
+            )
+            await asyncpg_connection.execute(f'DROP TABLE "{OPERATIONS_STAGING_TABLE}"')
+
+        return IngestResult(
+            inserted=counts["inserted"],
+            updated=counts["stored"] - counts["inserted"],
+            skipped=len(records) - counts["stored"],
+        )
+
+    async def _get_existing_ids(self, ids: list[int]) -> set[int]:
+        """
+        Get the ids already stored, looked up in batches so each query only reads the index
+        entries of its ids.
+        """
+        existing_ids: set[int] = set()
+        for start in range(0, len(ids), EXISTING_IDS_BATCH_SIZE):
+            existing_ids.update(
+                await OperationModel.filter(
+                    id__in=ids[start : start + EXISTING_IDS_BATCH_SIZE]
+                ).values_list("id", flat=True)
+            )
+        return existing_ids
+
+    def _remove_repeated(
+        self, operations: list[Operation], on_conflict: ConflictModes
+    ) -> list[Operation]:
+        """
+        Keep one operation per NUME, the last one when overwriting and the first one otherwise.
+        """
+        if on_conflict == ConflictModes.OVERWRITE:
+            return list({operation.id: operation for operation in operations}.values())
+        return list(
+            reversed(
+                {operation.id: operation for operation in reversed(operations)}.values()
+            )
+        )
 
     async def get_operations(
         self,
@@ -79,26 +391,19 @@ class OperationsRepository(OperationsRepositoryInterface):
         to_date: datetime.date,
         type_operation: tuple[HBTypeOperations, ...] | None = None,
         ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
     ) -> list[Operation]:
         """
-        Get operations.
+        Get operations, newest first as the strategies expect them: by operation date and NUME,
+        both descending, so operations of the same day always come in the same order.
         """
-
-        filters: dict[str, Any] = {
-            "date_operation__gte": from_date,
-            "date_operation__lte": to_date,
-        }
-        if type_operation:
-            pass
-            filters["type_operation__type_operation__in"] = [
-                op for op in type_operation
-            ]
-
-        if ticker:
-            filters["ticket__ticker__icontains"] = ticker
+        filters = self._get_operations_filters(
+            from_date, to_date, type_operation, ticker, ticker_match
+        )
 
         operations_records = (
             await OperationModel.filter(**filters)
+            .order_by("-date_operation", "-id")
             .prefetch_related("type_operation", "ticket", "reference")
             .all()
         )
@@ -107,6 +412,279 @@ class OperationsRepository(OperationsRepositoryInterface):
             for operation_record in operations_records
         ]
 
+    async def get_operations_page(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        limit: int,
+        sort: TypeOfSort = TypeOfSort.ASCENDING,
+        cursor: OperationsCursor | None = None,
+        offset: int = 0,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> list[Operation]:
+        """
+        Get a page of operations sorted by (date_operation, date_liquidation, id).
+        A cursor is applied as a range on the sort columns, so the index on them is walked
+        from the cursor and the page costs the same wherever it is.
+        """
+        query = OperationModel.filter(
+            **self._get_operations_filters(
+                from_date, to_date, type_operation, ticker, ticker_match
+            )
+        )
+
+        ascending = sort == TypeOfSort.ASCENDING
+        if cursor is not None:
+            # A previous page is read walking the sort order backwards from the cursor
+            ascending = ascending != (cursor.direction == CursorDirections.PREV)
+            query = query.filter(keyset_filter(cursor, ascending))
+
+        order = "" if ascending else "-"
+        operations_records = (
+            await query.order_by(
+                f"{order}date_operation", f"{order}date_liquidation", f"{order}id"
+            )
+            .offset(offset)
+            .limit(limit)
+            .select_related("type_operation", "ticket", "reference")
+        )
+        return [
+            Operation.from_model(operation_record)
+            for operation_record in operations_records
+        ]
+
+    async def iter_operations(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        batch_size: int,
+        sort: TypeOfSort = TypeOfSort.ASCENDING,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> AsyncIterator[list[Operation]]:
+        """
+        Yield every operation in batches, walking the sort order with a cursor. Each batch is
+        a short query, so no connection is held while the batches are consumed.
+        """
+        cursor = None
+        while True:
+            operations = await self.get_operations_page(
+                from_date,
+                to_date,
+                batch_size,
+                sort=sort,
+                cursor=cursor,
+                type_operation=type_operation,
+                ticker=ticker,
+                ticker_match=ticker_match,
+            )
+            if operations:
+                yield operations
+            if len(operations) < batch_size:
+                return
+            cursor = OperationsCursor.from_operation(
+                operations[-1], CursorDirections.NEXT
+            )
+
+    async def count_operations(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> int:
+        return await OperationModel.filter(
+            **self._get_operations_filters(
+                from_date, to_date, type_operation, ticker, ticker_match
+            )
+        ).count()
+
+    async def get_operations_frame(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        type_operation: tuple[HBTypeOperations, ...] | None = None,
+        ticker: str | None = None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> pd.DataFrame:
+        """
+        Get the columns of the operations used by the analysis with a single joined query,
+        in the order of get_operations. On PostgreSQL the records are decoded straight into
+        arrays, no model nor Operation is built per row.
+        """
+        connection = OperationModel._meta.db
+        if isinstance(connection, AsyncpgDBClient):
+            rows = await self._fetch_operations_columns(
+                connection, from_date, to_date, type_operation, ticker, ticker_match
+            )
+        else:
+            rows = (
+                await OperationModel.filter(
+                    **self._get_operations_filters(
+                        from_date, to_date, type_operation, ticker, ticker_match
+                    )
+                )
+                .order_by("-date_operation", "-id")
+                .values_list(
+                    "type_operation__type_operation",
+                    "ticket__ticker",
+                    "amount",
+                    "price_of_operation",
+                    "date_operation",
+                )
+            )
+
+        type_operations, tickers, amounts, prices, dates = list(zip(*rows)) or [()] * 5
+        return pd.DataFrame(
+            {
+                DatabaseColumnsOperations.TYPE_OPERATION: np.array(
+                    type_operations, dtype=object
+                ),
+                DatabaseColumnsOperations.TICKER: np.array(tickers, dtype=object),
+                # Missing amounts and prices are decoded as NaN
+                DatabaseColumnsOperations.AMOUNT: np.array(amounts, dtype=np.float64),
+                DatabaseColumnsOperations.PRICE: np.array(prices, dtype=np.float64),
+                DatabaseColumnsOperations.DATE_OPERATION: np.array(
+                    dates, dtype="datetime64[D]"
+                ),
+            }
+        )
+
+    async def get_cash_frame(
+        self, from_date: datetime.date, to_date: datetime.date
+    ) -> pd.DataFrame:
+        """
+        Get the balance left by every operation liquidated between the dates and its import.
+        No relation is needed, the columns are read straight from the operations table.
+        """
+        rows = (
+            await OperationModel.filter(
+                date_liquidation__gte=from_date, date_liquidation__lte=to_date
+            )
+            .order_by("-date_liquidation", "-id")
+            .values_list("date_liquidation", "accumulated", "import_of_operation")
+        )
+
+        dates, accumulated, imports = list(zip(*rows)) or [()] * 3
+        return pd.DataFrame(
+            {
+                DatabaseColumnsOperations.DATE_LIQUIDATION: np.array(
+                    dates, dtype="datetime64[D]"
+                ),
+                DatabaseColumnsOperations.ACCUMULATED: np.array(
+                    accumulated, dtype=np.float64
+                ),
+                # Missing imports are decoded as NaN
+                DatabaseColumnsOperations.IMPORT_OF_OPERATION: np.array(
+                    imports, dtype=np.float64
+                ),
+            }
+        )
+
+    async def get_daily_fingerprints(
+        self, type_operation: tuple[HBTypeOperations, ...] | None = None
+    ) -> dict[datetime.date, str]:
+        """
+        Aggregate the operations of every day in a single query. The NUMEs are summed alone
+        and weighting the amount, ticker and type, so changing, adding or removing an operation
+        changes the sums of its day.
+        """
+        connection = OperationModel._meta.db
+        values = [str(operation) for operation in type_operation or ()]
+        if isinstance(connection, AsyncpgDBClient):
+            placeholders = [f"${number}" for number in range(1, len(values) + 1)]
+        else:
+            placeholders = ["?"] * len(values)
+        condition = (
+            f'WHERE "operation_types"."type_operation" IN ({", ".join(placeholders)}) '
+            if values
+            else ""
+        )
+        weighted_id = 'CAST("operations"."id" AS BIGINT)'
+
+        _, rows = await connection.execute_query(
+            'SELECT "operations"."date_operation", COUNT(*), '
+            f'SUM({weighted_id}), SUM({weighted_id} * COALESCE("operations"."amount", 0)), '
+            f'SUM({weighted_id} * "operations"."ticket_id"), '
+            f'SUM({weighted_id} * "operations"."type_operation_id"), '
+            'SUM(COALESCE("operations"."price_of_operation", 0)) FROM "operations" '
+            'JOIN "operation_types" ON "operation_types"."id" = "operations"."type_operation_id" '
+            f'{condition}GROUP BY "operations"."date_operation"',
+            values,
+        )
+        fingerprints = {}
+        for date, *sums, prices in (tuple(row) for row in rows):
+            # SQLite returns the dates as ISO strings
+            day = datetime.date.fromisoformat(date) if isinstance(date, str) else date
+            fingerprints[day] = ":".join([*map(str, map(int, sums)), f"{prices:.6f}"])
+        return fingerprints
+
+    async def _fetch_operations_columns(
+        self,
+        connection: AsyncpgDBClient,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        type_operation: tuple[HBTypeOperations, ...] | None,
+        ticker: str | None,
+        ticker_match: TickerMatches,
+    ) -> list[Any]:
+        """
+        Select the OPERATIONS_FRAME_COLUMNS joining the operation types and tickers, with the
+        same filters as get_operations.
+        """
+        conditions = ['"operations"."date_operation" BETWEEN $1 AND $2']
+        values: list[Any] = [from_date, to_date]
+        if type_operation:
+            values.append([str(operation) for operation in type_operation])
+            conditions.append(
+                f'"operation_types"."type_operation" = ANY(${len(values)}::varchar[])'
+            )
+        if ticker and ticker_match == TickerMatches.EXACT:
+            values.append(ticker)
+            conditions.append(f'"tickets"."ticker" = ${len(values)}')
+        elif ticker:
+            escaped_ticker = (
+                ticker.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            values.append(f"%{escaped_ticker}%")
+            # Same expression as the trigram index of the tickets
+            conditions.append(f'UPPER("tickets"."ticker") LIKE UPPER(${len(values)})')
+
+        columns = ", ".join(OPERATIONS_FRAME_COLUMNS)
+        async with connection.acquire_connection() as asyncpg_connection:
+            return await asyncpg_connection.fetch(
+                f'SELECT {columns} FROM "operations" '
+                'JOIN "operation_types" ON "operation_types"."id" = "operations"."type_operation_id" '
+                'JOIN "tickets" ON "tickets"."id" = "operations"."ticket_id" '
+                f"WHERE {' AND '.join(conditions)} "
+                'ORDER BY "operations"."date_operation" DESC, "operations"."id" DESC',
+                *values,
+            )
+
+    def _get_operations_filters(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        type_operation: tuple[HBTypeOperations, ...] | None,
+        ticker: str | None,
+        ticker_match: TickerMatches = TickerMatches.CONTAINS,
+    ) -> dict[str, Any]:
+        filters: dict[str, Any] = {
+            "date_operation__gte": from_date,
+            "date_operation__lte": to_date,
+        }
+        if type_operation:
+            filters["type_operation__type_operation__in"] = list(type_operation)
+        if ticker and ticker_match == TickerMatches.EXACT:
+            filters["ticket__ticker"] = ticker
+        elif ticker:
+            filters["ticket__ticker__icontains"] = ticker
+        return filters
+
     async def update_operations(
         self,
         properties_to_filter: "OperationProperties",
@@ -123,7 +701,7 @@ class OperationsRepository(OperationsRepositoryInterface):
             Number of operations updated
         """
 
-        async with in_transaction():
+        async with self._write_transaction():
             # Build filter criteria
             filters: dict[str, Any] = {}
 
@@ -156,6 +734,10 @@ class OperationsRepository(OperationsRepositoryInterface):
 
             # Update the operations
             updated_count = await OperationModel.filter(**filters).update(**update_data)
+            if updated_count:
+                await self._increase_dataset_version()
+                # Files ingested before no longer match what is stored
+                await IngestedFileModel.all().delete()
 
             return updated_count
 
@@ -189,5 +771,73 @@ class OperationsRepository(OperationsRepositoryInterface):
             ]
 
         # Delete operations matching the filters
-        deleted_count = await OperationModel.filter(**filters).delete()
+        async with self._write_transaction():
+            deleted_count = await OperationModel.filter(**filters).delete()
+            if deleted_count:
+                await self._increase_dataset_version()
+                await IngestedFileModel.all().delete()
         return deleted_count
+
+    async def get_dataset_version(self) -> int:
+        """
+        Get the version of the stored operations, 0 until they are modified for the first time.
+        """
+        return (await self.get_dataset_version_info()).version
+
+    async def get_dataset_version_info(self) -> DatasetVersion:
+        """
+        Get the version of the stored operations and when they changed, read again from the
+        database once it is older than `dataset_version_ttl`.
+        """
+        if (
+            self._dataset_version is not None
+            and time.monotonic() - self._dataset_version_read_at
+            < self.dataset_version_ttl
+        ):
+            return self._dataset_version
+
+        changes = self._dataset_version_changes
+        read_at = time.monotonic()
+        record = await DatasetVersionModel.get_or_none(id=DATASET_VERSION_ID)
+        dataset_version = (
+            DatasetVersion(record.version, record.modified_at)
+            if record
+            else DatasetVersion()
+        )
+        # A version read while the operations were changing may already be outdated
+        if changes == self._dataset_version_changes:
+            self._dataset_version = dataset_version
+            self._dataset_version_read_at = read_at
+        return dataset_version
+
+    @asynccontextmanager
+    async def _write_transaction(self) -> AsyncIterator[BaseDBAsyncClient]:
+        """
+        Transaction that modifies the operations, the known dataset version is forgotten when
+        it ends so the new version is read once it is committed.
+        """
+        try:
+            async with in_transaction() as connection:
+                yield connection
+        finally:
+            self._dataset_version = None
+            self._dataset_version_changes += 1
+
+    async def _increase_dataset_version(self) -> None:
+        """
+        Increase the dataset version, called within the transaction that modifies the operations.
+        """
+        modified_at = datetime.datetime.now(datetime.timezone.utc)
+        updated = await DatasetVersionModel.filter(id=DATASET_VERSION_ID).update(
+            version=F("version") + 1, modified_at=modified_at
+        )
+        if not updated:
+            # The migrations seed the row, a schema generated without them gets it on the first
+            # write. Ignoring the conflict lets concurrent first writes increase it in turn.
+            await DatasetVersionModel.bulk_create(
+                [DatasetVersionModel(id=DATASET_VERSION_ID, version=0)],
+                ignore_conflicts=True,
+            )
+            await DatasetVersionModel.filter(id=DATASET_VERSION_ID).update(
+                version=F("version") + 1, modified_at=modified_at
+            )
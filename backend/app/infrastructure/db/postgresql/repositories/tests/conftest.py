@@ -0,0 +1,21 @@
+import pytest
+from tortoise import Tortoise
+
+
+@pytest.fixture
+async def database():
+    """Fixture that provides an empty in-memory database with the models."""
+    await Tortoise.init(
+        config={
+            "connections": {"default": "sqlite://:memory:"},
+            "apps": {
+                "models": {
+                    "models": ["app.infrastructure.db.postgresql.models"],
+                    "default_connection": "default",
+                }
+            },
+        }
+    )
+    await Tortoise.generate_schemas()
+    yield
+    await Tortoise.close_connections()
@@ -0,0 +1,99 @@
+import asyncio
+
+from tortoise.transactions import in_transaction
+
+from app.infrastructure.db.postgresql.models import TicketModel
+from app.infrastructure.db.postgresql.repositories.dimension_cache import (
+    DimensionCache,
+    DimensionIds,
+)
+
+
+class TestDimensionCache:
+    async def test_resolve_creates_each_key_once(self, make_operation, database):
+        """Test that missing keys, including NULL ones, are created once and reused."""
+        cache = DimensionCache()
+        operations = [
+            make_operation(ticker="AAPL"),
+            make_operation(ticker=None, detail="detail"),
+        ]
+
+        created = DimensionIds()
+        await cache.resolve(operations, created)
+        ids = await cache.resolve(operations + [make_operation(ticker="AAPL")], created)
+
+        assert await TicketModel.all().count() == 2
+        assert ids.ticket_ids == created.ticket_ids
+        assert set(ids.ticket_ids) == {"AAPL", None}
+        assert set(ids.reference_ids) == {None, "detail"}
+        assert list(ids.type_operation_ids) == ["CPRA"]
+
+    async def test_concurrent_resolves_create_each_key_once(
+        self, make_operation, database
+    ):
+        """Test that resolves running at the same time share the keys they both create."""
+        cache = DimensionCache()
+        first, second = DimensionIds(), DimensionIds()
+
+        first_ids, second_ids = await asyncio.gather(
+            cache.resolve([make_operation(ticker="AAPL")], first),
+            cache.resolve([make_operation(ticker="AAPL")], second),
+        )
+
+        assert await TicketModel.all().count() == 1
+        assert first_ids.ticket_ids["AAPL"] == second_ids.ticket_ids["AAPL"]
+
+    async def test_resolve_reuses_keys_created_elsewhere(
+        self, make_operation, database
+    ):
+        """Test that keys stored after the cache was loaded are read instead of duplicated."""
+        cache = DimensionCache()
+        await cache.resolve([make_operation(ticker="AAPL")], DimensionIds())
+        ticket = await TicketModel.create(
+            species="SPECIES", species_code="002", ticker="MSFT"
+        )
+
+        created = DimensionIds()
+        ids = await cache.resolve([make_operation(ticker="MSFT")], created)
+
+        assert ids.ticket_ids["MSFT"] == ticket.id
+        assert cache.ids.ticket_ids["MSFT"] == ticket.id
+        assert not created.ticket_ids
+        assert await TicketModel.all().count() == 2
+
+    async def test_created_ids_are_shared_once_published(
+        self, make_operation, database
+    ):
+        """Test that ids created in a rolled back transaction never reach the cache."""
+        cache = DimensionCache()
+        created = DimensionIds()
+        try:
+            async with in_transaction():
+                await cache.resolve([make_operation(ticker="AAPL")], created)
+                raise ValueError("rolled back")
+        except ValueError:
+            pass
+
+        assert "AAPL" not in cache.ids.ticket_ids
+        assert not await TicketModel.exists()
+
+        created = DimensionIds()
+        async with in_transaction():
+            ids = await cache.resolve([make_operation(ticker="AAPL")], created)
+        cache.publish(created)
+
+        assert cache.ids.ticket_ids["AAPL"] == ids.ticket_ids["AAPL"]
+        assert cache.ids.ticket_ids["AAPL"] == (await TicketModel.get(ticker="AAPL")).id
+
+    async def test_invalidate(self, make_operation, database):
+        """Test that an invalidated cache loads the stored ids again."""
+        cache = DimensionCache()
+        created = DimensionIds()
+        await cache.resolve([make_operation(ticker="AAPL")], created)
+        cache.publish(created)
+        await TicketModel.all().delete()
+
+        cache.invalidate()
+        ids = await cache.resolve([make_operation(ticker="AAPL")], DimensionIds())
+
+        assert ids.ticket_ids["AAPL"] == (await TicketModel.get(ticker="AAPL")).id
@@ -0,0 +1,56 @@
+import datetime
+
+from app.domain.entities.entities import LotSnapshot, OpenLot
+from app.infrastructure.db.postgresql.repositories.lot_snapshots_repository import (
+    LotSnapshotsRepository,
+)
+
+
+def make_snapshot(as_of: datetime.date, amount: float) -> LotSnapshot:
+    return LotSnapshot(
+        as_of=as_of,
+        open_lots=[
+            OpenLot(
+                operation_id=1,
+                ticker="AAPL",
+                date_operation=datetime.date(2024, 1, 10),
+                price=10.0,
+                amount=amount,
+            )
+        ],
+        fingerprint=f"{as_of}-{amount}",
+    )
+
+
+class TestLotSnapshotsRepository:
+    async def test_replace_snapshots_from_date(self, database):
+        """Test that the snapshots before the date are kept and marked with the version."""
+        january, february, march = (
+            datetime.date(2024, 1, 31),
+            datetime.date(2024, 2, 29),
+            datetime.date(2024, 3, 31),
+        )
+        repository = LotSnapshotsRepository()
+        await repository.replace_snapshots(
+            [make_snapshot(as_of, 4) for as_of in (january, february, march)], 1
+        )
+
+        await repository.replace_snapshots([make_snapshot(february, 2)], 2, february)
+
+        assert await repository.get_dataset_version() == 2
+        assert await repository.get_fingerprints() == {
+            january: f"{january}-4",
+            february: f"{february}-2",
+        }
+        snapshot = await repository.get_snapshot_before(march)
+        assert snapshot == make_snapshot(february, 2)
+
+    async def test_rebuild_lock(self, database):
+        """Test that a rebuild started while another holds the lock does not wait for it."""
+        repository = LotSnapshotsRepository()
+
+        async with repository.rebuild_lock() as first:
+            async with repository.rebuild_lock() as second:
+                assert (first, second) == (True, False)
+        async with repository.rebuild_lock() as after:
+            assert after
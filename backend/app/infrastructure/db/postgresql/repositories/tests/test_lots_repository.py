@@ -0,0 +1,100 @@
+import datetime
+
+from app.domain.entities.entities import FifoWatermark, OperationsAnalyzed
+from app.domain.entities.enums import TickerMatches
+from app.infrastructure.db.postgresql.repositories.lots_repository import (
+    LotsRepository,
+)
+
+
+def make_closed_lot(
+    ticker: str, date_operation: datetime.date, date_liquidation: datetime.date
+) -> OperationsAnalyzed:
+    return OperationsAnalyzed(
+        id=0,
+        ticker=ticker,
+        amount=1,
+        date_operation=date_operation,
+        date_liquidation=date_liquidation,
+        buy_price=10,
+        sell_price=11,
+        inverted_amount=10,
+        current_amount=11,
+        percentage_gain=10,
+        nominal_gain=1,
+        tna=0,
+    )
+
+
+async def collect(repository: LotsRepository, **filters) -> list[list[tuple]]:
+    return [
+        [(lot.ticker, lot.date_operation, lot.date_liquidation) for lot in batch]
+        async for batch in repository.iter_closed_lots(**filters)
+    ]
+
+
+class TestLotsRepository:
+    async def test_iter_closed_lots(self, database):
+        """Test that the batches walk the closed lots in the order of get_closed_lots."""
+        day = datetime.date(2024, 1, 1)
+        repository = LotsRepository()
+        await repository.save_matching(
+            [
+                make_closed_lot("GGAL", day, day + datetime.timedelta(days=3)),
+                make_closed_lot("AAPL", day, day + datetime.timedelta(days=1)),
+                make_closed_lot("GGAL", day, day + datetime.timedelta(days=1)),
+                make_closed_lot("AAPL", day + datetime.timedelta(days=2), day),
+                make_closed_lot("AAPL", day - datetime.timedelta(days=1), day),
+            ],
+            [],
+            FifoWatermark(last_operation_id=1, last_date_operation=day),
+        )
+        from_date, to_date = day, day + datetime.timedelta(days=5)
+
+        batches = await collect(
+            repository, from_date=from_date, to_date=to_date, batch_size=2
+        )
+
+        assert [len(batch) for batch in batches] == [2, 2]
+        assert [lot for batch in batches for lot in batch] == [
+            (lot.ticker, lot.date_operation, lot.date_liquidation)
+            for lot in await repository.get_closed_lots(from_date, to_date)
+        ]
+        assert batches[0][0][:2] == ("AAPL", day)
+        assert batches[-1][-1][1] == day + datetime.timedelta(days=2)
+
+    async def test_iter_closed_lots_ticker(self, database):
+        """Test that the ticker filter is applied to every batch."""
+        day = datetime.date(2024, 1, 1)
+        repository = LotsRepository()
+        await repository.save_matching(
+            [make_closed_lot(ticker, day, day) for ticker in ("AL30", "AL30D", "GD30")]
+            * 2,
+            [],
+            FifoWatermark(last_operation_id=1, last_date_operation=day),
+        )
+
+        contains = await collect(
+            repository, from_date=day, to_date=day, batch_size=3, ticker="al30"
+        )
+        exact = await collect(
+            repository,
+            from_date=day,
+            to_date=day,
+            batch_size=1,
+            ticker="AL30",
+            ticker_match=TickerMatches.EXACT,
+        )
+
+        assert [len(batch) for batch in contains] == [3, 1]
+        assert {lot[0] for batch in contains for lot in batch} == {"AL30", "AL30D"}
+        assert [batch[0][0] for batch in exact] == ["AL30", "AL30"]
+
+    async def test_iter_closed_lots_empty(self, database):
+        """Test that no batch is yielded without closed lots."""
+        day = datetime.date(2024, 1, 1)
+
+        assert (
+            await collect(LotsRepository(), from_date=day, to_date=day, batch_size=2)
+            == []
+        )
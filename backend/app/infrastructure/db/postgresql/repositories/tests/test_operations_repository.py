@@ -0,0 +1,265 @@
+import asyncio
+import datetime
+
+import pandas as pd
+import pytest
+
+from app.domain.entities.entities import (
+    OperationsCursor,
+)
+from app.domain.entities.enums import (
+    ConflictModes,
+    CursorDirections,
+    DatabaseColumnsOperations,
+    HBTypeOperations,
+    TickerMatches,
+    TypeOfSort,
+)
+from app.infrastructure.db.postgresql.models import OperationModel
+from app.infrastructure.db.postgresql.repositories.operations_repository import (
+    OperationsRepository,
+)
+
+
+class TestOperationsRepository:
+    async def test_create_operations_skip(self, make_operation, database):
+        """Test that stored and repeated NUMEs are skipped and counted."""
+        repository = OperationsRepository()
+        await repository.create_operations([make_operation(1)])
+
+        result = await repository.create_operations(
+            [
+                make_operation(1, amount=99),
+                make_operation(2),
+                make_operation(2, amount=99),
+            ],
+            ConflictModes.SKIP,
+        )
+
+        assert (result.inserted, result.updated, result.skipped) == (1, 0, 2)
+        assert await OperationModel.filter(amount=99).count() == 0
+
+    async def test_create_operations_overwrite(self, make_operation, database):
+        """Test that stored NUMEs are overwritten and counted as updated."""
+        repository = OperationsRepository()
+        await repository.create_operations([make_operation(1)])
+
+        result = await repository.create_operations(
+            [make_operation(1, amount=99), make_operation(2)], ConflictModes.OVERWRITE
+        )
+
+        assert (result.inserted, result.updated, result.skipped) == (1, 1, 0)
+        assert (await OperationModel.get(id=1)).amount == 99
+
+    async def test_create_operations_reject(self, make_operation, database):
+        """Test that a stored NUME rejects the whole batch."""
+        repository = OperationsRepository()
+        await repository.create_operations([make_operation(1)])
+
+        with pytest.raises(ValueError, match="NUME 1"):
+            await repository.create_operations([make_operation(2), make_operation(1)])
+
+        assert await OperationModel.all().count() == 1
+
+    async def test_create_operations_in_chunks(self, make_operation, database):
+        """Test that the chunks are stored in a single transaction rolled back on failure."""
+        repository = OperationsRepository()
+
+        async def chunks(fail: bool):
+            yield [make_operation(1), make_operation(2)]
+            yield [make_operation(2, amount=99), make_operation(3)]
+            if fail:
+                raise ValueError("broken chunk")
+
+        with pytest.raises(ValueError, match="broken chunk"):
+            await repository.create_operations_in_chunks(
+                chunks(True), ConflictModes.SKIP, content_hash="a"
+            )
+        assert await OperationModel.all().count() == 0
+        assert not await repository.is_file_ingested("a")
+
+        result = await repository.create_operations_in_chunks(
+            chunks(False), ConflictModes.SKIP, content_hash="a"
+        )
+
+        assert (result.inserted, result.updated, result.skipped) == (3, 0, 1)
+        assert await repository.is_file_ingested("a")
+
+    async def test_is_file_ingested(self, make_operation, database):
+        """Test that the hash of an ingested file is forgotten once operations are deleted."""
+        repository = OperationsRepository()
+        await repository.create_operations([make_operation(1)], content_hash="hash")
+        assert await repository.is_file_ingested("hash")
+
+        await repository.delete_operations(id=[1])
+
+        assert not await repository.is_file_ingested("hash")
+
+    async def test_concurrent_uploads_of_a_file(self, make_operation, database):
+        """Test that only one of the uploads of the same file stores its operations."""
+        repository = OperationsRepository()
+
+        results = await asyncio.gather(
+            repository.create_operations([make_operation(1)], content_hash="hash"),
+            repository.create_operations(
+                [make_operation(1)], ConflictModes.REJECT, "hash"
+            ),
+        )
+
+        assert sorted(result.already_ingested for result in results) == [False, True]
+        assert sum(result.inserted for result in results) == 1
+
+    async def test_get_operations_frame(self, make_operation, database):
+        """Test that the frame holds the analyzed columns of the filtered operations."""
+        repository = OperationsRepository()
+        await repository.create_operations(
+            [make_operation(1), make_operation(2, amount=None)]
+        )
+
+        frame = await repository.get_operations_frame(
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 31),
+            type_operation=(HBTypeOperations.BUY,),
+            ticker="AP",
+        )
+
+        assert frame[DatabaseColumnsOperations.TICKER].tolist() == ["AAPL", "AAPL"]
+        assert frame[DatabaseColumnsOperations.AMOUNT].fillna(0).tolist() == [0, 10]
+        assert (
+            frame[DatabaseColumnsOperations.DATE_OPERATION].tolist()
+            == [pd.Timestamp(2024, 1, 1)] * 2
+        )
+        assert (
+            await repository.get_operations_frame(
+                datetime.date(2024, 2, 1), datetime.date(2024, 2, 28)
+            )
+        ).empty
+
+    async def test_operations_come_newest_first(self, make_operation, database):
+        """Test that both reads sort by operation date and NUME whatever the insert order."""
+        repository = OperationsRepository()
+        await repository.create_operations(
+            [
+                make_operation(2, date=datetime.date(2024, 1, 2), amount=2),
+                make_operation(3, date=datetime.date(2024, 1, 1), amount=3),
+                make_operation(1, date=datetime.date(2024, 1, 2), amount=1),
+            ]
+        )
+        dates = (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+
+        operations = await repository.get_operations(*dates)
+        frame = await repository.get_operations_frame(*dates)
+
+        assert [operation.id for operation in operations] == [2, 1, 3]
+        assert frame[DatabaseColumnsOperations.AMOUNT].tolist() == [2, 1, 3]
+
+    async def test_get_operations_exact_ticker(self, make_operation, database):
+        """Test that the exact ticker mode leaves out the tickers containing the filter."""
+        repository = OperationsRepository()
+        await repository.create_operations(
+            [make_operation(1, ticker="AL"), make_operation(2, ticker="ALUA")]
+        )
+        dates = (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+
+        contained = await repository.get_operations(*dates, ticker="AL")
+        exact = await repository.get_operations(
+            *dates, ticker="AL", ticker_match=TickerMatches.EXACT
+        )
+
+        assert sorted(operation.id for operation in contained) == [1, 2]
+        assert [operation.id for operation in exact] == [1]
+
+    async def test_get_operations_page(self, make_operation, database):
+        """Test that cursors walk the operations sorted by date in both directions."""
+        repository = OperationsRepository()
+        operations = [make_operation(id) for id in range(1, 8)]
+        for operation in operations:
+            operation.date_operation = datetime.date(2024, 1, 1 + operation.id // 2)
+        await repository.create_operations(operations)
+        dates = (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+
+        first = await repository.get_operations_page(
+            *dates, limit=3, sort=TypeOfSort.DESCENDING
+        )
+        cursor = OperationsCursor.from_operation(first[-1], CursorDirections.NEXT)
+        second = await repository.get_operations_page(
+            *dates, limit=3, sort=TypeOfSort.DESCENDING, cursor=cursor
+        )
+        cursor = OperationsCursor.from_operation(second[0], CursorDirections.PREV)
+        previous = await repository.get_operations_page(
+            *dates, limit=3, sort=TypeOfSort.DESCENDING, cursor=cursor
+        )
+
+        assert [operation.id for operation in first + second] == [7, 6, 5, 4, 3, 2]
+        assert [operation.id for operation in previous] == [5, 6, 7]
+
+    async def test_iter_operations(self, make_operation, database):
+        """Test that the batches hold every operation once, in the requested order."""
+        repository = OperationsRepository()
+        await repository.create_operations([make_operation(id) for id in range(1, 6)])
+
+        batches = [
+            batch
+            async for batch in repository.iter_operations(
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 1, 31),
+                batch_size=2,
+                sort=TypeOfSort.DESCENDING,
+            )
+        ]
+
+        assert [[operation.id for operation in batch] for batch in batches] == [
+            [5, 4],
+            [3, 2],
+            [1],
+        ]
+
+    async def test_get_dataset_version_info(self, make_operation, database):
+        """Test that changes made through the repository are seen while the version is reused."""
+        repository = OperationsRepository(dataset_version_ttl=60)
+        assert (await repository.get_dataset_version_info()).version == 0
+
+        await repository.create_operations([make_operation(1)])
+        created = await repository.get_dataset_version_info()
+        await repository.delete_operations(id=[1])
+        deleted = await repository.get_dataset_version_info()
+
+        assert created.version == 1 and created.modified_at is not None
+        assert deleted.version == 2 and deleted.modified_at >= created.modified_at
+
+    async def test_first_writes_increase_the_version_in_turn(
+        self, make_operation, database
+    ):
+        """Test that concurrent first writes each increase the version of a missing row."""
+        await asyncio.gather(
+            *(
+                OperationsRepository().create_operations([make_operation(id)])
+                for id in range(1, 4)
+            )
+        )
+
+        assert (await OperationsRepository().get_dataset_version_info()).version == 3
+
+    async def test_get_daily_fingerprints(self, make_operation, database):
+        """Test that only the fingerprint of the day whose operations changed is different."""
+        first_day, second_day = datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)
+        repository = OperationsRepository()
+        await repository.create_operations(
+            [
+                make_operation(1, date=first_day),
+                make_operation(2, date=first_day, amount=None),
+                make_operation(3, date=second_day),
+                make_operation(4, HBTypeOperations.DIVIDEND, date=second_day),
+            ]
+        )
+        trades = (HBTypeOperations.BUY, HBTypeOperations.SELL)
+
+        before = await repository.get_daily_fingerprints(trades)
+        await OperationModel.filter(id=3).update(amount=11)
+        after = await repository.get_daily_fingerprints(trades)
+        await repository.delete_operations(id=[4])
+
+        assert sorted(before) == [first_day, second_day]
+        assert after[first_day] == before[first_day]
+        assert after[second_day] != before[second_day]
+        assert await repository.get_daily_fingerprints(trades) == after
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from app.domain.entities.enums import ExecutorTypes
+from app.domain.interfaces.executors.task_executor_interface import (
+    TaskExecutorInterface,
+)
+
+T = TypeVar("T")
+
+
+class PoolTaskExecutor(TaskExecutorInterface):
+    """
+    Run CPU bound tasks in a thread or process pool, logging how long each task takes.
+    The time waiting for a free worker is reported apart from the time running the task.
+    """
+
+    def __init__(self, executor_type: str = ExecutorTypes.THREAD, max_workers: int = 4):
+        if max_workers <= 0:
+            raise ValueError(
+                f"Invalid executor max workers: {max_workers}. Expected a positive number"
+            )
+
+        self.executor_type = self._parse_executor_type(executor_type)
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+        self._pool: Executor | None = None
+
+    async def run(self, task_name: str, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a synchronous function in the pool and wait for its result.
+        """
+        submitted_at = time.perf_counter()
+        started_at, result = await asyncio.get_running_loop().run_in_executor(
+            self._get_pool(), partial(_timed_call, func, *args)
+        )
+        finished_at = time.perf_counter()
+
+        # perf_counter is not shared between processes, the queue time is only known for threads
+        if self.executor_type == ExecutorTypes.THREAD:
+            queued_ms = (started_at - submitted_at) * 1000
+            self.logger.info(
+                f"Task {task_name} finished in {(finished_at - submitted_at) * 1000:.1f} ms "
+                f"({queued_ms:.1f} ms waiting for a {self.executor_type} worker)"
+            )
+        else:
+            self.logger.info(
+                f"Task {task_name} finished in {(finished_at - submitted_at) * 1000:.1f} ms "
+                f"in a {self.executor_type} worker"
+            )
+        return result
+
+    def shutdown(self) -> None:
+        """
+        Release the workers of the pool, a new pool is created if the executor is used again.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _get_pool(self) -> Executor:
+        """
+        Create the pool on first use, so processes are not spawned until work arrives.
+        """
+        if self._pool is None:
+            if self.executor_type == ExecutorTypes.PROCESS:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="analyzer"
+                )
+        return self._pool
+
+    def _parse_executor_type(self, executor_type: str) -> ExecutorTypes:
+        try:
+            return ExecutorTypes(executor_type)
+        except ValueError:
+            raise ValueError(
+                f"Invalid executor type: '{executor_type}'. "
+                f"Expected one of: {', '.join(ExecutorTypes)}"
+            )
+
+
+def _timed_call(func: Callable[..., T], *args: Any) -> tuple[float, T]:
+    """
+    Call the function returning when it started, defined at module level to be picklable.
+    """
+    started_at = time.perf_counter()
+    return started_at, func(*args)
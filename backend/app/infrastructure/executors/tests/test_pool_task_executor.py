@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+
+from app.domain.entities.enums import ExecutorTypes
+from app.infrastructure.executors.pool_task_executor import PoolTaskExecutor
+
+
+def _add(a: int, b: int) -> int:
+    return a + b
+
+
+class TestPoolTaskExecutor:
+    """Test class for PoolTaskExecutor functionality."""
+
+    @pytest.mark.parametrize("executor_type", list(ExecutorTypes))
+    async def test_run_returns_result(self, executor_type):
+        """Test that tasks run in the pool return the value of the function."""
+        executor = PoolTaskExecutor(executor_type, max_workers=1)
+        try:
+            assert await executor.run("add", _add, 2, 3) == 5
+        finally:
+            executor.shutdown()
+
+    async def test_thread_tasks_do_not_run_in_event_loop_thread(self):
+        """Test that thread tasks run outside of the thread of the event loop."""
+        executor = PoolTaskExecutor(ExecutorTypes.THREAD, max_workers=1)
+        try:
+            worker_thread = await executor.run("current_thread", threading.get_ident)
+        finally:
+            executor.shutdown()
+
+        assert worker_thread != threading.get_ident()
+
+    async def test_errors_are_propagated(self):
+        """Test that exceptions raised by the task reach the caller."""
+        executor = PoolTaskExecutor(ExecutorTypes.THREAD, max_workers=1)
+        try:
+            with pytest.raises(ValueError):
+                await executor.run("int", int, "not a number")
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.parametrize(
+        "executor_type, max_workers", [("fibers", 1), (ExecutorTypes.THREAD, 0)]
+    )
+    def test_invalid_configuration(self, executor_type, max_workers):
+        """Test that unknown pool types and empty pools are rejected."""
+        with pytest.raises(ValueError):
+            PoolTaskExecutor(executor_type, max_workers)
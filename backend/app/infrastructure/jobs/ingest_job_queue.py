@@ -0,0 +1,179 @@
+import asyncio
+import datetime
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from collections import OrderedDict
+
+from fastapi import UploadFile
+
+from app.domain.entities.entities import IngestJob
+from app.domain.entities.enums import ConflictModes, JobStatuses
+from app.domain.interfaces.jobs.ingest_job_queue_interface import (
+    IngestJobQueueInterface,
+)
+from app.domain.use_cases.treat_csv_use_case import TreatCsvUseCase
+
+# Finished jobs are kept so their status can be read, the oldest ones are forgotten first
+MAX_FINISHED_JOBS = 1000
+
+
+class IngestJobQueue(IngestJobQueueInterface):
+    """
+    Store uploaded files in the background with a fixed number of asyncio workers.
+    Files are copied to the spool directory when submitted, so the request ends right away
+    and the copy is streamed in chunks by a worker when its turn comes.
+    Jobs live in the memory of the process that received the upload.
+    """
+
+    def __init__(
+        self,
+        treat_csv_use_case: TreatCsvUseCase,
+        spool_dir: str,
+        chunk_size: int,
+        max_concurrent_jobs: int = 2,
+        max_queued_jobs: int = 50,
+    ):
+        if max_concurrent_jobs <= 0:
+            raise ValueError(
+                f"Invalid max concurrent jobs: {max_concurrent_jobs}. Expected a positive number"
+            )
+
+        self.treat_csv_use_case = treat_csv_use_case
+        self.spool_dir = spool_dir
+        self.chunk_size = chunk_size
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.logger = logging.getLogger(__name__)
+        self._jobs: OrderedDict[str, IngestJob] = OrderedDict()
+        self._queue: asyncio.Queue[tuple[IngestJob, str, ConflictModes]] = (
+            asyncio.Queue(maxsize=max_queued_jobs)
+        )
+        self._workers: list[asyncio.Task] = []
+        # Slots taken by the files being copied to the spool directory
+        self._reserved_slots = 0
+
+    async def submit(
+        self, csv_file: UploadFile, on_conflict: ConflictModes = ConflictModes.REJECT
+    ) -> IngestJob:
+        """
+        Copy the uploaded file to the spool directory and queue it.
+
+        Raises:
+            asyncio.QueueFull: When the maximum number of queued jobs is reached
+        """
+        # The slot is reserved before the copy, so uploads copied at the same time can not
+        # exceed the maximum once they are queued
+        if (
+            self._queue.maxsize > 0
+            and self._queue.qsize() + self._reserved_slots >= self._queue.maxsize
+        ):
+            raise asyncio.QueueFull()
+
+        self._reserved_slots += 1
+        try:
+            spooled_path = await asyncio.to_thread(self._spool, csv_file)
+        finally:
+            self._reserved_slots -= 1
+        job = IngestJob(id=uuid.uuid4().hex, file_name=csv_file.filename)
+        self._queue.put_nowait((job, spooled_path, on_conflict))
+        self._jobs[job.id] = job
+        self._start_workers()
+        return job
+
+    def get(self, job_id: str) -> IngestJob | None:
+        return self._jobs.get(job_id)
+
+    async def shutdown(self) -> None:
+        """
+        Cancel the workers, waiting for the running jobs to be marked as failed, and remove the
+        files of the jobs still queued.
+        """
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        while not self._queue.empty():
+            job, spooled_path, _ = self._queue.get_nowait()
+            self._remove(spooled_path)
+            job.status = JobStatuses.FAILED
+            job.error = "The service stopped before the job started"
+
+    def _start_workers(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self.max_concurrent_jobs)
+        ]
+
+    async def _work(self) -> None:
+        while True:
+            job, spooled_path, on_conflict = await self._queue.get()
+            try:
+                await self._run(job, spooled_path, on_conflict)
+            finally:
+                self._queue.task_done()
+
+    async def _run(
+        self, job: IngestJob, spooled_path: str, on_conflict: ConflictModes
+    ) -> None:
+        job.status = JobStatuses.RUNNING
+        job.started_at = datetime.datetime.now()
+        try:
+            with open(spooled_path, "rb") as content:
+                job.result = await self.treat_csv_use_case.execute_streaming(
+                    UploadFile(content, filename=job.file_name),
+                    self.chunk_size,
+                    on_conflict,
+                    job,
+                )
+            job.status = JobStatuses.COMPLETED
+        except asyncio.CancelledError:
+            # The transaction of the job is rolled back, it can be submitted again
+            job.status = JobStatuses.FAILED
+            job.error = "The service stopped while the job was running"
+            raise
+        except Exception as e:
+            job.status = JobStatuses.FAILED
+            job.error = str(e)
+            self.logger.error(f"Ingest job {job.id} failed: {str(e)}")
+        finally:
+            job.finished_at = datetime.datetime.now()
+            self._remove(spooled_path)
+            self._forget_finished_jobs()
+
+        self.logger.info(
+            f"Ingest job {job.id} {job.status} with {job.rows_written} rows "
+            f"({job.rows_per_second:.0f} rows/s)"
+        )
+
+    def _spool(self, csv_file: UploadFile) -> str:
+        os.makedirs(self.spool_dir, exist_ok=True)
+        csv_file.file.seek(0)
+        with tempfile.NamedTemporaryFile(
+            dir=self.spool_dir, suffix=".csv", delete=False
+        ) as spooled:
+            try:
+                shutil.copyfileobj(csv_file.file, spooled)
+            except BaseException:
+                spooled.close()
+                self._remove(spooled.name)
+                raise
+        return spooled.name
+
+    def _remove(self, spooled_path: str) -> None:
+        try:
+            os.remove(spooled_path)
+        except FileNotFoundError:
+            pass
+
+    def _forget_finished_jobs(self) -> None:
+        finished = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status in (JobStatuses.COMPLETED, JobStatuses.FAILED)
+        ]
+        for job_id in finished[: max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[job_id]
@@ -0,0 +1,122 @@
+import asyncio
+import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from app.domain.entities.entities import IngestResult
+from app.domain.entities.enums import JobStatuses
+from app.infrastructure.jobs.ingest_job_queue import IngestJobQueue
+
+
+class FakeTreatCsvUseCase:
+    """Use case that reports one row per line of the file, failing on empty files."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def execute_streaming(self, csv_file, chunk_size, on_conflict, job):
+        await self.release.wait()
+        rows = len((await csv_file.read()).splitlines())
+        if not rows:
+            raise ValueError("Empty file")
+        job.rows_parsed = job.rows_written = rows
+        return IngestResult(inserted=rows)
+
+
+def upload(content: bytes) -> UploadFile:
+    return UploadFile(io.BytesIO(content), filename="operations.csv")
+
+
+async def wait_finished(queue: IngestJobQueue, job_id: str):
+    while queue.get(job_id).finished_at is None:
+        await asyncio.sleep(0.01)
+    return queue.get(job_id)
+
+
+class TestIngestJobQueue:
+    """Test class for IngestJobQueue functionality."""
+
+    async def test_submit_runs_job_in_background(self, tmp_path):
+        """Test that a submitted file is queued, stored by a worker and its copy removed."""
+        use_case = FakeTreatCsvUseCase()
+        queue = IngestJobQueue(use_case, str(tmp_path), chunk_size=10)
+        try:
+            job = await queue.submit(upload(b"a\nb\nc\n"))
+            assert job.status == JobStatuses.QUEUED
+            assert len(os.listdir(tmp_path)) == 1
+
+            use_case.release.set()
+            job = await wait_finished(queue, job.id)
+        finally:
+            await queue.shutdown()
+
+        assert job.status == JobStatuses.COMPLETED
+        assert job.result.inserted == 3
+        assert job.rows_written == 3
+        assert os.listdir(tmp_path) == []
+
+    async def test_failed_job_reports_error(self, tmp_path):
+        """Test that the error of a failing job is kept in the job."""
+        use_case = FakeTreatCsvUseCase()
+        use_case.release.set()
+        queue = IngestJobQueue(use_case, str(tmp_path), chunk_size=10)
+        try:
+            job = await wait_finished(queue, (await queue.submit(upload(b""))).id)
+        finally:
+            await queue.shutdown()
+
+        assert job.status == JobStatuses.FAILED
+        assert job.error == "Empty file"
+
+    async def test_submit_rejects_when_queue_is_full(self, tmp_path):
+        """Test that files are not accepted once the maximum of queued jobs is reached."""
+        queue = IngestJobQueue(
+            FakeTreatCsvUseCase(),
+            str(tmp_path),
+            chunk_size=10,
+            max_concurrent_jobs=1,
+            max_queued_jobs=1,
+        )
+        try:
+            await queue.submit(upload(b"a\n"))
+            await asyncio.sleep(0)  # The worker takes the first job
+            await queue.submit(upload(b"b\n"))
+            with pytest.raises(asyncio.QueueFull):
+                await queue.submit(upload(b"c\n"))
+        finally:
+            await queue.shutdown()
+
+    async def test_concurrent_submits_respect_the_maximum(self, tmp_path):
+        """Test that uploads copied at the same time can not queue more jobs than allowed."""
+        queue = IngestJobQueue(
+            FakeTreatCsvUseCase(),
+            str(tmp_path),
+            chunk_size=10,
+            max_concurrent_jobs=1,
+            max_queued_jobs=1,
+        )
+        try:
+            results = await asyncio.gather(
+                *(queue.submit(upload(b"a\n")) for _ in range(3)),
+                return_exceptions=True,
+            )
+        finally:
+            await queue.shutdown()
+
+        assert sum(isinstance(result, asyncio.QueueFull) for result in results) == 2
+        assert os.listdir(tmp_path) == []
+
+    async def test_shutdown_fails_running_job(self, tmp_path):
+        """Test that a job cancelled while running is reported as failed."""
+        queue = IngestJobQueue(FakeTreatCsvUseCase(), str(tmp_path), chunk_size=10)
+        job = await queue.submit(upload(b"a\n"))
+        await asyncio.sleep(0)  # The worker starts the job
+        assert job.status == JobStatuses.RUNNING
+
+        await queue.shutdown()
+
+        assert job.status == JobStatuses.FAILED
+        assert job.finished_at is not None
+        assert os.listdir(tmp_path) == []
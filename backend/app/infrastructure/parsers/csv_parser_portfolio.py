@@ -1,5 +1,7 @@
-from datetime import datetime
+from io import BytesIO
+from typing import BinaryIO, Iterator
 
+import numpy as np
 import pandas as pd
 from fastapi import UploadFile
 
@@ -7,63 +9,155 @@ from app.domain.entities.entities import Operation, OperationType, Reference, Ti
 from app.domain.entities.enums import DataSetColumns
 from app.domain.interfaces.parsers.csv_parser_interface import CsvParserInterface
 
+DATE_FORMAT = "%d/%m/%y"
+
+# Codes keep their leading zeros and tickers come padded with spaces, both are read as text
+STRING_COLUMNS = [
+    DataSetColumns.TYPE_OPERATION,
+    DataSetColumns.SPECIES,
+    DataSetColumns.SPECIES_CODE,
+    DataSetColumns.TICKER,
+    DataSetColumns.CODE,
+    DataSetColumns.REFERENCE,
+]
+DATE_COLUMNS = [DataSetColumns.DATE_LIQUIDATION, DataSetColumns.DATE_OPERATION]
+STRIPPED_COLUMNS = [DataSetColumns.SPECIES_CODE, DataSetColumns.TICKER]
+
 
 class CsvParserPortfolio(CsvParserInterface):
     """
     Parser for csv files.
+    Columns are converted as a whole and the entities are built in a single pass at the end.
     """
 
-    def _parse_date(self, date_string):
+    def parse(self, csv_file: UploadFile | BinaryIO) -> list[Operation]:
         """
-        Parse date string from DD/MM/YY format to datetime object.
+        Parse a csv file, either the uploaded file or its content already read.
         """
-        if pd.isna(date_string) or date_string is None:
-            return None
-
-        try:
-            # Handle DD/MM/YY format
-            if isinstance(date_string, str) and "/" in date_string:
-                return datetime.strptime(date_string, "%d/%m/%y")
-            # If it's already a datetime object, return as is
-            elif isinstance(date_string, datetime):
-                return date_string
-            # Try pandas to_datetime as fallback
-            else:
-                return pd.to_datetime(date_string)
-        except (ValueError, TypeError):
-            return None
-
-    def parse(self, csv_file: UploadFile) -> list[Operation]:
+        return self._build_operations(self.parse_frame(csv_file))
+
+    def split_chunks(
+        self, csv_file: UploadFile | BinaryIO, chunk_size: int
+    ) -> Iterator[BinaryIO]:
         """
-        Parse a csv file.
+        Split a csv file into csv files of at most `chunk_size` rows, each one with the header,
+        reading the content line by line so only one chunk is kept in memory.
+        A quoted value spanning several lines stays in the chunk of its row.
         """
-        df = pd.read_csv(csv_file.file, sep=",")
+        content = getattr(csv_file, "file", csv_file)
+        header = content.readline()
+        lines: list[bytes] = []
+        rows = 0
+        inside_quotes = False
+        for line in content:
+            lines.append(line)
+            if line.count(b'"') % 2:
+                inside_quotes = not inside_quotes
+            if inside_quotes:
+                continue
 
-        # Replace all nan values with None
-        df = df.replace([pd.NA, pd.NaT, float("nan")], None)
+            rows += 1
+            if rows == chunk_size:
+                yield BytesIO(header + b"".join(lines))
+                lines, rows = [], 0
 
-        operations = []
-        for index, row in df.iterrows():
-            operation = Operation(
-                id=row[DataSetColumns.ID],
-                type_operation=OperationType(
-                    type_operation=row[DataSetColumns.TYPE_OPERATION]
-                ),
+        if lines:
+            yield BytesIO(header + b"".join(lines))
+
+    def parse_frame(self, csv_file: UploadFile | BinaryIO) -> pd.DataFrame:
+        """
+        Read a csv file into a DataFrame with the DataSetColumns columns normalized: dates parsed,
+        codes and tickers stripped and missing values as None.
+        """
+        # Uploaded files expose their content through `file`, read content is used as is
+        content = getattr(csv_file, "file", csv_file)
+        df = pd.read_csv(
+            content, sep=",", dtype={column: "string" for column in STRING_COLUMNS}
+        )
+
+        for column in STRIPPED_COLUMNS:
+            df[column] = df[column].str.strip()
+        for column in DATE_COLUMNS:
+            # Dates that do not follow the format are left empty
+            df[column] = pd.to_datetime(df[column], format=DATE_FORMAT, errors="coerce")
+        return df
+
+    def _build_operations(self, df: pd.DataFrame) -> list[Operation]:
+        """
+        Build the entities from the columns converted to Python values, missing values as None.
+        """
+        columns = {column: self._to_list(df[column]) for column in DataSetColumns}
+
+        return [
+            Operation(
+                id=id,
+                type_operation=OperationType(type_operation=type_operation),
                 ticket=Ticket(
-                    species=row[DataSetColumns.SPECIES],
-                    species_code=row[DataSetColumns.SPECIES_CODE].strip() ,
-                    ticker=row[DataSetColumns.TICKER].strip()
+                    species=species, species_code=species_code, ticker=ticker
                 ),
-                amount=row[DataSetColumns.AMOUNT],
-                code=row[DataSetColumns.CODE],
-                accumulated=row[DataSetColumns.ACCUMULATED],
-                number_receipt=row[DataSetColumns.NUMBER_RECEIPT],
-                date_liquidation=self._parse_date(row[DataSetColumns.DATE_LIQUIDATION]),
-                date_operation=self._parse_date(row[DataSetColumns.DATE_OPERATION]),
-                reference=Reference(detail=row[DataSetColumns.REFERENCE]),
-                import_of_operation=row[DataSetColumns.IMPO],
-                price_of_operation=row[DataSetColumns.PCIO],
-                comprobant_of_operation=row[DataSetColumns.COMPROBANTE],
+                amount=amount,
+                code=code,
+                accumulated=accumulated,
+                number_receipt=number_receipt,
+                date_liquidation=date_liquidation,
+                date_operation=date_operation,
+                reference=Reference(detail=reference),
+                import_of_operation=import_of_operation,
+                price_of_operation=price_of_operation,
+                comprobant_of_operation=comprobant_of_operation,
+            )
+            for (
+                id,
+                type_operation,
+                species,
+                species_code,
+                ticker,
+                amount,
+                code,
+                accumulated,
+                number_receipt,
+                date_liquidation,
+                date_operation,
+                reference,
+                import_of_operation,
+                price_of_operation,
+                comprobant_of_operation,
+            ) in zip(
+                columns[DataSetColumns.ID],
+                columns[DataSetColumns.TYPE_OPERATION],
+                columns[DataSetColumns.SPECIES],
+                columns[DataSetColumns.SPECIES_CODE],
+                columns[DataSetColumns.TICKER],
+                columns[DataSetColumns.AMOUNT],
+                columns[DataSetColumns.CODE],
+                columns[DataSetColumns.ACCUMULATED],
+                columns[DataSetColumns.NUMBER_RECEIPT],
+                columns[DataSetColumns.DATE_LIQUIDATION],
+                columns[DataSetColumns.DATE_OPERATION],
+                columns[DataSetColumns.REFERENCE],
+                columns[DataSetColumns.IMPO],
+                columns[DataSetColumns.PCIO],
+                columns[DataSetColumns.COMPROBANTE],
             )
-            operations.append(operation)
-        return operations
+        ]
+
+    def _to_list(self, column: pd.Series) -> list:
+        """
+        Convert a column to Python values, replacing NaN, NaT and NA by None.
+        """
+        if pd.api.types.is_datetime64_any_dtype(column):
+            # Exports span few distinct days, so each one is converted once
+            codes, unique_dates = pd.factorize(column)
+            dates = np.array([*unique_dates.to_pydatetime(), None], dtype=object)
+            return dates[
+                codes
+            ].tolist()  # Missing dates have code -1, the None at the end
+
+        values = column.astype(object).tolist()
+        if column.hasnans:
+            missing = column.isna().to_numpy()
+            values = [
+                None if is_missing else value
+                for value, is_missing in zip(values, missing)
+            ]
+        return values
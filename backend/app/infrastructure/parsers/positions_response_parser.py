@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import Any, Dict, List
 
 from pydantic import BaseModel
@@ -31,62 +30,59 @@ class PositionsResponseParser(ResponseParserInterface):
     """
 
     def parse(
-        self, positions: List[Operation], sort: TypeOfSort = TypeOfSort.ASCENDING
+        self,
+        positions: List[Operation],
+        sort: TypeOfSort | None = TypeOfSort.ASCENDING,
     ) -> List[Dict[str, Any]]:
         """
         Parse a list of Operation entities and convert them to PositionResponse dictionaries.
 
         Args:
             positions: List of Operation entities
-            sort: Type of sorting to apply (default: ASCENDING)
+            sort: Type of sorting to apply (default: ASCENDING), None keeps the order received
 
         Returns:
             List of PositionResponse dictionaries sorted by date_operation
         """
-        position_responses = []
 
-        for operation in positions:
-            position_response = self._convert_operation_to_position_response(operation)
-            position_responses.append(position_response.dict())
-
-        # Sort by date_operation (newest first by default), then by date_liquidation as secondary sort
-        def parse_date(date_str: str) -> datetime:
-            """Parse DD/MM/YYYY date string to datetime object for proper sorting."""
-            return datetime.strptime(date_str, "%d/%m/%Y")
-
-        def sort_key(x: Dict[str, Any]) -> tuple:
+        # Operations are sorted by their dates before formatting them as DD/MM/YYYY
+        def sort_key(operation: Operation) -> tuple:
             """Create a tuple for multi-level sorting: (date_operation, date_liquidation)."""
-            return (parse_date(x["date_operation"]), parse_date(x["date_liquidation"]))
+            return (operation.date_operation, operation.date_liquidation)
 
         if sort == TypeOfSort.ASCENDING:
-            position_responses.sort(key=sort_key, reverse=False)
-        else:  # DESCENDING
-            position_responses.sort(key=sort_key, reverse=True)
+            positions = sorted(positions, key=sort_key)
+        elif sort == TypeOfSort.DESCENDING:
+            positions = sorted(positions, key=sort_key, reverse=True)
 
-        return position_responses
+        return [
+            self._convert_operation_to_position_response(operation)
+            for operation in positions
+        ]
 
     def _convert_operation_to_position_response(
         self, operation: Operation
-    ) -> PositionResponse:
+    ) -> Dict[str, Any]:
         """
-        Convert a single Operation to PositionResponse.
+        Convert a single Operation to a dictionary with the PositionResponse fields.
+        Operations come from the database, so the values are converted without validating them.
 
         Args:
             operation: The Operation to convert
 
         Returns:
-            PositionResponse entity
+            PositionResponse dictionary
         """
-        return PositionResponse(
-            id=operation.id,
-            type_operation=operation.type_operation.type_operation,
-            ticket=operation.ticket.ticker or "UNKNOWN",
-            species=operation.ticket.species,
-            reference=operation.reference.detail or "",
-            amount=operation.amount or 0.0,
-            code=operation.code,
-            accumulated=operation.accumulated,
-            number_receipt=operation.number_receipt,
-            date_liquidation=operation.date_liquidation.strftime("%d/%m/%Y"),
-            date_operation=operation.date_operation.strftime("%d/%m/%Y"),
-        )
+        return {
+            "id": int(operation.id),
+            "type_operation": operation.type_operation.type_operation,
+            "ticket": operation.ticket.ticker or "UNKNOWN",
+            "species": operation.ticket.species,
+            "reference": operation.reference.detail or "",
+            "amount": float(operation.amount or 0.0),
+            "code": operation.code,
+            "accumulated": float(operation.accumulated),
+            "number_receipt": int(operation.number_receipt),
+            "date_liquidation": operation.date_liquidation.strftime("%d/%m/%Y"),
+            "date_operation": operation.date_operation.strftime("%d/%m/%Y"),
+        }
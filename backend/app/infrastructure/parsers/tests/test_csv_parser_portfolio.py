@@ -1,12 +1,15 @@
 import io
 import math
 import os
+from datetime import datetime
 from typing import Union, get_args, get_origin, get_type_hints
 from unittest.mock import Mock
 
+import pandas as pd
 import pytest
 
 from app.domain.entities.entities import Operation
+from app.domain.entities.enums import DataSetColumns
 from app.infrastructure.parsers.csv_parser_portfolio import CsvParserPortfolio
 
 
@@ -104,3 +107,52 @@ class TestCsvParserPortfolio:
                     isinstance(operation.reference.detail, float)
                     and math.isnan(operation.reference.detail)
                 )
+
+    def test_parse_frame(self, parser, mock_upload_file):
+        """Test that the columns are normalized without building the entities."""
+        df = parser.parse_frame(mock_upload_file)
+
+        assert len(df) == 341
+        assert str(df[DataSetColumns.DATE_OPERATION].dtype) == "datetime64[ns]"
+        assert str(df[DataSetColumns.DATE_LIQUIDATION].dtype) == "datetime64[ns]"
+        assert df[DataSetColumns.DATE_OPERATION].iloc[0] == pd.Timestamp(2024, 12, 30)
+        # Tickers come padded with spaces and species codes have leading zeros
+        assert df[DataSetColumns.TICKER].iloc[0] == "TGNO4"
+        assert df[DataSetColumns.SPECIES_CODE].iloc[1] == "00927"
+
+    def test_parse_invalid_dates(self, parser):
+        """Test that dates not following the DD/MM/YY format are left empty."""
+        header = "CPTE,IMPO,CLAV,ESPE,ACUM,NroComprobante,Ticker,Comprobante,FEC1,FEC2,DETA,CodigoEspecie,NUME,CANT,PCIO\n"
+        row = "CPRA,-10,C1,ESPECIE,5,1,AAPL ,1,not a date,30/12/24,,001,1,10,1.5\n"
+
+        operations = parser.parse(io.BytesIO((header + row).encode()))
+
+        assert operations[0].date_liquidation is None
+        assert operations[0].date_operation == datetime(2024, 12, 30)
+        assert operations[0].ticket.ticker == "AAPL"
+        assert operations[0].amount == 10
+
+    def test_split_chunks(self, parser, mock_upload_file, csv_file_path):
+        """Test that the chunks parsed one by one give the operations of the whole file."""
+        chunks = list(parser.split_chunks(mock_upload_file, 100))
+
+        with open(csv_file_path, "rb") as f:
+            expected_operations = parser.parse(io.BytesIO(f.read()))
+        assert len(chunks) == 4
+        assert [
+            operation for chunk in chunks for operation in parser.parse(chunk)
+        ] == expected_operations
+
+    def test_split_chunks_quoted_line_breaks(self, parser):
+        """Test that a quoted value spanning several lines is kept in the chunk of its row."""
+        header = "CPTE,IMPO,CLAV,ESPE,ACUM,NroComprobante,Ticker,Comprobante,FEC1,FEC2,DETA,CodigoEspecie,NUME,CANT,PCIO\n"
+        rows = (
+            'CPRA,-10,C1,ESPECIE,5,1,AAPL,1,30/12/24,30/12/24,"first\nsecond",001,1,10,1.5\n'
+            "VTAS,10,C1,ESPECIE,5,2,AAPL,1,31/12/24,31/12/24,,001,2,10,1.5\n"
+        )
+
+        chunks = list(parser.split_chunks(io.BytesIO((header + rows).encode()), 1))
+
+        assert len(chunks) == 2
+        assert parser.parse(chunks[0])[0].reference.detail == "first\nsecond"
+        assert parser.parse(chunks[1])[0].number_receipt == 2
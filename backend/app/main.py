@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
@@ -9,6 +10,9 @@ from slowapi.util import get_remote_address
 
 from app.config.settings import Settings
 from app.domain.entities.enums import DatabaseTypes
+from app.infrastructure.analyzers.strategies.parallel_fifo_strategy import (
+    ParallelFifoStrategy,
+)
 from app.infrastructure.api.main_routes import MainRoutes
 from app.infrastructure.db.main import (
     close_database_connections,
@@ -46,6 +50,13 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     try:
+        await main_routes.ingest_job_queue.shutdown()
+        if main_routes.sync_lots_use_case:
+            await main_routes.sync_lots_use_case.shutdown()
+        # Waiting for the running tasks would block the event loop
+        await asyncio.to_thread(main_routes.task_executor.shutdown)
+        if isinstance(main_routes.strategy, ParallelFifoStrategy):
+            await asyncio.to_thread(main_routes.strategy.shutdown)
         await close_database_connections(database_types)
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}")